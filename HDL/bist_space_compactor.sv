@@ -0,0 +1,34 @@
+// Module: bist_space_compactor.sv
+// Description: Folds every ALU output observed in BIST mode into one MISR input word:
+//                response = result ^ (adder_result * x mod POLY) ^ {is_equal, comparison}
+//              The adder runs for every operator, so adder_result carries the
+//              adder's faults in XOR / SLL cycles too. For ADD / SUB result equals
+//              adder_result, so a plain XOR would cancel every adder error;
+//              multiplying by x (one step of misr_analyzer without input) keeps
+//              e ^ (e * x) non-zero for any error e, because x + 1 does not
+//              divide the primitive x^WIDTH + POLY. Use the MISR's POLY; the
+//              default is the same bist_poly_pkg polynomial for every WIDTH.
+
+module bist_space_compactor import bist_poly_pkg::*; #(
+    parameter WIDTH = 32,
+    parameter logic [WIDTH-1:0] POLY = WIDTH'(default_poly(WIDTH))   // as misr_analyzer
+)(
+    input  logic [WIDTH-1:0] result,
+    input  logic [WIDTH-1:0] adder_result,
+    input  logic             comparison_result,
+    input  logic             is_equal_result,
+    output logic [WIDTH-1:0] response
+);
+
+    logic [WIDTH-1:0] adder_times_x;
+
+    assign adder_times_x = {adder_result[WIDTH-2:0], 1'b0} ^ (adder_result[WIDTH-1] ? POLY : '0);
+    assign response      = result ^ adder_times_x
+                         ^ {{(WIDTH-2){1'b0}}, is_equal_result, comparison_result};
+
+    // Elaboration check: bist_poly_pkg has no default POLY for this WIDTH
+    if (POLY == '0) begin : g_no_default_poly
+        $error("bist_space_compactor: no default POLY for WIDTH %0d, set POLY", WIDTH);
+    end
+
+endmodule
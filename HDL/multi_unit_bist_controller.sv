@@ -0,0 +1,352 @@
+// Module: multi_unit_bist_controller.sv
+// Description: Shared runtime BIST controller for N identical datapaths
+//              (ALU instances / lockstep cores). One LFSR is broadcast to all
+//              units; every unit has its own idle detector and MISR.
+//
+//              Scheduler: a session enrols every enabled unit that is idle
+//              when it starts. Enrolled units run in lockstep on the
+//              broadcast patterns; a unit whose system requests the datapath
+//              drops out of the session (abort for that unit only) while the
+//              others continue. The drop-out is combinational: the unit's
+//              operands and MISR are released in the request cycle (zero-cycle
+//              handover), and the LFSR and cycle counter hold when the request
+//              drops the last enrolled unit. Units that become idle mid-session join the
+//              next one. The session is abandoned when no unit is left.
+//
+//              Register map (byte offsets), shared part as runtime_bist_controller:
+//                0x00 CTRL        [0] enable, [1] golden from bist_golden_pkg table
+//                0x04 STATUS      [0] busy, [1] any unit failed, [2] any unit passed
+//                0x08 THRESHOLD   idle cycles before a unit can be enrolled
+//                0x0C GOLDEN_SIG  expected signature when CTRL[1] = 0
+//                0x14 CFG         [1:0] length (32 << len_sel), [3:2] operator mix
+//                0x20 SEED        LFSR seed loaded at every session start
+//                0x28 IRQ_EN      [0] done, [1] fail, [2] abort
+//                0x2C IRQ_STATUS  same bits, write-1-to-clear
+//                0x30 UNIT_EN     units taking part in BIST (reset: all)
+//                0x34 UNIT_PASS   per-unit result of its last completed session
+//                0x38 UNIT_FAIL   per-unit result of its last completed session
+//                0x3C UNIT_ACTIVE units enrolled in the running session
+//                0x40 + 4*u       UNIT_SIG[u]   MISR signature of unit u (kept while
+//                                 the unit is not enrolled)
+//                0x60 + 4*u       UNIT_COUNT[u] [15:0] completed, [31:16] aborted sessions
+
+module multi_unit_bist_controller import bist_golden_pkg::*; #(
+    parameter int N_UNITS    = 4,   // 1..8
+    parameter int DATA_WIDTH = 32
+)(
+    input  logic                                clk,
+    input  logic                                rst_n,
+
+    // --- System Interface (one lane per unit) ---
+    input  logic [N_UNITS-1:0]                  sys_req_valid,
+    output logic [N_UNITS-1:0]                  bist_active_mode,
+    input  logic [N_UNITS-1:0][DATA_WIDTH-1:0]  dut_result_in,
+
+    // --- BIST Interface (broadcast) ---
+    output logic [DATA_WIDTH-1:0]               bist_pattern_out,
+    output logic [1:0]                          bist_op_mode,
+
+    // --- APB Interface ---
+    input  logic [31:0]                         paddr,
+    input  logic                                psel,
+    input  logic                                penable,
+    input  logic                                pwrite,
+    input  logic [31:0]                         pwdata,
+    output logic [31:0]                         prdata,
+    output logic                                pready,
+
+    output logic                                error_irq,
+    output logic                                bist_irq
+);
+
+    // --- Internal Signals ---
+    logic [7:0]  reg_addr;
+    logic [31:0] reg_wdata;
+    logic        reg_write_en;
+    logic [31:0] reg_rdata_mux;
+
+    // --- Shared Registers ---
+    logic [31:0] reg_ctrl;
+    logic [31:0] reg_threshold;
+    logic [31:0] reg_golden_sig;
+    logic [3:0]  reg_cfg;
+    logic [31:0] reg_seed;
+    logic [2:0]  reg_irq_en;
+    logic [2:0]  reg_irq_status;
+    logic [N_UNITS-1:0] reg_unit_en;
+
+    // --- Per-Unit State ---
+    logic [N_UNITS-1:0] idle_detected;
+    logic [N_UNITS-1:0] enrolled;
+    logic [N_UNITS-1:0] unit_pass, unit_fail;
+    logic [N_UNITS-1:0] candidates, dropping, staying;
+    logic [N_UNITS-1:0] misr_en;
+    logic [DATA_WIDTH-1:0] unit_sig [N_UNITS];
+    logic [15:0] unit_done_cnt  [N_UNITS];
+    logic [15:0] unit_abort_cnt [N_UNITS];
+
+    logic        lfsr_en, lfsr_seed_load, misr_clear;
+    logic [7:0]  test_cycle_cnt;
+    logic [7:0]  session_last;
+    logic [31:0] golden_expected;
+
+    typedef enum logic [2:0] {
+        IDLE,
+        WAIT_FOR_SLOT,
+        RUN_TEST,
+        CHECK_RESULT,
+        ABORT
+    } state_t;
+
+    state_t state, next_state;
+
+    // 1. APB INSTANCE
+    apb_slave_if #(.ADDR_WIDTH(32), .DATA_WIDTH(32)) u_apb_if (
+        .clk(clk), .rst_n(rst_n),
+        .paddr(paddr), .psel(psel), .penable(penable),
+        .pwrite(pwrite), .pwdata(pwdata), .prdata(prdata), .pready(pready), .pslverr(),
+        .reg_addr(reg_addr), .reg_wdata(reg_wdata), .reg_write_en(reg_write_en),
+        .reg_read_en(), .reg_rdata(reg_rdata_mux)
+    );
+
+    // 2. REGISTERS
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            reg_ctrl       <= '0;
+            reg_threshold  <= 32'd100;
+            reg_golden_sig <= 32'hFFFF_FFFF;
+            reg_cfg        <= 4'b0011;
+            reg_seed       <= GOLDEN_SEED;
+            reg_irq_en     <= '0;
+            reg_unit_en    <= '1;
+        end else if (reg_write_en) begin
+            case (reg_addr)
+                8'h00: reg_ctrl       <= reg_wdata;
+                8'h08: reg_threshold  <= reg_wdata;
+                8'h0C: reg_golden_sig <= reg_wdata;
+                8'h14: reg_cfg        <= reg_wdata[3:0];
+                8'h20: reg_seed       <= reg_wdata;
+                8'h28: reg_irq_en     <= reg_wdata[2:0];
+                8'h30: reg_unit_en    <= reg_wdata[N_UNITS-1:0];
+            endcase
+        end
+    end
+
+    assign golden_expected = reg_ctrl[1] ? golden_rom({GOLDEN_SLOT_W'(0), reg_cfg}) : reg_golden_sig;
+    assign bist_op_mode    = reg_cfg[3:2];
+    assign session_last    = 8'((32 << reg_cfg[1:0]) - 1);
+
+    // READ MUX
+    always_comb begin
+        reg_rdata_mux = 32'h0;
+        case (reg_addr)
+            8'h00: reg_rdata_mux = reg_ctrl;
+            8'h04: reg_rdata_mux = {29'h0, |unit_pass, |unit_fail, (state == RUN_TEST)};
+            8'h08: reg_rdata_mux = reg_threshold;
+            8'h0C: reg_rdata_mux = reg_golden_sig;
+            8'h14: reg_rdata_mux = {28'h0, reg_cfg};
+            8'h20: reg_rdata_mux = reg_seed;
+            8'h28: reg_rdata_mux = {29'h0, reg_irq_en};
+            8'h2C: reg_rdata_mux = {29'h0, reg_irq_status};
+            8'h30: reg_rdata_mux = 32'(reg_unit_en);
+            8'h34: reg_rdata_mux = 32'(unit_pass);
+            8'h38: reg_rdata_mux = 32'(unit_fail);
+            8'h3C: reg_rdata_mux = 32'(enrolled);
+            default: begin
+                for (int u = 0; u < N_UNITS; u++) begin
+                    if (reg_addr == 8'(8'h40 + 4 * u)) reg_rdata_mux = 32'(unit_sig[u]);
+                    if (reg_addr == 8'(8'h60 + 4 * u)) reg_rdata_mux = {unit_abort_cnt[u], unit_done_cnt[u]};
+                end
+            end
+        endcase
+    end
+
+    // 3. SUB-MODULES
+    lfsr_gen u_lfsr (
+        .clk(clk), .rst_n(rst_n), .enable(lfsr_en),
+        .seed_load(lfsr_seed_load), .seed_data(reg_seed), .pattern_out(bist_pattern_out)
+    );
+
+    generate
+        for (genvar u = 0; u < N_UNITS; u++) begin : g_unit
+            idle_detector #(.TIMER_WIDTH(32)) u_idle_det (
+                .clk(clk), .rst_n(rst_n), .system_valid(sys_req_valid[u]),
+                .threshold(reg_threshold), .idle_trigger(idle_detected[u])
+            );
+
+            // Only enrolled units start a new signature; the others keep
+            // UNIT_SIG of their last session for diagnosis
+            misr_analyzer #(.WIDTH(DATA_WIDTH)) u_misr (
+                .clk(clk), .rst_n(rst_n), .enable(misr_en[u]), .clear(misr_clear && enrolled[u]),
+                .dut_response(dut_result_in[u]), .signature(unit_sig[u])
+            );
+        end
+    endgenerate
+
+    // 4. SCHEDULER FSM
+    assign candidates = reg_unit_en & idle_detected & ~sys_req_valid;
+    assign dropping   = enrolled & sys_req_valid;
+    assign staying    = enrolled & ~sys_req_valid;
+
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) state <= IDLE;
+        else state <= next_state;
+    end
+
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) test_cycle_cnt <= 0;
+        else if (state == RUN_TEST) begin
+            if (staying != '0) test_cycle_cnt <= test_cycle_cnt + 1;
+        end
+        else test_cycle_cnt <= 0;
+    end
+
+    always_comb begin
+        next_state       = state;
+        lfsr_en          = 0;
+        lfsr_seed_load   = 0;
+        misr_clear       = 0;
+        misr_en          = '0;
+        bist_active_mode = '0;
+
+        case (state)
+            IDLE: begin
+                if (reg_ctrl[0]) next_state = WAIT_FOR_SLOT;
+            end
+
+            WAIT_FOR_SLOT: begin
+                if (!reg_ctrl[0]) next_state = IDLE;
+                else if (|candidates) next_state = RUN_TEST;
+            end
+
+            RUN_TEST: begin
+                // A requesting unit gets its datapath back in the request cycle
+                bist_active_mode = staying;
+                lfsr_en = (staying != '0);
+                misr_en = staying;
+                if (test_cycle_cnt == 0 && staying != '0) begin
+                    misr_clear = 1;
+                    lfsr_seed_load = 1;
+                end
+
+                if (staying == '0) begin
+                    next_state = ABORT;
+                end else if (test_cycle_cnt >= session_last) begin
+                    next_state = CHECK_RESULT;
+                end
+            end
+
+            CHECK_RESULT: begin
+                next_state = IDLE;
+            end
+
+            ABORT: begin
+                next_state = WAIT_FOR_SLOT;
+            end
+
+            default: next_state = IDLE;
+        endcase
+    end
+
+    // 5. PER-UNIT ENROLMENT, RESULTS AND COUNTERS
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            enrolled  <= '0;
+            unit_pass <= '0;
+            unit_fail <= '0;
+            for (int u = 0; u < N_UNITS; u++) begin
+                unit_done_cnt[u]  <= '0;
+                unit_abort_cnt[u] <= '0;
+            end
+        end else begin
+            if (state == WAIT_FOR_SLOT && next_state == RUN_TEST) begin
+                enrolled <= candidates;
+            end else if (state == RUN_TEST) begin
+                enrolled <= enrolled & ~sys_req_valid;
+                for (int u = 0; u < N_UNITS; u++)
+                    if (dropping[u]) unit_abort_cnt[u] <= unit_abort_cnt[u] + 1'b1;
+            end else if (state == CHECK_RESULT) begin
+                for (int u = 0; u < N_UNITS; u++) begin
+                    if (enrolled[u]) begin
+                        unit_done_cnt[u] <= unit_done_cnt[u] + 1'b1;
+                        unit_pass[u] <= (unit_sig[u] == golden_expected);
+                        unit_fail[u] <= (unit_sig[u] != golden_expected);
+                    end
+                end
+                enrolled <= '0;
+            end else begin
+                enrolled <= '0;
+            end
+        end
+    end
+
+    assign error_irq = |unit_fail;
+
+    // Interrupt Status (W1C): set wins over clear
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            reg_irq_status <= '0;
+        end else begin
+            if (reg_write_en && reg_addr == 8'h2C)
+                reg_irq_status <= reg_irq_status & ~reg_wdata[2:0];
+            if (state == CHECK_RESULT) begin
+                reg_irq_status[0] <= 1'b1;
+                for (int u = 0; u < N_UNITS; u++)
+                    if (enrolled[u] && unit_sig[u] != golden_expected) reg_irq_status[1] <= 1'b1;
+            end
+            if (state == RUN_TEST && dropping != '0) reg_irq_status[2] <= 1'b1;
+        end
+    end
+
+    assign bist_irq = |(reg_irq_status & reg_irq_en);
+
+    // =========================================================================
+    // 6. SYSTEMVERILOG ASSERTIONS (Vivado/Questa Only)
+    // =========================================================================
+`ifndef __ICARUS__
+    // synthesis translate_off
+    generate
+        for (genvar u = 0; u < N_UNITS; u++) begin : g_sva
+            a_safety_check: assert property (
+                @(posedge clk) disable iff (!rst_n)
+                sys_req_valid[u] |-> !bist_active_mode[u])
+            else $error("[SVA ERROR] Safety Violation on unit %0d!", u);
+
+            // The request cycle is never compacted into the unit's signature
+            a_handover_mask: assert property (
+                @(posedge clk) disable iff (!rst_n)
+                sys_req_valid[u] |-> !misr_en[u])
+            else $error("[SVA ERROR] MISR of unit %0d updated during a system request!", u);
+        end
+    endgenerate
+    // synthesis translate_on
+`endif
+
+    // =========================================================================
+    // 7. WINDOWED WAVEFORM DUMP (Simulation Only, Tools/wave_window.py)
+    // =========================================================================
+    // Built with +define+BIST_WAVE_WINDOW. Dumps this controller's hierarchy
+    // into +bist_wave_file from +bist_wave_start (ns) on; without the plusarg
+    // nothing is dumped.
+`ifdef BIST_WAVE_WINDOW
+    // synthesis translate_off
+    string           wave_file;
+    longint unsigned wave_start = 0;
+    bit              wave_armed = 1'b0;
+
+    initial begin
+        wave_armed = $value$plusargs("bist_wave_file=%s", wave_file);
+        void'($value$plusargs("bist_wave_start=%d", wave_start));
+    end
+
+    always @(posedge clk) begin
+        if (wave_armed && $time >= wave_start) begin
+            $dumpfile(wave_file);
+            $dumpvars(0, multi_unit_bist_controller);
+            wave_armed = 1'b0;
+        end
+    end
+    // synthesis translate_on
+`endif
+
+endmodule
@@ -0,0 +1,90 @@
+"""
+Streaming toggle-activity monitor for ibex_alu_bist_wrapper.
+
+Samples the ALU operand buses (after the BIST input mux), result_o and the
+controller's LFSR and MISR registers once per clock, in the read-only phase
+after the falling edge, and feeds them to ToggleCounter
+(Tools/power_model.py): one packed XOR + popcount per cycle, counts per
+mode, constant memory. Modes:
+
+    bist    the controller drives the ALU (bist_active)
+    idle    core_sleep_i and the ALU is not under test
+    normal  everything else (functional traffic)
+
+    mon = ActivityMonitor(dut, weights={"result": 1.6}).start()
+    ...
+    mon.log_report()                  # per-mode toggle rates and energy
+    mon.counter.report()["bist"]      # {cycles, toggles, rate, energy, energy_per_cycle}
+
+`classify(dut) -> mode` replaces the default mode decoding (its modes must
+be passed in `modes`).
+"""
+import cocotb
+from cocotb.triggers import FallingEdge, ReadOnly
+
+from power_model import FIELDS, MODES, ToggleCounter
+
+# ToggleCounter field -> path inside ibex_alu_bist_wrapper
+SIGNALS = {
+    "operand_a": "alu_operand_a_mux",
+    "operand_b": "alu_operand_b_mux",
+    "result": "result_o",
+    "lfsr": "u_bist_ctrl.u_lfsr.lfsr_reg",
+    "misr": "u_bist_ctrl.u_misr.misr_reg",
+}
+
+
+def _resolve(handle, path):
+    for part in path.split("."):
+        handle = getattr(handle, part)
+    return handle
+
+
+class ActivityMonitor:
+    """Per-cycle toggle counting of one wrapper instance."""
+
+    def __init__(self, dut, weights=None, classify=None, modes=MODES):
+        self.dut = dut
+        self.clk = dut.clk_i
+        self.counter = ToggleCounter(FIELDS, weights, modes)
+        self.classify = classify
+        self.task = None
+        # Handles are looked up once, not per cycle
+        self._handles = [(_resolve(dut, SIGNALS[name]), pos) for name, pos, _ in self.counter.offsets]
+        self._active = dut.bist_active
+        self._sleep = dut.core_sleep_i
+
+    def start(self):
+        self.task = cocotb.start_soon(self._run())
+        return self
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+
+    def _mode(self):
+        if int(self._active.value):
+            return "bist"
+        return "idle" if int(self._sleep.value) else "normal"
+
+    async def _run(self):
+        counter = self.counter
+        handles = self._handles
+        classify = self.classify
+        while True:
+            await FallingEdge(self.clk)
+            await ReadOnly()
+            word = 0
+            for handle, pos in handles:
+                word |= int(handle.value) << pos
+            counter.sample(word, classify(self.dut) if classify else self._mode())
+
+    def log_report(self):
+        report = self.counter.report()
+        names = [name for name, _ in self.counter.fields]
+        self.dut._log.info(f"   {'MODE':<8} {'CYCLES':>7} " + " ".join(f"{n:>9}" for n in names) +
+                           f" {'E/CYCLE':>8} {'ENERGY':>9}")
+        for mode, r in report.items():
+            self.dut._log.info(f"   {mode:<8} {r['cycles']:>7} " + " ".join(f"{r['rate'][n]:>9.2f}" for n in names) +
+                               f" {r['energy_per_cycle']:>8.2f} {r['energy']:>9.0f}")
+        return report
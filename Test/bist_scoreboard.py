@@ -0,0 +1,200 @@
+"""
+Lockstep scoreboard for runtime_bist_controller.
+
+Runs BistControllerModel (Tools/bist_ctrl_model.py) next to a controller
+instance and compares FSM state, cycle counter, bist_active_mode, pattern,
+signature, STATUS, the rate-limit budget and the interrupt state on every clock. Each side is
+packed into one integer per cycle, so a matching cycle costs a single
+compare; on a mismatch the XOR of the two words is decoded into the
+diverging fields.
+
+The model is loaded from the RTL registers when reset is released, so the
+scoreboard can be attached to any testbench that instantiates the
+controller (the controller itself, or u_bist_ctrl inside the wrapper).
+Inputs are sampled from the instance ports in the read-only phase after
+the falling edge, where every testbench in Test/ has already driven them.
+
+    sb = BistScoreboard(dut).start()                       # runtime_bist_controller toplevel
+    sb = BistScoreboard(dut.u_bist_ctrl, clk=dut.clk_i).start()
+
+The first diverging cycle raises AssertionError (failing the test) with the
+last `context` cycles of inputs and state.
+"""
+from collections import deque
+
+import cocotb
+from cocotb.triggers import FallingEdge, ReadOnly
+from cocotb.utils import get_sim_time
+
+from bist_ctrl_model import STATE_NAMES, BistControllerModel
+
+# Model attribute -> RTL path inside runtime_bist_controller (copied into the model at reset release)
+STATE_PATHS = {
+    "reg_ctrl": "reg_ctrl",
+    "reg_threshold": "reg_threshold",
+    "reg_golden_sig": "reg_golden_sig",
+    "reg_cfg": "reg_cfg",
+    "reg_gtbl_idx": "reg_gtbl_idx",
+    "reg_seed": "reg_seed",
+    "reg_irq_en": "reg_irq_en",
+    "reg_chkpt": "reg_chkpt",
+    "reg_min_interval": "reg_min_interval",
+    "reg_budget_window": "reg_budget_window",
+    "reg_budget": "reg_budget",
+    "interval_cnt": "interval_cnt",
+    "window_cnt": "window_cnt",
+    "budget_used": "budget_used",
+    "seed_slot": "seed_slot",
+    "rot_seed": "rot_seed",
+    "idle_counter": "u_idle_det.idle_counter",
+    "idle_trigger": "u_idle_det.idle_trigger",
+    "lfsr": "u_lfsr.lfsr_reg",
+    "misr": "u_misr.misr_reg",
+    "state": "state",
+    "test_cycle_cnt": "test_cycle_cnt",
+    "reg_status": "reg_status",
+    "reg_chkpt_status": "reg_chkpt_status",
+    "error_irq": "error_irq",
+    "reg_irq_status": "reg_irq_status",
+}
+
+# Compared every cycle: (field, width, RTL path, model attribute)
+FIELDS = (
+    ("state", 3, "state", "state"),
+    ("test_cycle_cnt", 8, "test_cycle_cnt", "test_cycle_cnt"),
+    ("bist_active_mode", 1, "bist_active_mode", "bist_active_mode"),
+    ("status", 32, "reg_status", "reg_status"),
+    ("chkpt_status", 9, "reg_chkpt_status", "reg_chkpt_status"),
+    ("error_irq", 1, "error_irq", "error_irq"),
+    ("irq_status", 3, "reg_irq_status", "reg_irq_status"),
+    ("bist_irq", 1, "bist_irq", "bist_irq"),
+    ("seed_slot", 2, "seed_slot", "seed_slot"),
+    ("budget_used", 32, "budget_used", "budget_used"),
+    ("pattern", 32, "bist_pattern_out", "bist_pattern_out"),
+    ("signature", 32, "u_misr.misr_reg", "misr"),
+)
+
+INPUTS = ("sys_req_valid", "dut_result_in", "psel", "penable", "pwrite", "paddr", "pwdata")
+
+
+def _resolve(handle, path):
+    for part in path.split("."):
+        handle = getattr(handle, part)
+    return handle
+
+
+def _field_offsets():
+    offsets, pos = [], 0
+    for name, width, _, _ in FIELDS:
+        offsets.append((name, pos, (1 << width) - 1))
+        pos += width
+    return offsets
+
+
+class BistScoreboard:
+    """Per-cycle RTL vs. BistControllerModel comparison for one controller instance."""
+
+    OFFSETS = _field_offsets()
+
+    def __init__(self, ctrl, clk=None, rst_n=None, context=8, raise_on_divergence=True, golden_table_ram=False):
+        self.ctrl = ctrl
+        self.clk = clk if clk is not None else ctrl.clk
+        self.rst_n = rst_n if rst_n is not None else ctrl.rst_n
+        self.log = ctrl._log
+        self.model = BistControllerModel(golden_table_ram)
+        self.raise_on_divergence = raise_on_divergence
+        self.history = deque(maxlen=context)
+        self.cycles = 0
+        self.divergence = None
+        self.task = None
+        # Handles are looked up once, not per cycle
+        self._state = [(attr, _resolve(ctrl, path)) for attr, path in STATE_PATHS.items()]
+        self._fields = [(_resolve(ctrl, path), attr, pos) for (_, _, path, attr), (_, pos, _) in
+                        zip(FIELDS, self.OFFSETS)]
+        self._inputs = [(name, getattr(ctrl, name)) for name in INPUTS]
+
+    def start(self):
+        self.task = cocotb.start_soon(self._run())
+        return self
+
+    def _pack_rtl(self):
+        word = 0
+        for handle, _, pos in self._fields:
+            word |= int(handle.value) << pos
+        return word
+
+    def _pack_model(self):
+        model = self.model
+        word = 0
+        for _, attr, pos in self._fields:
+            word |= getattr(model, attr) << pos
+        return word
+
+    def _sync(self):
+        for attr, handle in self._state:
+            setattr(self.model, attr, int(handle.value))
+
+    @classmethod
+    def unpack(cls, word):
+        return {name: (word >> pos) & mask for name, pos, mask in cls.OFFSETS}
+
+    @classmethod
+    def _row(cls, cycle, inputs, word):
+        i = dict(zip(INPUTS, inputs))
+        f = cls.unpack(word)
+        write = i["psel"] and i["penable"] and i["pwrite"]
+        return (f"{cycle:>7} {STATE_NAMES[f['state']] if f['state'] < len(STATE_NAMES) else f['state']:<13} "
+                f"{f['test_cycle_cnt']:>3} {i['sys_req_valid']:>3} {f['bist_active_mode']:>3} "
+                f"0x{f['pattern']:08X} 0x{i['dut_result_in']:08X} 0x{f['signature']:08X} 0x{f['status']:X} "
+                f"{f['error_irq']}{f['bist_irq']}  {'W' if write else '-'}{i['paddr'] & 0xFF:02X}")
+
+    def report(self):
+        """Compact dump of the first divergence (None if the RTL and model agreed throughout)."""
+        if self.divergence is None:
+            return None
+        d = self.divergence
+        lines = [f"First divergence at cycle {d['cycle']} ({d['time_ns']:.0f} ns):"]
+        lines += [f"  {name:<16} RTL {'X' if got < 0 else f'0x{got:X}'}  model 0x{exp:X}"
+                  for name, (got, exp) in d["fields"].items()]
+        lines.append(f"  {'cycle':>7} {'state':<13} {'cnt':>3} {'sys':>3} {'act':>3} {'pattern':<10} "
+                     f"{'dut_result':<10} {'signature':<10} STS IRQ APB")
+        lines += ["  " + self._row(*h) for h in d["context"]]
+        return "\n".join(lines)
+
+    async def _run(self):
+        synced = False
+        model = self.model
+        while True:
+            await FallingEdge(self.clk)
+            await ReadOnly()
+            if not int(self.rst_n.value):
+                synced = False
+                continue
+            inputs = tuple(int(handle.value) for _, handle in self._inputs)
+            try:
+                rtl = self._pack_rtl()
+            except ValueError:
+                rtl = None  # X/Z in a compared field
+            model.sys_req_valid = inputs[0]  # bist_active_mode is bypassed by the current request
+            if not synced:
+                self._sync()
+                synced = True
+            elif rtl != self._pack_model():
+                self._diverged(inputs, rtl)
+                return
+            self.history.append((self.cycles, inputs, rtl))
+            model.step(*inputs)
+            self.cycles += 1
+
+    def _diverged(self, inputs, rtl):
+        expected = self._pack_model()
+        exp_fields = self.unpack(expected)
+        got = self.unpack(rtl) if rtl is not None else {}
+        fields = {name: (got.get(name, -1), exp) for name, exp in exp_fields.items() if got.get(name) != exp}
+        self.history.append((self.cycles, inputs, rtl if rtl is not None else expected))
+        self.divergence = {"cycle": self.cycles, "time_ns": get_sim_time(unit="ns"), "fields": fields,
+                           "context": list(self.history)}
+        message = self.report()
+        self.log.error(message)
+        if self.raise_on_divergence:
+            raise AssertionError(message)
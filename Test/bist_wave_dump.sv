@@ -0,0 +1,34 @@
+// Module: bist_wave_dump.sv
+// Description: Windowed toplevel waveform dump (Tools/wave_window.py) for the
+//              cocotb targets without a BIST controller (test_lfsr, test_misr,
+//              test_alu, ...). Same plusargs as the controllers'
+//              BIST_WAVE_WINDOW block: dumps the whole toplevel into
+//              +bist_wave_file from the first clock edge at or after
+//              +bist_wave_start (ns). Test/makefile compiles it with
+//              WAVE_WINDOW=1 and defines BIST_WAVE_TOP (toplevel module) and
+//              BIST_WAVE_CLK (its clock port). Icarus elaborates it as a second
+//              root (-s bist_wave_dump); Verilator, which builds a single top,
+//              binds it into the toplevel.
+
+module bist_wave_dump;
+    string           wave_file;
+    longint unsigned wave_start = 0;
+    bit              wave_armed = 1'b0;
+
+    initial begin
+        wave_armed = $value$plusargs("bist_wave_file=%s", wave_file);
+        void'($value$plusargs("bist_wave_start=%d", wave_start));
+    end
+
+    always @(posedge `BIST_WAVE_TOP.`BIST_WAVE_CLK) begin
+        if (wave_armed && $time >= wave_start) begin
+            $dumpfile(wave_file);
+            $dumpvars(0, `BIST_WAVE_TOP);
+            wave_armed = 1'b0;
+        end
+    end
+endmodule
+
+`ifdef VERILATOR
+bind `BIST_WAVE_TOP bist_wave_dump u_bist_wave_dump ();
+`endif
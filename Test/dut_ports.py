@@ -0,0 +1,553 @@
+"""
+Port bundles of the cocotb toplevels (see Tools/port_bundles.py).
+GENERATED by Tools/port_bundles.py -- do not edit by hand.
+"""
+from port_bundles import PortBundle
+
+
+class LfsrGenPorts(PortBundle):
+    """lfsr_gen (HDL/lfsr_gen.sv)."""
+    MODULE = 'lfsr_gen'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'enable': 1,
+        'seed_load': 1,
+        'seed_data': 32,
+    }
+    OUTPUTS = {
+        'pattern_out': 32,
+    }
+    GROUPS = {}
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'enable',
+        'seed_load',
+        'seed_data',
+        'pattern_out',
+    )
+
+
+class MisrAnalyzerPorts(PortBundle):
+    """misr_analyzer (HDL/misr_analyzer.sv)."""
+    MODULE = 'misr_analyzer'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'enable': 1,
+        'clear': 1,
+        'dut_response': 32,
+    }
+    OUTPUTS = {
+        'signature': 32,
+    }
+    GROUPS = {}
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'enable',
+        'clear',
+        'dut_response',
+        'signature',
+    )
+
+
+class LfsrGenKstepPorts(PortBundle):
+    """lfsr_gen_kstep (HDL/lfsr_gen_kstep.sv)."""
+    MODULE = 'lfsr_gen_kstep'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'enable': 1,
+        'seed_load': 1,
+        'seed_data': 32,
+    }
+    OUTPUTS = {
+        'pattern_out': 128,
+    }
+    GROUPS = {}
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'enable',
+        'seed_load',
+        'seed_data',
+        'pattern_out',
+    )
+
+
+class MisrAnalyzerKstepPorts(PortBundle):
+    """misr_analyzer_kstep (HDL/misr_analyzer_kstep.sv)."""
+    MODULE = 'misr_analyzer_kstep'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'enable': 1,
+        'clear': 1,
+        'dut_response': 128,
+    }
+    OUTPUTS = {
+        'signature': 32,
+    }
+    GROUPS = {}
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'enable',
+        'clear',
+        'dut_response',
+        'signature',
+    )
+
+
+class IdleDetectorPorts(PortBundle):
+    """idle_detector (HDL/idle_detector.sv)."""
+    MODULE = 'idle_detector'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'system_valid': 1,
+        'threshold': 16,
+    }
+    OUTPUTS = {
+        'idle_trigger': 1,
+    }
+    GROUPS = {}
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'system_valid',
+        'threshold',
+        'idle_trigger',
+    )
+
+
+class ApbSlaveIfPorts(PortBundle):
+    """apb_slave_if (HDL/apb_slave_if.sv)."""
+    MODULE = 'apb_slave_if'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'paddr': 32,
+        'psel': 1,
+        'penable': 1,
+        'pwrite': 1,
+        'pwdata': 32,
+        'reg_rdata': 32,
+    }
+    OUTPUTS = {
+        'prdata': 32,
+        'pready': 1,
+        'pslverr': 1,
+        'reg_addr': 8,
+        'reg_wdata': 32,
+        'reg_write_en': 1,
+        'reg_read_en': 1,
+    }
+    GROUPS = {
+        'apb': ('paddr', 'psel', 'penable', 'pwrite', 'pwdata'),
+    }
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'paddr',
+        'psel',
+        'penable',
+        'pwrite',
+        'pwdata',
+        'reg_rdata',
+        'prdata',
+        'pready',
+        'pslverr',
+        'reg_addr',
+        'reg_wdata',
+        'reg_write_en',
+        'reg_read_en',
+    )
+
+
+class IbexAluPorts(PortBundle):
+    """ibex_alu (HDL/ibex_alu.sv)."""
+    MODULE = 'ibex_alu'
+    CLOCK = 'clk_i'
+    INPUTS = {
+        'rst_ni': 1,
+        'operator_i': 7,
+        'operand_a_i': 32,
+        'operand_b_i': 32,
+        'instr_first_cycle_i': 1,
+        'imd_val_q_i_0': 32,
+        'imd_val_q_i_1': 32,
+        'multdiv_operand_a_i': 32,
+        'multdiv_operand_b_i': 32,
+        'multdiv_sel_i': 1,
+    }
+    OUTPUTS = {
+        'imd_val_d_o_0': 32,
+        'imd_val_d_o_1': 32,
+        'imd_val_we_o': 2,
+        'adder_result_o': 32,
+        'adder_result_ext_o': 34,
+        'result_o': 32,
+        'comparison_result_o': 1,
+        'is_equal_result_o': 1,
+    }
+    GROUPS = {
+        'imd': ('imd_val_q_i_0', 'imd_val_q_i_1'),
+        'operands': ('operator_i', 'operand_a_i', 'operand_b_i', 'multdiv_operand_a_i', 'multdiv_operand_b_i'),
+    }
+    __slots__ = (
+        'clk_i',
+        'rst_ni',
+        'operator_i',
+        'operand_a_i',
+        'operand_b_i',
+        'instr_first_cycle_i',
+        'imd_val_q_i_0',
+        'imd_val_q_i_1',
+        'multdiv_operand_a_i',
+        'multdiv_operand_b_i',
+        'multdiv_sel_i',
+        'imd_val_d_o_0',
+        'imd_val_d_o_1',
+        'imd_val_we_o',
+        'adder_result_o',
+        'adder_result_ext_o',
+        'result_o',
+        'comparison_result_o',
+        'is_equal_result_o',
+    )
+
+
+class IbexMultdivFastPorts(PortBundle):
+    """ibex_multdiv_fast (HDL/ibex_multdiv_fast.sv)."""
+    MODULE = 'ibex_multdiv_fast'
+    CLOCK = 'clk_i'
+    INPUTS = {
+        'rst_ni': 1,
+        'mult_en_i': 1,
+        'div_en_i': 1,
+        'mult_sel_i': 1,
+        'div_sel_i': 1,
+        'operator_i': 2,
+        'signed_mode_i': 2,
+        'op_a_i': 32,
+        'op_b_i': 32,
+        'alu_adder_ext_i': 32,
+        'alu_adder_i': 32,
+        'equal_to_zero_i': 1,
+        'data_ind_timing_i': 1,
+        'imd_val_q_i_0': 34,
+        'imd_val_q_i_1': 34,
+    }
+    OUTPUTS = {
+        'alu_operand_a_o': 32,
+        'alu_operand_b_o': 32,
+        'multdiv_result_o': 32,
+        'valid_o': 1,
+        'multdiv_ready_id_o': 1,
+        'imd_val_d_o_0': 34,
+        'imd_val_d_o_1': 34,
+        'imd_val_we_o': 2,
+    }
+    GROUPS = {
+        'imd': ('imd_val_q_i_0', 'imd_val_q_i_1'),
+        'operands': ('operator_i',),
+    }
+    __slots__ = (
+        'clk_i',
+        'rst_ni',
+        'mult_en_i',
+        'div_en_i',
+        'mult_sel_i',
+        'div_sel_i',
+        'operator_i',
+        'signed_mode_i',
+        'op_a_i',
+        'op_b_i',
+        'alu_adder_ext_i',
+        'alu_adder_i',
+        'equal_to_zero_i',
+        'data_ind_timing_i',
+        'imd_val_q_i_0',
+        'imd_val_q_i_1',
+        'alu_operand_a_o',
+        'alu_operand_b_o',
+        'multdiv_result_o',
+        'valid_o',
+        'multdiv_ready_id_o',
+        'imd_val_d_o_0',
+        'imd_val_d_o_1',
+        'imd_val_we_o',
+    )
+
+
+class RuntimeBistControllerPorts(PortBundle):
+    """runtime_bist_controller (HDL/runtime_bist_controller.sv)."""
+    MODULE = 'runtime_bist_controller'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'sys_req_valid': 1,
+        'dut_result_in': 32,
+        'paddr': 32,
+        'psel': 1,
+        'penable': 1,
+        'pwrite': 1,
+        'pwdata': 32,
+    }
+    OUTPUTS = {
+        'bist_active_mode': 1,
+        'bist_pattern_out': 32,
+        'bist_op_mode': 2,
+        'prdata': 32,
+        'pready': 1,
+        'error_irq': 1,
+        'bist_irq': 1,
+    }
+    GROUPS = {
+        'apb': ('paddr', 'psel', 'penable', 'pwrite', 'pwdata'),
+    }
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'sys_req_valid',
+        'dut_result_in',
+        'paddr',
+        'psel',
+        'penable',
+        'pwrite',
+        'pwdata',
+        'bist_active_mode',
+        'bist_pattern_out',
+        'bist_op_mode',
+        'prdata',
+        'pready',
+        'error_irq',
+        'bist_irq',
+    )
+
+
+class MultiUnitBistControllerPorts(PortBundle):
+    """multi_unit_bist_controller (HDL/multi_unit_bist_controller.sv)."""
+    MODULE = 'multi_unit_bist_controller'
+    CLOCK = 'clk'
+    INPUTS = {
+        'rst_n': 1,
+        'sys_req_valid': 4,
+        'dut_result_in': 128,
+        'paddr': 32,
+        'psel': 1,
+        'penable': 1,
+        'pwrite': 1,
+        'pwdata': 32,
+    }
+    OUTPUTS = {
+        'bist_active_mode': 4,
+        'bist_pattern_out': 32,
+        'bist_op_mode': 2,
+        'prdata': 32,
+        'pready': 1,
+        'error_irq': 1,
+        'bist_irq': 1,
+    }
+    GROUPS = {
+        'apb': ('paddr', 'psel', 'penable', 'pwrite', 'pwdata'),
+    }
+    __slots__ = (
+        'clk',
+        'rst_n',
+        'sys_req_valid',
+        'dut_result_in',
+        'paddr',
+        'psel',
+        'penable',
+        'pwrite',
+        'pwdata',
+        'bist_active_mode',
+        'bist_pattern_out',
+        'bist_op_mode',
+        'prdata',
+        'pready',
+        'error_irq',
+        'bist_irq',
+    )
+
+
+class IbexAluBistWrapperPorts(PortBundle):
+    """ibex_alu_bist_wrapper (HDL/ibex_alu_bist_wrapper.sv)."""
+    MODULE = 'ibex_alu_bist_wrapper'
+    CLOCK = 'clk_i'
+    INPUTS = {
+        'rst_ni': 1,
+        'operator_i': 7,
+        'operand_a_i': 32,
+        'operand_b_i': 32,
+        'instr_first_cycle_i': 1,
+        'multdiv_en_i': 1,
+        'imd_val_q_i': 64,
+        'imd_val_we_i': 2,
+        'core_sleep_i': 1,
+        'paddr_i': 32,
+        'psel_i': 1,
+        'penable_i': 1,
+        'pwrite_i': 1,
+        'pwdata_i': 32,
+        'sim_fault_inject_i': 1,
+        'sim_fault_mode_i': 2,
+        'sim_fault_bit_i': 5,
+        'sim_fault_cycle_i': 16,
+    }
+    OUTPUTS = {
+        'adder_result_o': 32,
+        'result_o': 32,
+        'comparison_result_o': 1,
+        'is_equal_result_o': 1,
+        'prdata_o': 32,
+        'pready_o': 1,
+        'bist_error_irq_o': 1,
+        'bist_irq_o': 1,
+    }
+    GROUPS = {
+        'apb': ('paddr_i', 'psel_i', 'penable_i', 'pwrite_i', 'pwdata_i'),
+        'fault': ('sim_fault_inject_i', 'sim_fault_mode_i', 'sim_fault_bit_i', 'sim_fault_cycle_i'),
+        'imd': ('imd_val_q_i', 'imd_val_we_i'),
+        'operands': ('operator_i', 'operand_a_i', 'operand_b_i'),
+    }
+    __slots__ = (
+        'clk_i',
+        'rst_ni',
+        'operator_i',
+        'operand_a_i',
+        'operand_b_i',
+        'instr_first_cycle_i',
+        'multdiv_en_i',
+        'imd_val_q_i',
+        'imd_val_we_i',
+        'core_sleep_i',
+        'paddr_i',
+        'psel_i',
+        'penable_i',
+        'pwrite_i',
+        'pwdata_i',
+        'sim_fault_inject_i',
+        'sim_fault_mode_i',
+        'sim_fault_bit_i',
+        'sim_fault_cycle_i',
+        'adder_result_o',
+        'result_o',
+        'comparison_result_o',
+        'is_equal_result_o',
+        'prdata_o',
+        'pready_o',
+        'bist_error_irq_o',
+        'bist_irq_o',
+    )
+
+
+class IbexExBlockPorts(PortBundle):
+    """ibex_ex_block (HDL/ibex_ex_block.sv)."""
+    MODULE = 'ibex_ex_block'
+    CLOCK = 'clk_i'
+    INPUTS = {
+        'rst_ni': 1,
+        'alu_operator_i': 7,
+        'alu_operand_a_i': 32,
+        'alu_operand_b_i': 32,
+        'alu_instr_first_cycle_i': 1,
+        'multdiv_operator_i': 2,
+        'div_en_i': 1,
+        'mult_sel_i': 1,
+        'div_sel_i': 1,
+        'multdiv_signed_mode_i': 2,
+        'multdiv_operand_a_i': 32,
+        'multdiv_operand_b_i': 32,
+        'multdiv_ready_id_i': 1,
+        'data_ind_timing_i': 1,
+        'bt_a_operand_i': 32,
+        'bt_b_operand_i': 32,
+        'imd_val_q_i_0': 32,
+        'imd_val_q_i_1': 32,
+        'core_sleep_i': 1,
+        'sim_fault_inject_i': 1,
+        'paddr_i': 32,
+        'psel_i': 1,
+        'penable_i': 1,
+        'pwrite_i': 1,
+        'pwdata_i': 32,
+    }
+    OUTPUTS = {
+        'imd_val_we_o': 2,
+        'imd_val_d_o_0': 32,
+        'imd_val_d_o_1': 32,
+        'alu_adder_result_ex_o': 32,
+        'result_ex_o': 32,
+        'branch_target_o': 32,
+        'branch_decision_o': 1,
+        'ex_valid_o': 1,
+        'bist_error_irq_o': 1,
+        'prdata_o': 32,
+        'pready_o': 1,
+    }
+    GROUPS = {
+        'apb': ('paddr_i', 'psel_i', 'penable_i', 'pwrite_i', 'pwdata_i'),
+        'fault': ('sim_fault_inject_i',),
+        'imd': ('imd_val_q_i_0', 'imd_val_q_i_1'),
+        'operands': ('alu_operator_i', 'alu_operand_a_i', 'alu_operand_b_i', 'multdiv_operator_i', 'multdiv_operand_a_i', 'multdiv_operand_b_i', 'bt_a_operand_i', 'bt_b_operand_i'),
+    }
+    __slots__ = (
+        'clk_i',
+        'rst_ni',
+        'alu_operator_i',
+        'alu_operand_a_i',
+        'alu_operand_b_i',
+        'alu_instr_first_cycle_i',
+        'multdiv_operator_i',
+        'div_en_i',
+        'mult_sel_i',
+        'div_sel_i',
+        'multdiv_signed_mode_i',
+        'multdiv_operand_a_i',
+        'multdiv_operand_b_i',
+        'multdiv_ready_id_i',
+        'data_ind_timing_i',
+        'bt_a_operand_i',
+        'bt_b_operand_i',
+        'imd_val_q_i_0',
+        'imd_val_q_i_1',
+        'core_sleep_i',
+        'sim_fault_inject_i',
+        'paddr_i',
+        'psel_i',
+        'penable_i',
+        'pwrite_i',
+        'pwdata_i',
+        'imd_val_we_o',
+        'imd_val_d_o_0',
+        'imd_val_d_o_1',
+        'alu_adder_result_ex_o',
+        'result_ex_o',
+        'branch_target_o',
+        'branch_decision_o',
+        'ex_valid_o',
+        'bist_error_irq_o',
+        'prdata_o',
+        'pready_o',
+    )
+
+
+BUNDLES = {
+    'lfsr_gen': LfsrGenPorts,
+    'misr_analyzer': MisrAnalyzerPorts,
+    'lfsr_gen_kstep': LfsrGenKstepPorts,
+    'misr_analyzer_kstep': MisrAnalyzerKstepPorts,
+    'idle_detector': IdleDetectorPorts,
+    'apb_slave_if': ApbSlaveIfPorts,
+    'ibex_alu': IbexAluPorts,
+    'ibex_multdiv_fast': IbexMultdivFastPorts,
+    'runtime_bist_controller': RuntimeBistControllerPorts,
+    'multi_unit_bist_controller': MultiUnitBistControllerPorts,
+    'ibex_alu_bist_wrapper': IbexAluBistWrapperPorts,
+    'ibex_ex_block': IbexExBlockPorts,
+}
@@ -1,6 +1,6 @@
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer, Event
+from cocotb.triggers import ReadOnly, RisingEdge, Timer, Event
 from cocotb.utils import get_sim_time
 import random
 
@@ -138,7 +138,7 @@ class MonitorAndScoreboard:
         ax2.grid(True, alpha=0.3)
         ax2.set_yticks([0, 1])
         
-        # Highlight Danger Zones (Where both are 1 - Should happen only for 1 cycle before abort)
+        # Highlight Danger Zones (Where both are 1 - Must never happen: the handover is combinational)
         # Using fill_between logic could be added here for advanced analysis
 
         plt.savefig("bist_verification_result.png")
@@ -222,13 +222,12 @@ async def test_professional_scenario(dut):
     # Force traffic while BIST is running
     critical_a = 0xAAAA
     critical_b = 0x5555
-    await sys_drv.send_traffic(critical_a, critical_b)
+    dut.sys_req_valid.value = 1
+    dut.sys_data_a.value = critical_a
+    dut.sys_data_b.value = critical_b
     
-    # Wait 2 cycles for MUX switch and Pipeline
-    await RisingEdge(dut.clk)
-    await RisingEdge(dut.clk)
-    
-    # Check output immediately
+    # Zero-cycle handover: the request cycle itself must carry the system operands
+    await ReadOnly()
     final_res = dut.sys_result_out.value.to_unsigned()
     expected = critical_a + critical_b
     
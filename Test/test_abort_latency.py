@@ -0,0 +1,162 @@
+"""
+Abort-Latency Sweep: runtime_bist_controller / ibex_alu_bist_wrapper — BIST-to-system handover
+Tests: one simulator process runs a list of request arrival times back to back (reset between runs).
+       Each run lets the core sleep, raises the system request (sys_req_valid / core_sleep_i falling)
+       `arrival` cycles later and counts the cycles until the datapath is handed back:
+           controller  bist_active_mode = 0
+           wrapper     the ALU input mux selects the core's operands and result_o is correct
+       Latency 0 means the request cycle itself is served by the core's operands.
+
+Tools/abort_latency.py sweeps every arrival time of a session over parallel simulator processes:
+    ABORT_LATENCY_IN   JSON {"config": {"len_sel", "op_mode", "threshold"}, "arrivals": [int, ...]}
+    ABORT_LATENCY_OUT  JSONL, one result per arrival
+Without ABORT_LATENCY_IN every arrival time of a 32-cycle session runs as a regression test.
+"""
+import json
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+
+from bist_ctrl_model import STATE_NAMES
+from bist_model import ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, OP_MIX, alu_result, config_index, session_length
+from dut_ports import IbexAluBistWrapperPorts, RuntimeBistControllerPorts
+
+CLK_NS = 10
+# Cycles after the request until the handover must have happened (SVA: sys_req_valid |-> !bist_active_mode)
+MAX_HANDOVER_CYCLES = 0
+# Arrivals after the session: CHECK_RESULT, IDLE and the next WAIT_FOR_SLOT
+SLACK_CYCLES = 8
+
+DEFAULT_CONFIG = {"len_sel": 0, "op_mode": OP_MIX, "threshold": 3}
+CORE_OPS = (ALU_ADD, ALU_SUB, ALU_XOR, ALU_SLL)
+
+
+def arrival_range(config):
+    """Every arrival time from the first sleeping cycle to SLACK_CYCLES after the session."""
+    return list(range(1, config["threshold"] + session_length(config["len_sel"]) + SLACK_CYCLES))
+
+
+class ControllerDriver:
+    """runtime_bist_controller toplevel: the request is sys_req_valid."""
+    name = "ctrl"
+
+    def __init__(self, dut):
+        self.ports = RuntimeBistControllerPorts(dut)
+        self.clk, self.rst_n, self.ctrl = self.ports.clk, self.ports.rst_n, dut
+        self.apb = {"addr": self.ports.paddr, "sel": self.ports.psel, "enable": self.ports.penable,
+                    "write": self.ports.pwrite, "wdata": self.ports.pwdata}
+
+    def reset_inputs(self):
+        self.ports.reset_inputs(sys_req_valid=1)
+
+    def request(self, rng, on):
+        self.ports.sys_req_valid.value = int(on)
+
+    def handed_over(self):
+        return not int(self.ports.bist_active_mode.value)
+
+
+class WrapperDriver:
+    """ibex_alu_bist_wrapper toplevel: the request is core_sleep_i falling, with an ALU operation."""
+    name = "wrapper"
+
+    def __init__(self, dut):
+        self.ports = IbexAluBistWrapperPorts(dut)
+        self.clk, self.rst_n, self.ctrl = self.ports.clk_i, self.ports.rst_ni, dut.u_bist_ctrl
+        self.apb = {"addr": self.ports.paddr_i, "sel": self.ports.psel_i, "enable": self.ports.penable_i,
+                    "write": self.ports.pwrite_i, "wdata": self.ports.pwdata_i}
+        self.mux_a, self.mux_b = dut.alu_operand_a_mux, dut.alu_operand_b_mux
+        self.op = None
+
+    def reset_inputs(self):
+        self.ports.reset_inputs(instr_first_cycle_i=1)
+
+    def request(self, rng, on):
+        self.ports.core_sleep_i.value = int(not on)
+        if on:
+            self.op = CORE_OPS[rng.randrange(4)], rng.getrandbits(32), rng.getrandbits(32)
+            self.ports.drive(operator_i=self.op[0], operand_a_i=self.op[1], operand_b_i=self.op[2])
+
+    def handed_over(self):
+        op, a, b = self.op
+        return (int(self.mux_a.value) == a and int(self.mux_b.value) == b
+                and int(self.ports.result_o.value) == alu_result(op, a, b))
+
+
+async def apb_write(drv, addr, data):
+    apb = drv.apb
+    apb["addr"].value, apb["sel"].value, apb["write"].value, apb["wdata"].value = addr, 1, 1, data
+    apb["enable"].value = 0
+    await RisingEdge(drv.clk)
+    apb["enable"].value = 1
+    await RisingEdge(drv.clk)
+    apb["sel"].value, apb["enable"].value, apb["write"].value = 0, 0, 0
+
+
+async def run_arrival(drv, config, arrival):
+    """Sleep, raise the request `arrival` cycles later and time the handover."""
+    await Timer(1, unit="ns")  # leave the read-only phase of the previous run
+    drv.reset_inputs()
+    drv.rst_n.value = 0
+    await Timer(2 * CLK_NS, unit="ns")
+    drv.rst_n.value = 1
+    await RisingEdge(drv.clk)
+    await apb_write(drv, 0x08, config["threshold"])
+    await apb_write(drv, 0x14, config_index(config["len_sel"], config["op_mode"]))
+    await apb_write(drv, 0x00, 0x3)  # enable, golden table
+    rng = random.Random(arrival)
+
+    await FallingEdge(drv.clk)
+    drv.request(rng, False)
+    for _ in range(arrival):
+        await FallingEdge(drv.clk)
+    state, cnt = int(drv.ctrl.state.value), int(drv.ctrl.test_cycle_cnt.value)
+    drv.request(rng, True)
+    result = {"target": drv.name, "len_sel": config["len_sel"], "arrival": arrival,
+              "state": STATE_NAMES[state], "cnt": cnt, "latency": None}
+    for latency in range(MAX_HANDOVER_CYCLES + 8):
+        await ReadOnly()
+        if drv.handed_over():
+            result["latency"] = latency
+            break
+        await FallingEdge(drv.clk)
+    return result
+
+
+@cocotb.test()
+async def test_abort_latency_sweep(dut):
+    """Run the arrivals of ABORT_LATENCY_IN (or every arrival of a 32-cycle session)."""
+    drv = WrapperDriver(dut) if hasattr(dut, "core_sleep_i") else ControllerDriver(dut)
+    cocotb.start_soon(Clock(drv.clk, CLK_NS, unit="ns").start())
+    path = os.environ.get("ABORT_LATENCY_IN")
+    if path:
+        with open(path) as f:
+            sweep = json.load(f)
+    else:
+        sweep = {"config": DEFAULT_CONFIG}
+    config = dict(DEFAULT_CONFIG, **sweep.get("config", {}))
+    arrivals = sweep.get("arrivals") or arrival_range(config)
+
+    out = os.environ.get("ABORT_LATENCY_OUT")
+    results = []
+    with open(out, "w") if out else open(os.devnull, "w") as f:
+        for arrival in arrivals:
+            result = await run_arrival(drv, config, arrival)
+            results.append(result)
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+
+    worst = max((r["latency"] for r in results if r["latency"] is not None), default=None)
+    if not path:
+        missing = [r for r in results if r["latency"] is None]
+        assert not missing, f"No handover within {MAX_HANDOVER_CYCLES + 8} cycles: {missing[:3]}"
+        assert worst <= MAX_HANDOVER_CYCLES, \
+            f"Handover took {worst} cycles: {[r for r in results if r['latency'] == worst][:3]}"
+        states = {r["state"] for r in results}
+        assert {"IDLE", "WAIT_FOR_SLOT", "RUN_TEST", "CHECK_RESULT"} <= states, f"States covered: {states}"
+        offsets = {r["cnt"] for r in results if r["state"] == "RUN_TEST"}
+        assert offsets == set(range(session_length(config["len_sel"]))), "Not every session cycle was hit"
+    dut._log.info(f"✅ {drv.name}: {len(results)} arrivals, worst-case handover {worst} cycle{'s' * (worst != 1)}")
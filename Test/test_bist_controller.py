@@ -1,10 +1,65 @@
 """
 Unit Test: runtime_bist_controller — BIST Controller
-Tests: APB register R/W, FSM idle-to-run, full BIST cycle, fail detection, safety abort.
+Tests: APB register R/W, FSM idle-to-run, full BIST cycle, fail detection, safety abort,
+       golden table readback, per-configuration golden table check, seed register,
+       seed rotation schedule, completion/abort interrupt, APB traffic (IRQ vs polling),
+       fault dictionary diagnosis, checkpoint signatures (pass, early detection latency),
+       rate limiting (MIN_INTERVAL, per-window BUDGET),
+       cycle-by-cycle equivalence with the Python controller model (bist_ctrl_model.py),
+       lockstep scoreboard first-divergence report.
+Every test runs under the lockstep scoreboard (bist_scoreboard.py), started by reset().
 """
+import os
+import random
+import tempfile
+
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer, with_timeout
+from cocotb.utils import get_sim_time
+
+from bist_ctrl_model import GOLDEN_SEED, BistControllerModel
+from bist_model import (OP_MIX, OP_MODES, SEED_SLOTS, alu_response, config_index, schedule_seeds,
+                        session_signature)
+from bist_scoreboard import BistScoreboard
+from fault_dict import FaultDictionary
+from fault_model import Fault, faulty_response
+from dut_ports import RuntimeBistControllerPorts
+from golden_table import build_table
+
+# Register map
+REG_CTRL = 0x00
+REG_STATUS = 0x04
+REG_CFG = 0x14
+REG_GTBL_IDX = 0x18
+REG_GTBL_DATA = 0x1C
+REG_SEED = 0x20
+REG_SEED_SLOT = 0x24
+REG_IRQ_EN = 0x28
+REG_IRQ_STATUS = 0x2C
+REG_CHKPT = 0x30
+REG_CHKPT_STATUS = 0x34
+REG_MIN_INTERVAL = 0x38
+REG_BUDGET_WINDOW = 0x3C
+REG_BUDGET = 0x40
+REG_BUDGET_USED = 0x44
+
+CTRL_EN = 0x1
+CTRL_GOLDEN_TABLE = 0x2
+CTRL_SEED_ROTATE = 0x4
+
+IRQ_DONE = 0x1
+IRQ_FAIL = 0x2
+IRQ_ABORT = 0x4
+IRQ_ALL = 0x7
+
+CHKPT_EN = 0x1
+
+# APB transactions issued by the helpers below (for the traffic benchmark)
+apb_count = {"read": 0, "write": 0}
+
+# Lockstep scoreboard of the running test (started by reset())
+scoreboard = None
 
 
 async def reset(dut):
@@ -18,11 +73,15 @@ async def reset(dut):
     dut.pwdata.value = 0
     await Timer(50, unit="ns")
     dut.rst_n.value = 1
+    global scoreboard
+    if scoreboard is None or scoreboard.task.done():
+        scoreboard = BistScoreboard(dut).start()
     await RisingEdge(dut.clk)
     await RisingEdge(dut.clk)
 
 
 async def apb_write(dut, addr, data):
+    apb_count["write"] += 1
     dut.paddr.value = addr
     dut.psel.value = 1
     dut.pwrite.value = 1
@@ -37,6 +96,7 @@ async def apb_write(dut, addr, data):
 
 
 async def apb_read(dut, addr):
+    apb_count["read"] += 1
     dut.paddr.value = addr
     dut.psel.value = 1
     dut.pwrite.value = 0
@@ -70,6 +130,15 @@ async def wait_bist_done(dut, timeout=600):
     raise TimeoutError("BIST did not complete")
 
 
+async def poll_busy(dut, busy, timeout=600):
+    """Poll STATUS (back-to-back reads) until busy == `busy`; returns the status."""
+    for _ in range(timeout):
+        status = await apb_read(dut, REG_STATUS)
+        if status & 1 == busy:
+            return status
+    raise TimeoutError(f"STATUS busy never became {busy}")
+
+
 @cocotb.test()
 async def test_apb_register_rw(dut):
     """Write and read back CTRL, THRESHOLD, GOLDEN_SIG registers."""
@@ -235,3 +304,501 @@ async def test_safety_abort(dut):
     bist_active = int(dut.bist_active_mode.value)
     assert bist_active == 0, f"BIST should abort on sys_req_valid, but bist_active={bist_active}"
     dut._log.info("✅ Safety abort verified (BIST releases ALU on interrupt)")
+
+
+async def alu_model(dut, fault_mask=0, fault=None):
+    """Drive dut_result_in as the wrapper's ALU would (combinational response to the pattern).
+
+    fault: optional fault_model.Fault injected into the modelled datapath.
+    """
+    while True:
+        await FallingEdge(dut.clk)
+        pattern = dut.bist_pattern_out.value.to_unsigned()
+        op_mode = dut.bist_op_mode.value.to_unsigned()
+        if fault is None:
+            response = alu_response(pattern, op_mode)
+        else:
+            response = faulty_response(pattern, op_mode, fault)
+        dut.dut_result_in.value = response ^ fault_mask
+
+
+async def wait_high(signal, timeout_us=20):
+    """Wait until a 1-bit signal is high (no bus traffic)."""
+    if int(signal.value) != 1:
+        await with_timeout(RisingEdge(signal), timeout_us, "us")
+
+
+async def run_one_session(dut, ctrl):
+    """Start a session, clear CTRL[0] while it runs (no re-run), wait for the done IRQ, return STATUS."""
+    await apb_write(dut, REG_IRQ_EN, IRQ_DONE)
+    await apb_write(dut, REG_CTRL, ctrl | CTRL_EN)
+    await wait_high(dut.bist_active_mode)
+    await apb_write(dut, REG_CTRL, ctrl)
+    await wait_high(dut.bist_irq)
+    await apb_write(dut, REG_IRQ_STATUS, IRQ_ALL)
+    return await apb_read(dut, REG_STATUS)
+
+
+@cocotb.test()
+async def test_golden_table_readback(dut):
+    """CFG read/write and GTBL_IDX/GTBL_DATA readback of the generated table."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+
+    cfg = await apb_read(dut, REG_CFG)
+    assert cfg == 0x3, f"CFG reset value 0x{cfg:X} != 0x3 (256 cycles, legacy operator)"
+    await apb_write(dut, REG_CFG, 0xE)
+    assert await apb_read(dut, REG_CFG) == 0xE, "CFG read-back mismatch"
+
+    table = build_table()
+    await apb_write(dut, REG_GTBL_IDX, 0)
+    for idx, *_, sig in table:
+        assert await apb_read(dut, REG_GTBL_IDX) == idx, "GTBL_IDX should auto-increment on GTBL_DATA writes"
+        got = await apb_read(dut, REG_GTBL_DATA)
+        assert got == sig, f"Table entry {idx}: 0x{got:08X} != 0x{sig:08X}"
+        # ROM build: the write only advances the index
+        await apb_write(dut, REG_GTBL_DATA, 0)
+
+    dut._log.info(f"✅ {len(table)} golden table entries match Tools/golden_table.py")
+
+
+@cocotb.test()
+async def test_golden_table_all_configs(dut):
+    """Every configuration passes against its table entry without a calibration run."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut))
+
+    await apb_write(dut, 0x08, 3)
+    dut.sys_req_valid.value = 0
+    for idx, slot, len_sel, op_mode, sig in build_table():
+        if slot:
+            continue  # seed rotation off: slot 0 only
+        await apb_write(dut, REG_CFG, config_index(len_sel, op_mode))
+        status = await run_one_session(dut, CTRL_GOLDEN_TABLE)
+        got = await apb_read(dut, 0x10)
+        assert got == sig, f"Config {idx}: signature 0x{got:08X} != golden 0x{sig:08X}"
+        assert status & 0x6 == 0x4, f"Config {idx}: status 0x{status:08X}, expected PASS"
+
+    dut._log.info("✅ All configurations PASS against the golden table")
+
+
+@cocotb.test()
+async def test_golden_table_detects_fault(dut):
+    """A faulty response fails against the table entry of the active configuration."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut, fault_mask=1 << 7))
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(0, 3))
+    dut.sys_req_valid.value = 0
+    status = await run_one_session(dut, CTRL_GOLDEN_TABLE)
+
+    assert status & 0x6 == 0x2, f"Status 0x{status:08X}, expected FAIL"
+    assert int(dut.error_irq.value) == 1, "error_irq should be set on a table mismatch"
+    dut._log.info("✅ Stuck bit detected against the golden table")
+
+
+@cocotb.test()
+async def test_seed_register(dut):
+    """SEED read/write, and every session restarts the LFSR from SEED."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut))
+
+    assert await apb_read(dut, REG_SEED) == 0xDEAD_BEEF, "SEED reset value should be the LFSR INITIAL_SEED"
+    seed = 0x1357_9BDF
+    await apb_write(dut, REG_SEED, seed)
+    assert await apb_read(dut, REG_SEED) == seed, "SEED read-back mismatch"
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(0, OP_MIX))
+    dut.sys_req_valid.value = 0
+    expected = session_signature(seed, 32, OP_MIX)
+    for run in range(2):
+        await run_one_session(dut, 0)
+        sig = await apb_read(dut, 0x10)
+        assert sig == expected, f"Run {run}: signature 0x{sig:08X} != model 0x{expected:08X}"
+
+    dut._log.info(f"✅ Sessions replay SEED 0x{seed:08X}: signature 0x{expected:08X}")
+
+
+@cocotb.test()
+async def test_seed_rotation_schedule(dut):
+    """CTRL[2]: sessions walk the seed schedule and pass against the per-slot table entries."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut))
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(0, OP_MIX))
+    dut.sys_req_valid.value = 0
+    seeds = schedule_seeds(0xDEAD_BEEF, 32)
+    signatures = []
+    for n in range(SEED_SLOTS + 1):
+        slot = await apb_read(dut, REG_SEED_SLOT)
+        assert slot == n % SEED_SLOTS, f"Session {n}: seed slot {slot} != {n % SEED_SLOTS}"
+        status = await run_one_session(dut, CTRL_GOLDEN_TABLE | CTRL_SEED_ROTATE)
+        sig = await apb_read(dut, 0x10)
+        expected = session_signature(seeds[slot], 32, OP_MIX)
+        assert sig == expected, f"Session {n} (slot {slot}): 0x{sig:08X} != model 0x{expected:08X}"
+        assert status & 0x6 == 0x4, f"Session {n}: status 0x{status:08X}, expected PASS"
+        signatures.append(sig)
+
+    assert len(set(signatures[:SEED_SLOTS])) == SEED_SLOTS, "Each slot should test a different pattern window"
+    assert signatures[SEED_SLOTS] == signatures[0], "Schedule should wrap back to SEED"
+    dut._log.info(f"✅ {SEED_SLOTS}-slot seed rotation verified, wraps back to SEED")
+
+
+@cocotb.test()
+async def test_completion_irq_w1c(dut):
+    """bist_irq rises at session end when enabled, IRQ_STATUS is write-1-to-clear."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(0, 0))
+    await apb_write(dut, 0x0C, 0xDEAD_DEAD)  # wrong golden: done + fail
+    dut.sys_req_valid.value = 0
+
+    # Masked: status bits set, line stays low
+    await apb_write(dut, REG_CTRL, CTRL_EN)
+    await wait_high(dut.bist_active_mode)
+    await apb_write(dut, REG_CTRL, 0)
+    for _ in range(40):
+        await RisingEdge(dut.clk)
+        assert int(dut.bist_irq.value) == 0, "bist_irq must stay low while IRQ_EN = 0"
+    pending = await apb_read(dut, REG_IRQ_STATUS)
+    assert pending == IRQ_DONE | IRQ_FAIL, f"IRQ_STATUS 0x{pending:X} != done|fail"
+
+    # Enabling a pending source raises the line; W1C of one bit keeps the other
+    await apb_write(dut, REG_IRQ_EN, IRQ_DONE | IRQ_FAIL)
+    await RisingEdge(dut.clk)
+    assert int(dut.bist_irq.value) == 1, "bist_irq should assert for a pending enabled source"
+    await apb_write(dut, REG_IRQ_STATUS, IRQ_DONE)
+    assert await apb_read(dut, REG_IRQ_STATUS) == IRQ_FAIL, "W1C should clear only the written bit"
+    assert int(dut.bist_irq.value) == 1, "fail source still pending"
+    await apb_write(dut, REG_IRQ_STATUS, IRQ_FAIL)
+    await RisingEdge(dut.clk)
+    assert int(dut.bist_irq.value) == 0, "bist_irq should drop after W1C"
+    dut._log.info("✅ Completion IRQ: enable mask and write-1-to-clear verified")
+
+
+@cocotb.test()
+async def test_abort_irq(dut):
+    """A system request during RUN_TEST raises the abort interrupt."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_IRQ_EN, IRQ_ABORT)
+    await apb_write(dut, REG_CTRL, CTRL_EN)
+    dut.sys_req_valid.value = 0
+    await wait_high(dut.bist_active_mode)
+    for _ in range(10):
+        await RisingEdge(dut.clk)
+    dut.sys_req_valid.value = 1
+    await wait_high(dut.bist_irq, timeout_us=1)
+
+    pending = await apb_read(dut, REG_IRQ_STATUS)
+    assert pending == IRQ_ABORT, f"IRQ_STATUS 0x{pending:X}, expected abort only"
+    dut._log.info("✅ Abort interrupt verified")
+
+
+@cocotb.test()
+async def test_irq_vs_polling_apb_traffic(dut):
+    """Benchmark: APB transactions per completed session, STATUS polling vs. completion IRQ."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    sessions = 4
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(1, 0))  # 64-cycle sessions
+    dut.sys_req_valid.value = 0
+
+    async def polled_session():
+        await apb_write(dut, REG_CTRL, CTRL_EN)
+        await poll_busy(dut, 1)
+        await apb_write(dut, REG_CTRL, 0)
+        await poll_busy(dut, 0)
+
+    async def irq_session():
+        await apb_write(dut, REG_CTRL, CTRL_EN)
+        await wait_high(dut.bist_active_mode)
+        await apb_write(dut, REG_CTRL, 0)
+        await wait_high(dut.bist_irq)
+        await apb_read(dut, REG_IRQ_STATUS)
+        await apb_write(dut, REG_IRQ_STATUS, IRQ_ALL)
+
+    results = {}
+    for name, session in (("polling", polled_session), ("irq", irq_session)):
+        if name == "irq":
+            await apb_write(dut, REG_IRQ_EN, IRQ_ALL)
+        before = sum(apb_count.values())
+        for _ in range(sessions):
+            await session()
+        results[name] = (sum(apb_count.values()) - before) / sessions
+
+    dut._log.info(f"   APB transactions per session: polling {results['polling']:.1f}, "
+                  f"irq {results['irq']:.1f} ({results['polling'] / results['irq']:.1f}x fewer)")
+    assert results["irq"] <= 4, f"IRQ flow should need at most 4 APB transactions, got {results['irq']}"
+    assert results["irq"] < results["polling"], "IRQ flow should use fewer APB transactions than polling"
+    dut._log.info("✅ Completion IRQ removes STATUS polling traffic")
+
+
+@cocotb.test()
+async def test_fault_dictionary_diagnosis(dut):
+    """The read-back SIGNATURE of a faulty session maps back to the injected fault."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    injected = Fault("shift2", 9, 0)
+    cocotb.start_soon(alu_model(dut, fault=injected))
+
+    len_sel = 1
+    with tempfile.TemporaryDirectory() as tmp:
+        fd = FaultDictionary(os.path.join(tmp, "fault_dict.db"))
+        resolution = fd.add(0xDEAD_BEEF, len_sel, OP_MIX)
+
+        await apb_write(dut, 0x08, 3)
+        await apb_write(dut, REG_CFG, config_index(len_sel, OP_MIX))
+        status = await run_one_session(dut, CTRL_GOLDEN_TABLE)
+        assert status & 0x6 == 0x2, f"Status 0x{status:08X}, expected FAIL"
+
+        sig = await apb_read(dut, 0x10)
+        candidates = fd.lookup(sig, len_sel, OP_MIX)
+        fd.close()
+
+    assert injected in candidates, f"Signature 0x{sig:08X}: {injected} not in candidates {candidates}"
+    dut._log.info(f"✅ Signature 0x{sig:08X} diagnosed as {', '.join(map(str, candidates))} "
+                  f"({100 * resolution.unique / resolution.detected:.1f}% of detected faults unique)")
+
+
+@cocotb.test()
+async def test_checkpoints_pass(dut):
+    """Fault-free 256-cycle sessions pass every 32-cycle checkpoint in every operator mix."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut))
+
+    await apb_write(dut, REG_CHKPT, CHKPT_EN)
+    assert await apb_read(dut, REG_CHKPT) == CHKPT_EN, "CHKPT read-back mismatch"
+    await apb_write(dut, 0x08, 3)
+    dut.sys_req_valid.value = 0
+    for op_mode in OP_MODES:
+        await apb_write(dut, REG_CFG, config_index(3, op_mode))
+        status = await run_one_session(dut, CTRL_GOLDEN_TABLE)
+        assert status & 0xE == 0x4, f"Op mode {op_mode}: status 0x{status:08X}, expected PASS"
+        assert await apb_read(dut, REG_CHKPT_STATUS) == 0, f"Op mode {op_mode}: unexpected checkpoint mismatch"
+
+    dut._log.info("✅ All checkpoints match in every operator mix")
+
+
+async def detection_latency(dut, chkpt):
+    """Cycles from session start (bist_active_mode) to error_irq for a stuck result bit."""
+    await apb_write(dut, REG_CHKPT, chkpt)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE | CTRL_EN)
+    await wait_high(dut.bist_active_mode)
+    start = get_sim_time(unit="ns")
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE)  # no follow-up session
+    await wait_high(dut.error_irq)
+    cycles = round((get_sim_time(unit="ns") - start) / 10)
+    status = await apb_read(dut, REG_STATUS)
+    chkpt_status = await apb_read(dut, REG_CHKPT_STATUS)
+    await poll_busy(dut, 0)
+    return cycles, status, chkpt_status
+
+
+@cocotb.test()
+async def test_checkpoint_early_detection(dut):
+    """A fault is flagged at the first checkpoint window instead of at the end of the session."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut, fault_mask=1 << 7))
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, REG_CFG, config_index(3, OP_MIX))
+    dut.sys_req_valid.value = 0
+
+    end_cycles, status, chkpt_status = await detection_latency(dut, 0)
+    assert status & 0x8 == 0 and chkpt_status == 0, "Without CHKPT the fail must come from CHECK_RESULT"
+    assert end_cycles > 256, f"End-of-session detection after {end_cycles} cycles"
+
+    latencies = {}
+    for sel in range(3):
+        window = 32 << sel
+        cycles, status, chkpt_status = await detection_latency(dut, CHKPT_EN | sel << 1)
+        assert status & 0xA == 0xA, f"Window {window}: status 0x{status:08X}, expected checkpoint FAIL"
+        assert chkpt_status == 0x100 | window, f"Window {window}: CHKPT_STATUS 0x{chkpt_status:03X}"
+        assert cycles < end_cycles, f"Window {window}: {cycles} cycles, not earlier than {end_cycles}"
+        latencies[window] = cycles
+
+    report = ", ".join(f"every {w}: {c}" for w, c in latencies.items())
+    dut._log.info(f"✅ Detection latency (cycles): end of session {end_cycles}, {report} "
+                  f"({100 * (1 - latencies[32] / end_cycles):.0f}% faster with 32-cycle windows)")
+
+
+async def trace_sessions(dut, cycles):
+    """[(active, session_start, throttled, window_cnt)] of `cycles` clocks (sampled after the falling edge)."""
+    trace = []
+    for _ in range(cycles):
+        await FallingEdge(dut.clk)
+        await ReadOnly()
+        active = int(dut.bist_active_mode.value)
+        trace.append((active, active and int(dut.test_cycle_cnt.value) == 0, int(dut.reg_status.value) >> 4 & 1,
+                      int(dut.window_cnt.value)))
+        assert not int(dut.error_irq.value), "Rate-limited session failed"
+    await FallingEdge(dut.clk)
+    return trace
+
+
+@cocotb.test()
+async def test_rate_limiting(dut):
+    """MIN_INTERVAL spaces session starts exactly; BUDGET caps the BIST cycles of every window."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    cocotb.start_soon(alu_model(dut))
+    for reg, value in ((REG_MIN_INTERVAL, 200), (REG_BUDGET_WINDOW, 500), (REG_BUDGET, 64)):
+        await apb_write(dut, reg, value)
+        assert await apb_read(dut, reg) == value, f"Register 0x{reg:02X} read-back mismatch"
+    await apb_write(dut, REG_BUDGET_WINDOW, 0)
+    await apb_write(dut, 0x08, 2)
+    await apb_write(dut, REG_CFG, config_index(0, OP_MIX))
+    dut.sys_req_valid.value = 0
+
+    # Always idle: back-to-back 32-cycle sessions without a limit, one per MIN_INTERVAL with it
+    await apb_write(dut, REG_CTRL, CTRL_EN | CTRL_GOLDEN_TABLE)
+    trace = await trace_sessions(dut, 1100)
+    starts = [i for i, (_, start, _, _) in enumerate(trace) if start]
+    gaps = {b - a for a, b in zip(starts, starts[1:])}
+    assert len(starts) >= 5 and gaps == {200}, f"Session starts {starts[:8]}: gaps {gaps}, expected 200"
+    assert any(throttled for _, _, throttled, _ in trace), "STATUS[4] never flagged a held-back idle slot"
+
+    # Budget: at most 64 BIST cycles (two 32-cycle sessions) per 500-cycle window
+    await apb_write(dut, REG_MIN_INTERVAL, 0)
+    await apb_write(dut, REG_BUDGET, 64)
+    await apb_write(dut, REG_BUDGET_WINDOW, 500)  # restarts the window in the write cycle
+    trace = await trace_sessions(dut, 2000)
+    bounds = [i for i, (_, _, _, window) in enumerate(trace) if window == 0]
+    per_window = [sum(t[0] for t in trace[a:b]) for a, b in zip(bounds, bounds[1:])]
+    assert len(per_window) >= 3 and all(b - a == 500 for a, b in zip(bounds, bounds[1:])), f"Windows at {bounds}"
+    # An idle core fills each window up to the budget; a session straddling a boundary counts in both windows
+    assert all(64 - 32 < n <= 64 for n in per_window), f"BIST cycles per window {per_window}, budget 64"
+    used = await apb_read(dut, REG_BUDGET_USED)
+    assert used <= 64, f"BUDGET_USED {used} exceeds the budget"
+    dut._log.info(f"✅ Session starts every 200 cycles ({len(starts)} sessions); "
+                  f"BIST cycles per 500-cycle window {per_window}")
+
+
+def random_apb_access(rng):
+    """(write, addr, data) of one random APB transaction for the equivalence test."""
+    if rng.random() < 0.6:
+        return False, rng.randrange(0, 0x48, 4), 0
+    addr, data = rng.choice([
+        (REG_CTRL, rng.choice((CTRL_EN, CTRL_EN | CTRL_GOLDEN_TABLE, CTRL_EN | CTRL_GOLDEN_TABLE | CTRL_SEED_ROTATE,
+                               CTRL_EN | CTRL_SEED_ROTATE, 0))),
+        (0x08, rng.randrange(0, 12)),
+        (0x0C, rng.getrandbits(32)),
+        (REG_CFG, config_index(rng.randrange(2), rng.choice(OP_MODES))),
+        (REG_GTBL_IDX, rng.getrandbits(6)),
+        (REG_GTBL_DATA, rng.getrandbits(32)),
+        (REG_SEED, rng.choice((GOLDEN_SEED, GOLDEN_SEED, rng.getrandbits(32)))),
+        (REG_IRQ_EN, rng.getrandbits(3)),
+        (REG_IRQ_STATUS, rng.getrandbits(3)),
+        (REG_CHKPT, rng.choice((0, CHKPT_EN, CHKPT_EN | 2))),
+        (REG_MIN_INTERVAL, rng.choice((0, 0, 40, 300))),
+        (REG_BUDGET_WINDOW, rng.choice((0, 0, 150, 400))),
+        (REG_BUDGET, rng.choice((0, 32, 64, 100))),
+    ])
+    return True, addr, data
+
+
+@cocotb.test()
+async def test_python_model_equivalence(dut):
+    """Every output of the RTL matches BistControllerModel, cycle by cycle, under random traffic."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    ports = RuntimeBistControllerPorts(dut)
+    ports.reset_inputs()
+    for _ in range(3):
+        await FallingEdge(ports.clk)
+    ports.rst_n.value = 1
+    model = BistControllerModel()
+    rng = random.Random(38)
+
+    n_cycles = 8000
+    busy, burst = False, 0
+    apb, apb_phase, apb_gap = None, 0, 0
+    for cycle in range(n_cycles):
+        # Bursty system traffic; the datapath answers the model's pattern, sometimes wrongly
+        if burst == 0:
+            busy = not busy
+            burst = 1 + int(rng.expovariate(1 / (30 if busy else 90)))
+        burst -= 1
+        result = alu_response(model.bist_pattern_out, model.bist_op_mode)
+        if rng.random() < 0.002:
+            result ^= 1 << rng.randrange(32)
+
+        # APB: setup + access phase per transaction, random gaps
+        if apb is None:
+            if apb_gap:
+                apb_gap -= 1
+            else:
+                apb, apb_phase = random_apb_access(rng), 0
+        pwrite, paddr, pwdata = apb if apb else (False, ports.paddr.value.to_unsigned(), 0)
+        psel, penable = (1, apb_phase) if apb else (0, 0)
+        if apb is not None:
+            apb_phase += 1
+            if apb_phase == 2:
+                apb, apb_gap = None, rng.randrange(0, 40)
+
+        inputs = dict(sys_req_valid=int(busy), dut_result=result, psel=psel, penable=penable,
+                      pwrite=int(pwrite), paddr=paddr, pwdata=pwdata)
+        ports.drive(sys_req_valid=int(busy), dut_result_in=result, psel=psel, penable=penable,
+                    pwrite=int(pwrite), paddr=paddr, pwdata=pwdata)
+        await ReadOnly()
+        model.sys_req_valid = int(busy)
+        expected = {"bist_active_mode": model.bist_active_mode, "bist_pattern_out": model.bist_pattern_out,
+                    "bist_op_mode": model.bist_op_mode, "prdata": model.prdata(paddr), "pready": 1,
+                    "error_irq": model.error_irq, "bist_irq": model.bist_irq}
+        got = ports.sample_all()
+        diff = {k: (f"0x{got[k]:X}" if got[k] is not None else "X", f"0x{v:X}")
+                for k, v in expected.items() if got[k] != v}
+        assert not diff, f"Cycle {cycle} (state {model.state}, cnt {model.test_cycle_cnt}): RTL vs model {diff}"
+        model.step(**inputs)
+        await FallingEdge(ports.clk)
+
+    dut._log.info(f"   {model.sessions_completed} completed, {model.sessions_aborted} aborted, "
+                  f"{model.sessions_failed} failed sessions")
+    assert model.sessions_completed and model.sessions_aborted and model.sessions_failed, \
+        "Random traffic did not cover completion, abort and failure"
+    dut._log.info(f"✅ RTL and Python model agree on all outputs for {n_cycles} cycles")
+
+
+@cocotb.test()
+async def test_scoreboard_first_divergence(dut):
+    """Corrupt the MISR mid-session → scoreboard stops at exactly that cycle and names the field."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    scoreboard.task.cancel()  # replaced by a non-raising one below
+    sb = BistScoreboard(dut, raise_on_divergence=False).start()
+    await RisingEdge(dut.clk)
+
+    await apb_write(dut, 0x08, 3)
+    await apb_write(dut, 0x00, 1)  # Enable
+    await RisingEdge(dut.bist_active_mode)
+    for _ in range(20):
+        await RisingEdge(dut.clk)
+    assert sb.divergence is None, f"Unexpected divergence before the fault:\n{sb.report()}"
+
+    await FallingEdge(dut.clk)
+    cycle = sb.cycles  # the scoreboard checks this cycle in the read-only phase
+    dut.u_misr.misr_reg.value = int(dut.u_misr.misr_reg.value) ^ 0x100
+    await with_timeout(sb.task, 100, "ns")
+
+    d = sb.divergence
+    assert d is not None, "Scoreboard missed the corrupted MISR"
+    assert d["cycle"] == cycle, f"First divergence reported at cycle {d['cycle']}, corrupted at {cycle}"
+    assert list(d["fields"]) == ["signature"], f"Unexpected diverging fields: {list(d['fields'])}"
+    got, expected = d["fields"]["signature"]
+    assert got ^ expected == 0x100
+    dut._log.info(f"✅ First divergence reported at cycle {cycle} (signature bit 8)")
@@ -0,0 +1,132 @@
+"""
+Power Test: ibex_alu_bist_wrapper — toggle activity per mode (activity_monitor.py)
+Tests: per-mode toggle rates of functional traffic, idle (sleep, BIST off) and BIST sessions;
+       exact match of the RTL toggle counts of a session with the Python model (power_model.py)
+       for every operator mix.
+"""
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, RisingEdge, Timer
+
+from activity_monitor import ActivityMonitor
+from bist_ctrl_model import CHECK_RESULT, RUN_TEST
+from bist_model import (ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, INITIAL_SEED, OP_MIX, OP_MODES, config_index,
+                        session_length)
+from dut_ports import IbexAluBistWrapperPorts
+from power_model import OP_NAMES, session_activity
+
+REG_CTRL = 0x00
+REG_THRESHOLD = 0x08
+REG_CFG = 0x14
+CTRL_EN_GOLDEN = 0x3  # enable, golden table
+
+CORE_OPS = (ALU_ADD, ALU_SUB, ALU_XOR, ALU_SLL)
+WEIGHTS = {"operand_a": 1.0, "operand_b": 1.0, "result": 1.6, "lfsr": 0.4, "misr": 0.4}
+
+
+async def reset(ports):
+    ports.reset_inputs(instr_first_cycle_i=1)
+    await Timer(50, unit="ns")
+    ports.rst_ni.value = 1
+    await RisingEdge(ports.clk_i)
+    await RisingEdge(ports.clk_i)
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+async def run_session(ports, timeout=1000):
+    """Sleep until the controller has run one full session (CHECK_RESULT), then wake up."""
+    ports.core_sleep_i.value = 1
+    for _ in range(timeout):
+        await RisingEdge(ports.clk_i)
+        if int(ports.dut.u_bist_ctrl.state.value) == CHECK_RESULT:
+            break
+    else:
+        raise TimeoutError("BIST session did not complete")
+    await FallingEdge(ports.clk_i)
+    ports.core_sleep_i.value = 0
+
+
+@cocotb.test()
+async def test_mode_toggle_rates(dut):
+    """Functional, idle and BIST toggle rates; idle and functional mode leave the LFSR/MISR quiet."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, REG_THRESHOLD, 5)
+    await apb_write(ports, REG_CFG, config_index(1, OP_MIX))
+    mon = ActivityMonitor(dut, WEIGHTS).start()
+
+    # Functional traffic: random operands every cycle
+    for _ in range(500):
+        await FallingEdge(ports.clk_i)
+        ports.drive(operator_i=random.choice(CORE_OPS), operand_a_i=random.getrandbits(32),
+                    operand_b_i=random.getrandbits(32))
+    # Idle: the core sleeps with its operands held, BIST disabled
+    await FallingEdge(ports.clk_i)
+    ports.core_sleep_i.value = 1
+    for _ in range(300):
+        await RisingEdge(ports.clk_i)
+    ports.core_sleep_i.value = 0
+    idle_off = mon.counter.report()["idle"]
+    # BIST: three sessions in sleep slots (each return to the held operands is an idle cycle)
+    await apb_write(ports, REG_CTRL, CTRL_EN_GOLDEN)
+    for _ in range(3):
+        await run_session(ports)
+        for _ in range(20):
+            await RisingEdge(ports.clk_i)
+    mon.stop()
+
+    report = mon.log_report()
+    normal, bist = report["normal"], report["bist"]
+    for bus in ("operand_a", "operand_b"):
+        assert 12 < normal["rate"][bus] < 20, f"Random {bus} should toggle ~16 bits/cycle, got {normal['rate'][bus]}"
+    assert normal["toggles"]["lfsr"] == 0 and normal["toggles"]["misr"] == 0, \
+        "LFSR/MISR must be quiet in functional mode"
+    assert idle_off["cycles"] >= 300 and idle_off["energy"] == 0, \
+        f"Idle with BIST off must not toggle: {idle_off['toggles']}"
+    assert bist["cycles"] == 3 * session_length(1), f"Expected 3 sessions of BIST cycles, got {bist['cycles']}"
+    assert bist["rate"]["lfsr"] > 10 and bist["rate"]["misr"] > 10
+    dut._log.info(f"✅ BIST costs {bist['energy_per_cycle']:.1f} units/cycle vs {normal['energy_per_cycle']:.1f} "
+                  f"functional and {idle_off['energy_per_cycle']:.1f} idle")
+
+
+@cocotb.test()
+async def test_session_toggles_match_model(dut):
+    """Toggles between BIST cycles 1 .. L-1 equal session_activity() for every operator mix."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    ctrl = dut.u_bist_ctrl
+
+    def in_session(_dut):
+        # Transitions into cycle c >= 2: both samples lie in cycles 1 .. L-1 of the session
+        return "bist" if int(ctrl.state.value) == RUN_TEST and int(ctrl.test_cycle_cnt.value) >= 2 else "other"
+
+    for op_mode in OP_MODES:
+        for len_sel in (0, 2):
+            await reset(ports)
+            await apb_write(ports, REG_THRESHOLD, 5)
+            await apb_write(ports, REG_CFG, config_index(len_sel, op_mode))
+            await apb_write(ports, REG_CTRL, CTRL_EN_GOLDEN)
+            mon = ActivityMonitor(dut, WEIGHTS, classify=in_session, modes=("bist", "other")).start()
+            await run_session(ports)
+            mon.stop()
+
+            length = session_length(len_sel)
+            rtl = mon.counter.report()["bist"]
+            model = session_activity(INITIAL_SEED, length, op_mode, WEIGHTS).report()["bist"]
+            assert rtl["cycles"] == length - 2, f"{rtl['cycles']} in-session transitions, expected {length - 2}"
+            assert rtl["toggles"] == model["toggles"], \
+                f"{OP_NAMES[op_mode]}/{length}: RTL toggles {rtl['toggles']} != model {model['toggles']}"
+            assert abs(rtl["energy"] - model["energy"]) < 1e-6
+            dut._log.info(f"   {OP_NAMES[op_mode]:<6} {length:>4} cycles: {rtl['energy']:>8.1f} units "
+                          f"({rtl['energy_per_cycle']:.1f}/cycle), model match")
+    dut._log.info("✅ RTL toggle activity matches the Python model for every operator mix")
@@ -1,80 +1,83 @@
 """
 Integration Test: ibex_alu_bist_wrapper — ALU + BIST Wrapper
-Tests: normal passthrough, BIST mode muxing, calibration cycle, fault injection.
+Tests: normal passthrough, BIST mode muxing, calibration cycle, fault injection,
+       golden table (no calibration) per operator mix, stuck-at/transient fault injector,
+       zero-cycle handover under random wake-ups, bit-sliced model signatures for random SEED values,
+       space compaction of the adder, comparison and equality outputs into the MISR input.
+The embedded controller runs under the lockstep scoreboard (bist_scoreboard.py), started by reset().
 """
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer, with_timeout
 import random
 
+from bist_ctrl_model import CHECK_RESULT, RUN_TEST
+from bist_model import (INITIAL_SEED, MISR_MATRIX, OP_MIX, OP_MODES, alu_outputs, alu_response, alu_result,
+                        bist_operands, config_index, gf2_apply, gf2_pow, session_length, session_patterns,
+                        session_signature)
+from bist_scoreboard import BistScoreboard
+from bitslice_model import Lanes, error_signature, session_cycles, session_signatures
+from fault_dict import failing_signatures
+from fault_model import Fault
+
+from dut_ports import IbexAluBistWrapperPorts
+
 # ALU opcodes
 ALU_ADD = 0
 ALU_SUB = 1
 ALU_XOR = 2
 
+# sim_fault_mode_i (bist_fault_injector)
+FAULT_OFF = 0
+FAULT_SA0 = 1
+FAULT_SA1 = 2
+FAULT_FLIP = 3
+
+# Lockstep scoreboard on u_bist_ctrl (started by reset())
+scoreboard = None
 
-async def reset(dut):
-    dut.rst_ni.value = 0
-    dut.operator_i.value = 0
-    dut.operand_a_i.value = 0
-    dut.operand_b_i.value = 0
-    dut.instr_first_cycle_i.value = 1
-    dut.multdiv_en_i.value = 0
-    dut.imd_val_q_i.value = 0
-    dut.imd_val_we_i.value = 0
-    dut.core_sleep_i.value = 0
-    dut.sim_fault_inject_i.value = 0
-    dut.paddr_i.value = 0
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
-    dut.pwrite_i.value = 0
-    dut.pwdata_i.value = 0
+
+async def reset(ports):
+    ports.reset_inputs(instr_first_cycle_i=1)
     await Timer(50, unit="ns")
-    dut.rst_ni.value = 1
-    await RisingEdge(dut.clk_i)
-    await RisingEdge(dut.clk_i)
-
-
-async def apb_write(dut, addr, data):
-    dut.paddr_i.value = addr
-    dut.psel_i.value = 1
-    dut.pwrite_i.value = 1
-    dut.pwdata_i.value = data
-    dut.penable_i.value = 0
-    await RisingEdge(dut.clk_i)
-    dut.penable_i.value = 1
-    await RisingEdge(dut.clk_i)
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
-    dut.pwrite_i.value = 0
-
-
-async def apb_read(dut, addr):
-    dut.paddr_i.value = addr
-    dut.psel_i.value = 1
-    dut.pwrite_i.value = 0
-    dut.penable_i.value = 0
-    await RisingEdge(dut.clk_i)
-    dut.penable_i.value = 1
-    await RisingEdge(dut.clk_i)
-    data = dut.prdata_o.value.to_unsigned()
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
+    ports.rst_ni.value = 1
+    global scoreboard
+    if scoreboard is None or scoreboard.task.done():
+        scoreboard = BistScoreboard(ports.dut.u_bist_ctrl, clk=ports.clk_i, rst_n=ports.rst_ni).start()
+    await RisingEdge(ports.clk_i)
+    await RisingEdge(ports.clk_i)
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+async def apb_read(ports, addr):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=0, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    data = ports.sample("prdata_o")
+    ports.drive(psel_i=0, penable_i=0)
     return data
 
 
-async def wait_bist_start(dut, timeout=200):
+async def wait_bist_start(ports, timeout=200):
     for _ in range(timeout):
-        status = await apb_read(dut, 0x04)
+        status = await apb_read(ports, 0x04)
         if status & 1:
             return
         await Timer(10, unit="ns")
-    dut._log.warning("[TIMEOUT] BIST did not start")
+    ports.dut._log.warning("[TIMEOUT] BIST did not start")
 
 
-async def wait_bist_done(dut, timeout=600):
+async def wait_bist_done(ports, timeout=600):
     for _ in range(timeout):
-        status = await apb_read(dut, 0x04)
+        status = await apb_read(ports, 0x04)
         if (status & 1) == 0:
             return status
         await Timer(50, unit="ns")
@@ -84,24 +87,21 @@ async def wait_bist_done(dut, timeout=600):
 @cocotb.test()
 async def test_normal_alu_passthrough(dut):
     """In normal mode, ALU operations should pass through correctly."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    await reset(dut)
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
 
     # ADD
-    dut.operator_i.value = ALU_ADD
-    dut.operand_a_i.value = 100
-    dut.operand_b_i.value = 200
-    dut.core_sleep_i.value = 0  # System active
-    await RisingEdge(dut.clk_i)
-    res = dut.result_o.value.to_unsigned()
+    ports.drive(operator_i=ALU_ADD, operand_a_i=100, operand_b_i=200)
+    ports.core_sleep_i.value = 0  # System active
+    await RisingEdge(ports.clk_i)
+    res = ports.sample("result_o")
     assert res == 300, f"Normal ADD: got {res}, expected 300"
 
     # SUB
-    dut.operator_i.value = ALU_SUB
-    dut.operand_a_i.value = 500
-    dut.operand_b_i.value = 123
-    await RisingEdge(dut.clk_i)
-    res = dut.result_o.value.to_unsigned()
+    ports.drive(operator_i=ALU_SUB, operand_a_i=500, operand_b_i=123)
+    await RisingEdge(ports.clk_i)
+    res = ports.sample("result_o")
     assert res == 377, f"Normal SUB: got {res}, expected 377"
 
     dut._log.info("✅ Normal ALU passthrough verified")
@@ -110,25 +110,23 @@ async def test_normal_alu_passthrough(dut):
 @cocotb.test()
 async def test_bist_mode_mux(dut):
     """When BIST is active, ALU inputs should come from LFSR pattern."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    await reset(dut)
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
 
     # Configure BIST with short threshold
-    await apb_write(dut, 0x08, 5)   # Threshold
-    await apb_write(dut, 0x00, 1)   # Enable
+    await apb_write(ports, 0x08, 5)   # Threshold
+    await apb_write(ports, 0x00, 1)   # Enable
 
     # Go to sleep (idle)
-    dut.core_sleep_i.value = 1
-    dut.operator_i.value = ALU_ADD
-    dut.operand_a_i.value = 0xAAAA
-    dut.operand_b_i.value = 0xBBBB
+    ports.drive(core_sleep_i=1, operator_i=ALU_ADD, operand_a_i=0xAAAA, operand_b_i=0xBBBB)
 
     # Wait for BIST to start
-    await wait_bist_start(dut)
+    await wait_bist_start(ports)
 
     # During BIST, the result_o should NOT be operand_a + operand_b
-    await RisingEdge(dut.clk_i)
-    res = dut.result_o.value.to_unsigned()
+    await RisingEdge(ports.clk_i)
+    res = ports.sample("result_o")
     expected_normal = 0xAAAA + 0xBBBB
     # The result should be bist_pattern + ~bist_pattern (from mux)
     dut._log.info(f"   BIST mode result: 0x{res:08X} (normal would be 0x{expected_normal:08X})")
@@ -139,37 +137,38 @@ async def test_bist_mode_mux(dut):
 @cocotb.test()
 async def test_calibration_and_recheck(dut):
     """Full calibration: run BIST → capture signature → save golden → re-run → PASS."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    await reset(dut)
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
 
     # 1. Configure
-    await apb_write(dut, 0x08, 3)  # Short threshold
-    await apb_write(dut, 0x00, 1)  # Enable
-    dut.core_sleep_i.value = 1     # Go idle
+    await apb_write(ports, 0x08, 3)  # Short threshold
+    await apb_write(ports, 0x00, 1)  # Enable
+    ports.core_sleep_i.value = 1     # Go idle
 
     # 2. First run: calibration
-    await wait_bist_start(dut)
-    await wait_bist_done(dut)
+    await wait_bist_start(ports)
+    await wait_bist_done(ports)
 
-    golden = await apb_read(dut, 0x10)
+    golden = await apb_read(ports, 0x10)
     dut._log.info(f"   Calibration signature: 0x{golden:08X}")
 
     # 3. Save golden
-    await apb_write(dut, 0x0C, golden)
+    await apb_write(ports, 0x0C, golden)
 
     # 4. Re-run
-    dut.core_sleep_i.value = 0
-    await RisingEdge(dut.clk_i)
-    await apb_write(dut, 0x00, 1)
-    dut.core_sleep_i.value = 1
+    ports.drive(core_sleep_i=0)
+    await RisingEdge(ports.clk_i)
+    await apb_write(ports, 0x00, 1)
+    ports.drive(core_sleep_i=1)
 
-    await wait_bist_start(dut)
-    await wait_bist_done(dut)
+    await wait_bist_start(ports)
+    await wait_bist_done(ports)
 
     for _ in range(3):
-        await RisingEdge(dut.clk_i)
+        await RisingEdge(ports.clk_i)
 
-    irq = int(dut.bist_error_irq_o.value)
+    irq = ports.sample("bist_error_irq_o")
     assert irq == 0, f"IRQ should be 0 after matching golden, got {irq}"
     dut._log.info("✅ Calibration → re-run → PASS verified")
 
@@ -177,20 +176,20 @@ async def test_calibration_and_recheck(dut):
 @cocotb.test()
 async def test_fault_injection(dut):
     """With sim_fault_inject, BIST should detect a hardware fault."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    await reset(dut)
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
 
     # 1. Calibration run (no fault)
-    await apb_write(dut, 0x08, 3)
-    await apb_write(dut, 0x00, 1)
-    dut.core_sleep_i.value = 1
-    dut.sim_fault_inject_i.value = 0
+    await apb_write(ports, 0x08, 3)
+    await apb_write(ports, 0x00, 1)
+    ports.drive(core_sleep_i=1, sim_fault_inject_i=0)
 
-    await wait_bist_start(dut)
-    await wait_bist_done(dut)
+    await wait_bist_start(ports)
+    await wait_bist_done(ports)
 
-    golden = await apb_read(dut, 0x10)
-    await apb_write(dut, 0x0C, golden)
+    golden = await apb_read(ports, 0x10)
+    await apb_write(ports, 0x0C, golden)
     dut._log.info(f"   Golden: 0x{golden:08X}")
 
     # 2. Fault injection run with IRQ monitor
@@ -199,9 +198,9 @@ async def test_fault_injection(dut):
     async def monitor_irq():
         nonlocal irq_seen
         while True:
-            await RisingEdge(dut.clk_i)
+            await RisingEdge(ports.clk_i)
             try:
-                if int(dut.bist_error_irq_o.value) == 1:
+                if ports.sample("bist_error_irq_o") == 1:
                     irq_seen = True
                     return
             except ValueError:
@@ -209,22 +208,206 @@ async def test_fault_injection(dut):
 
     cocotb.start_soon(monitor_irq())
 
-    dut.core_sleep_i.value = 0
-    await RisingEdge(dut.clk_i)
-    await apb_write(dut, 0x00, 1)
-    dut.core_sleep_i.value = 1
+    ports.drive(core_sleep_i=0)
+    await RisingEdge(ports.clk_i)
+    await apb_write(ports, 0x00, 1)
+    ports.drive(core_sleep_i=1)
 
-    await wait_bist_start(dut)
-    dut.sim_fault_inject_i.value = 1
-    await wait_bist_done(dut)
+    await wait_bist_start(ports)
+    ports.drive(sim_fault_inject_i=1)
+    await wait_bist_done(ports)
 
     # Disable to prevent re-run
-    await apb_write(dut, 0x00, 0)
+    await apb_write(ports, 0x00, 0)
 
     for _ in range(5):
-        await RisingEdge(dut.clk_i)
+        await RisingEdge(ports.clk_i)
 
-    faulty_sig = await apb_read(dut, 0x10)
+    faulty_sig = await apb_read(ports, 0x10)
     dut._log.info(f"   Faulty signature: 0x{faulty_sig:08X}, IRQ seen: {irq_seen}")
     assert irq_seen, f"Fault should trigger IRQ but it was not observed"
     dut._log.info("✅ Fault injection detection verified")
+
+
+async def run_one_session(ports, ctrl):
+    """Start a session, clear CTRL[0] while it runs (no re-run), wait for bist_irq_o, return STATUS."""
+    await apb_write(ports, 0x28, 0x1)  # IRQ_EN: session done
+    await apb_write(ports, 0x00, ctrl | 1)
+    ports.drive(core_sleep_i=1)
+    await wait_bist_start(ports)
+    await apb_write(ports, 0x00, ctrl)
+    if ports.sample("bist_irq_o") != 1:
+        await with_timeout(RisingEdge(ports.bist_irq_o), 20, "us")
+    await apb_write(ports, 0x2C, 0x7)  # IRQ_STATUS: write-1-to-clear
+    return await apb_read(ports, 0x04)
+
+
+@cocotb.test()
+async def test_golden_table_no_calibration(dut):
+    """Each operator mix passes against the on-chip golden table, with no calibration run."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, 0x08, 3)
+
+    len_sel = 1
+    for op_mode in OP_MODES:
+        await apb_write(ports, 0x14, config_index(len_sel, op_mode))
+        status = await run_one_session(ports, 0x2)  # CTRL[1]: golden from table
+        sig = await apb_read(ports, 0x10)
+        expected = session_signature(length=session_length(len_sel), op_mode=op_mode)
+        dut._log.info(f"   op_mode {op_mode}: signature 0x{sig:08X}, status 0x{status:X}")
+        assert sig == expected, f"op_mode {op_mode}: 0x{sig:08X} != model 0x{expected:08X}"
+        assert status & 0x6 == 0x4, f"op_mode {op_mode}: status 0x{status:08X}, expected PASS"
+        assert ports.sample("bist_error_irq_o") == 0, "IRQ should stay low on a table match"
+
+    # A fault in the ALU result is caught against the same table
+    ports.drive(sim_fault_inject_i=1)
+    status = await run_one_session(ports, 0x2)
+    assert status & 0x6 == 0x2, f"Fault run: status 0x{status:08X}, expected FAIL"
+    assert ports.sample("bist_error_irq_o") == 1, "Fault should trigger IRQ"
+    dut._log.info("✅ Golden table PASS for all operator mixes, fault detected without calibration")
+
+
+@cocotb.test()
+async def test_fault_injector_modes(dut):
+    """Stuck-at and transient faults on any result bit leave the model's faulty signature."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, 0x08, 3)
+
+    len_sel = 1
+    length = session_length(len_sel)
+    await apb_write(ports, 0x14, config_index(len_sel, OP_MIX))
+    golden, sigs = failing_signatures(session_patterns(INITIAL_SEED, length), OP_MIX,
+                                      [Fault("result", 4, 0), Fault("result", 17, 1)])
+    flip_bit, flip_cycle = 9, 20
+    cases = [
+        (FAULT_SA0, 4, 0, sigs[Fault("result", 4, 0)]),
+        (FAULT_SA1, 17, 0, sigs[Fault("result", 17, 1)]),
+        # One flipped capture at test cycle c goes through the remaining length - 1 - c MISR shifts
+        (FAULT_FLIP, flip_bit, flip_cycle,
+         golden ^ gf2_apply(gf2_pow(MISR_MATRIX, length - 1 - flip_cycle), 1 << flip_bit)),
+        (FAULT_OFF, 0, 0, golden),
+    ]
+    for mode, bit, cycle, expected in cases:
+        ports.sim_fault_mode_i.value = FAULT_OFF  # disarm: restart the injector's cycle count
+        await RisingEdge(ports.clk_i)
+        ports.drive(sim_fault_mode_i=mode, sim_fault_bit_i=bit, sim_fault_cycle_i=cycle)
+        status = await run_one_session(ports, 0x2)
+        sig = await apb_read(ports, 0x10)
+        dut._log.info(f"   mode {mode} bit {bit} cycle {cycle}: signature 0x{sig:08X}")
+        assert sig == expected, f"mode {mode} bit {bit}: 0x{sig:08X} != model 0x{expected:08X}"
+        assert status & 0x6 == (0x4 if mode == FAULT_OFF else 0x2), f"mode {mode}: status 0x{status:08X}"
+
+    dut._log.info("✅ Stuck-at-0/1 and transient flip match the fault model")
+
+
+@cocotb.test()
+async def test_zero_cycle_handover(dut):
+    """A wake-up in any session cycle is served by the core's operands in that cycle; sessions still pass."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, 0x08, 2)
+    len_sel = 0
+    length = session_length(len_sel)
+    await apb_write(ports, 0x14, config_index(len_sel, OP_MIX))
+    await apb_write(ports, 0x00, 0x3)  # enable, golden table
+    ctrl = dut.u_bist_ctrl
+    rng = random.Random(44)
+
+    sleeping = False
+    wake_offsets, completed = set(), 0
+    for cycle in range(6000):
+        await FallingEdge(ports.clk_i)
+        # Random interrupts: short busy bursts, sleep periods around one session long
+        sleeping = rng.random() < (0.97 if sleeping else 0.3)
+        ports.core_sleep_i.value = int(sleeping)
+        if not sleeping:
+            op, a, b = rng.choice((ALU_ADD, ALU_SUB, ALU_XOR)), rng.getrandbits(32), rng.getrandbits(32)
+            ports.drive(operator_i=op, operand_a_i=a, operand_b_i=b)
+        await ReadOnly()
+        state, cnt = int(ctrl.state.value), int(ctrl.test_cycle_cnt.value)
+        if not sleeping:
+            res, expected = int(ports.result_o.value), alu_result(op, a, b)
+            assert not int(dut.bist_active.value), f"Cycle {cycle}: BIST drives the ALU during a request"
+            assert res == expected, f"Cycle {cycle} (cnt {cnt}): result 0x{res:08X}, expected 0x{expected:08X}"
+            if state == RUN_TEST:
+                wake_offsets.add(cnt)
+        completed += state == CHECK_RESULT
+        assert not int(ports.bist_error_irq_o.value), f"Cycle {cycle}: session failed after a masked wake-up"
+
+    assert completed >= 10, f"Only {completed} sessions completed"
+    assert {0, length - 1} <= wake_offsets, f"Wake-ups missed the first/last session cycle: {sorted(wake_offsets)}"
+    dut._log.info(f"✅ Zero-cycle handover at {len(wake_offsets)}/{length} session offsets, "
+                  f"{completed} sessions passed")
+
+
+@cocotb.test()
+async def test_bitslice_seed_signatures(dut):
+    """Random SEED values: fault-free and stuck-at signatures equal the bit-sliced model's lanes."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, 0x08, 3)
+
+    len_sel = 0
+    length = session_length(len_sel)
+    await apb_write(ports, 0x14, config_index(len_sel, OP_MIX))
+    rng = random.Random(48)
+    seeds = [rng.getrandbits(32) | 1 for _ in range(4)]
+    fault = Fault("result", 6, 0)
+    golden = session_signatures(seeds, length, OP_MIX)
+    lanes = Lanes(len(seeds))
+    errors = lanes.unpack(error_signature(session_cycles(lanes, seeds, length, OP_MIX), fault))
+
+    for seed, sig_good, err in zip(seeds, golden, errors):
+        await apb_write(ports, 0x20, seed)
+        for mode, expected in ((FAULT_OFF, sig_good), (FAULT_SA0, sig_good ^ err)):
+            ports.sim_fault_mode_i.value = FAULT_OFF  # disarm: restart the injector's cycle count
+            await RisingEdge(ports.clk_i)
+            ports.drive(sim_fault_mode_i=mode, sim_fault_bit_i=fault.bit, sim_fault_cycle_i=0)
+            await run_one_session(ports, 0x0)
+            sig = await apb_read(ports, 0x10)
+            dut._log.info(f"   SEED 0x{seed:08X} fault mode {mode}: signature 0x{sig:08X}")
+            assert sig == expected, f"SEED 0x{seed:08X} mode {mode}: 0x{sig:08X} != lane 0x{expected:08X}"
+    ports.drive(sim_fault_mode_i=FAULT_OFF)
+    dut._log.info(f"✅ {len(seeds)} seeds: RTL signatures match the bit-sliced model, with and without a fault")
+
+
+@cocotb.test()
+async def test_space_compactor(dut):
+    """Every session cycle the MISR input is the model's compacted result, adder, comparison and equality outputs."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    await reset(ports)
+    await apb_write(ports, 0x08, 3)
+    await apb_write(ports, 0x14, config_index(0, OP_MIX))
+    await apb_write(ports, 0x00, 0x3)  # enable, golden table
+
+    ports.drive(core_sleep_i=1)
+    checked, adder_only = 0, 0
+    for _ in range(400):
+        await RisingEdge(ports.clk_i)
+        await ReadOnly()
+        if not int(dut.bist_active.value):
+            continue
+        pattern, op_mode = int(dut.bist_pattern.value), int(dut.bist_op_mode.value)
+        outputs = (ports.sample("result_o"), ports.sample("adder_result_o"),
+                   ports.sample("comparison_result_o"), ports.sample("is_equal_result_o"))
+        expected = alu_outputs(*bist_operands(pattern, op_mode))
+        assert outputs == expected, f"Pattern 0x{pattern:08X}: ALU outputs {outputs} != model {expected}"
+        response = int(dut.bist_response.value)
+        assert response == alu_response(pattern, op_mode), \
+            f"Pattern 0x{pattern:08X}: MISR input 0x{response:08X} != model 0x{alu_response(pattern, op_mode):08X}"
+        checked += 1
+        adder_only += response != alu_response(pattern, op_mode, compact_all=False)
+    await FallingEdge(ports.clk_i)
+    ports.drive(core_sleep_i=0)
+    await apb_write(ports, 0x00, 0x0)
+
+    assert checked >= 100, f"Only {checked} session cycles sampled"
+    assert adder_only == checked, f"{checked - adder_only} cycles compacted to the bare result"
+    dut._log.info(f"✅ {checked} session cycles: MISR input matches the space-compaction model")
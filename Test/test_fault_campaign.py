@@ -0,0 +1,111 @@
+"""
+Fault-Injection Campaign: ibex_alu_bist_wrapper — bist_fault_injector runs
+Tests: one simulator process runs a list of injections back to back (reset between runs)
+       and records, per injection, whether bist_error_irq_o rose and how many cycles after
+       the fault was first applied.
+
+Tools/fault_campaign.py spreads a campaign over parallel simulator processes:
+    FAULT_CAMPAIGN_IN   JSON {"config": {...}, "injections": [{"id", "mode", "bit", "cycle"}, ...]}
+    FAULT_CAMPAIGN_OUT  JSONL, one result per injection
+Without FAULT_CAMPAIGN_IN a small built-in campaign runs as a regression test.
+"""
+import json
+import os
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer, with_timeout
+from cocotb.utils import get_sim_time
+
+from bist_model import OP_MIX, config_index, session_length
+from dut_ports import IbexAluBistWrapperPorts
+
+CLK_NS = 10
+
+# sim_fault_mode_i (bist_fault_injector)
+FAULT_MODES = {"sa0": 1, "sa1": 2, "flip": 3}
+
+DEFAULT_CONFIG = {"len_sel": 1, "op_mode": OP_MIX, "chkpt": 0, "threshold": 3}
+SMOKE_INJECTIONS = [
+    {"id": 0, "mode": "sa0", "bit": 4, "cycle": 0},
+    {"id": 1, "mode": "sa1", "bit": 17, "cycle": 30},
+    {"id": 2, "mode": "flip", "bit": 9, "cycle": 20},
+    {"id": 3, "mode": "flip", "bit": 31, "cycle": 100},
+]
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+async def reset(ports):
+    ports.reset_inputs(instr_first_cycle_i=1)
+    await Timer(2 * CLK_NS, unit="ns")
+    ports.rst_ni.value = 1
+    await RisingEdge(ports.clk_i)
+
+
+async def run_injection(ports, config, inj, max_cycles):
+    """Inject one fault into continuously repeating sessions and time bist_error_irq_o."""
+    await reset(ports)
+    await apb_write(ports, 0x08, config["threshold"])
+    await apb_write(ports, 0x14, config_index(config["len_sel"], config["op_mode"]))
+    if config["chkpt"]:
+        window_sel = (config["chkpt"] // 32).bit_length() - 1
+        await apb_write(ports, 0x30, 1 | window_sel << 1)
+    ports.drive(sim_fault_mode_i=FAULT_MODES[inj["mode"]], sim_fault_bit_i=inj["bit"], sim_fault_cycle_i=inj["cycle"])
+    await apb_write(ports, 0x00, 0x3)  # enable, golden table
+    ports.core_sleep_i.value = 1
+
+    result = dict(inj, detected=False, activated=False, latency=None)
+    active = ports.dut.u_fault_inj.active
+    try:
+        if int(active.value) != 1:
+            await with_timeout(RisingEdge(active), max_cycles * CLK_NS, "ns")
+    except cocotb.triggers.SimTimeoutError:
+        return result
+    result["activated"] = True
+    start = get_sim_time(unit="ns")
+    try:
+        await with_timeout(RisingEdge(ports.bist_error_irq_o), max_cycles * CLK_NS, "ns")
+    except cocotb.triggers.SimTimeoutError:
+        return result
+    result["detected"] = True
+    result["latency"] = round((get_sim_time(unit="ns") - start) / CLK_NS)
+    return result
+
+
+@cocotb.test()
+async def test_injection_campaign(dut):
+    """Run the injections of FAULT_CAMPAIGN_IN (or the built-in smoke campaign)."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, CLK_NS, unit="ns").start())
+    path = os.environ.get("FAULT_CAMPAIGN_IN")
+    if path:
+        with open(path) as f:
+            campaign = json.load(f)
+    else:
+        campaign = {"config": DEFAULT_CONFIG, "injections": SMOKE_INJECTIONS}
+    config = dict(DEFAULT_CONFIG, **campaign.get("config", {}))
+    # Enough for the faulty session plus the one after it (a late transient lands in the next session)
+    max_cycles = campaign.get("max_cycles", 2 * session_length(config["len_sel"]) + 32)
+
+    out = os.environ.get("FAULT_CAMPAIGN_OUT")
+    results = []
+    with open(out, "w") if out else open(os.devnull, "w") as f:
+        for inj in campaign["injections"]:
+            result = await run_injection(ports, config, inj, max_cycles)
+            results.append(result)
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+
+    if not path:
+        for r in results:
+            assert r["activated"] and r["detected"], f"Smoke injection not detected: {r}"
+            assert r["latency"] <= session_length(config["len_sel"]) + 4, f"Late detection: {r}"
+    detected = sum(r["detected"] for r in results)
+    dut._log.info(f"✅ {len(results)} injections, {detected} detected")
@@ -7,6 +7,8 @@ from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, Timer
 import random
 
+from dut_ports import IbexExBlockPorts
+
 # ALU opcodes
 ALU_ADD = 0
 ALU_SUB = 1
@@ -21,80 +23,57 @@ MD_OP_MULL = 0
 MASK32 = 0xFFFFFFFF
 
 
-async def imd_val_loopback(dut):
+async def imd_val_loopback(ports):
     """Emulates pipeline register for multdiv intermediate values."""
+    clk, we_o, d_0, d_1 = ports.clk_i, ports.imd_val_we_o, ports.imd_val_d_o_0, ports.imd_val_d_o_1
+    q_0, q_1 = ports.imd_val_q_i_0, ports.imd_val_q_i_1
     while True:
-        await RisingEdge(dut.clk_i)
+        await RisingEdge(clk)
         try:
-            we = int(dut.imd_val_we_o.value)
+            we = int(we_o.value)
             if we & 1:
-                dut.imd_val_q_i_0.value = int(dut.imd_val_d_o_0.value)
+                q_0.value = int(d_0.value)
             if we & 2:
-                dut.imd_val_q_i_1.value = int(dut.imd_val_d_o_1.value)
+                q_1.value = int(d_1.value)
         except ValueError:
             pass
 
 
-async def reset(dut):
-    dut.rst_ni.value = 0
-    dut.alu_operand_a_i.value = 0
-    dut.alu_operand_b_i.value = 0
-    dut.alu_operator_i.value = 0
-    dut.alu_instr_first_cycle_i.value = 1
-    dut.multdiv_operator_i.value = 0
-    dut.multdiv_signed_mode_i.value = 0
-    dut.multdiv_operand_a_i.value = 0
-    dut.multdiv_operand_b_i.value = 0
-    dut.multdiv_ready_id_i.value = 1
-    dut.data_ind_timing_i.value = 0
-    dut.mult_sel_i.value = 0
-    dut.div_sel_i.value = 0
-    dut.div_en_i.value = 0
-    dut.bt_a_operand_i.value = 0
-    dut.bt_b_operand_i.value = 0
-    dut.core_sleep_i.value = 0
-    dut.sim_fault_inject_i.value = 0
-    dut.paddr_i.value = 0
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
-    dut.pwrite_i.value = 0
-    dut.pwdata_i.value = 0
-    dut.imd_val_q_i_0.value = 0
-    dut.imd_val_q_i_1.value = 0
+async def reset(ports):
+    ports.reset_inputs(alu_instr_first_cycle_i=1, multdiv_ready_id_i=1)
     await Timer(50, unit="ns")
-    dut.rst_ni.value = 1
-    await RisingEdge(dut.clk_i)
-    await RisingEdge(dut.clk_i)
-
-
-async def apb_write(dut, addr, data):
-    dut.paddr_i.value = addr
-    dut.psel_i.value = 1
-    dut.pwrite_i.value = 1
-    dut.pwdata_i.value = data
-    dut.penable_i.value = 0
-    await RisingEdge(dut.clk_i)
-    dut.penable_i.value = 1
-    await RisingEdge(dut.clk_i)
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
-    dut.pwrite_i.value = 0
-
-
-async def apb_read(dut, addr):
-    dut.paddr_i.value = addr
-    dut.psel_i.value = 1
-    dut.pwrite_i.value = 0
-    dut.penable_i.value = 0
-    await RisingEdge(dut.clk_i)
-    dut.penable_i.value = 1
-    await RisingEdge(dut.clk_i)
-    data = dut.prdata_o.value.to_unsigned()
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
+    ports.rst_ni.value = 1
+    await RisingEdge(ports.clk_i)
+    await RisingEdge(ports.clk_i)
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+async def apb_read(ports, addr):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=0, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    data = ports.sample("prdata_o")
+    ports.drive(psel_i=0, penable_i=0)
     return data
 
 
+async def start(dut):
+    """Clock, imd loopback and reset; returns the DUT's port bundle."""
+    ports = IbexExBlockPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    cocotb.start_soon(imd_val_loopback(ports))
+    await reset(ports)
+    return ports
+
+
 # =========================================================================
 # TESTS
 # =========================================================================
@@ -102,9 +81,7 @@ async def apb_read(dut, addr):
 @cocotb.test()
 async def test_alu_operations(dut):
     """Verify multiple ALU operations: ADD, SUB, AND, OR, XOR."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    cocotb.start_soon(imd_val_loopback(dut))
-    await reset(dut)
+    ports = await start(dut)
 
     cases = [
         (ALU_ADD, 15, 25, 40),
@@ -114,13 +91,9 @@ async def test_alu_operations(dut):
         (ALU_XOR, 0xFF00FF00, 0x0F0F0F0F, 0xF00FF00F),
     ]
     for op, a, b, expected in cases:
-        dut.alu_operator_i.value = op
-        dut.alu_operand_a_i.value = a
-        dut.alu_operand_b_i.value = b
-        dut.mult_sel_i.value = 0
-        dut.div_sel_i.value = 0
-        await RisingEdge(dut.clk_i)
-        res = dut.result_ex_o.value.to_unsigned()
+        ports.drive(alu_operator_i=op, alu_operand_a_i=a, alu_operand_b_i=b, mult_sel_i=0, div_sel_i=0)
+        await RisingEdge(ports.clk_i)
+        res = ports.sample("result_ex_o")
         assert res == expected, f"Op {op}: 0x{a:X} op 0x{b:X} = 0x{res:08X}, expected 0x{expected:08X}"
 
     dut._log.info("✅ All ALU operations verified (ADD, SUB, AND, OR, XOR)")
@@ -129,25 +102,20 @@ async def test_alu_operations(dut):
 @cocotb.test()
 async def test_multiplication(dut):
     """Multi-cycle multiply with loopback."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    cocotb.start_soon(imd_val_loopback(dut))
-    await reset(dut)
+    ports = await start(dut)
 
     cases = [(12, 12, 144), (100, 100, 10000), (7, 8, 56)]
     for a, b, expected in cases:
-        await reset(dut)
-        dut.multdiv_operator_i.value = MD_OP_MULL
-        dut.multdiv_operand_a_i.value = a
-        dut.multdiv_operand_b_i.value = b
-        dut.multdiv_signed_mode_i.value = 0
-        dut.mult_sel_i.value = 1
+        await reset(ports)
+        ports.drive(multdiv_operator_i=MD_OP_MULL, multdiv_operand_a_i=a, multdiv_operand_b_i=b,
+                    multdiv_signed_mode_i=0, mult_sel_i=1)
 
         for _ in range(10):
-            await RisingEdge(dut.clk_i)
+            await RisingEdge(ports.clk_i)
 
-        res = dut.result_ex_o.value.to_unsigned()
+        res = ports.sample("result_ex_o")
         assert res == expected, f"MULT({a}*{b}): got {res}, expected {expected}"
-        dut.mult_sel_i.value = 0
+        ports.drive(mult_sel_i=0)
 
     dut._log.info("✅ Multiplication verified with pipeline loopback")
 
@@ -155,9 +123,7 @@ async def test_multiplication(dut):
 @cocotb.test()
 async def test_random_alu(dut):
     """20 random ALU ADD/SUB operations verified against Python."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    cocotb.start_soon(imd_val_loopback(dut))
-    await reset(dut)
+    ports = await start(dut)
 
     random.seed(2026)
     ops = [(ALU_ADD, lambda a, b: (a + b) & MASK32),
@@ -169,12 +135,9 @@ async def test_random_alu(dut):
         b = random.randint(0, MASK32)
         expected = func(a, b)
 
-        dut.alu_operator_i.value = op
-        dut.alu_operand_a_i.value = a
-        dut.alu_operand_b_i.value = b
-        dut.mult_sel_i.value = 0
-        await RisingEdge(dut.clk_i)
-        res = dut.result_ex_o.value.to_unsigned()
+        ports.drive(alu_operator_i=op, alu_operand_a_i=a, alu_operand_b_i=b, mult_sel_i=0)
+        await RisingEdge(ports.clk_i)
+        res = ports.sample("result_ex_o")
         assert res == expected, f"Random #{i}: op={op} 0x{a:X} 0x{b:X} → 0x{res:08X} != 0x{expected:08X}"
 
     dut._log.info("✅ 20 random ALU operations verified")
@@ -183,9 +146,7 @@ async def test_random_alu(dut):
 @cocotb.test()
 async def test_stress_mode_switching(dut):
     """Rapidly switch between normal ALU ops and idle (potential BIST trigger)."""
-    cocotb.start_soon(Clock(dut.clk_i, 10, unit="ns").start())
-    cocotb.start_soon(imd_val_loopback(dut))
-    await reset(dut)
+    ports = await start(dut)
 
     random.seed(99)
     for i in range(50):
@@ -193,14 +154,10 @@ async def test_stress_mode_switching(dut):
         b = random.randint(0, MASK32)
 
         # Normal operation
-        dut.alu_operator_i.value = ALU_ADD
-        dut.alu_operand_a_i.value = a
-        dut.alu_operand_b_i.value = b
-        dut.mult_sel_i.value = 0
-        dut.core_sleep_i.value = 0
-        await RisingEdge(dut.clk_i)
-
-        res = dut.result_ex_o.value.to_unsigned()
+        ports.drive(alu_operator_i=ALU_ADD, alu_operand_a_i=a, alu_operand_b_i=b, mult_sel_i=0, core_sleep_i=0)
+        await RisingEdge(ports.clk_i)
+
+        res = ports.sample("result_ex_o")
         expected = (a + b) & MASK32
         assert res == expected, f"Stress #{i}: 0x{res:08X} != 0x{expected:08X}"
 
@@ -1,10 +1,24 @@
 """
 Unit Test: misr_analyzer — MISR Signature Analyzer
-Tests: reset, clear, determinism, different inputs, single-bit sensitivity.
+Tests: reset, clear, determinism, different inputs, single-bit sensitivity,
+       cycle-by-cycle match with the polynomial MISR model, no cancellation of errors WIDTH cycles apart.
+
+The width comes from the build (make test_misr MISR_WIDTH=16); the model uses
+the bist_poly_pkg default POLY of that width (MISR_POLY at 32 bits).
 """
+import random
+
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+
+from bist_model import default_poly, misr_step
+
+
+def width_mask(dut):
+    """(WIDTH, WIDTH-bit mask) of the build."""
+    width = len(dut.signature)
+    return width, (1 << width) - 1
 
 
 async def reset(dut):
@@ -32,11 +46,12 @@ async def test_clear(dut):
     """Clear should reset signature to 0 after processing data."""
     cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
     await reset(dut)
+    _, mask = width_mask(dut)
 
     # Feed some data
     dut.enable.value = 1
     for i in range(10):
-        dut.dut_response.value = (i + 1) * 0x11111111
+        dut.dut_response.value = ((i + 1) * 0x11111111) & mask
         await RisingEdge(dut.clk)
 
     sig_before = dut.signature.value.to_unsigned()
@@ -58,8 +73,9 @@ async def test_clear(dut):
 async def test_deterministic(dut):
     """Same input sequence should produce the same signature every time."""
     cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    _, mask = width_mask(dut)
 
-    test_data = [0xAAAA_BBBB, 0x1234_5678, 0xDEAD_BEEF, 0x0000_FFFF, 0x8000_0001]
+    test_data = [d & mask for d in (0xAAAA_BBBB, 0x1234_5678, 0xDEAD_BEEF, 0x0000_FFFF, 0x8000_0001)]
     signatures = []
 
     for run in range(2):
@@ -81,6 +97,7 @@ async def test_deterministic(dut):
 async def test_different_inputs(dut):
     """Different input sequences should produce different signatures."""
     cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    _, mask = width_mask(dut)
 
     sequences = [
         [0x1111_1111, 0x2222_2222, 0x3333_3333],
@@ -92,7 +109,7 @@ async def test_different_inputs(dut):
         await reset(dut)
         dut.enable.value = 1
         for d in seq:
-            dut.dut_response.value = d
+            dut.dut_response.value = d & mask
             await RisingEdge(dut.clk)
         dut.enable.value = 0
         await RisingEdge(dut.clk)
@@ -106,11 +123,12 @@ async def test_different_inputs(dut):
 async def test_single_bit_sensitivity(dut):
     """Flipping a single bit in input should change the signature."""
     cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    width, mask = width_mask(dut)
 
-    base_data = [0xAAAA_AAAA, 0x5555_5555, 0x1234_5678]
+    base_data = [d & mask for d in (0xAAAA_AAAA, 0x5555_5555, 0x1234_5678)]
     sigs = []
 
-    for flip_bit in [None, 0, 15, 31]:
+    for flip_bit in [None, 0, width // 2 - 1, width - 1]:
         await reset(dut)
         dut.enable.value = 1
         for i, d in enumerate(base_data):
@@ -126,3 +144,49 @@ async def test_single_bit_sensitivity(dut):
     assert len(set(sigs)) == len(sigs), \
         f"Single-bit flips didn't all produce unique signatures: {[hex(s) for s in sigs]}"
     dut._log.info("✅ Single-bit sensitivity verified")
+
+
+@cocotb.test()
+async def test_polynomial_model(dut):
+    """Every cycle's signature equals bist_model.misr_step with the default POLY, enable toggling."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    width, _ = width_mask(dut)
+    poly = default_poly(width)
+    rng = random.Random(49)
+
+    expected = 0
+    for cycle in range(300):
+        enable = rng.random() < 0.8
+        data = rng.getrandbits(width)
+        dut.enable.value = int(enable)
+        dut.dut_response.value = data
+        await RisingEdge(dut.clk)
+        await ReadOnly()
+        if enable:
+            expected = misr_step(expected, data, width, poly)
+        sig = dut.signature.value.to_unsigned()
+        assert sig == expected, f"Cycle {cycle}: signature 0x{sig:08X}, model 0x{expected:08X}"
+        await FallingEdge(dut.clk)
+    dut._log.info(f"✅ 300 cycles match the {width}-bit POLY 0x{poly:X} model")
+
+
+@cocotb.test()
+async def test_errors_width_apart(dut):
+    """The same bit flipped in two responses WIDTH cycles apart does not cancel (it did with the rotation)."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    width, _ = width_mask(dut)
+    base = [random.getrandbits(width) for _ in range(2 * width + 8)]
+    sigs = []
+    for flips in ((), (3, 3 + width)):
+        await reset(dut)
+        dut.enable.value = 1
+        for i, d in enumerate(base):
+            dut.dut_response.value = d ^ (1 << 7) if i in flips else d
+            await RisingEdge(dut.clk)
+        dut.enable.value = 0
+        await RisingEdge(dut.clk)
+        sigs.append(dut.signature.value.to_unsigned())
+
+    assert sigs[0] != sigs[1], f"Errors {width} cycles apart aliased: 0x{sigs[0]:08X}"
+    dut._log.info(f"✅ Errors {width} cycles apart leave 0x{sigs[0] ^ sigs[1]:08X}")
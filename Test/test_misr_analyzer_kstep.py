@@ -0,0 +1,102 @@
+"""
+Unit Test: misr_analyzer_kstep — k-step MISR
+Tests: reset, k-step signature equals serial compaction (golden model), clear, lane order sensitivity.
+"""
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+
+from bist_model import MISR
+
+
+async def reset(dut):
+    dut.rst_n.value = 0
+    dut.enable.value = 0
+    dut.clear.value = 0
+    dut.dut_response.value = 0
+    await Timer(50, unit="ns")
+    dut.rst_n.value = 1
+    await RisingEdge(dut.clk)
+
+
+def pack(values):
+    """Pack per-lane responses into the dut_response bus ([0] = LSBs)."""
+    bus = 0
+    for k, v in enumerate(values):
+        bus |= (v & 0xFFFFFFFF) << (32 * k)
+    return bus
+
+
+async def compact(dut, words, steps):
+    dut.enable.value = 1
+    for i in range(0, len(words), steps):
+        dut.dut_response.value = pack(words[i:i + steps])
+        await RisingEdge(dut.clk)
+    dut.enable.value = 0
+    await RisingEdge(dut.clk)
+    return dut.signature.value.to_unsigned()
+
+
+@cocotb.test()
+async def test_reset_zero(dut):
+    """After reset, signature should be 0."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    assert dut.signature.value.to_unsigned() == 0, "Signature after reset should be 0"
+    dut._log.info("✅ Signature is 0 after reset")
+
+
+@cocotb.test()
+async def test_matches_serial_misr(dut):
+    """k responses per clock should give the same signature as k serial misr_analyzer steps."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    steps = int(dut.STEPS.value)
+
+    random.seed(29)
+    words = [random.getrandbits(32) for _ in range(steps * 16)]
+    serial = MISR(steps=1)
+    for w in words:
+        serial.clock([w])
+
+    sig = await compact(dut, words, steps)
+    assert sig == serial.signature, f"k-step 0x{sig:08X} != serial 0x{serial.signature:08X}"
+    dut._log.info(f"✅ {len(words)} responses in {len(words) // steps} clocks: 0x{sig:08X}")
+
+
+@cocotb.test()
+async def test_clear(dut):
+    """Clear should reset the signature after processing data."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    steps = int(dut.STEPS.value)
+
+    sig = await compact(dut, [0x1111_1111 * (i + 1) for i in range(steps * 2)], steps)
+    assert sig != 0, "Signature should be non-zero after processing data"
+    dut.clear.value = 1
+    await RisingEdge(dut.clk)
+    dut.clear.value = 0
+    await RisingEdge(dut.clk)
+    assert dut.signature.value.to_unsigned() == 0, "Signature after clear should be 0"
+    dut._log.info("✅ Clear resets signature to 0")
+
+
+@cocotb.test()
+async def test_lane_order(dut):
+    """Swapping two lanes should change the signature (lanes are not symmetric)."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    steps = int(dut.STEPS.value)
+    if steps < 2:
+        dut._log.info("STEPS=1: nothing to swap")
+        return
+
+    words = [0xAAAA_0000 + k for k in range(steps)]
+    swapped = [words[1], words[0]] + words[2:]
+    sigs = []
+    for seq in (words, swapped):
+        await reset(dut)
+        sigs.append(await compact(dut, seq, steps))
+    assert sigs[0] != sigs[1], f"Lane swap not detected: 0x{sigs[0]:08X}"
+    dut._log.info("✅ Lane order sensitivity verified")
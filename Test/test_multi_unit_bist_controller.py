@@ -0,0 +1,430 @@
+"""
+Unit Test: multi_unit_bist_controller — Shared BIST Controller for N Units
+Tests: register map, all idle units pass in one session, fault isolation per unit,
+       per-unit drop-out on a system request, zero-cycle handover under random wake-ups,
+       UNIT_EN mask, signatures of units left out of a session, completion-rate benchmark.
+
+The unit count comes from the build (make test_multi_unit N_UNITS=8); every test
+adapts to len(dut.sys_req_valid).
+"""
+import json
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer, with_timeout
+
+from bist_model import OP_MIX, alu_response, config_index
+
+# Register map
+REG_CTRL = 0x00
+REG_STATUS = 0x04
+REG_THRESHOLD = 0x08
+REG_CFG = 0x14
+REG_SEED = 0x20
+REG_IRQ_EN = 0x28
+REG_IRQ_STATUS = 0x2C
+REG_UNIT_EN = 0x30
+REG_UNIT_PASS = 0x34
+REG_UNIT_FAIL = 0x38
+REG_UNIT_ACTIVE = 0x3C
+REG_UNIT_SIG = 0x40
+REG_UNIT_COUNT = 0x60
+
+CTRL_EN = 0x1
+CTRL_GOLDEN_TABLE = 0x2
+
+IRQ_DONE = 0x1
+IRQ_FAIL = 0x2
+IRQ_ABORT = 0x4
+IRQ_ALL = 0x7
+
+RUN_TEST = 2  # state_t
+
+# 32-cycle MIX sessions keep the benchmark short
+BENCH_CFG = config_index(0, OP_MIX)
+BENCH_CYCLES = 20000
+BENCH_THRESHOLD = 8
+# Per-unit system traffic: busy bursts and idle gaps, uniform lengths in cycles
+BENCH_BUSY = (10, 100)
+BENCH_IDLE = (20, 400)
+
+
+def n_units(dut):
+    return len(dut.sys_req_valid)
+
+
+async def reset(dut):
+    dut.rst_n.value = 0
+    dut.sys_req_valid.value = 0
+    dut.dut_result_in.value = 0
+    dut.paddr.value = 0
+    dut.psel.value = 0
+    dut.penable.value = 0
+    dut.pwrite.value = 0
+    dut.pwdata.value = 0
+    await Timer(50, unit="ns")
+    dut.rst_n.value = 1
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+
+
+async def apb_write(dut, addr, data):
+    dut.paddr.value = addr
+    dut.psel.value = 1
+    dut.pwrite.value = 1
+    dut.pwdata.value = data
+    dut.penable.value = 0
+    await RisingEdge(dut.clk)
+    dut.penable.value = 1
+    await RisingEdge(dut.clk)
+    dut.psel.value = 0
+    dut.penable.value = 0
+    dut.pwrite.value = 0
+
+
+async def apb_read(dut, addr):
+    dut.paddr.value = addr
+    dut.psel.value = 1
+    dut.pwrite.value = 0
+    dut.penable.value = 0
+    await RisingEdge(dut.clk)
+    dut.penable.value = 1
+    await RisingEdge(dut.clk)
+    data = dut.prdata.value.to_unsigned()
+    dut.psel.value = 0
+    dut.penable.value = 0
+    return data
+
+
+async def unit_model(dut, fault_masks=None, busy=None, rng=None):
+    """Drive every unit's ALU response to the broadcast pattern (random system results while busy).
+
+    busy: optional callable(unit) -> bool giving the unit's system request for the next cycle.
+    """
+    n = n_units(dut)
+    fault_masks = fault_masks or [0] * n
+    rng = rng or random.Random(0)
+    while True:
+        await FallingEdge(dut.clk)
+        resp = alu_response(dut.bist_pattern_out.value.to_unsigned(), dut.bist_op_mode.value.to_unsigned())
+        req, packed = 0, 0
+        for u in range(n):
+            if busy is not None and busy(u):
+                req |= 1 << u
+                packed |= rng.getrandbits(32) << (32 * u)
+            else:
+                packed |= (resp ^ fault_masks[u]) << (32 * u)
+        if busy is not None:
+            dut.sys_req_valid.value = req
+        dut.dut_result_in.value = packed
+
+
+async def wait_high(signal, timeout_us=20):
+    """Wait until a 1-bit signal is high (no bus traffic)."""
+    if int(signal.value) != 1:
+        await with_timeout(RisingEdge(signal), timeout_us, "us")
+
+
+async def wait_not_busy(dut, timeout=600):
+    """Poll STATUS until the running session (if any) has finished."""
+    for _ in range(timeout):
+        if not await apb_read(dut, REG_STATUS) & 1:
+            return
+        await RisingEdge(dut.clk)
+    raise TimeoutError("BIST session did not complete")
+
+
+async def unit_counts(dut, unit):
+    """(completed, aborted) sessions of one unit."""
+    count = await apb_read(dut, REG_UNIT_COUNT + 4 * unit)
+    return count & 0xFFFF, count >> 16
+
+
+async def run_one_session(dut, ctrl=CTRL_GOLDEN_TABLE):
+    """Start a session, clear CTRL[0] while it runs, wait for the done IRQ."""
+    await apb_write(dut, REG_IRQ_EN, IRQ_DONE)
+    await apb_write(dut, REG_CTRL, ctrl | CTRL_EN)
+    await wait_high(dut.bist_irq)
+    await apb_write(dut, REG_CTRL, ctrl)
+    # CTRL[0] may have been cleared after a follow-up session started: let it finish
+    await wait_not_busy(dut)
+    await apb_write(dut, REG_IRQ_STATUS, IRQ_ALL)
+
+
+@cocotb.test()
+async def test_register_map(dut):
+    """Reset values of the shared and per-unit registers, UNIT_EN read/write."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    all_units = (1 << n) - 1
+
+    assert await apb_read(dut, REG_UNIT_EN) == all_units, "UNIT_EN should reset to all units"
+    assert await apb_read(dut, REG_SEED) == 0xDEAD_BEEF, "SEED reset value"
+    assert await apb_read(dut, REG_CFG) == 0x3, "CFG reset value (256-cycle COMPL)"
+    for reg in (REG_STATUS, REG_UNIT_PASS, REG_UNIT_FAIL, REG_UNIT_ACTIVE):
+        assert await apb_read(dut, reg) == 0, f"Register 0x{reg:02X} should reset to 0"
+    for u in range(n):
+        assert await unit_counts(dut, u) == (0, 0), f"Unit {u} counters should reset to 0"
+
+    await apb_write(dut, REG_UNIT_EN, 0x1)
+    assert await apb_read(dut, REG_UNIT_EN) == 0x1, "UNIT_EN read-back mismatch"
+    dut._log.info(f"✅ Register map verified ({n} units)")
+
+
+@cocotb.test()
+async def test_all_units_one_session(dut):
+    """Idle units are enrolled together and all pass against the golden table."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    all_units = (1 << n) - 1
+    cocotb.start_soon(unit_model(dut))
+
+    await apb_write(dut, REG_THRESHOLD, 3)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await run_one_session(dut)
+
+    assert await apb_read(dut, REG_UNIT_PASS) == all_units, "Every unit should PASS"
+    assert await apb_read(dut, REG_UNIT_FAIL) == 0, "No unit should FAIL"
+    assert int(dut.error_irq.value) == 0, "error_irq must stay low"
+    sig0 = await apb_read(dut, REG_UNIT_SIG)
+    for u in range(n):
+        done, aborted = await unit_counts(dut, u)
+        assert done >= 1 and aborted == 0, f"Unit {u}: completed {done}, aborted {aborted}"
+        sig = await apb_read(dut, REG_UNIT_SIG + 4 * u)
+        assert sig == sig0, f"Unit {u} signature 0x{sig:08X} != unit 0 0x{sig0:08X}"
+    dut._log.info(f"✅ {n} units tested in one shared session, signature 0x{sig0:08X}")
+
+
+@cocotb.test()
+async def test_fault_isolated_to_unit(dut):
+    """A stuck bit in one unit fails that unit only."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    bad = n - 1
+    masks = [0] * n
+    masks[bad] = 1 << 5
+    cocotb.start_soon(unit_model(dut, fault_masks=masks))
+
+    await apb_write(dut, REG_THRESHOLD, 3)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await apb_write(dut, REG_IRQ_EN, IRQ_FAIL)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE | CTRL_EN)
+    await wait_high(dut.bist_irq)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE)
+
+    assert await apb_read(dut, REG_UNIT_FAIL) == 1 << bad, "Only the faulty unit should FAIL"
+    assert await apb_read(dut, REG_UNIT_PASS) == ((1 << n) - 1) & ~(1 << bad), "The other units should PASS"
+    assert int(dut.error_irq.value) == 1, "error_irq should be set"
+    dut._log.info(f"✅ Fault isolated to unit {bad}")
+
+
+@cocotb.test()
+async def test_unit_drop_out(dut):
+    """A system request aborts the session for that unit only; the others complete."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    requests = {"unit0": False}
+    cocotb.start_soon(unit_model(dut, busy=lambda u: u == 0 and requests["unit0"]))
+
+    await apb_write(dut, REG_THRESHOLD, 3)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await apb_write(dut, REG_IRQ_EN, IRQ_ABORT)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE | CTRL_EN)
+    await wait_high(dut.bist_active_mode[0])
+    await Timer(100, unit="ns")
+    requests["unit0"] = True
+
+    await wait_high(dut.bist_irq)
+    await RisingEdge(dut.clk)
+    assert int(dut.bist_active_mode.value) & 1 == 0, "Unit 0 must be released on its system request"
+    if n > 1:
+        assert int(dut.bist_active_mode.value) >> 1 != 0, "The other units should keep testing"
+
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE)
+    await wait_not_busy(dut)
+    done, aborted = await unit_counts(dut, 0)
+    assert (done, aborted) == (0, 1), f"Unit 0: completed {done}, aborted {aborted}"
+    assert await apb_read(dut, REG_UNIT_PASS) == ((1 << n) - 1) & ~1, "Units 1..N-1 should PASS"
+    requests["unit0"] = False
+    dut._log.info("✅ Unit 0 dropped out, the other units completed")
+
+
+@cocotb.test()
+async def test_zero_cycle_handover(dut):
+    """A unit's request releases its operands and MISR in the request cycle; sessions still pass.
+
+    When the request drops the last enrolled unit, the LFSR and the cycle counter hold too.
+    """
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    await apb_write(dut, REG_THRESHOLD, 2)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE | CTRL_EN)
+    rng = random.Random(44)
+
+    sleeping = [False] * n
+    served, last_drops = 0, 0
+    for cycle in range(6000):
+        await FallingEdge(dut.clk)
+        resp = alu_response(dut.bist_pattern_out.value.to_unsigned(), dut.bist_op_mode.value.to_unsigned())
+        req, packed = 0, 0
+        for u in range(n):
+            # Random interrupts: short busy bursts, sleep periods around one session long
+            sleeping[u] = rng.random() < (0.97 if sleeping[u] else 0.3)
+            if sleeping[u]:
+                packed |= resp << (32 * u)
+            else:
+                req |= 1 << u
+                packed |= rng.getrandbits(32) << (32 * u)
+        dut.sys_req_valid.value = req
+        dut.dut_result_in.value = packed
+        await ReadOnly()
+        active, misr_en = int(dut.bist_active_mode.value), int(dut.misr_en.value)
+        assert active & req == 0, f"Cycle {cycle}: BIST keeps units 0x{active & req:X} during their request"
+        assert misr_en & req == 0, f"Cycle {cycle}: MISR of units 0x{misr_en & req:X} updated during a request"
+        if int(dut.state.value) == RUN_TEST:
+            enrolled = int(dut.enrolled.value)
+            served += bin(enrolled & req).count("1")
+            if enrolled & ~req == 0:
+                assert not int(dut.lfsr_en.value), f"Cycle {cycle}: LFSR advanced after the last unit dropped"
+                last_drops += 1
+
+    # Finish the running session with every unit asleep
+    cocotb.start_soon(unit_model(dut, busy=lambda u: False))
+    await FallingEdge(dut.clk)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE)
+    await wait_not_busy(dut)
+    completed = sum([(await unit_counts(dut, u))[0] for u in range(n)])
+    fails = await apb_read(dut, REG_UNIT_FAIL)
+    assert fails == 0, f"UNIT_FAIL 0x{fails:X} after masked wake-ups"
+    assert completed >= n, f"Only {completed} unit sessions completed"
+    assert served > 0 and last_drops > 0, f"Wake-ups of enrolled units: {served}, of the last unit: {last_drops}"
+    dut._log.info(f"✅ {served} wake-ups of enrolled units served in the request cycle ({last_drops} of the last "
+                  f"unit), {completed} unit sessions passed")
+
+
+@cocotb.test()
+async def test_unit_enable_mask(dut):
+    """Units cleared in UNIT_EN are never enrolled."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    mask = 0x5 & ((1 << n) - 1)
+    cocotb.start_soon(unit_model(dut))
+
+    await apb_write(dut, REG_THRESHOLD, 3)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await apb_write(dut, REG_UNIT_EN, mask)
+    await run_one_session(dut)
+
+    assert await apb_read(dut, REG_UNIT_PASS) == mask, f"Only UNIT_EN 0x{mask:X} units should be tested"
+    for u in range(n):
+        done, _ = await unit_counts(dut, u)
+        assert (done > 0) == bool(mask >> u & 1), f"Unit {u}: completed {done} with UNIT_EN 0x{mask:X}"
+    dut._log.info(f"✅ UNIT_EN 0x{mask:X} respected")
+
+
+@cocotb.test()
+async def test_idle_unit_keeps_signature(dut):
+    """A unit left out of a session (UNIT_EN-masked or busy) keeps UNIT_SIG of its last session."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+    if n == 1:
+        dut._log.info("Single-unit build: no other unit can run a session, skipped")
+        return
+    all_units = (1 << n) - 1
+    masks = [0] * n
+    masks[0] = 1 << 5
+    requests = {"unit0": False}
+    cocotb.start_soon(unit_model(dut, fault_masks=masks, busy=lambda u: u == 0 and requests["unit0"]))
+
+    await apb_write(dut, REG_THRESHOLD, 3)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    await run_one_session(dut)
+    assert await apb_read(dut, REG_UNIT_FAIL) == 1, "Unit 0 should FAIL"
+    bad_sig = await apb_read(dut, REG_UNIT_SIG)
+    good_sig = await apb_read(dut, REG_UNIT_SIG + 4)
+    assert bad_sig != good_sig, "The faulty unit should have its own signature"
+    counts0 = await unit_counts(dut, 0)
+
+    for left_out in ("masked", "busy"):
+        if left_out == "masked":
+            await apb_write(dut, REG_UNIT_EN, all_units & ~1)
+        else:
+            await apb_write(dut, REG_UNIT_EN, all_units)
+            requests["unit0"] = True
+        done_before, _ = await unit_counts(dut, 1)
+        await run_one_session(dut)
+        done, _ = await unit_counts(dut, 1)
+        assert done > done_before, f"Unit 1 should complete a session with unit 0 {left_out}"
+        assert await unit_counts(dut, 0) == counts0, f"Unit 0 must not be enrolled while {left_out}"
+        sig = await apb_read(dut, REG_UNIT_SIG)
+        assert sig == bad_sig, f"Unit 0 ({left_out}) signature 0x{sig:08X}, expected 0x{bad_sig:08X}"
+        assert await apb_read(dut, REG_UNIT_FAIL) == 1, f"Unit 0 ({left_out}) should still report FAIL"
+    requests["unit0"] = False
+    dut._log.info(f"✅ Unit 0 kept its failing signature 0x{bad_sig:08X} while masked and while busy")
+
+
+@cocotb.test()
+async def test_completion_rate_benchmark(dut):
+    """Sessions completed per 1000 cycles under independent random traffic on every unit.
+
+    Unit u sees the same traffic whatever N is, so runs with different N_UNITS
+    are comparable (Tools/multi_unit_bench.py collects them). The result is
+    written to $MULTI_UNIT_BENCH_JSON when set.
+    """
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset(dut)
+    n = n_units(dut)
+
+    traffic = [random.Random(1000 + u) for u in range(n)]
+    state = [{"busy": False, "left": traffic[u].randint(*BENCH_IDLE)} for u in range(n)]
+    idle_cycles = [0] * n
+
+    def busy(u):
+        s = state[u]
+        s["left"] -= 1
+        if s["left"] <= 0:
+            s["busy"] = not s["busy"]
+            s["left"] = traffic[u].randint(*(BENCH_BUSY if s["busy"] else BENCH_IDLE))
+        idle_cycles[u] += not s["busy"]
+        return s["busy"]
+
+    await apb_write(dut, REG_THRESHOLD, BENCH_THRESHOLD)
+    await apb_write(dut, REG_CFG, BENCH_CFG)
+    cocotb.start_soon(unit_model(dut, busy=busy))
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE | CTRL_EN)
+    for _ in range(BENCH_CYCLES):
+        await RisingEdge(dut.clk)
+    await apb_write(dut, REG_CTRL, CTRL_GOLDEN_TABLE)
+
+    per_unit = [await unit_counts(dut, u) for u in range(n)]
+    fails = await apb_read(dut, REG_UNIT_FAIL)
+    assert fails == 0, f"UNIT_FAIL 0x{fails:X}: fault-free units must never fail"
+    completed = sum(d for d, _ in per_unit)
+    aborted = sum(a for _, a in per_unit)
+    assert all(d > 0 for d, _ in per_unit), f"Every unit should complete a session: {per_unit}"
+
+    result = {
+        "n_units": n,
+        "cycles": BENCH_CYCLES,
+        "completed": completed,
+        "aborted": aborted,
+        "sessions_per_kcycle": 1000.0 * completed / BENCH_CYCLES,
+        "per_unit": [{"completed": d, "aborted": a, "idle_cycles": i}
+                     for (d, a), i in zip(per_unit, idle_cycles)],
+    }
+    out = os.environ.get("MULTI_UNIT_BENCH_JSON")
+    if out:
+        with open(out, "w") as f:
+            json.dump(result, f, indent=2)
+    dut._log.info(f"✅ {n} units: {completed} sessions completed, {aborted} aborted in {BENCH_CYCLES} cycles "
+                  f"({result['sessions_per_kcycle']:.2f} sessions/kcycle)")
@@ -0,0 +1,203 @@
+"""
+Parameter Sweep Point: ibex_alu_bist_wrapper — one build configuration, a list of runtime points
+Tests: per point (len_sel, op_mode, threshold) on the built parameters (TIMER_WIDTH, RV32B):
+           THRESHOLD readback (truncated to TIMER_WIDTH bits)
+           two sessions from sleep to verdict: pass against the golden table, model signature,
+               BIST latency (cycles from the first sleeping cycle to CHECK_RESULT)
+           zero-cycle handover in the middle of a session, then the resumed session passes
+           stuck-at-0 on a result bit is detected (fail) whenever the model predicts it
+
+Tools/param_sweep.py builds one simulator per build point and runs the runtime points in parallel:
+    PARAM_SWEEP_IN   JSON {"build": {...}, "points": [{"len_sel", "op_mode", "threshold"}, ...]}
+    PARAM_SWEEP_OUT  JSONL, one result per point
+Without PARAM_SWEEP_IN every session length runs once as a regression test.
+"""
+import json
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+
+from bist_ctrl_model import CHECK_RESULT, RUN_TEST
+from bist_model import (ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, INITIAL_SEED, LEN_SELECTS, OP_COMPL, OP_MIX,
+                        alu_result, config_index, session_length, session_signature)
+from dut_ports import IbexAluBistWrapperPorts
+from fault_model import Fault, faulty_response
+
+REG_CTRL = 0x00
+REG_STATUS = 0x04
+REG_THRESHOLD = 0x08
+REG_SIGNATURE = 0x10
+REG_CFG = 0x14
+CTRL_EN_GOLDEN = 0x3  # enable, golden table
+FAULT_OFF = 0
+FAULT_SA0 = 1
+
+SESSIONS = 2
+# Sleep-to-verdict cycles beyond THRESHOLD + session length: idle detection and WAIT_FOR_SLOT
+LATENCY_OVERHEAD = 2
+# Sleep-to-verdict margin over THRESHOLD + session length before a point times out
+TIMEOUT_SLACK = 64
+CORE_OPS = (ALU_ADD, ALU_SUB, ALU_XOR, ALU_SLL)
+DEFAULT_POINTS = [{"len_sel": s, "op_mode": OP_MIX, "threshold": 3} for s in LEN_SELECTS] + \
+                 [{"len_sel": 0, "op_mode": OP_COMPL, "threshold": 20}]
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+async def apb_read(ports, addr):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=0, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    data = ports.sample("prdata_o")
+    ports.drive(psel_i=0, penable_i=0)
+    return data
+
+
+def detectable_bit(length, op_mode):
+    """A result bit whose stuck-at-0 changes the model signature, or None."""
+    golden = session_signature(INITIAL_SEED, length, op_mode)
+    for bit in range(32):
+        faulty = session_signature(INITIAL_SEED, length, op_mode,
+                                   response=lambda p, m, b=bit: faulty_response(p, m, Fault("result", b, 0)))
+        if faulty != golden:
+            return bit
+    return None
+
+
+async def sleep_until(ports, ctrl, done, timeout):
+    """Sleep from the next falling edge on; cycles until done(ctrl) holds after a rising edge."""
+    await FallingEdge(ports.clk_i)
+    ports.core_sleep_i.value = 1
+    for cycles in range(1, timeout + 1):
+        await RisingEdge(ports.clk_i)
+        await ReadOnly()
+        if done(ctrl):
+            return cycles
+    return None
+
+
+async def wake(ports):
+    await FallingEdge(ports.clk_i)
+    ports.core_sleep_i.value = 0
+
+
+async def run_point(ports, point):
+    """Measure one runtime point. Returns its result record."""
+    ctrl = ports.dut.u_bist_ctrl
+    len_sel, op_mode, threshold = point["len_sel"], point["op_mode"], point["threshold"]
+    length = session_length(len_sel)
+    failures = []
+    result = dict(point, length=length, latency=None, handover_ok=None, fault_detected=None)
+
+    await Timer(1, unit="ns")  # leave the read-only phase of the previous point
+    ports.reset_inputs(instr_first_cycle_i=1)
+    await Timer(20, unit="ns")
+    ports.rst_ni.value = 1
+    await RisingEdge(ports.clk_i)
+    await apb_write(ports, REG_THRESHOLD, threshold)
+    await apb_write(ports, REG_CFG, config_index(len_sel, op_mode))
+    await apb_write(ports, REG_CTRL, CTRL_EN_GOLDEN)
+    effective = threshold & ((1 << len(ctrl.reg_threshold)) - 1)
+    readback = await apb_read(ports, REG_THRESHOLD)
+    result["threshold_effective"] = effective
+    if readback != effective:
+        failures.append(f"THRESHOLD reads {readback}, expected {effective}")
+    timeout = effective + length + TIMEOUT_SLACK
+    expected = session_signature(INITIAL_SEED, length, op_mode)
+
+    async def verdict(label):
+        status = await apb_read(ports, REG_STATUS)
+        signature = await apb_read(ports, REG_SIGNATURE)
+        if status & 0x6 != 0x4 or signature != expected:
+            failures.append(f"{label}: STATUS 0x{status:X}, SIGNATURE 0x{signature:08X} (model 0x{expected:08X})")
+
+    # Sessions from sleep to verdict
+    latencies = []
+    for s in range(SESSIONS):
+        cycles = await sleep_until(ports, ctrl, lambda c: int(c.state.value) == CHECK_RESULT, timeout)
+        await wake(ports)
+        if cycles is None:
+            failures.append(f"session {s}: no verdict within {timeout} cycles")
+            break
+        latencies.append(cycles)
+        await verdict(f"session {s}")
+    result["latency"] = max(latencies) if latencies else None
+    if len(set(latencies)) > 1:
+        failures.append(f"latency differs between sessions: {latencies}")
+
+    # Zero-cycle handover half-way through a session, then the resumed session passes
+    middle = await sleep_until(ports, ctrl, lambda c: int(c.state.value) == RUN_TEST and
+                               int(c.test_cycle_cnt.value) == length // 2, timeout)
+    if middle is None:
+        failures.append("handover: session did not reach its middle cycle")
+    else:
+        await FallingEdge(ports.clk_i)
+        op, a, b = random.choice(CORE_OPS), random.getrandbits(32), random.getrandbits(32)
+        ports.drive(core_sleep_i=0, operator_i=op, operand_a_i=a, operand_b_i=b)
+        await ReadOnly()
+        result["handover_ok"] = (ports.sample("result_o") == alu_result(op, a, b)
+                                 and not int(ports.dut.bist_active.value))
+        if not result["handover_ok"]:
+            failures.append("handover: core operation not served in the request cycle")
+        if await sleep_until(ports, ctrl, lambda c: int(c.state.value) == CHECK_RESULT, timeout) is None:
+            failures.append("handover: resumed session did not finish")
+        await wake(ports)
+        await verdict("resumed session")
+
+    # Stuck-at-0 on a result bit the model says the signature observes
+    bit = detectable_bit(length, op_mode)
+    if bit is not None:
+        ports.drive(sim_fault_mode_i=FAULT_SA0, sim_fault_bit_i=bit, sim_fault_cycle_i=0)
+        await sleep_until(ports, ctrl, lambda c: int(c.state.value) == CHECK_RESULT, timeout)
+        await wake(ports)
+        ports.drive(sim_fault_mode_i=FAULT_OFF)
+        status = await apb_read(ports, REG_STATUS)
+        result["fault_detected"] = bool(status & 0x2)
+        if not result["fault_detected"]:
+            failures.append(f"stuck-at-0 on result bit {bit} not detected (STATUS 0x{status:X})")
+
+    result["passed"] = not failures
+    result["failures"] = failures
+    return result
+
+
+@cocotb.test()
+async def test_param_sweep_points(dut):
+    """Run the points of PARAM_SWEEP_IN (or every session length) on this build."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, 10, unit="ns").start())
+    random.seed(47)
+    path = os.environ.get("PARAM_SWEEP_IN")
+    sweep = {"points": DEFAULT_POINTS}
+    if path:
+        with open(path) as f:
+            sweep = json.load(f)
+
+    out = os.environ.get("PARAM_SWEEP_OUT")
+    results = []
+    with open(out, "w") if out else open(os.devnull, "w") as f:
+        for point in sweep["points"]:
+            result = dict(await run_point(ports, point), build=sweep.get("build", {}))
+            results.append(result)
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+            dut._log.info(f"   len {result['length']:>3} op {point['op_mode']} threshold {point['threshold']:>5}: "
+                          f"latency {result['latency']}, {'pass' if result['passed'] else 'FAIL'}")
+
+    if not path:
+        failed = [r for r in results if not r["passed"]]
+        assert not failed, f"Failing points: {[(r['len_sel'], r['op_mode'], r['failures']) for r in failed]}"
+        for r in results:
+            assert r["latency"] == r["threshold"] + r["length"] + LATENCY_OVERHEAD, \
+                f"Latency {r['latency']} for threshold {r['threshold']}, {r['length']} cycles"
+    dut._log.info(f"✅ {len(results)} sweep point(s) run")
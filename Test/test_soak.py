@@ -0,0 +1,232 @@
+"""
+Soak Test: ibex_alu_bist_wrapper — long-run mixed traffic, sleep and runtime BIST
+Tests: one test drives a cycle budget of core traffic (random ALU operations checked against
+       Python every cycle) alternating with sleep periods in which the controller runs BIST
+       sessions, services bist_irq_o over APB (IRQ_STATUS read + W1C) and keeps streaming
+       counters. The lockstep scoreboard (bist_scoreboard.py) checks the controller every cycle.
+
+The loop keeps O(1) state (counters and cached handles, no per-cycle history) so it can
+run for hours at constant memory and speed. Environment:
+    SOAK_CYCLES      cycle budget (default 20000: regression smoke run)
+    SOAK_PROFILE     traffic profile, one of PROFILES (default "mixed")
+    SOAK_SEED        traffic seed (default 1)
+    SOAK_SNAPSHOT    cycles between progress snapshots (default SOAK_CYCLES / 10)
+    SOAK_OUT         JSONL file for the snapshots (one JSON object per snapshot)
+    SOAK_SCOREBOARD  0 disables the lockstep scoreboard (faster)
+"""
+import json
+import os
+import random
+import time
+from collections import deque
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge, Timer
+from cocotb.utils import get_sim_time
+
+from bist_ctrl_model import ABORT, CHECK_RESULT, RUN_TEST
+from bist_model import ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, OP_MIX, alu_result, config_index
+from bist_scoreboard import BistScoreboard
+from dut_ports import IbexAluBistWrapperPorts
+
+CLK_NS = 10
+
+REG_CTRL = 0x00
+REG_THRESHOLD = 0x08
+REG_CFG = 0x14
+REG_IRQ_EN = 0x28
+REG_IRQ_STATUS = 0x2C
+CTRL_EN_GOLDEN_ROTATE = 0x7  # enable, golden table, seed rotation
+IRQ_DONE, IRQ_FAIL, IRQ_ABORT = 0x1, 0x2, 0x4
+
+CORE_OPS = (ALU_ADD, ALU_SUB, ALU_XOR, ALU_SLL)
+
+# Traffic profiles: mean busy/sleep burst lengths (cycles, geometric), share of busy cycles
+# that issue an ALU operation, idle threshold and session configuration
+PROFILES = {
+    "mixed":  {"busy_mean": 400, "sleep_mean": 300, "op_rate": 0.8, "threshold": 50, "len_sel": 1},
+    "sleepy": {"busy_mean": 100, "sleep_mean": 2000, "op_rate": 0.5, "threshold": 20, "len_sel": 3},
+    "busy":   {"busy_mean": 3000, "sleep_mean": 150, "op_rate": 0.95, "threshold": 100, "len_sel": 0},
+    "choppy": {"busy_mean": 20, "sleep_mean": 90, "op_rate": 0.7, "threshold": 10, "len_sel": 2},
+}
+
+
+class SoakStats:
+    """Streaming counters of a soak run (constant size)."""
+    FIELDS = ("cycles", "busy_cycles", "sleep_cycles", "bist_cycles", "ops_checked", "sessions_started",
+              "sessions_aborted", "sessions_completed", "sessions_failed", "irqs", "irq_done", "irq_fail",
+              "irq_abort", "apb_transfers")
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for name in self.FIELDS:
+            setattr(self, name, 0)
+
+    @property
+    def sessions_passed(self):
+        return self.sessions_completed - self.sessions_failed
+
+    def as_dict(self):
+        return dict({name: getattr(self, name) for name in self.FIELDS}, sessions_passed=self.sessions_passed)
+
+
+def rss_kib():
+    """Current resident set size of the simulator process (KiB), None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+async def reset(ports):
+    ports.reset_inputs(instr_first_cycle_i=1)
+    await Timer(50, unit="ns")
+    ports.rst_ni.value = 1
+    await RisingEdge(ports.clk_i)
+    await RisingEdge(ports.clk_i)
+
+
+async def apb_write(ports, addr, data):
+    ports.drive(paddr_i=addr, psel_i=1, pwrite_i=1, pwdata_i=data, penable_i=0)
+    await RisingEdge(ports.clk_i)
+    ports.penable_i.value = 1
+    await RisingEdge(ports.clk_i)
+    ports.reset_inputs("apb")
+
+
+@cocotb.test()
+async def test_soak(dut):
+    """Cycle-budgeted soak of traffic, sleep, BIST sessions and IRQ servicing with streaming counters."""
+    ports = IbexAluBistWrapperPorts(dut)
+    cocotb.start_soon(Clock(ports.clk_i, CLK_NS, unit="ns").start())
+    budget = int(float(os.environ.get("SOAK_CYCLES", 20000)))
+    profile_name = os.environ.get("SOAK_PROFILE", "mixed")
+    profile = PROFILES[profile_name]
+    every = int(float(os.environ.get("SOAK_SNAPSHOT", 0))) or max(1, budget // 10)
+    rng = random.Random(int(os.environ.get("SOAK_SEED", 1)))
+
+    await reset(ports)
+    scoreboard = None
+    if os.environ.get("SOAK_SCOREBOARD", "1") != "0":
+        scoreboard = BistScoreboard(dut.u_bist_ctrl, clk=ports.clk_i, rst_n=ports.rst_ni).start()
+    await apb_write(ports, REG_THRESHOLD, profile["threshold"])
+    await apb_write(ports, REG_CFG, config_index(profile["len_sel"], OP_MIX))
+    await apb_write(ports, REG_IRQ_EN, IRQ_DONE | IRQ_FAIL | IRQ_ABORT)
+    await apb_write(ports, REG_CTRL, CTRL_EN_GOLDEN_ROTATE)
+
+    # Cached handles (hot loop)
+    clk = ports.clk_i
+    sleep_h, op_h, a_h, b_h, res_h = ports.core_sleep_i, ports.operator_i, ports.operand_a_i, ports.operand_b_i, \
+        ports.result_o
+    psel_h, penable_h, pwrite_h, paddr_h, pwdata_h, prdata_h = ports.psel_i, ports.penable_i, ports.pwrite_i, \
+        ports.paddr_i, ports.pwdata_i, ports.prdata_o
+    irq_h, err_h = ports.bist_irq_o, ports.bist_error_irq_o
+    ctrl = dut.u_bist_ctrl
+    state_h, cnt_h, active_h = ctrl.state, ctrl.test_cycle_cnt, ctrl.bist_active_mode
+
+    stats = SoakStats()
+    out = open(os.environ["SOAK_OUT"], "w") if os.environ.get("SOAK_OUT") else None
+    busy_p, sleep_p = 1 / profile["busy_mean"], 1 / profile["sleep_mean"]
+    op_rate = profile["op_rate"]
+    sleeping = False
+    prev_err = 0
+    apb = deque()       # pending APB phases of the IRQ handler: (psel, penable, pwrite, paddr, pwdata)
+    irq_read = False    # the current access phase returns IRQ_STATUS
+    t0 = last_wall = time.monotonic()
+    last_cycle = 0
+
+    for cycle in range(budget):
+        await FallingEdge(clk)
+        # Core: geometric busy/sleep bursts; the wake-up cycle may issue an op (zero-cycle handover)
+        if sleeping:
+            if rng.random() < sleep_p:
+                sleeping = False
+        elif rng.random() < busy_p:
+            sleeping = True
+        issue = not sleeping and rng.random() < op_rate
+        sleep_h.value = int(sleeping)
+        if issue:
+            op, a, b = CORE_OPS[rng.randrange(4)], rng.getrandbits(32), rng.getrandbits(32)
+            op_h.value, a_h.value, b_h.value = op, a, b
+
+        # IRQ handler: read IRQ_STATUS, write the pending bits back (W1C)
+        if apb:
+            psel, penable, pwrite, paddr, pwdata = apb.popleft()
+            psel_h.value, penable_h.value, pwrite_h.value, paddr_h.value, pwdata_h.value = \
+                psel, penable, pwrite, paddr, pwdata
+            irq_read = penable and not pwrite
+        elif int(psel_h.value):
+            psel_h.value, penable_h.value = 0, 0
+
+        await ReadOnly()
+        if issue:
+            assert not int(active_h.value), f"Cycle {cycle}: core operation issued while BIST drives the ALU"
+            res, expected = int(res_h.value), alu_result(op, a, b)
+            assert res == expected, \
+                f"Cycle {cycle}: op {op} 0x{a:08X}, 0x{b:08X} -> 0x{res:08X}, expected 0x{expected:08X}"
+            stats.ops_checked += 1
+        if irq_read:
+            pending = int(prdata_h.value) & 0x7
+            stats.irq_done += bool(pending & IRQ_DONE)
+            stats.irq_fail += bool(pending & IRQ_FAIL)
+            stats.irq_abort += bool(pending & IRQ_ABORT)
+            apb.extend(((1, 0, 1, REG_IRQ_STATUS, pending), (1, 1, 1, REG_IRQ_STATUS, pending)))
+            irq_read = False
+        elif not apb and not int(psel_h.value) and int(irq_h.value):
+            stats.irqs += 1
+            stats.apb_transfers += 2
+            apb.extend(((1, 0, 0, REG_IRQ_STATUS, 0), (1, 1, 0, REG_IRQ_STATUS, 0)))
+
+        state = int(state_h.value)
+        # Same accounting as BistControllerModel: an aborted session resumes at its cycle count and
+        # the masked request cycle is not a BIST cycle
+        if state == RUN_TEST:
+            if int(active_h.value):
+                stats.bist_cycles += 1
+                stats.sessions_started += int(cnt_h.value) == 0
+        elif state == ABORT:
+            stats.sessions_aborted += 1
+        elif state == CHECK_RESULT:
+            stats.sessions_completed += 1
+        err = int(err_h.value)
+        if err and not prev_err:
+            stats.sessions_failed += 1
+        prev_err = err
+        if sleeping:
+            stats.sleep_cycles += 1
+        else:
+            stats.busy_cycles += 1
+        stats.cycles += 1
+
+        if stats.cycles % every == 0 or stats.cycles == budget:
+            now = time.monotonic()
+            snap = dict(stats.as_dict(), sim_time_ns=get_sim_time(unit="ns"), wall_s=round(now - t0, 3),
+                        cycles_per_s=round((stats.cycles - last_cycle) / max(now - last_wall, 1e-9)),
+                        rss_kib=rss_kib())
+            last_cycle, last_wall = stats.cycles, now
+            if out:
+                out.write(json.dumps(snap) + "\n")
+                out.flush()
+            dut._log.info(f"   [{profile_name}] {stats.cycles:>10} cycles  {snap['cycles_per_s']:>7} cyc/s  "
+                          f"ops {stats.ops_checked}  sessions {stats.sessions_started} "
+                          f"(pass {stats.sessions_passed}, abort {stats.sessions_aborted}, "
+                          f"fail {stats.sessions_failed})  irqs {stats.irqs}  "
+                          f"rss {snap['rss_kib']} KiB")
+    if out:
+        out.close()
+
+    # No fault is injected and the golden table covers every CFG and seed slot
+    assert stats.sessions_failed == 0, f"{stats.sessions_failed} BIST sessions failed without an injected fault"
+    assert stats.irq_fail == 0, f"{stats.irq_fail} fail interrupts without an injected fault"
+    assert stats.sessions_started and stats.sessions_passed and stats.sessions_aborted, \
+        f"Profile {profile_name} did not cover passed and aborted sessions: {stats.as_dict()}"
+    assert 0 <= stats.sessions_started - stats.sessions_completed <= 1, \
+        f"{stats.sessions_started} sessions started but {stats.sessions_completed} completed"
+    assert stats.irqs and stats.irq_done, "No completion interrupt was serviced"
+    if scoreboard:
+        assert scoreboard.divergence is None
+    dut._log.info(f"✅ Soak [{profile_name}]: {stats.cycles} cycles, {stats.ops_checked} ops checked, "
+                  f"{stats.sessions_started} sessions ({stats.sessions_passed} passed, "
+                  f"{stats.sessions_aborted} aborts), {stats.irqs} IRQs serviced")
@@ -0,0 +1,188 @@
+"""
+Abort-Latency Characterisation — BIST-to-system handover per request arrival time.
+
+Sweeps the arrival time of a system request exhaustively over one sleep
+period: every WAIT_FOR_SLOT cycle, every cycle offset of the BIST session
+(RUN_TEST, cnt 0 .. L-1), CHECK_RESULT, IDLE and the next wait. For each
+arrival Test/test_abort_latency.py counts the cycles until the datapath is
+handed back to the core:
+
+    ctrl      runtime_bist_controller: bist_active_mode = 0
+    wrapper   ibex_alu_bist_wrapper: ALU input mux on the core's operands
+              and result_o correct for the core's first operation
+
+ABORT is never the state in which a request arrives: it is only entered
+from RUN_TEST with the request already high.
+
+Each target is built once; the arrival list is split into chunks that run
+concurrently, one simulator process per worker (ABORT_LATENCY_IN/OUT). The
+report gives, per target, the worst case and a latency histogram overall and
+per arrival state.
+
+Usage:
+    python Tools/abort_latency.py --make-arg SIM=verilator -j 8
+    python Tools/abort_latency.py --targets wrapper --len-sel 3 --json latency.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from bist_ctrl_model import STATE_NAMES
+from bist_model import LEN_SELECTS, OP_MIX, OP_MODES, session_length
+from results_db import REPO_ROOT
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+TARGETS = {"ctrl": "test_abort_latency_ctrl", "wrapper": "test_abort_latency"}
+# Keep in sync with Test/test_abort_latency.py
+SLACK_CYCLES = 8
+
+
+def arrivals(len_sel, threshold):
+    return list(range(1, threshold + session_length(len_sel) + SLACK_CYCLES))
+
+
+def _make(target, make_args, out_dir, name, env_extra):
+    log = os.path.join(out_dir, f"{name}.log")
+    cmd = ["make", "-f", "makefile", target, f"COCOTB_RESULTS_FILE=results_{name}.xml"]
+    env = dict(os.environ, PWD=TEST_DIR, **env_extra)
+    with open(log, "w") as f:
+        rc = subprocess.run(cmd + make_args, cwd=TEST_DIR, env=env, stdout=f, stderr=subprocess.STDOUT).returncode
+    return rc, log
+
+
+def run_chunk(index, target, config, chunk, make_args, out_dir):
+    """Simulate one chunk of arrival times. Returns its result records ([] on failure)."""
+    name = f"abort_latency_{index}"
+    src = os.path.join(out_dir, f"{name}.json")
+    out = os.path.join(out_dir, f"{name}.jsonl")
+    with open(src, "w") as f:
+        json.dump({"config": config, "arrivals": chunk}, f)
+    if os.path.exists(out):
+        os.remove(out)
+    rc, log = _make(TARGETS[target], make_args, out_dir, name, {"ABORT_LATENCY_IN": src, "ABORT_LATENCY_OUT": out})
+    if rc != 0 or not os.path.exists(out):
+        print(f"❌ chunk {index} ({target}): simulation failed (see {os.path.relpath(log, REPO_ROOT)})")
+        return []
+    with open(out) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _histogram(latencies):
+    hist = {}
+    for v in latencies:
+        hist[v] = hist.get(v, 0) + 1
+    return dict(sorted(hist.items(), key=lambda kv: (kv[0] is None, kv[0] or 0)))
+
+
+def summarize(results):
+    """{target: {runs, worst, histogram, states: {state: {runs, worst, histogram, offsets}}}}."""
+    summary = {}
+    for target in TARGETS:
+        rows = [r for r in results if r["target"] == target]
+        if not rows:
+            continue
+        lat = [r["latency"] for r in rows]
+        states = {}
+        for state in STATE_NAMES:
+            srows = [r for r in rows if r["state"] == state]
+            if not srows:
+                continue
+            slat = [r["latency"] for r in srows]
+            worst = None if None in slat else max(slat)
+            states[state] = {
+                "runs": len(srows),
+                "worst": worst,
+                "histogram": _histogram(slat),
+                # Session offsets (RUN_TEST cnt) that reach the worst case
+                "worst_offsets": sorted({r["cnt"] for r in srows if r["latency"] == worst}),
+            }
+        summary[target] = {
+            "runs": len(rows),
+            "worst": None if None in lat else max(lat),
+            "histogram": _histogram(lat),
+            "states": states,
+            "unreached_states": [s for s in STATE_NAMES if s not in states],
+        }
+    return summary
+
+
+def _ranges(values):
+    """'0-63' style compression of sorted integers."""
+    out, start = [], None
+    for i, v in enumerate(values):
+        if start is None:
+            start = v
+        if i + 1 == len(values) or values[i + 1] != v + 1:
+            out.append(f"{start}-{v}" if v != start else f"{v}")
+            start = None
+    return ",".join(out)
+
+
+def print_summary(summary):
+    for target, s in summary.items():
+        worst = "none (no handover)" if s["worst"] is None else f"{s['worst']} cycle{'s' * (s['worst'] != 1)}"
+        print(f"\n{target}: {s['runs']} arrivals, worst-case handover {worst}")
+        peak = max(s["histogram"].values())
+        for latency, n in s["histogram"].items():
+            label = "never" if latency is None else f"{latency} cyc"
+            print(f"  {label:>7} {n:>6} {'#' * round(40 * n / peak)}")
+        print(f"  {'STATE':<14} {'RUNS':>5} {'WORST':>6}  HISTOGRAM / WORST-CASE OFFSETS")
+        for state, st in s["states"].items():
+            hist = " ".join(f"{'never' if k is None else k}:{v}" for k, v in st["histogram"].items())
+            offsets = f"  cnt {_ranges(st['worst_offsets'])}" if state == "RUN_TEST" else ""
+            print(f"  {state:<14} {st['runs']:>5} {'-' if st['worst'] is None else st['worst']:>6}  {hist}{offsets}")
+        if s["unreached_states"]:
+            print(f"  not an arrival state: {', '.join(s['unreached_states'])} (entered only with the request high)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel BIST-to-system handover latency sweep")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--len-sel", type=int, nargs="+", default=list(LEN_SELECTS),
+                        help="CFG[1:0] session length selects to sweep")
+    parser.add_argument("--op-mode", type=int, choices=OP_MODES, default=OP_MIX, help="CFG[3:2]")
+    parser.add_argument("--threshold", type=int, default=3, help="THRESHOLD register (idle cycles)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    parser.add_argument("--json", metavar="FILE", help="write the summary and every result to FILE")
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.join(TEST_DIR, "sim_build", "logs")
+    os.makedirs(out_dir, exist_ok=True)
+    # Build each target once (runs the built-in 32-cycle sweep) so the workers share its simulator binary
+    for target in args.targets:
+        rc, log = _make(TARGETS[target], args.make_arg, out_dir, f"abort_latency_build_{target}", {})
+        if rc != 0:
+            print(f"❌ {target}: build failed (see {os.path.relpath(log, REPO_ROOT)})")
+            return 1
+
+    jobs = []
+    for target in args.targets:
+        for len_sel in args.len_sel:
+            config = {"len_sel": len_sel, "op_mode": args.op_mode, "threshold": args.threshold}
+            times = arrivals(len_sel, args.threshold)
+            size = -(-len(times) // max(1, args.jobs))
+            jobs += [(target, config, times[i:i + size]) for i in range(0, len(times), size)]
+    total = sum(len(chunk) for _, _, chunk in jobs)
+    print(f"Abort latency: {total} arrivals ({', '.join(args.targets)}; sessions of "
+          f"{', '.join(str(session_length(s)) for s in args.len_sel)} cycles), {len(jobs)} chunks on {args.jobs} workers")
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = [r for chunk in pool.map(lambda ij: run_chunk(ij[0], *ij[1], args.make_arg, out_dir),
+                                           enumerate(jobs)) for r in chunk]
+    results.sort(key=lambda r: (r["target"], r["len_sel"], r["arrival"]))
+    summary = summarize(results)
+    print_summary(summary)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": summary, "results": results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+    return 0 if len(results) == total and all(s["worst"] is not None for s in summary.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,583 @@
+"""
+Runtime BIST Controller Model — cycle-accurate Python model of runtime_bist_controller.
+
+Two engines answer "what does BIST completion look like under workload X":
+
+  * BistControllerModel: register-exact, one step() per clock edge. It models
+    the IDLE / WAIT_FOR_SLOT / RUN_TEST / CHECK_RESULT / ABORT FSM,
+    idle_detector, the LFSR/MISR, the APB register file (CTRL .. CHKPT_STATUS),
+    the golden/checkpoint tables, seed rotation, rate limiting (MIN_INTERVAL,
+    BUDGET_WINDOW/BUDGET), STATUS, error_irq and the IRQ_STATUS/IRQ_EN
+    interrupt. test_bist_controller.py checks it against
+    the RTL cycle by cycle on random traffic.
+
+  * fast_forward(): the same FSM and idle detector for a fixed configuration
+    (CTRL[0] set, no APB traffic), driven by a run-length encoded
+    sys_req_valid trace. It jumps from one FSM event to the next instead of
+    stepping every cycle, so its cost grows with the number of busy/idle
+    bursts and sessions, not with the number of cycles. `check` compares it
+    with BistControllerModel on random workloads.
+
+`whatif` reports the test interval (longest and mean time between completed
+sessions) and the BIST energy (power_model.py, per-cycle session energy of
+the configured operator mix) of a workload, with or without rate limiting.
+
+Usage:
+    python Tools/bist_ctrl_model.py whatif --cycles 1e9 --busy-mean 2000 --idle-mean 500 --threshold 100
+    python Tools/bist_ctrl_model.py whatif --cycles 1e6 --exact          # per-cycle model (slow)
+    python Tools/bist_ctrl_model.py whatif --idle-mean 1e5 --min-interval 10ms --clock-mhz 100
+    python Tools/bist_ctrl_model.py check                                # fast_forward == per-cycle model
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from collections import namedtuple
+
+from bist_model import INITIAL_SEED, LFSR_TAPS, MASK, misr_step, session_length
+from golden_table import CHKPT_K_WIDTH, CHKPT_WINDOW, SEED_SLOTS, build_checkpoints, build_table
+from power_model import session_activity
+
+GOLDEN_SEED = INITIAL_SEED
+
+# FSM states (encoding of runtime_bist_controller state_t)
+IDLE, WAIT_FOR_SLOT, RUN_TEST, CHECK_RESULT, ABORT = range(5)
+STATE_NAMES = ("IDLE", "WAIT_FOR_SLOT", "RUN_TEST", "CHECK_RESULT", "ABORT")
+
+# Reset values
+RESET_THRESHOLD = 100
+RESET_GOLDEN_SIG = 0xFFFF_FFFF
+RESET_CFG = 0b0011
+
+_tables = {}
+
+
+def _rom_tables():
+    """(golden_rom, checkpoint_rom) as index -> signature dicts, the contents of bist_golden_pkg."""
+    if not _tables:
+        _tables["golden"] = {idx: sig for idx, _, _, _, sig in build_table(GOLDEN_SEED)}
+        _tables["chkpt"] = {idx: sig for idx, _, _, sig in build_checkpoints(GOLDEN_SEED)}
+    return _tables["golden"], _tables["chkpt"]
+
+
+class BistControllerModel:
+    """Register-exact model of runtime_bist_controller; step() = one rising clock edge."""
+
+    def __init__(self, golden_table_ram=False):
+        self.golden_table_ram = golden_table_ram
+        self.reset()
+
+    def reset(self):
+        golden, self.checkpoint_rom = _rom_tables()
+        self.golden_table = [golden.get(i, 0) for i in range(4 * SEED_SLOTS * 4)]
+        self.reg_ctrl = 0
+        self.reg_threshold = RESET_THRESHOLD
+        self.reg_golden_sig = RESET_GOLDEN_SIG
+        self.reg_cfg = RESET_CFG
+        self.reg_gtbl_idx = 0
+        self.reg_seed = GOLDEN_SEED
+        self.reg_irq_en = 0
+        self.reg_chkpt = 0
+        self.reg_min_interval = 0
+        self.reg_budget_window = 0
+        self.reg_budget = 0
+        self.interval_cnt = MASK
+        self.window_cnt = 0
+        self.budget_used = 0
+        self.seed_slot = 0
+        self.rot_seed = GOLDEN_SEED
+        self.idle_counter = 0
+        self.idle_trigger = 0
+        self.lfsr = GOLDEN_SEED
+        self.misr = 0
+        self.state = IDLE
+        self.test_cycle_cnt = 0
+        self.reg_status = 0
+        self.reg_chkpt_status = 0
+        self.error_irq = 0
+        self.reg_irq_status = 0
+        # sys_req_valid of the current cycle (bist_active_mode is bypassed by it)
+        self.sys_req_valid = 0
+        # Event counters (not part of the RTL)
+        self.cycles = 0
+        self.sessions_started = 0
+        self.sessions_completed = 0
+        self.sessions_aborted = 0
+        self.sessions_failed = 0
+        self.run_cycles = 0
+        self.last_completion = 0
+        self.max_test_interval = 0
+
+    # --- Combinational outputs of the current state ---
+    @property
+    def bist_active_mode(self):
+        return int(self.state == RUN_TEST and not self.sys_req_valid)
+
+    @property
+    def bist_pattern_out(self):
+        return self.lfsr
+
+    @property
+    def bist_op_mode(self):
+        return self.reg_cfg >> 2
+
+    @property
+    def bist_irq(self):
+        return int(bool(self.reg_irq_status & self.reg_irq_en))
+
+    @property
+    def golden_expected(self):
+        if self.reg_ctrl & 0x2:
+            return self.golden_table[(self.seed_slot << 4) | self.reg_cfg]
+        return self.reg_golden_sig
+
+    def prdata(self, paddr):
+        """APB read mux (combinational on paddr[7:0])."""
+        addr = paddr & 0xFF
+        if addr == 0x00:
+            return self.reg_ctrl
+        if addr == 0x04:
+            return self.reg_status
+        if addr == 0x08:
+            return self.reg_threshold
+        if addr == 0x0C:
+            return self.reg_golden_sig
+        if addr == 0x10:
+            return self.misr
+        if addr == 0x14:
+            return self.reg_cfg
+        if addr == 0x18:
+            return self.reg_gtbl_idx
+        if addr == 0x1C:
+            return self.golden_table[self.reg_gtbl_idx]
+        if addr == 0x20:
+            return self.reg_seed
+        if addr == 0x24:
+            return self.seed_slot
+        if addr == 0x28:
+            return self.reg_irq_en
+        if addr == 0x2C:
+            return self.reg_irq_status
+        if addr == 0x30:
+            return self.reg_chkpt
+        if addr == 0x34:
+            return self.reg_chkpt_status
+        if addr == 0x38:
+            return self.reg_min_interval
+        if addr == 0x3C:
+            return self.reg_budget_window
+        if addr == 0x40:
+            return self.reg_budget
+        if addr == 0x44:
+            return self.budget_used
+        return 0
+
+    def _chkpt_fail(self):
+        cnt = self.test_cycle_cnt
+        if self.state != RUN_TEST or not self.reg_chkpt & 1 or self.seed_slot or self.reg_seed != GOLDEN_SEED:
+            return False
+        window = ((CHKPT_WINDOW << (self.reg_chkpt >> 1)) - 1) & 0xFF
+        if cnt == 0 or cnt & window:
+            return False
+        k = cnt >> CHKPT_WINDOW.bit_length() - 1
+        return self.misr != self.checkpoint_rom.get(((self.reg_cfg >> 2) << CHKPT_K_WIDTH) | k, 0)
+
+    def _rate_ok(self, session_last):
+        cnt = self.test_cycle_cnt
+        interval_ok = cnt != 0 or self.interval_cnt + 1 >= self.reg_min_interval
+        budget_ok = not self.reg_budget_window or self.budget_used + session_last + 1 - cnt <= self.reg_budget
+        return interval_ok and budget_ok
+
+    def step(self, sys_req_valid=0, dut_result=0, psel=0, penable=0, pwrite=0, paddr=0, pwdata=0):
+        """Advance one clock edge with the given input values held during the cycle."""
+        state = self.state
+        cnt = self.test_cycle_cnt
+        write_en = psel and penable and pwrite
+        addr = paddr & 0xFF
+        golden_expected = self.golden_expected
+        chkpt_fail = self._chkpt_fail()
+        session_last = ((32 << (self.reg_cfg & 3)) - 1) & 0xFF
+        misr_match = self.misr == golden_expected
+        session_seed = self.reg_seed if self.seed_slot == 0 else self.rot_seed
+        rate_ok = self._rate_ok(session_last)
+
+        # FSM next state and controls
+        next_state = state
+        seed_load = misr_clear = run = False
+        if state == IDLE:
+            if self.reg_ctrl & 1:
+                next_state = WAIT_FOR_SLOT
+        elif state == WAIT_FOR_SLOT:
+            if not sys_req_valid and self.idle_trigger and rate_ok:
+                next_state = RUN_TEST
+        elif state == RUN_TEST:
+            # A request cycle is masked (zero-cycle handover) and replayed on resume
+            run = not sys_req_valid
+            if cnt == 0 and run:
+                seed_load = misr_clear = True
+            if chkpt_fail:
+                next_state = IDLE
+            elif sys_req_valid:
+                next_state = ABORT
+            elif cnt >= session_last:
+                next_state = CHECK_RESULT
+        elif state == CHECK_RESULT:
+            next_state = IDLE
+        else:
+            next_state = WAIT_FOR_SLOT
+
+        # Seed scheduler (hands the pre-edge LFSR state to the next slot)
+        if not self.reg_ctrl & 4 or (write_en and addr in (0x14, 0x20)):
+            self.seed_slot = 0
+        elif state == CHECK_RESULT:
+            self.seed_slot = 0 if self.seed_slot == SEED_SLOTS - 1 else self.seed_slot + 1
+            self.rot_seed = self.lfsr
+
+        # Rate limiting (interval since the last start, per-window budget)
+        if run and cnt == 0:
+            self.interval_cnt = 1
+        elif self.interval_cnt != MASK:
+            self.interval_cnt += 1
+        if (not self.reg_budget_window or (write_en and addr == 0x3C)
+                or self.window_cnt == (self.reg_budget_window - 1) & MASK):
+            self.window_cnt = 0
+            self.budget_used = 0
+        else:
+            self.window_cnt += 1
+            self.budget_used += int(run)
+
+        # Idle detector
+        if sys_req_valid:
+            self.idle_counter = 0
+            self.idle_trigger = 0
+        elif self.idle_counter < self.reg_threshold:
+            self.idle_counter += 1
+            self.idle_trigger = 0
+        else:
+            self.idle_trigger = 1
+
+        # LFSR / MISR
+        if seed_load:
+            self.lfsr = session_seed
+        elif run:
+            lfsr = self.lfsr
+            self.lfsr = ((lfsr << 1) | (bin(lfsr & LFSR_TAPS).count("1") & 1)) & MASK
+        if misr_clear:
+            self.misr = 0
+        elif run:
+            self.misr = misr_step(self.misr, dut_result)
+
+        # Status, error_irq, IRQ_STATUS
+        throttled = state == WAIT_FOR_SLOT and not sys_req_valid and self.idle_trigger and not rate_ok
+        status = (self.reg_status & ~0b10001) | int(state == RUN_TEST) | (int(throttled) << 4)
+        irq_status = self.reg_irq_status
+        if write_en and addr == 0x2C:
+            irq_status &= ~pwdata & 7
+        if chkpt_fail:
+            status |= 0b1010
+            self.reg_chkpt_status = 0x100 | cnt
+            self.error_irq = 1
+            irq_status |= 2
+            self.sessions_failed += 1
+        if state == CHECK_RESULT:
+            irq_status |= 1
+            if misr_match:
+                status |= 0b0100
+            else:
+                status |= 0b0010
+                self.error_irq = 1
+                irq_status |= 2
+                self.sessions_failed += 1
+            self.sessions_completed += 1
+            self.max_test_interval = max(self.max_test_interval, self.cycles - self.last_completion)
+            self.last_completion = self.cycles
+        if state == RUN_TEST and cnt == 0:
+            status &= ~0b1110
+            self.reg_chkpt_status = 0
+            self.error_irq = 0
+            self.sessions_started += int(run)
+        if state == ABORT:
+            irq_status |= 4
+            self.sessions_aborted += 1
+        self.reg_status = status
+        self.reg_irq_status = irq_status
+
+        # Register file and golden table RAM
+        if write_en:
+            if addr == 0x00:
+                self.reg_ctrl = pwdata
+            elif addr == 0x08:
+                self.reg_threshold = pwdata
+            elif addr == 0x0C:
+                self.reg_golden_sig = pwdata
+            elif addr == 0x14:
+                self.reg_cfg = pwdata & 0xF
+            elif addr == 0x18:
+                self.reg_gtbl_idx = pwdata & 0x3F
+            elif addr == 0x1C:
+                if self.golden_table_ram:
+                    self.golden_table[self.reg_gtbl_idx] = pwdata
+                self.reg_gtbl_idx = (self.reg_gtbl_idx + 1) & 0x3F
+            elif addr == 0x20:
+                self.reg_seed = pwdata
+            elif addr == 0x28:
+                self.reg_irq_en = pwdata & 7
+            elif addr == 0x30:
+                self.reg_chkpt = pwdata & 7
+            elif addr == 0x38:
+                self.reg_min_interval = pwdata
+            elif addr == 0x3C:
+                self.reg_budget_window = pwdata
+            elif addr == 0x40:
+                self.reg_budget = pwdata
+
+        # State and cycle counter
+        self.state = next_state
+        if run:
+            self.test_cycle_cnt = (cnt + 1) & 0xFF
+            self.run_cycles += 1
+        elif state == IDLE:
+            self.test_cycle_cnt = 0
+        self.cycles += 1
+
+
+# =============================================================================
+# Event-driven engine for long workloads
+# =============================================================================
+WorkloadStats = namedtuple("WorkloadStats",
+                           "cycles busy_cycles sessions_started sessions_completed sessions_aborted run_cycles "
+                           "max_test_interval")
+
+
+def fast_forward(segments, threshold=RESET_THRESHOLD, len_sel=RESET_CFG & 3, min_interval=0, budget_window=0,
+                 budget=0):
+    """Session statistics for a run-length encoded sys_req_valid trace [(busy, cycles), ...].
+
+    Equivalent to BistControllerModel from reset with CTRL[0] = 1, THRESHOLD,
+    CFG[1:0] = len_sel, MIN_INTERVAL, BUDGET_WINDOW and BUDGET set and no
+    further APB traffic. max_test_interval is the longest span between two
+    completed sessions (the first from cycle 0).
+    """
+    last = (session_length(len_sel) - 1) & 0xFF
+    need = threshold + 1  # idle cycles before idle_trigger is seen by the FSM
+    state, cnt, idle_run = IDLE, 0, 0
+    cycles = busy_cycles = started = completed = aborted = run_cycles = 0
+    last_start, last_completion, max_interval = None, 0, 0
+    used = 0  # BIST cycles of the current budget window
+    for busy, n in segments:
+        if busy:
+            busy_cycles += n
+        left = n
+        while left:
+            active = False
+            if state == WAIT_FOR_SLOT:
+                # First cycle that may start (or resume) the session, None: not in this burst
+                start = None if busy else cycles + max(0, need - idle_run)
+                if start is not None and cnt == 0 and last_start is not None:
+                    start = max(start, last_start + min_interval - 1)
+                if start is not None and budget_window:
+                    session_left = last + 1 - cnt
+                    if session_left > budget:
+                        start = None
+                    elif start // budget_window == cycles // budget_window and used + session_left > budget:
+                        start = (cycles // budget_window + 1) * budget_window
+                if start is None or start - cycles >= left:
+                    take = left
+                else:
+                    take = start - cycles + 1
+                    state = RUN_TEST
+            elif state == RUN_TEST:
+                if busy:
+                    # Masked request cycle: the counter holds, the resumed session replays it
+                    take = 1
+                    state = ABORT
+                else:
+                    if cnt == 0:
+                        started += 1
+                        last_start = cycles
+                    take = min(left, max(0, last - cnt) + 1)
+                    if take == max(0, last - cnt) + 1:
+                        state = CHECK_RESULT
+                    cnt = (cnt + take) & 0xFF
+                    run_cycles += take
+                    active = True
+            elif state == CHECK_RESULT:
+                take = 1
+                completed += 1
+                max_interval = max(max_interval, cycles - last_completion)
+                last_completion = cycles
+                state = IDLE
+            elif state == ABORT:
+                take = 1
+                aborted += 1
+                state = WAIT_FOR_SLOT
+            else:
+                take = 1
+                cnt = 0
+                state = WAIT_FOR_SLOT
+            if budget_window:
+                window = (cycles + take) // budget_window * budget_window
+                if window > cycles:
+                    used = cycles + take - window if active else 0
+                elif active:
+                    used += take
+            cycles += take
+            left -= take
+            idle_run = 0 if busy else idle_run + take
+    return WorkloadStats(cycles, busy_cycles, started, completed, aborted, run_cycles, max_interval)
+
+
+def run_exact(segments, threshold=RESET_THRESHOLD, len_sel=RESET_CFG & 3, min_interval=0, budget_window=0,
+              budget=0):
+    """fast_forward() statistics from the per-cycle model."""
+    model = BistControllerModel()
+    model.reg_threshold = threshold
+    model.reg_cfg = (model.reg_cfg & ~3) | len_sel
+    model.reg_min_interval = min_interval
+    model.reg_budget_window = budget_window
+    model.reg_budget = budget
+    model.reg_ctrl = 1
+    busy_cycles = 0
+    for busy, n in segments:
+        busy_cycles += n if busy else 0
+        for _ in range(n):
+            model.step(busy)
+    return WorkloadStats(model.cycles, busy_cycles, model.sessions_started, model.sessions_completed,
+                         model.sessions_aborted, model.run_cycles, model.max_test_interval)
+
+
+def bursty_workload(cycles, busy_mean, idle_mean, seed=1):
+    """Alternating busy/idle bursts with exponentially distributed lengths, `cycles` in total."""
+    rng = random.Random(seed)
+    busy = rng.random() < busy_mean / (busy_mean + idle_mean)
+    left = cycles
+    while left > 0:
+        n = min(left, 1 + int(rng.expovariate(1.0 / max(busy_mean if busy else idle_mean, 1))))
+        yield busy, n
+        left -= n
+        busy = not busy
+
+
+def check(workloads=40, cycles=20000, seed=1):
+    """[(params, fast, exact)] for every random workload on which the two engines disagree."""
+    rng = random.Random(seed)
+    mismatches = []
+    for i in range(workloads):
+        params = {"threshold": rng.choice((0, 1, 2, 5, 20, 100)), "len_sel": rng.randrange(4),
+                  "busy_mean": rng.choice((1, 3, 20, 300)), "idle_mean": rng.choice((1, 10, 60, 400))}
+        # Half of the workloads with rate limiting (budgets from one session to a few per window)
+        rate = {}
+        if i % 2:
+            length = session_length(params["len_sel"])
+            window = rng.choice((0, 97, 500, 3000))
+            rate = {"min_interval": rng.choice((0, 1, length, 700, 2500)), "budget_window": window,
+                    "budget": rng.choice((length - 1, length, 2 * length + 5, window))}
+        params.update(rate)
+        trace = list(bursty_workload(cycles, params["busy_mean"], params["idle_mean"], seed + i))
+        config = (params["threshold"], params["len_sel"], *rate.values())
+        fast = fast_forward(trace, *config)
+        exact = run_exact(trace, *config)
+        if fast != exact:
+            mismatches.append((params, fast, exact))
+    return mismatches
+
+
+def _parse_cycles(value):
+    return int(float(value))
+
+
+TIME_UNITS = {"s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+
+
+def to_cycles(value, clock_mhz):
+    """Cycle count from '1e6' (cycles) or a time such as '10ms' / '250us' at clock_mhz."""
+    value = str(value).strip()
+    for unit in sorted(TIME_UNITS, key=len, reverse=True):
+        if value.endswith(unit):
+            return round(float(value[:-len(unit)]) * TIME_UNITS[unit] * clock_mhz * 1e6)
+    return _parse_cycles(value)
+
+
+def session_energy_per_cycle(len_sel, op_mode, weights=None):
+    """Toggle energy of one BIST cycle (power_model.py units) for a CFG configuration."""
+    return session_activity(INITIAL_SEED, session_length(len_sel), op_mode, weights).report()["bist"][
+        "energy_per_cycle"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runtime BIST controller model")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("whatif", help="session statistics for a bursty workload")
+    p.add_argument("--cycles", type=_parse_cycles, default=10 ** 8)
+    p.add_argument("--busy-mean", type=float, default=200, help="mean busy burst (cycles)")
+    p.add_argument("--idle-mean", type=float, default=400, help="mean idle burst (cycles)")
+    p.add_argument("--threshold", type=int, default=RESET_THRESHOLD, help="THRESHOLD register")
+    p.add_argument("--len-sel", type=int, default=RESET_CFG & 3, help="CFG[1:0] session length select")
+    p.add_argument("--op-mode", type=int, default=RESET_CFG >> 2, help="CFG[3:2] operator mix (energy)")
+    p.add_argument("--min-interval", default="0", help="MIN_INTERVAL, cycles or a time (e.g. 10ms)")
+    p.add_argument("--budget-window", default="0", help="BUDGET_WINDOW, cycles or a time (0: no budget)")
+    p.add_argument("--budget", default="0", help="BUDGET: BIST cycles per window")
+    p.add_argument("--clock-mhz", type=float, default=100.0, help="clock for time units and the report")
+    p.add_argument("--seed", type=int, default=1, help="workload seed")
+    p.add_argument("--exact", action="store_true", help="use the per-cycle model")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p = sub.add_parser("check", help="compare fast_forward with the per-cycle model")
+    p.add_argument("--workloads", type=int, default=40)
+    p.add_argument("--cycles", type=_parse_cycles, default=20000)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "check":
+        mismatches = check(args.workloads, args.cycles)
+        for params, fast, exact in mismatches:
+            print(f"❌ {params}\n   fast  {fast}\n   exact {exact}")
+        if mismatches:
+            return 1
+        print(f"✅ fast_forward matches the per-cycle model on {args.workloads} workloads of {args.cycles} cycles")
+        return 0
+
+    rate = {"min_interval": to_cycles(args.min_interval, args.clock_mhz),
+            "budget_window": to_cycles(args.budget_window, args.clock_mhz),
+            "budget": to_cycles(args.budget, args.clock_mhz)}
+    trace = bursty_workload(args.cycles, args.busy_mean, args.idle_mean, args.seed)
+    t0 = time.perf_counter()
+    engine = run_exact if args.exact else fast_forward
+    stats = engine(trace, args.threshold, args.len_sel, **rate)
+    elapsed = time.perf_counter() - t0
+    idle = stats.cycles - stats.busy_cycles
+    energy = stats.run_cycles * session_energy_per_cycle(args.len_sel, args.op_mode)
+    mean_interval = stats.cycles / stats.sessions_completed if stats.sessions_completed else None
+    report = dict(stats._asdict(), **rate,
+                  sessions_per_mcycle=1e6 * stats.sessions_completed / stats.cycles,
+                  abort_ratio=stats.sessions_aborted / max(1, stats.sessions_completed + stats.sessions_aborted),
+                  idle_used=stats.run_cycles / idle if idle else 0.0,
+                  mean_cycles_between_completions=mean_interval,
+                  bist_energy=energy,
+                  bist_energy_per_mcycle=1e6 * energy / stats.cycles,
+                  engine="exact" if args.exact else "fast_forward",
+                  seconds=elapsed, cycles_per_second=stats.cycles / elapsed if elapsed else None)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"Workload: {stats.cycles:,} cycles, busy bursts ~{args.busy_mean:g}, idle bursts ~{args.idle_mean:g} "
+          f"({100 * stats.busy_cycles / stats.cycles:.1f}% busy)")
+    ms = 1e-3 / args.clock_mhz  # cycles -> ms
+    limits = [f"MIN_INTERVAL {rate['min_interval']:,}"] if rate["min_interval"] else []
+    if rate["budget_window"]:
+        limits.append(f"BUDGET {rate['budget']:,} / {rate['budget_window']:,} cycles")
+    print(f"Config:   THRESHOLD {args.threshold}, {session_length(args.len_sel)}-cycle sessions, "
+          f"{', '.join(limits) or 'no rate limit'} ({args.clock_mhz:g} MHz)")
+    print(f"  completed sessions      {stats.sessions_completed:>14,}  ({report['sessions_per_mcycle']:.1f} / Mcycle)")
+    print(f"  aborted sessions        {stats.sessions_aborted:>14,}  ({100 * report['abort_ratio']:.1f}% of ends)")
+    print(f"  idle cycles used (RUN)  {100 * report['idle_used']:>13.1f}%")
+    if mean_interval:
+        print(f"  cycles per completion   {mean_interval:>14,.0f}  ({mean_interval * ms:.3f} ms)")
+        print(f"  longest test interval   {stats.max_test_interval:>14,}  ({stats.max_test_interval * ms:.3f} ms)")
+    print(f"  BIST energy             {energy:>14,.0f}  ({report['bist_energy_per_mcycle']:,.0f} / Mcycle, "
+          f"power_model units)")
+    print(f"  {report['engine']}: {elapsed:.2f} s, {report['cycles_per_second'] / 1e6:,.1f} Mcycles/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
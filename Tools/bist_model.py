@@ -0,0 +1,431 @@
+"""
+BIST Golden Model — bit-accurate Python models of lfsr_gen and misr_analyzer.
+
+Both registers are linear over GF(2), so every k-step update is a matrix power
+of the single-step transition matrix. Matrices are stored as a list of WIDTH
+column bitmasks (column j = image of unit vector e_j), which keeps
+matrix-vector products to a handful of integer XORs.
+
+The k-step models match lfsr_gen_kstep / misr_analyzer_kstep (STEPS = k): one
+call produces or absorbs k patterns, and the resulting state equals k
+single-step updates.
+"""
+import math
+
+WIDTH = 32
+MASK = (1 << WIDTH) - 1
+
+# lfsr_gen: x^32 + x^22 + x^2 + x^1 + 1 (Xilinx Standard), feedback taps 31, 21, 1, 0
+LFSR_TAPS = (1 << 31) | (1 << 21) | (1 << 1) | (1 << 0)
+INITIAL_SEED = 0xDEAD_BEEF
+
+# misr_analyzer: internal-XOR feedback polynomial x^32 + x^22 + x^2 + x^1 + 1 (primitive),
+# given by its terms below x^32
+MISR_POLY = (1 << 22) | (1 << 2) | (1 << 1) | (1 << 0)
+# The former compactor {misr_reg[30:0], misr_reg[31]} ^ response: x^32 + 1, a pure rotation
+ROTATE_POLY = 1
+
+
+# =============================================================================
+# Single-step updates (reference semantics of the RTL)
+# =============================================================================
+def parity(x):
+    return bin(x).count("1") & 1
+
+
+def lfsr_step(state, taps=LFSR_TAPS, width=WIDTH):
+    """lfsr_reg <= {lfsr_reg[WIDTH-2:0], ^(lfsr_reg & TAPS)}"""
+    return ((state << 1) | parity(state & taps)) & ((1 << width) - 1)
+
+
+def misr_step(sig, data, width=WIDTH, poly=MISR_POLY):
+    """misr_reg <= {misr_reg[WIDTH-2:0], 1'b0} ^ (misr_reg[WIDTH-1] ? POLY : '0) ^ dut_response"""
+    mask = (1 << width) - 1
+    feedback = poly if (sig >> (width - 1)) & 1 else 0
+    return ((sig << 1) & mask) ^ feedback ^ (data & mask)
+
+
+# =============================================================================
+# GF(2) matrices (column bitmask representation)
+# =============================================================================
+def gf2_matrix(step, width=WIDTH):
+    """Transition matrix of a linear single-step function."""
+    return [step(1 << j) for j in range(width)]
+
+
+def gf2_apply(mat, x):
+    """y = M x over GF(2)."""
+    y = 0
+    j = 0
+    while x:
+        if x & 1:
+            y ^= mat[j]
+        x >>= 1
+        j += 1
+    return y
+
+
+def gf2_mul(a, b):
+    """Matrix product A B (apply B first, then A)."""
+    return [gf2_apply(a, col) for col in b]
+
+
+def gf2_identity(width=WIDTH):
+    return [1 << j for j in range(width)]
+
+
+def gf2_pow(mat, n):
+    result = gf2_identity(len(mat))
+    base = mat
+    while n:
+        if n & 1:
+            result = gf2_mul(base, result)
+        base = gf2_mul(base, base)
+        n >>= 1
+    return result
+
+
+def gf2_row_weights(mat):
+    """Number of state bits feeding each output bit (XOR fan-in per bit)."""
+    width = len(mat)
+    return [sum((col >> i) & 1 for col in mat) for i in range(width)]
+
+
+def is_prime(n):
+    """Deterministic Miller-Rabin for n < 3.3e24 (covers 2^WIDTH - 1 factors up to WIDTH = 64)."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in bases:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d, r = d // 2, r + 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_rho(n):
+    """A non-trivial factor of the composite odd n."""
+    c = 1
+    while True:
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = math.gcd(abs(x - y), n)
+        if d != n:
+            return d
+        c += 1
+
+
+def prime_factors(n):
+    """Distinct prime factors of n (small trial division, then Pollard rho)."""
+    factors = set()
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factors.add(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors.add(m)
+        else:
+            d = _pollard_rho(m)
+            stack += [d, m // d]
+    return sorted(factors)
+
+
+def is_maximal_length(mat):
+    """True when the transition matrix has order 2^width - 1 (primitive feedback polynomial)."""
+    width = len(mat)
+    period = (1 << width) - 1
+    identity = gf2_identity(width)
+    if gf2_pow(mat, period) != identity:
+        return False
+    return all(gf2_pow(mat, period // q) != identity for q in prime_factors(period))
+
+
+def lfsr_is_maximal(taps, width=WIDTH):
+    """True when lfsr_gen with these feedback taps cycles through all 2^width - 1 non-zero states."""
+    return is_maximal_length(gf2_matrix(lambda s: lfsr_step(s, taps, width), width))
+
+
+def gf2_poly_mulmod(a, b, poly, width):
+    """a * b mod x^width + poly, operands and result reduced below x^width."""
+    top = 1 << width
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a & top:
+            a ^= top | poly
+    return result
+
+
+def gf2_poly_powmod(n, poly, width):
+    """x^n mod x^width + poly (width >= 2)."""
+    result, base = 1, 2
+    while n:
+        if n & 1:
+            result = gf2_poly_mulmod(result, base, poly, width)
+        base = gf2_poly_mulmod(base, base, poly, width)
+        n >>= 1
+    return result
+
+
+def misr_is_maximal(poly, width=WIDTH):
+    """True when x^width + poly is primitive (the MISR state cycles through all non-zero states).
+
+    x has order 2^width - 1 modulo a primitive polynomial, the order of the
+    MISR transition matrix (its companion matrix).
+    """
+    if not poly & 1:
+        return False
+    period = (1 << width) - 1
+    if gf2_poly_powmod(period, poly, width) != 1:
+        return False
+    return all(gf2_poly_powmod(period // q, poly, width) != 1 for q in prime_factors(period))
+
+
+def primitive_poly(width):
+    """A lowest-weight primitive MISR polynomial for `width`: a trinomial, else a pentanomial.
+
+    Returned as POLY (the terms below x^width); smallest exponents first.
+    """
+    for k in range(1, width):
+        if misr_is_maximal((1 << k) | 1, width):
+            return (1 << k) | 1
+    for k3 in range(3, width):
+        for k2 in range(2, k3):
+            for k1 in range(1, k2):
+                poly = (1 << k3) | (1 << k2) | (1 << k1) | 1
+                if misr_is_maximal(poly, width):
+                    return poly
+    raise ValueError(f"no primitive trinomial or pentanomial of degree {width}")
+
+
+def default_poly(width):
+    """The misr_analyzer POLY default for `width`: MISR_POLY at 32 bits, else primitive_poly."""
+    return MISR_POLY if width == WIDTH else primitive_poly(width)
+
+
+def poly_taps(poly, width):
+    """lfsr_gen TAPS with feedback polynomial x^width + poly (LFSR_TAPS for MISR_POLY at 32 bits).
+
+    Tap i stands for x^(i+1); the Fibonacci register's characteristic polynomial
+    is the reciprocal, which is primitive exactly when x^width + poly is.
+    """
+    return ((1 << width) | poly) >> 1
+
+
+LFSR_MATRIX = gf2_matrix(lfsr_step)
+MISR_MATRIX = gf2_matrix(lambda s: misr_step(s, 0))
+
+
+# =============================================================================
+# Register models
+# =============================================================================
+class LFSR:
+    """lfsr_gen (steps=1) / lfsr_gen_kstep (steps=k) model."""
+
+    def __init__(self, seed=INITIAL_SEED, steps=1, taps=LFSR_TAPS, width=WIDTH):
+        self.width = width
+        self.steps = steps
+        self.state = seed & ((1 << width) - 1)
+        single = gf2_matrix(lambda s: lfsr_step(s, taps, width), width)
+        # pattern_out[j] = T^j state, next state = T^k state
+        self.lane_matrices = [gf2_pow(single, j) for j in range(steps)]
+        self.next_matrix = gf2_pow(single, steps)
+
+    def load(self, seed):
+        self.state = seed & ((1 << self.width) - 1)
+
+    def patterns(self):
+        """The k patterns presented in the current cycle (lane 0 = current state)."""
+        return [gf2_apply(m, self.state) for m in self.lane_matrices]
+
+    def clock(self):
+        """Advance one clock (k steps). Returns the patterns of the cycle just consumed."""
+        out = self.patterns()
+        self.state = gf2_apply(self.next_matrix, self.state)
+        return out
+
+
+class MISR:
+    """misr_analyzer (steps=1) / misr_analyzer_kstep (steps=k) model."""
+
+    def __init__(self, steps=1, width=WIDTH, step=None, poly=MISR_POLY):
+        self.width = width
+        self.steps = steps
+        self.signature = 0
+        self._step = step or (lambda s, d: misr_step(s, d, width, poly))
+        single = gf2_matrix(lambda s: self._step(s, 0), width)
+        # sig' = R^k sig ^ XOR_j R^(k-1-j) d_j
+        self.state_matrix = gf2_pow(single, steps)
+        self.lane_matrices = [gf2_pow(single, steps - 1 - j) for j in range(steps)]
+
+    def clear(self):
+        self.signature = 0
+
+    def clock(self, responses):
+        """Absorb k responses (lane 0 first) in one clock."""
+        if len(responses) != self.steps:
+            raise ValueError(f"expected {self.steps} responses, got {len(responses)}")
+        sig = gf2_apply(self.state_matrix, self.signature)
+        for mat, data in zip(self.lane_matrices, responses):
+            sig ^= gf2_apply(mat, data)
+        self.signature = sig
+        return sig
+
+
+# =============================================================================
+# Datapath under test (ibex_alu_bist_wrapper in BIST mode)
+# =============================================================================
+# ibex_pkg::alu_op_e encodings used by the BIST operand generator
+ALU_ADD = 0
+ALU_SUB = 1
+ALU_XOR = 2
+ALU_SLL = 10
+
+# CFG[3:2] operator mix (runtime_bist_controller -> ibex_alu_bist_wrapper)
+OP_COMPL = 0  # ADD  pattern + ~pattern (legacy, result is always all-ones)
+OP_ADD = 1    # ADD  pattern + swap16(pattern)
+OP_SUB = 2    # SUB  pattern - swap16(pattern)
+OP_MIX = 3    # ADD/SUB/XOR/SLL selected by pattern[1:0]
+OP_MODES = (OP_COMPL, OP_ADD, OP_SUB, OP_MIX)
+MIX_OPERATORS = (ALU_ADD, ALU_SUB, ALU_XOR, ALU_SLL)
+
+
+def swap16(x):
+    return ((x << 16) | (x >> 16)) & MASK
+
+
+def bist_operands(pattern, op_mode=OP_COMPL):
+    """(operator, operand_a, operand_b) driven into the ALU for one pattern."""
+    if op_mode == OP_COMPL:
+        return ALU_ADD, pattern, ~pattern & MASK
+    if op_mode == OP_ADD:
+        return ALU_ADD, pattern, swap16(pattern)
+    if op_mode == OP_SUB:
+        return ALU_SUB, pattern, swap16(pattern)
+    return MIX_OPERATORS[pattern & 3], pattern, swap16(pattern)
+
+
+def alu_result(operator, a, b):
+    """ibex_alu result_o for the operators used in BIST mode."""
+    if operator == ALU_ADD:
+        return (a + b) & MASK
+    if operator == ALU_SUB:
+        return (a - b) & MASK
+    if operator == ALU_XOR:
+        return a ^ b
+    if operator == ALU_SLL:
+        return (a << (b & 31)) & MASK
+    raise ValueError(f"operator {operator} not used in BIST mode")
+
+
+def adder_result(operator, a, b):
+    """ibex_alu adder_result_o for the BIST operators (XOR / SLL still add a + b)."""
+    return (a - b) & MASK if operator == ALU_SUB else (a + b) & MASK
+
+
+def alu_outputs(operator, a, b):
+    """(result_o, adder_result_o, comparison_result_o, is_equal_result_o) for one BIST operation.
+
+    None of the BIST operators is a comparison, so comparison_result_o
+    takes ibex_alu's default branch and equals is_equal_result_o.
+    """
+    adder = adder_result(operator, a, b)
+    is_equal = int(adder == 0)
+    return alu_result(operator, a, b), adder, is_equal, is_equal
+
+
+def space_compact(result, adder, comparison, is_equal, width=WIDTH, poly=MISR_POLY):
+    """bist_space_compactor: result ^ (adder * x mod POLY) ^ {is_equal, comparison}.
+
+    For ADD / SUB result_o equals adder_result_o, so a plain XOR would cancel
+    every adder error. x + 1 does not divide the primitive x^WIDTH + POLY,
+    so e ^ (e * x) is never zero for a non-zero error e.
+    """
+    return result ^ misr_step(adder, 0, width, poly) ^ (is_equal << 1) ^ comparison
+
+
+def alu_response(pattern, op_mode=OP_COMPL, compact_all=True):
+    """MISR input for one BIST pattern: every ALU output through bist_space_compactor, or result_o only."""
+    operator, a, b = bist_operands(pattern, op_mode)
+    if not compact_all:
+        return alu_result(operator, a, b)
+    return space_compact(*alu_outputs(operator, a, b))
+
+
+# =============================================================================
+# Sessions (runtime_bist_controller)
+# =============================================================================
+# CFG[1:0] session length select: 32 << len_sel cycles (3 = 256, the reset value)
+LEN_SELECTS = (0, 1, 2, 3)
+
+# Hardware seed scheduler (CTRL[2]): sessions rotate through this many seed slots
+SEED_SLOTS = 4
+
+
+def session_length(len_sel):
+    return 32 << len_sel
+
+
+def config_index(len_sel, op_mode):
+    """Golden table index of a configuration: CFG[3:0] = {op_mode, len_sel}."""
+    return (op_mode << 2) | len_sel
+
+
+def lfsr_advance(state, n):
+    """LFSR state after n single steps: T^n state."""
+    return gf2_apply(gf2_pow(LFSR_MATRIX, n), state)
+
+
+def schedule_seeds(seed=INITIAL_SEED, length=256, slots=SEED_SLOTS):
+    """Session seeds of the hardware seed scheduler.
+
+    Slot 0 uses the SEED register; every completed session hands its final
+    LFSR state (T^(length-1) of its seed) to the next slot, so consecutive
+    slots test adjacent, non-overlapping pattern windows. After the last
+    slot the schedule wraps back to the SEED register.
+    """
+    step = gf2_pow(LFSR_MATRIX, length - 1)
+    seeds = [seed & MASK]
+    for _ in range(slots - 1):
+        seeds.append(gf2_apply(step, seeds[-1]))
+    return seeds
+
+
+def session_patterns(seed=INITIAL_SEED, length=256):
+    """Patterns captured by one BIST session of runtime_bist_controller.
+
+    The LFSR is reseeded and the MISR cleared in cycle 0, so cycles
+    1 .. length-1 capture the responses to seed, T seed, T^2 seed, ...
+    """
+    lfsr = LFSR(seed)
+    return [lfsr.clock()[0] for _ in range(length - 1)]
+
+
+def session_signature(seed=INITIAL_SEED, length=256, op_mode=OP_COMPL, response=alu_response):
+    """Golden MISR signature of one session."""
+    misr = MISR()
+    for p in session_patterns(seed, length):
+        misr.clock([response(p, op_mode)])
+    return misr.signature
@@ -0,0 +1,400 @@
+"""
+Bit-sliced BIST Model — many lfsr_gen -> ALU -> misr_analyzer pipelines at once.
+
+Each pipeline (lane) has its own seed and, optionally, its own LFSR feedback
+taps. The lanes are transposed into bit planes: plane i of a 32-bit bus is
+one Python int whose bit k is bit i of lane k, so every gate costs one
+integer operation for all lanes. The LFSR shifts the plane list and XORs the
+tap planes, the adder is a ripple of plane-wide full adders, the log-shifter
+selects between shifted plane lists and the MISR shifts the plane list and
+XORs its top plane into the feedback polynomial's taps.
+The MIX operator mix selects per lane (pattern[1:0]), which becomes four
+select masks. Python ints have no width limit, so one plane holds 64 or
+many thousands of lanes; the cost of an operation grows much more slowly
+than the lane count.
+
+Fault simulation follows fault_model.py and gives the same detected set per
+lane. Every single stuck-at fault of fault_list() is forced on all lanes at
+once, and only its error is propagated from the fault-free values of the
+same cycle: a carry or operand difference ripples until the carry is
+fault-free again, and a shifter difference is routed by the shift amount.
+Adder errors also reach the space compactor (shifted by one bit) and may flip
+is_equal. The error planes go through a bit-sliced MISR, and a lane detects the fault
+when its error signature is non-zero. A bit-sliced counter adds up the
+detected faults per lane.
+
+Usage:
+    from bitslice_model import session_coverage, session_signatures
+    counts = session_coverage(seeds, length=256, op_mode=OP_MIX)          # detected faults per seed
+    counts = session_coverage(seeds, 256, OP_MIX, taps=taps_per_lane)     # (seed, taps) pairs
+    sigs = session_signatures(seeds, 256, OP_MIX)                         # golden signature per seed
+"""
+from bist_model import (ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, LFSR_TAPS, MISR_POLY, MIX_OPERATORS, OP_ADD, OP_COMPL,
+                        OP_MIX, OP_SUB, WIDTH)
+from fault_model import SHIFT_STAGES, fault_list
+
+
+# =============================================================================
+# Bit planes
+# =============================================================================
+class Lanes:
+    """Transposition between per-lane integers and bit planes (bit k of a plane = lane k)."""
+
+    def __init__(self, lanes):
+        self.lanes = lanes
+        self.ones = (1 << lanes) - 1
+
+    def pack(self, values, width=WIDTH):
+        """Per-lane integers -> `width` planes."""
+        planes = [0] * width
+        for k, v in enumerate(values):
+            for i in range(width):
+                if (v >> i) & 1:
+                    planes[i] |= 1 << k
+        return planes
+
+    def unpack(self, planes):
+        """Planes -> per-lane integers."""
+        values = [0] * self.lanes
+        for i, plane in enumerate(planes):
+            for k in range(self.lanes):
+                if (plane >> k) & 1:
+                    values[k] |= 1 << i
+        return values
+
+
+def _merge(err, i, d):
+    """err[i] ^= d, keeping only non-zero planes."""
+    if d:
+        d ^= err.get(i, 0)
+        if d:
+            err[i] = d
+        else:
+            del err[i]
+
+
+# =============================================================================
+# Bit-sliced datapath
+# =============================================================================
+def lfsr_step(state, taps):
+    """lfsr_reg <= {lfsr_reg[WIDTH-2:0], ^(lfsr_reg & TAPS)} on every lane (taps: tap planes)."""
+    fb = 0
+    for s, t in zip(state, taps):
+        if t:
+            fb ^= s & t
+    return [fb] + state[:-1]
+
+
+def misr_step(sig, data, poly=MISR_POLY):
+    """misr_reg <= {misr_reg[WIDTH-2:0], 1'b0} ^ (misr_reg[WIDTH-1] ? POLY : '0) ^ dut_response on every lane."""
+    top = sig[-1]
+    shifted = [0] + sig[:-1]
+    return [s ^ (top if (poly >> i) & 1 else 0) ^ d for i, (s, d) in enumerate(zip(shifted, data))]
+
+
+def ripple_add(a, b, cin):
+    """a + b + cin. Returns (sum planes, carry planes into every bit)."""
+    s, carries = [], []
+    c = cin
+    for x, y in zip(a, b):
+        carries.append(c)
+        s.append(x ^ y ^ c)
+        c = (x & y) | (c & (x ^ y))
+    return s, carries
+
+
+def barrel_sll(ones, a, shamt):
+    """a << shamt[4:0] through the log-shifter. Returns (output, every stage output)."""
+    x, stages = a, []
+    for k in range(SHIFT_STAGES):
+        sel, nsel, d = shamt[k], shamt[k] ^ ones, 1 << k
+        x = [x[i] & nsel for i in range(d)] + [(x[i - d] & sel) | (x[i] & nsel) for i in range(d, WIDTH)]
+        stages.append(x)
+    return x, stages
+
+
+def alu(ones, operator, a, b):
+    """result_o planes of one BIST operator. Returns (result, adder carries or shifter stages)."""
+    if operator == ALU_ADD:
+        return ripple_add(a, b, 0)
+    if operator == ALU_SUB:
+        return ripple_add(a, [x ^ ones for x in b], ones)
+    if operator == ALU_XOR:
+        return [x ^ y for x, y in zip(a, b)], None
+    if operator == ALU_SLL:
+        return barrel_sll(ones, a, b)
+    raise ValueError(f"operator {operator} not used in BIST mode")
+
+
+def bist_operands(ones, pattern, op_mode):
+    """(operand_a, operand_b, {operator: lane mask}) planes of one pattern (bist_model.bist_operands)."""
+    if op_mode == OP_COMPL:
+        return pattern, [x ^ ones for x in pattern], {ALU_ADD: ones}
+    swapped = pattern[16:] + pattern[:16]  # swap16: bit i <- bit i + 16
+    if op_mode == OP_ADD:
+        return pattern, swapped, {ALU_ADD: ones}
+    if op_mode == OP_SUB:
+        return pattern, swapped, {ALU_SUB: ones}
+    p0, p1 = pattern[0], pattern[1]
+    n0, n1 = p0 ^ ones, p1 ^ ones
+    return pattern, swapped, dict(zip(MIX_OPERATORS, (n1 & n0, n1 & p0, p1 & n0, p1 & p0)))
+
+
+class Cycle:
+    """Fault-free values of one BIST cycle on every lane, kept for fault propagation."""
+    __slots__ = ("ones", "a", "b", "sel", "adder_sel", "out", "inner", "result", "adder", "adder_or", "is_equal",
+                 "response")
+
+    def __init__(self, ones, pattern, op_mode):
+        self.ones = ones
+        self.a, self.b, self.sel = bist_operands(ones, pattern, op_mode)
+        self.out, self.inner = {}, {}
+        result = [0] * WIDTH
+        for op, mask in self.sel.items():
+            self.out[op], self.inner[op] = alu(ones, op, self.a, self.b)
+            result = [r | (x & mask) for r, x in zip(result, self.out[op])]
+        self.result = result
+        # The adder subtracts on SUB lanes and adds a + b on all others (XOR / SLL included)
+        sub = self.sel.get(ALU_SUB, 0)
+        self.adder_sel = {op: mask for op, mask in ((ALU_ADD, ones ^ sub), (ALU_SUB, sub)) if mask}
+        if ALU_ADD in self.adder_sel and ALU_ADD not in self.out:
+            self.out[ALU_ADD], self.inner[ALU_ADD] = alu(ones, ALU_ADD, self.a, self.b)
+        adder = [0] * WIDTH
+        for op, mask in self.adder_sel.items():
+            adder = [r | (x & mask) for r, x in zip(adder, self.out[op])]
+        self.adder = adder
+        # adder_or[i][j]: lanes with a set adder bit in i .. j - 1 (prefix for i = 0, suffix for j = WIDTH)
+        prefix, suffix = [0], [0]
+        for x, y in zip(adder, reversed(adder)):
+            prefix.append(prefix[-1] | x)
+            suffix.append(suffix[-1] | y)
+        self.adder_or = (prefix, suffix[::-1])
+        self.is_equal = ones ^ prefix[-1]
+        self.response = space_compact(result, adder, self.is_equal, self.is_equal)
+
+
+def any_set(planes):
+    """Lanes with at least one set bit."""
+    nz = 0
+    for x in planes:
+        nz |= x
+    return nz
+
+
+def space_compact(result, adder, comparison, is_equal):
+    """bist_space_compactor on every lane: result ^ (adder * x mod MISR_POLY) ^ {is_equal, comparison}."""
+    out = [r ^ x for r, x in zip(result, misr_step(adder, [0] * WIDTH))]
+    out[0] ^= comparison
+    out[1] ^= is_equal
+    return out
+
+
+def ripple_error(err, a, b, good, carries, start, c, mask):
+    """Merge into err the sum error of an adder re-evaluated from bit `start`, carry c into it.
+
+    a and b may only differ from the fault-free operands at `start`, so the
+    ripple stops at the first later bit whose carry is fault-free again.
+    """
+    for i in range(start, WIDTH):
+        if i > start and c == carries[i]:
+            return
+        x = a[i] ^ b[i]
+        _merge(err, i, (x ^ c ^ good[i]) & mask)
+        c = (a[i] & b[i]) | (c & x)
+
+
+def shift_error(err, ones, shamt, diff, start):
+    """Merge into err a {bit: plane} difference routed through shifter stages start .. 4.
+
+    For a fixed shift amount the shifter only routes data bits, so a
+    difference at bit i moves to bit i + 2^k on the lanes that shift in
+    stage k, and falls off above bit 31.
+    """
+    for k in range(start, SHIFT_STAGES):
+        sel, d = shamt[k], 1 << k
+        moved = {}
+        for i, x in diff.items():
+            _merge(moved, i, x & (sel ^ ones))
+            if i + d < WIDTH:
+                _merge(moved, i + d, x & sel)
+        diff = moved
+    for i, x in diff.items():
+        _merge(err, i, x)
+
+
+def adder_error(cyc, fault):
+    """{bit: plane} of faulty XOR fault-free adder_result_o in one cycle."""
+    ones, site, bit = cyc.ones, fault.site, fault.bit
+    force = ones if fault.value else 0
+    err = {}
+    if site == "sum":
+        for op, mask in cyc.adder_sel.items():
+            _merge(err, bit, (cyc.out[op][bit] ^ force) & mask)
+    elif site == "carry":
+        for op, mask in cyc.adder_sel.items():
+            b = cyc.b if op == ALU_ADD else [x ^ ones for x in cyc.b]
+            ripple_error(err, cyc.a, b, cyc.out[op], cyc.inner[op], bit, force, mask)
+    elif site in ("op_a", "op_b"):
+        a, b = list(cyc.a), list(cyc.b)
+        (a if site == "op_a" else b)[bit] = force
+        if a[bit] == cyc.a[bit] and b[bit] == cyc.b[bit]:
+            return err
+        for op, mask in cyc.adder_sel.items():
+            nb = b if op == ALU_ADD else [x ^ ones for x in b]
+            ripple_error(err, a, nb, cyc.out[op], cyc.inner[op], bit, cyc.inner[op][bit], mask)
+    return err
+
+
+def fault_error(cyc, fault, compact_all=True):
+    """{bit: plane} of the faulty XOR fault-free MISR input in one cycle (non-zero planes only).
+
+    The MISR input is the bist_space_compactor output, or result_o alone
+    with compact_all=False.
+    """
+    ones, site, bit = cyc.ones, fault.site, fault.bit
+    force = ones if fault.value else 0
+    aerr = adder_error(cyc, fault)
+    # result_o is the adder output on ADD / SUB lanes
+    arith = cyc.sel.get(ALU_ADD, 0) | cyc.sel.get(ALU_SUB, 0)
+    err = {}
+    for i, d in aerr.items():
+        _merge(err, i, d & arith)
+    if site == "result":
+        _merge(err, bit, cyc.result[bit] ^ force)
+    elif site.startswith("shift"):
+        if ALU_SLL in cyc.sel:
+            k = int(site[5:])
+            diff = {bit: (cyc.inner[ALU_SLL][k][bit] ^ force) & cyc.sel[ALU_SLL]}
+            shift_error(err, ones, cyc.b, diff, k + 1)
+    elif site in ("op_a", "op_b"):
+        a, b = list(cyc.a), list(cyc.b)
+        (a if site == "op_a" else b)[bit] = force
+        if a[bit] != cyc.a[bit] or b[bit] != cyc.b[bit]:
+            for op, mask in cyc.sel.items():
+                if op == ALU_XOR:
+                    _merge(err, bit, (a[bit] ^ b[bit] ^ cyc.out[op][bit]) & mask)
+                elif op == ALU_SLL and site == "op_a":
+                    shift_error(err, ones, b, {bit: (a[bit] ^ cyc.a[bit]) & mask}, 0)
+                elif op == ALU_SLL and bit < SHIFT_STAGES:  # another shift amount (SLL only reads b[4:0])
+                    out, _ = barrel_sll(ones, a, b)
+                    for i in range(WIDTH):
+                        _merge(err, i, (out[i] ^ cyc.out[op][i]) & mask)
+    if not compact_all:
+        return err
+
+    # bist_space_compactor: adder error times x, is_equal / comparison flips
+    for i, d in aerr.items():
+        if i < WIDTH - 1:
+            _merge(err, i + 1, d)
+        else:
+            for j in range(WIDTH):
+                if (MISR_POLY >> j) & 1:
+                    _merge(err, j, d)
+    if site == "cmp":
+        _merge(err, 0, cyc.is_equal ^ force)
+    elif site == "eq":
+        _merge(err, 1, cyc.is_equal ^ force)
+    elif aerr:
+        # Only lanes whose adder is zero outside the error span can become zero
+        lo, hi = min(aerr), max(aerr) + 1
+        prefix, suffix = cyc.adder_or
+        zero = ones ^ (prefix[lo] | suffix[hi])
+        if zero:
+            zero &= ~any_set([cyc.adder[i] ^ aerr.get(i, 0) for i in range(lo, hi)])
+            _merge(err, 0, zero ^ cyc.is_equal)
+            _merge(err, 1, zero ^ cyc.is_equal)
+    return err
+
+
+# =============================================================================
+# Sessions
+# =============================================================================
+def tap_planes(lanes, taps):
+    """Feedback taps -> planes: None (LFSR_TAPS), one value for all lanes, or one value per lane."""
+    if taps is None or isinstance(taps, int):
+        shared = LFSR_TAPS if taps is None else taps
+        return [lanes.ones if (shared >> i) & 1 else 0 for i in range(WIDTH)]
+    if len(taps) != lanes.lanes:
+        raise ValueError(f"expected {lanes.lanes} tap values, got {len(taps)}")
+    return lanes.pack(taps)
+
+
+def session_cycles(lanes, seeds, length, op_mode, taps=None):
+    """Fault-free Cycle of every capture of one session (bist_model.session_patterns order)."""
+    state = lanes.pack(seeds)
+    taps = tap_planes(lanes, taps)
+    cycles = []
+    for _ in range(length - 1):
+        cycles.append(Cycle(lanes.ones, state, op_mode))
+        state = lfsr_step(state, taps)
+    return cycles
+
+
+def error_signature(cycles, fault, poly=MISR_POLY, compact_all=True):
+    """Error signature planes of one fault over a session (faulty XOR good MISR)."""
+    return compact_errors((fault_error(cyc, fault, compact_all) for cyc in cycles), poly)
+
+
+def compact_errors(errors, poly=MISR_POLY):
+    """Signature planes of a sequence of {bit: plane} errors compacted from a cleared MISR."""
+    # The shift is an index offset: after t captures, register bit i is held
+    # in sig[(i - t) % WIDTH], so the bit shifted out lands on bit 0 and only
+    # the other feedback taps cost an XOR
+    taps = [i for i in range(1, WIDTH) if (poly >> i) & 1]
+    sig = [0] * WIDTH
+    t = 0
+    for t, err in enumerate(errors, 1):
+        top = sig[-t % WIDTH]
+        if top:
+            for i in taps:
+                sig[(i - t) % WIDTH] ^= top
+            if not poly & 1:
+                sig[-t % WIDTH] = 0
+        for i, d in err.items():
+            sig[(i - t) % WIDTH] ^= d
+    t %= WIDTH
+    return sig[-t:] + sig[:-t] if t else sig
+
+
+def count_add(counter, mask):
+    """Bit-sliced counter (LSB-first planes) += 1 on the lanes in mask."""
+    carry = mask
+    for i in range(len(counter)):
+        if not carry:
+            return
+        counter[i], carry = counter[i] ^ carry, counter[i] & carry
+    if carry:
+        counter.append(carry)
+
+
+def session_coverage(seeds, length=256, op_mode=OP_MIX, taps=None, faults=None, detail=False, poly=MISR_POLY,
+                     compact_all=True):
+    """Number of faults of fault_list() detected by one session, per lane.
+
+    Lane k uses seeds[k] and LFSR taps `taps` (None: LFSR_TAPS, an int for
+    all lanes, or one value per lane); the MISR uses `poly` and compacts
+    result_o only when compact_all is False. With detail=True, returns
+    (counts, {fault: detected lane mask}).
+    """
+    faults = fault_list() if faults is None else faults
+    lanes = Lanes(len(seeds))
+    cycles = session_cycles(lanes, seeds, length, op_mode, taps)
+    counter, masks = [], {}
+    for f in faults:
+        mask = 0
+        for plane in error_signature(cycles, f, poly, compact_all):
+            mask |= plane
+        count_add(counter, mask)
+        if detail:
+            masks[f] = mask
+    counts = lanes.unpack(counter)
+    return (counts, masks) if detail else counts
+
+
+def session_signatures(seeds, length=256, op_mode=OP_MIX, taps=None, poly=MISR_POLY, compact_all=True):
+    """Golden MISR signature per lane (bist_model.session_signature)."""
+    lanes = Lanes(len(seeds))
+    sig = [0] * WIDTH
+    for cyc in session_cycles(lanes, seeds, length, op_mode, taps):
+        sig = misr_step(sig, cyc.response if compact_all else cyc.result, poly)
+    return lanes.unpack(sig)
@@ -0,0 +1,102 @@
+"""
+Checkpoint Detection Latency — cycles from session start to the first failing check.
+
+Without checkpoints a fault is only flagged at CHECK_RESULT, L cycles after
+the session starts. With CHKPT enabled, runtime_bist_controller compares the
+MISR at every window boundary c = W, 2W, ... < L against the checkpoint table
+(golden_table.py), and the session fails at the first boundary whose MISR
+differs. For every fault of fault_model.py this tool finds that boundary
+from the running error signature (the MISR at cycle c holds the responses of
+cycles 1 .. c-1) and reports the mean detection latency per window size.
+
+A fault whose error signature aliases to zero at the end of the session can
+still be caught at an earlier checkpoint, so checkpoints can also add
+coverage.
+
+Usage:
+    python Tools/checkpoint_latency.py
+    python Tools/checkpoint_latency.py --len-sel 3 --windows 32 64 128 --op-mode 3
+    python Tools/checkpoint_latency.py --json
+"""
+import argparse
+import json
+import sys
+
+from bist_model import INITIAL_SEED, OP_MODES, bist_operands, misr_step, session_length, session_patterns
+from fault_model import fault_list, misr_input
+from golden_table import CHKPT_WINDOW
+
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+DEFAULT_WINDOWS = (CHKPT_WINDOW, 2 * CHKPT_WINDOW, 4 * CHKPT_WINDOW)
+
+
+def error_trace(patterns, op_mode, fault, good=None):
+    """Error signature held by the MISR at each cycle c = 1 .. len(patterns) + 1 (index c - 1)."""
+    stimuli = [bist_operands(p, op_mode) for p in patterns]
+    good = [misr_input(*s) for s in stimuli] if good is None else good
+    trace = [0]
+    err = 0
+    for s, r in zip(stimuli, good):
+        err = misr_step(err, misr_input(*s, fault) ^ r)
+        trace.append(err)
+    return trace
+
+
+def detection_cycle(trace, length, window=None):
+    """Cycle at which the controller flags the fault (None if never)."""
+    if window:
+        for c in range(window, length, window):
+            if trace[c - 1]:
+                return c
+    return length if trace[length - 1] else None
+
+
+def latency_report(seed, length, op_mode, windows=DEFAULT_WINDOWS, faults=None):
+    """{window (0 = end of session only): {detected, mean_cycles, max_cycles}} for one configuration."""
+    faults = fault_list() if faults is None else faults
+    patterns = session_patterns(seed, length)
+    good = [misr_input(*bist_operands(p, op_mode)) for p in patterns]
+    cycles = {w: [] for w in (0,) + tuple(windows)}
+    for f in faults:
+        trace = error_trace(patterns, op_mode, f, good)
+        for w in cycles:
+            c = detection_cycle(trace, length, w or None)
+            if c is not None:
+                cycles[w].append(c)
+    return {w: {"detected": len(c), "mean_cycles": sum(c) / len(c) if c else None,
+                "max_cycles": max(c, default=None)} for w, c in cycles.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Checkpoint fault-detection latency")
+    parser.add_argument("--seed", type=lambda v: int(v, 0), default=INITIAL_SEED, help="SEED register value")
+    parser.add_argument("--len-sel", type=int, default=3, help="CFG[1:0] session length select")
+    parser.add_argument("--op-mode", type=int, nargs="+", default=list(OP_MODES))
+    parser.add_argument("--windows", type=int, nargs="+", default=list(DEFAULT_WINDOWS))
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args(argv)
+
+    length = session_length(args.len_sel)
+    faults = fault_list()
+    report = {OP_NAMES[m]: latency_report(args.seed, length, m, args.windows, faults) for m in args.op_mode}
+    if args.json:
+        print(json.dumps({"faults": len(faults), "length": length, "latency": report}, indent=2))
+        return 0
+
+    print(f"Fault detection latency ({len(faults)} faults), {length}-cycle sessions, SEED 0x{args.seed:08X}")
+    print(f"{'OP':<6} {'CHECK':<12} {'DETECTED':>9} {'MEAN':>8} {'MAX':>5} {'REDUCTION':>10}")
+    for name, rows in report.items():
+        base = rows[0]["mean_cycles"]
+        for w, r in rows.items():
+            label = "end only" if w == 0 else f"every {w}"
+            if r["mean_cycles"] is None:
+                print(f"{name:<6} {label:<12} {r['detected']:>4}/{len(faults):<4} {'-':>8} {'-':>5} {'-':>10}")
+                continue
+            reduction = 100 * (1 - r["mean_cycles"] / base) if base else 0.0
+            print(f"{name:<6} {label:<12} {r['detected']:>4}/{len(faults):<4} {r['mean_cycles']:>8.1f} "
+                  f"{r['max_cycles']:>5} {reduction:>9.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+RTL Fault-Injection Campaign — detection rate and latency of the runtime BIST.
+
+Injects one fault per run into the ALU result seen by the BIST
+(bist_fault_injector inside ibex_alu_bist_wrapper) and measures the cycles
+from the first faulty cycle to bist_error_irq_o:
+
+    sa0 / sa1   bit stuck at 0 / 1 from BIST cycle CYCLE on
+    flip        single-cycle bit flip in BIST cycle CYCLE
+
+The injection list is split into chunks that run concurrently, one simulator
+process per worker (Test/test_fault_campaign.py reads its chunk from
+FAULT_CAMPAIGN_IN). The design is built once before the workers start.
+Results are aggregated per fault class: detection rate, latency percentiles
+and a latency histogram.
+
+Usage:
+    python Tools/fault_campaign.py --make-arg SIM=verilator -j 8
+    python Tools/fault_campaign.py --bits 0 7 15 31 --cycles 0 64 200 --chkpt 32
+    python Tools/fault_campaign.py --random 2000 --seed 7 --json campaign.json
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from bist_model import OP_MIX, OP_MODES, session_length
+from results_db import REPO_ROOT
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+TARGET = "test_fault_campaign"
+FAULT_CLASSES = ("sa0", "sa1", "flip")
+WIDTH = 32
+HIST_BINS = 8
+
+
+def grid_injections(bits, modes, cycles):
+    """Every (mode, bit, cycle) combination."""
+    return [{"mode": m, "bit": b, "cycle": c} for m in modes for b in bits for c in cycles]
+
+
+def random_injections(n, modes, length, seed):
+    """n injections with uniformly drawn mode, bit and cycle within one session."""
+    rng = random.Random(seed)
+    return [{"mode": rng.choice(modes), "bit": rng.randrange(WIDTH), "cycle": rng.randrange(length)}
+            for _ in range(n)]
+
+
+def _make(make_args, out_dir, name, env_extra):
+    log = os.path.join(out_dir, f"{name}.log")
+    cmd = ["make", "-f", "makefile", TARGET, f"COCOTB_RESULTS_FILE=results_{name}.xml"]
+    env = dict(os.environ, PWD=TEST_DIR, **env_extra)
+    with open(log, "w") as f:
+        rc = subprocess.run(cmd + make_args, cwd=TEST_DIR, env=env, stdout=f, stderr=subprocess.STDOUT).returncode
+    return rc, log
+
+
+def run_chunk(index, config, injections, make_args, out_dir):
+    """Simulate one chunk of injections. Returns its result records ([] on failure)."""
+    name = f"fault_campaign_{index}"
+    src = os.path.join(out_dir, f"{name}.json")
+    out = os.path.join(out_dir, f"{name}.jsonl")
+    with open(src, "w") as f:
+        json.dump({"config": config, "injections": injections}, f)
+    if os.path.exists(out):
+        os.remove(out)
+    rc, log = _make(make_args, out_dir, name, {"FAULT_CAMPAIGN_IN": src, "FAULT_CAMPAIGN_OUT": out})
+    if rc != 0 or not os.path.exists(out):
+        print(f"❌ chunk {index}: simulation failed (see {os.path.relpath(log, REPO_ROOT)})")
+        return []
+    with open(out) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    k = max(0, min(len(sorted_values) - 1, -(-p * len(sorted_values) // 100) - 1))
+    return sorted_values[k]
+
+
+def summarize(results, length):
+    """{fault class: detection rate, latency statistics and histogram} (plus "all")."""
+    bin_width = max(1, -(-2 * length // HIST_BINS))
+    summary = {}
+    for cls in FAULT_CLASSES + ("all",):
+        rows = [r for r in results if cls == "all" or r["mode"] == cls]
+        if not rows:
+            continue
+        lat = sorted(r["latency"] for r in rows if r["detected"])
+        hist = [0] * HIST_BINS
+        for v in lat:
+            hist[min(v // bin_width, HIST_BINS - 1)] += 1
+        summary[cls] = {
+            "injections": len(rows),
+            "activated": sum(r["activated"] for r in rows),
+            "detected": len(lat),
+            "detection_rate": len(lat) / len(rows),
+            "latency_min": lat[0] if lat else None,
+            "latency_p50": percentile(lat, 50),
+            "latency_p90": percentile(lat, 90),
+            "latency_max": lat[-1] if lat else None,
+            "latency_mean": sum(lat) / len(lat) if lat else None,
+            "histogram": {"bin_cycles": bin_width, "counts": hist},
+        }
+    return summary
+
+
+def _fmt(value, spec, width):
+    return f"{value:{spec}}".rjust(width) if value is not None else "-".rjust(width)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel RTL fault-injection campaign")
+    parser.add_argument("--len-sel", type=int, default=1, help="CFG[1:0] session length select")
+    parser.add_argument("--op-mode", type=int, choices=OP_MODES, default=OP_MIX, help="CFG[3:2]")
+    parser.add_argument("--chkpt", type=int, choices=(0, 32, 64, 128), default=0,
+                        help="checkpoint window in cycles (0 = end-of-session check only)")
+    parser.add_argument("--modes", nargs="+", choices=FAULT_CLASSES, default=list(FAULT_CLASSES))
+    parser.add_argument("--bits", type=int, nargs="+", default=list(range(WIDTH)))
+    parser.add_argument("--cycles", type=int, nargs="+", help="injection cycles (default: 8 across the session)")
+    parser.add_argument("--random", type=int, metavar="N", help="N random injections instead of the grid")
+    parser.add_argument("--seed", type=int, default=1, help="random injection seed")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=0, help="injections per simulator run (default: even split)")
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    parser.add_argument("--json", metavar="FILE", help="write the summary and every result to FILE")
+    args = parser.parse_args(argv)
+
+    length = session_length(args.len_sel)
+    if args.random:
+        injections = random_injections(args.random, args.modes, length, args.seed)
+    else:
+        cycles = args.cycles or sorted({length * k // 8 for k in range(8)} | {length - 1})
+        injections = grid_injections(args.bits, args.modes, cycles)
+    for i, inj in enumerate(injections):
+        inj["id"] = i
+    config = {"len_sel": args.len_sel, "op_mode": args.op_mode, "chkpt": args.chkpt}
+
+    out_dir = os.path.join(TEST_DIR, "sim_build", "logs")
+    os.makedirs(out_dir, exist_ok=True)
+    # Build once (runs the built-in smoke campaign) so the workers share one simulator binary
+    rc, log = _make(args.make_arg, out_dir, "fault_campaign_build", {})
+    if rc != 0:
+        print(f"❌ build failed (see {os.path.relpath(log, REPO_ROOT)})")
+        return 1
+
+    size = args.chunk or -(-len(injections) // max(1, args.jobs))
+    chunks = [injections[i:i + size] for i in range(0, len(injections), size)]
+    print(f"Fault campaign: {len(injections)} injections, {len(chunks)} chunks on {args.jobs} workers, "
+          f"{length}-cycle sessions, checkpoints {'every %d' % args.chkpt if args.chkpt else 'off'}")
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = [r for chunk in pool.map(lambda ic: run_chunk(*ic, args.make_arg, out_dir),
+                                           [(i, config, c) for i, c in enumerate(chunks)]) for r in chunk]
+    results.sort(key=lambda r: r["id"])
+    summary = summarize(results, length)
+
+    print(f"{'CLASS':<6} {'INJ':>6} {'DETECTED':>9} {'MIN':>5} {'P50':>5} {'P90':>5} {'MAX':>5} {'MEAN':>7}")
+    for cls, s in summary.items():
+        print(f"{cls:<6} {s['injections']:>6} {s['detection_rate']:>8.1%} {_fmt(s['latency_min'], 'd', 5)} "
+              f"{_fmt(s['latency_p50'], 'd', 5)} {_fmt(s['latency_p90'], 'd', 5)} "
+              f"{_fmt(s['latency_max'], 'd', 5)} {_fmt(s['latency_mean'], '.1f', 7)}")
+    if "all" in summary:
+        h = summary["all"]["histogram"]
+        print(f"\nLatency histogram ({h['bin_cycles']}-cycle bins)")
+        peak = max(h["counts"]) or 1
+        for i, n in enumerate(h["counts"]):
+            lo = i * h["bin_cycles"]
+            label = f"{lo}-{lo + h['bin_cycles'] - 1}" if i < HIST_BINS - 1 else f"{lo}+"
+            print(f"{label:>10} {n:>6} {'#' * round(40 * n / peak)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": config, "summary": summary, "results": results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+    return 0 if len(results) == len(injections) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+BIST Fault Dictionary — diagnosis of a failing session from its MISR signature.
+
+The MISR is linear and starts from zero, so a session with a single fault
+reads back
+
+    SIGNATURE (APB 0x10) = golden signature XOR error_signature(fault)
+
+This tool precomputes that value for every fault of fault_model.py and every
+BIST configuration, and stores it in a local SQLite database indexed by
+(configuration, signature). A read-back signature is then mapped to the
+candidate faults with one indexed lookup instead of a fault simulation.
+
+Faults that leave the same signature cannot be told apart by the session;
+the diagnostic resolution reports how many faults are identified uniquely
+and how many candidates a failing signature leaves on average.
+
+Usage:
+    python Tools/fault_dict.py build                       # slot 0, every CFG
+    python Tools/fault_dict.py build --slots 4             # every golden table entry
+    python Tools/fault_dict.py lookup 0x1234ABCD --len-sel 0 --op-mode 3
+    python Tools/fault_dict.py resolution
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from collections import defaultdict, namedtuple
+
+from bist_model import (INITIAL_SEED, LEN_SELECTS, OP_MODES, bist_operands, misr_step, schedule_seeds,
+                        session_length, session_patterns)
+from fault_model import Fault, fault_list, misr_input
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_DB = os.path.join(REPO_ROOT, "Test", "fault_dict.db")
+
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS configs (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    seed     INTEGER NOT NULL,
+    len_sel  INTEGER NOT NULL,
+    op_mode  INTEGER NOT NULL,
+    slot     INTEGER NOT NULL,
+    golden   INTEGER NOT NULL,
+    faults   INTEGER NOT NULL,
+    UNIQUE (seed, len_sel, op_mode, slot)
+);
+CREATE TABLE IF NOT EXISTS signatures (
+    config_id INTEGER NOT NULL REFERENCES configs(id),
+    signature INTEGER NOT NULL,
+    site      TEXT    NOT NULL,
+    bit       INTEGER NOT NULL,
+    value     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_signatures ON signatures(config_id, signature);
+"""
+
+Resolution = namedtuple("Resolution", "faults detected classes unique mean_candidates max_candidates")
+
+
+def failing_signatures(patterns, op_mode, faults=None):
+    """(golden signature, {fault: signature read back with that fault}) for one session."""
+    faults = fault_list() if faults is None else faults
+    stimuli = [bist_operands(p, op_mode) for p in patterns]
+    good = [misr_input(*s) for s in stimuli]
+    golden = 0
+    for r in good:
+        golden = misr_step(golden, r)
+    sigs = {}
+    for f in faults:
+        err = 0
+        for s, r in zip(stimuli, good):
+            err = misr_step(err, misr_input(*s, f) ^ r)
+        sigs[f] = golden ^ err
+    return golden, sigs
+
+
+def equivalence_classes(golden, sigs):
+    """{signature: [faults]} for the detected faults (signature != golden)."""
+    classes = defaultdict(list)
+    for f, sig in sigs.items():
+        if sig != golden:
+            classes[sig].append(f)
+    return dict(classes)
+
+
+def diagnostic_resolution(golden, sigs):
+    """Resolution of a dictionary: how well a failing signature pins down the fault."""
+    classes = equivalence_classes(golden, sigs)
+    detected = sum(len(c) for c in classes.values())
+    return Resolution(
+        faults=len(sigs),
+        detected=detected,
+        classes=len(classes),
+        unique=sum(1 for c in classes.values() if len(c) == 1),
+        # Expected number of candidates returned for a randomly chosen detected fault
+        mean_candidates=sum(len(c) ** 2 for c in classes.values()) / detected if detected else 0.0,
+        max_candidates=max((len(c) for c in classes.values()), default=0),
+    )
+
+
+class FaultDictionary:
+    """On-disk signature -> candidate faults index, one entry set per BIST configuration."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _config_id(self, seed, len_sel, op_mode, slot):
+        row = self.conn.execute(
+            "SELECT id FROM configs WHERE seed = ? AND len_sel = ? AND op_mode = ? AND slot = ?",
+            (seed, len_sel, op_mode, slot)).fetchone()
+        return row[0] if row else None
+
+    def add(self, seed, len_sel, op_mode, slot=0, faults=None):
+        """Fault-simulate one configuration and store its failing signatures. Returns the Resolution."""
+        length = session_length(len_sel)
+        slot_seed = schedule_seeds(seed, length, slot + 1)[slot]
+        golden, sigs = failing_signatures(session_patterns(slot_seed, length), op_mode, faults)
+        with self.conn:
+            old = self._config_id(seed, len_sel, op_mode, slot)
+            if old is not None:
+                self.conn.execute("DELETE FROM signatures WHERE config_id = ?", (old,))
+                self.conn.execute("DELETE FROM configs WHERE id = ?", (old,))
+            cur = self.conn.execute(
+                "INSERT INTO configs (seed, len_sel, op_mode, slot, golden, faults) VALUES (?, ?, ?, ?, ?, ?)",
+                (seed, len_sel, op_mode, slot, golden, len(sigs)))
+            self.conn.executemany(
+                "INSERT INTO signatures (config_id, signature, site, bit, value) VALUES (?, ?, ?, ?, ?)",
+                [(cur.lastrowid, sig, f.site, f.bit, f.value) for f, sig in sigs.items() if sig != golden])
+        return diagnostic_resolution(golden, sigs)
+
+    def golden(self, len_sel, op_mode, slot=0, seed=INITIAL_SEED):
+        row = self.conn.execute(
+            "SELECT golden FROM configs WHERE seed = ? AND len_sel = ? AND op_mode = ? AND slot = ?",
+            (seed, len_sel, op_mode, slot)).fetchone()
+        return row[0] if row else None
+
+    def lookup(self, signature, len_sel, op_mode, slot=0, seed=INITIAL_SEED):
+        """Candidate faults for a read-back signature ([] if it is the golden one or matches no modelled fault)."""
+        config_id = self._config_id(seed, len_sel, op_mode, slot)
+        if config_id is None:
+            raise KeyError(f"configuration len_sel={len_sel} op_mode={op_mode} slot={slot} "
+                           f"seed=0x{seed:08X} not in {self.path} (run: build)")
+        rows = self.conn.execute(
+            "SELECT site, bit, value FROM signatures WHERE config_id = ? AND signature = ?",
+            (config_id, signature)).fetchall()
+        return [Fault(*r) for r in rows]
+
+    def resolution(self, len_sel, op_mode, slot=0, seed=INITIAL_SEED):
+        """Resolution of a stored configuration, from the database alone."""
+        config_id = self._config_id(seed, len_sel, op_mode, slot)
+        if config_id is None:
+            return None
+        faults, = self.conn.execute("SELECT faults FROM configs WHERE id = ?", (config_id,)).fetchone()
+        sizes = [n for n, in self.conn.execute(
+            "SELECT COUNT(*) FROM signatures WHERE config_id = ? GROUP BY signature", (config_id,))]
+        detected = sum(sizes)
+        return Resolution(faults, detected, len(sizes), sum(1 for n in sizes if n == 1),
+                          sum(n * n for n in sizes) / detected if detected else 0.0, max(sizes, default=0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BIST fault dictionary")
+    parser.add_argument("--db", default=DEFAULT_DB, help="dictionary database")
+    parser.add_argument("--seed", type=lambda v: int(v, 0), default=INITIAL_SEED, help="SEED register value")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("build", help="fault-simulate and store the failing signatures")
+    p.add_argument("--len-sel", type=int, nargs="+", default=list(LEN_SELECTS))
+    p.add_argument("--op-mode", type=int, nargs="+", default=list(OP_MODES))
+    p.add_argument("--slots", type=int, default=1, help="seed slots 0..SLOTS-1 (CTRL[2] rotation)")
+    p = sub.add_parser("lookup", help="candidate faults for a read-back SIGNATURE")
+    p.add_argument("signature", type=lambda v: int(v, 0))
+    p.add_argument("--len-sel", type=int, default=3)
+    p.add_argument("--op-mode", type=int, default=0)
+    p.add_argument("--slot", type=int, default=0)
+    sub.add_parser("resolution", help="diagnostic resolution of every stored configuration")
+    args = parser.parse_args(argv)
+
+    fd = FaultDictionary(args.db)
+    try:
+        if args.cmd == "build":
+            for len_sel in args.len_sel:
+                for op_mode in args.op_mode:
+                    for slot in range(args.slots):
+                        r = fd.add(args.seed, len_sel, op_mode, slot)
+                        print(f"{OP_NAMES[op_mode]:<6} {session_length(len_sel):>4} cycles slot {slot}: "
+                              f"{r.detected}/{r.faults} detected, {r.classes} signatures")
+            print(f"Wrote {os.path.relpath(args.db, REPO_ROOT)}")
+
+        elif args.cmd == "lookup":
+            golden = fd.golden(args.len_sel, args.op_mode, args.slot, args.seed)
+            candidates = fd.lookup(args.signature, args.len_sel, args.op_mode, args.slot, args.seed)
+            if args.json:
+                print(json.dumps({"golden": golden, "candidates": [f._asdict() for f in candidates]}, indent=2))
+            elif args.signature == golden:
+                print(f"0x{args.signature:08X} is the golden signature: PASS")
+            elif not candidates:
+                print(f"0x{args.signature:08X}: no single modelled fault (multiple or unmodelled fault)")
+            else:
+                print(f"0x{args.signature:08X}: {len(candidates)} candidate fault(s)")
+                for f in candidates:
+                    print(f"  {f}")
+
+        elif args.cmd == "resolution":
+            rows = []
+            for seed, len_sel, op_mode, slot in fd.conn.execute(
+                    "SELECT seed, len_sel, op_mode, slot FROM configs ORDER BY seed, slot, op_mode, len_sel"):
+                rows.append({"seed": seed, "len_sel": len_sel, "op_mode": op_mode, "slot": slot,
+                             **fd.resolution(len_sel, op_mode, slot, seed)._asdict()})
+            if args.json:
+                print(json.dumps(rows, indent=2))
+                return 0
+            print(f"{'OP':<6} {'CYCLES':>6} {'SLOT':>4} {'DETECTED':>9} {'SIGS':>5} {'UNIQUE':>7} "
+                  f"{'AVG CAND':>9} {'MAX':>4}")
+            for r in rows:
+                print(f"{OP_NAMES[r['op_mode']]:<6} {session_length(r['len_sel']):>6} {r['slot']:>4} "
+                      f"{r['detected']:>4}/{r['faults']:<4} {r['classes']:>5} "
+                      f"{100 * r['unique'] / r['detected'] if r['detected'] else 0:>6.1f}% "
+                      f"{r['mean_candidates']:>9.2f} {r['max_candidates']:>4}")
+    finally:
+        fd.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+BIST Fault Model — single stuck-at faults on the datapath observed by the MISR.
+
+Models the part of ibex_alu_bist_wrapper that BIST mode exercises
+(operand mux -> ibex_alu adder / XOR / shifter -> result_o, adder_result_o,
+comparison_result_o, is_equal_result_o -> bist_space_compactor -> MISR) at
+the level of 32-bit buses:
+
+    site     bus                                      operators that observe it
+    op_a     ALU operand_a                             all
+    op_b     ALU operand_b                             all
+    carry    adder carry into bit i (i = 1..31)        all (ADD, SUB: also result_o)
+    sum      adder output (adder_result_o)             all (ADD, SUB: also result_o)
+    shiftK   log-shifter stage K output (K = 0..4,     SLL
+             stage K shifts by 2^K when b[K] = 1)
+    result   ALU result_o                              all
+    cmp      comparison_result_o (bit 0 only)          all
+    eq       is_equal_result_o (bit 0 only)            all
+
+The adder runs for every operator (a + b for XOR and SLL), so the space
+compactor observes adder faults in every cycle. With compact_all=False only
+result_o reaches the MISR, as before bist_space_compactor; the adder is then
+only observed through ADD / SUB and the flags not at all.
+
+Shifter stage faults are the random-pattern-resistant part of the list: a
+fault on a low bit of a late stage needs a specific shift amount and is only
+exercised by the SLL quarter of the MIX operator mix.
+
+A fault is detected by a session when its error sequence (faulty XOR good
+responses) leaves a non-zero MISR signature, so MISR aliasing is accounted
+for exactly.
+
+Usage:
+    from fault_model import fault_list, detected_faults
+    faults = fault_list()
+    hits = detected_faults(session_patterns(seed, 32), op_mode=OP_MIX, faults=faults)
+"""
+from collections import namedtuple
+
+from bist_model import ALU_ADD, ALU_SLL, ALU_SUB, ALU_XOR, MASK, WIDTH, bist_operands, misr_step, space_compact
+
+SHIFT_STAGES = 5
+FLAG_SITES = ("cmp", "eq")
+SITES = ("op_a", "op_b", "carry", "sum") + tuple(f"shift{k}" for k in range(SHIFT_STAGES)) + ("result",) + FLAG_SITES
+
+Fault = namedtuple("Fault", "site bit value")
+Fault.__str__ = lambda f: f"{f.site}[{f.bit}]/sa{f.value}"
+
+
+def fault_list(sites=SITES, width=WIDTH):
+    """All single stuck-at faults of the modelled sites."""
+    faults = []
+    for site in sites:
+        bits = range(1, width) if site == "carry" else range(1) if site in FLAG_SITES else range(width)
+        for bit in bits:
+            for value in (0, 1):
+                faults.append(Fault(site, bit, value))
+    return faults
+
+
+def _force(x, bit, value):
+    return (x | (1 << bit)) if value else (x & ~(1 << bit))
+
+
+def _adder(a, b, cin, fault=None):
+    """a + b + cin with an optional carry/sum fault."""
+    if fault is not None and fault.site == "carry":
+        low_mask = (1 << fault.bit) - 1
+        low = ((a & low_mask) + (b & low_mask) + cin) & low_mask
+        high = ((a >> fault.bit) + (b >> fault.bit) + fault.value) << fault.bit
+        out = (high | low) & MASK
+    else:
+        out = (a + b + cin) & MASK
+    if fault is not None and fault.site == "sum":
+        out = _force(out, fault.bit, fault.value)
+    return out
+
+
+def _shifter(a, shamt, fault=None):
+    """Left log-shifter a << shamt with an optional stage-output fault."""
+    x = a
+    for k in range(SHIFT_STAGES):
+        if (shamt >> k) & 1:
+            x = (x << (1 << k)) & MASK
+        if fault is not None and fault.site == f"shift{k}":
+            x = _force(x, fault.bit, fault.value)
+    return x
+
+
+def faulty_outputs(operator, a, b, fault=None):
+    """(result, adder, comparison, is_equal) of the BIST operators with a single stuck-at fault (None = good)."""
+    if fault is not None and fault.site == "op_a":
+        a = _force(a, fault.bit, fault.value)
+    if fault is not None and fault.site == "op_b":
+        b = _force(b, fault.bit, fault.value)
+    if operator == ALU_SUB:
+        adder = _adder(a, ~b & MASK, 1, fault)
+    else:
+        adder = _adder(a, b, 0, fault)
+    if operator in (ALU_ADD, ALU_SUB):
+        out = adder
+    elif operator == ALU_XOR:
+        out = a ^ b
+    elif operator == ALU_SLL:
+        out = _shifter(a, b & 31, fault)
+    else:
+        raise ValueError(f"operator {operator} not used in BIST mode")
+    if fault is not None and fault.site == "result":
+        out = _force(out, fault.bit, fault.value)
+    comparison = is_equal = int(adder == 0)
+    if fault is not None and fault.site == "cmp":
+        comparison = fault.value
+    if fault is not None and fault.site == "eq":
+        is_equal = fault.value
+    return out, adder, comparison, is_equal
+
+
+def faulty_result(operator, a, b, fault=None):
+    """ALU result_o for the BIST operators with a single stuck-at fault (None = good)."""
+    return faulty_outputs(operator, a, b, fault)[0]
+
+
+def misr_input(operator, a, b, fault=None, compact_all=True):
+    """MISR input with a single stuck-at fault: bist_space_compactor output, or result_o only."""
+    outputs = faulty_outputs(operator, a, b, fault)
+    return space_compact(*outputs) if compact_all else outputs[0]
+
+
+def faulty_response(pattern, op_mode, fault=None, compact_all=True):
+    return misr_input(*bist_operands(pattern, op_mode), fault, compact_all)
+
+
+def error_signature(patterns, op_mode, fault, compact_all=True, good=None):
+    """MISR signature of the error sequence: faulty signature XOR good signature.
+
+    good: fault-free MISR inputs of the patterns, when already known.
+    """
+    stimuli = [bist_operands(p, op_mode) for p in patterns]
+    good = [misr_input(*s, None, compact_all) for s in stimuli] if good is None else good
+    sig = 0
+    for s, r in zip(stimuli, good):
+        sig = misr_step(sig, misr_input(*s, fault, compact_all) ^ r)
+    return sig
+
+
+def detected_faults(patterns, op_mode, faults=None, compact_all=True):
+    """Faults whose session signature differs from the good signature."""
+    faults = fault_list() if faults is None else faults
+    good = [faulty_response(p, op_mode, None, compact_all) for p in patterns]
+    return {f for f in faults if error_signature(patterns, op_mode, f, compact_all, good)}
@@ -0,0 +1,210 @@
+"""
+Golden Signature Table Generator — per-configuration signatures for runtime_bist_controller.
+
+The controller compares the session signature against a table entry selected
+by the BIST configuration (CTRL[1] = 1) instead of the single GOLDEN_SIG
+register. This tool computes the table with the bit-accurate model in
+bist_model.py for every supported configuration and emits it as:
+  * an SV package (HDL/bist_golden_pkg.sv) holding the reset/ROM contents,
+  * an APB bulk-load image: one GTBL_IDX write followed by one GTBL_DATA write
+    per entry (GTBL_DATA auto-increments the index), for builds with
+    GOLDEN_TABLE_RAM = 1.
+
+Table index = {seed_slot, CFG[3:0]} = {seed_slot, op_mode, len_sel}, where
+seed_slot is the position in the hardware seed schedule (always 0 unless
+CTRL[2] enables seed rotation, see seed_schedule.py).
+
+The package also holds the checkpoint table used by CHKPT (0x30): the MISR
+value after every CHKPT_WINDOW cycles of a slot-0 session, index
+{op_mode, k}. A session starts from the same seed whatever its length, so
+checkpoint k is the signature of a (k * CHKPT_WINDOW)-cycle session.
+
+Usage:
+    python Tools/golden_table.py show
+    python Tools/golden_table.py pkg                 # regenerate HDL + Vivado/rtl packages
+    python Tools/golden_table.py image -o golden.apb
+    python Tools/golden_table.py check               # exit 1 if the committed package is stale
+"""
+import argparse
+import os
+import sys
+
+from bist_model import (INITIAL_SEED, LEN_SELECTS, OP_MODES, SEED_SLOTS, config_index, schedule_seeds,
+                        session_length, session_signature)
+
+# Checkpoint granularity in cycles; k = 1 .. CHKPT_COUNT - 1 within the longest session
+CHKPT_WINDOW = 32
+CHKPT_COUNT = session_length(LEN_SELECTS[-1]) // CHKPT_WINDOW
+CHKPT_K_WIDTH = (CHKPT_COUNT - 1).bit_length()
+CHKPT_IDX_WIDTH = 2 + CHKPT_K_WIDTH
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+PKG_NAME = "bist_golden_pkg"
+PKG_FILES = [os.path.join(REPO_ROOT, "HDL", f"{PKG_NAME}.sv"),
+             os.path.join(REPO_ROOT, "Vivado", "rtl", "packages", f"{PKG_NAME}.sv")]
+
+# runtime_bist_controller register map (byte offsets)
+REG_GTBL_IDX = 0x18
+REG_GTBL_DATA = 0x1C
+
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+CFG_WIDTH = 4
+SLOT_WIDTH = (SEED_SLOTS - 1).bit_length()
+IDX_WIDTH = SLOT_WIDTH + CFG_WIDTH
+
+
+def table_index(slot, len_sel, op_mode):
+    return (slot << CFG_WIDTH) | config_index(len_sel, op_mode)
+
+
+def build_table(seed=INITIAL_SEED, slots=SEED_SLOTS):
+    """[(index, slot, len_sel, op_mode, signature)] for every seed slot and configuration, by index."""
+    table = []
+    for len_sel in LEN_SELECTS:
+        length = session_length(len_sel)
+        for slot, slot_seed in enumerate(schedule_seeds(seed, length, slots)):
+            for op_mode in OP_MODES:
+                sig = session_signature(slot_seed, length, op_mode)
+                table.append((table_index(slot, len_sel, op_mode), slot, len_sel, op_mode, sig))
+    return sorted(table)
+
+
+def checkpoint_index(op_mode, k):
+    return (op_mode << CHKPT_K_WIDTH) | k
+
+
+def build_checkpoints(seed=INITIAL_SEED):
+    """[(index, op_mode, k, signature)]: MISR value at cycle k * CHKPT_WINDOW of a slot-0 session."""
+    return [(checkpoint_index(op_mode, k), op_mode, k, session_signature(seed, k * CHKPT_WINDOW, op_mode))
+            for op_mode in OP_MODES for k in range(1, CHKPT_COUNT)]
+
+
+def render_package(table, seed=INITIAL_SEED, checkpoints=None):
+    checkpoints = build_checkpoints(seed) if checkpoints is None else checkpoints
+    lines = [
+        f"// File: HDL/{PKG_NAME}.sv",
+        "// Description: Golden MISR signatures of runtime_bist_controller, one per",
+        "//              seed slot and BIST configuration",
+        "//              (index = {seed_slot, CFG[3:0]} = {seed_slot, op_mode, len_sel}),",
+        "//              for the ibex_alu_bist_wrapper datapath, and the CHKPT",
+        "//              checkpoint signatures (index = {op_mode, k}).",
+        "//              GENERATED by Tools/golden_table.py -- do not edit by hand.",
+        "",
+        f"package {PKG_NAME};",
+        "",
+        f"    localparam logic [31:0] GOLDEN_SEED       = 32'h{seed:08X};",
+        f"    localparam int          GOLDEN_SEED_SLOTS = {SEED_SLOTS};",
+        f"    localparam int          GOLDEN_SLOT_W     = {SLOT_WIDTH};",
+        f"    localparam int          GOLDEN_IDX_W      = {IDX_WIDTH};",
+        f"    localparam int          GOLDEN_ENTRIES    = {len(table)};",
+        f"    localparam int          CHKPT_WINDOW      = {CHKPT_WINDOW};",
+        f"    localparam int          CHKPT_IDX_W       = {CHKPT_IDX_WIDTH};",
+        "",
+        f"    function automatic logic [31:0] golden_rom(input logic [GOLDEN_IDX_W-1:0] idx);",
+        "        case (idx)",
+    ]
+    for idx, slot, len_sel, op_mode, sig in table:
+        lines.append(f"            {IDX_WIDTH}'d{idx:<2}: golden_rom = 32'h{sig:08X};  "
+                     f"// slot {slot} {OP_NAMES[op_mode]:<5} {session_length(len_sel)} cycles")
+    lines += [
+        "            default: golden_rom = 32'h0000_0000;",
+        "        endcase",
+        "    endfunction",
+        "",
+        "    // MISR value at cycle k * CHKPT_WINDOW of a slot-0 session, index = {op_mode, k}",
+        f"    function automatic logic [31:0] checkpoint_rom(input logic [CHKPT_IDX_W-1:0] idx);",
+        "        case (idx)",
+    ]
+    for idx, op_mode, k, sig in checkpoints:
+        lines.append(f"            {CHKPT_IDX_WIDTH}'d{idx:<2}: checkpoint_rom = 32'h{sig:08X};  "
+                     f"// {OP_NAMES[op_mode]:<5} cycle {k * CHKPT_WINDOW}")
+    lines += [
+        "            default: checkpoint_rom = 32'h0000_0000;",
+        "        endcase",
+        "    endfunction",
+        "",
+        "endpackage",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def apb_image(table, base=0):
+    """[(addr, data)] APB writes that bulk-load the table into GOLDEN_TABLE_RAM."""
+    writes = [(REG_GTBL_IDX, base)]
+    writes += [(REG_GTBL_DATA, sig) for *_, sig in table]
+    return writes
+
+
+def render_image(writes):
+    lines = ["# runtime_bist_controller golden table bulk-load (addr data)"]
+    lines += [f"0x{addr:08X} 0x{data:08X}" for addr, data in writes]
+    return "\n".join(lines) + "\n"
+
+
+def load_image(path):
+    """Parse an image written by render_image back into [(addr, data)]."""
+    writes = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                addr, data = line.split()
+                writes.append((int(addr, 16), int(data, 16)))
+    return writes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Golden signature table generator")
+    parser.add_argument("--seed", type=lambda v: int(v, 0), default=INITIAL_SEED, help="session seed")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("show", help="print the table")
+    p = sub.add_parser("pkg", help="write the SV package")
+    p.add_argument("-o", "--output", nargs="+", default=PKG_FILES)
+    p = sub.add_parser("image", help="write the APB bulk-load image")
+    p.add_argument("-o", "--output", default=None, help="output file (default: stdout)")
+    sub.add_parser("check", help="verify the committed package matches the model")
+    args = parser.parse_args(argv)
+
+    table = build_table(args.seed)
+
+    if args.cmd == "show":
+        print(f"Seed 0x{args.seed:08X}")
+        print(f"{'IDX':>3} {'SLOT':>4} {'OP':<6} {'CYCLES':>6}  SIGNATURE")
+        for idx, slot, len_sel, op_mode, sig in table:
+            print(f"{idx:>3} {slot:>4} {OP_NAMES[op_mode]:<6} {session_length(len_sel):>6}  0x{sig:08X}")
+        print(f"\nCheckpoints (every {CHKPT_WINDOW} cycles, slot 0)")
+        print(f"{'IDX':>3} {'OP':<6} {'CYCLE':>6}  SIGNATURE")
+        for idx, op_mode, k, sig in build_checkpoints(args.seed):
+            print(f"{idx:>3} {OP_NAMES[op_mode]:<6} {k * CHKPT_WINDOW:>6}  0x{sig:08X}")
+
+    elif args.cmd == "pkg":
+        text = render_package(table, args.seed)
+        for path in args.output:
+            with open(path, "w") as f:
+                f.write(text)
+            print(f"Wrote {os.path.relpath(path, REPO_ROOT)}")
+
+    elif args.cmd == "image":
+        text = render_image(apb_image(table))
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+
+    elif args.cmd == "check":
+        expected = render_package(table, args.seed)
+        stale = []
+        for path in PKG_FILES:
+            if not os.path.exists(path) or open(path).read() != expected:
+                stale.append(os.path.relpath(path, REPO_ROOT))
+        if stale:
+            print(f"❌ Stale golden table: {', '.join(stale)} (run: python Tools/golden_table.py pkg)")
+            return 1
+        print(f"✅ Golden table up to date ({len(table)} entries, {len(build_checkpoints(args.seed))} checkpoints)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+k-step BIST Trade-off — session latency vs. clock frequency for STEPS = k.
+
+lfsr_gen_kstep / misr_analyzer_kstep process k patterns per clock, so a
+session of N patterns takes ceil(N / k) cycles instead of N. The price is a
+wider XOR tree in front of the MISR (and LFSR) registers. The fan-in of every
+next-state bit is read off the GF(2) matrices in bist_model, converted to
+LUT6 levels, and added to the measured critical path of the synthesized
+single-step design (Reports/timing_report_<TAG>.txt):
+
+    delay_per_level = data_path_delay / logic_levels     (critical path)
+    delay_k         = data_path_delay + (misr_levels_k - misr_levels_1) * delay_per_level
+    fmax_k          = 1 / (delay_k + clock/setup overhead)
+    session_time_k  = ceil(N / k) / fmax_k
+
+The operand lanes are assumed to be duplicated datapaths (one ALU per lane),
+so the ALU part of the critical path does not grow with k. The estimate is a
+first-order model for choosing k before running synthesis, not a substitute
+for a timing report of the actual k-step design.
+
+Usage:
+    python Tools/kstep_analysis.py
+    python Tools/kstep_analysis.py --tag BIST --patterns 255 --steps 1 2 4 8 16
+    python Tools/kstep_analysis.py --json
+"""
+import argparse
+import json
+import math
+import sys
+
+from bist_model import LFSR_MATRIX, MISR_MATRIX, gf2_pow, gf2_row_weights
+from vivado_reports import REPORTS_DIR, load_reports
+
+# Inputs of one Xilinx 7-series LUT (a LUT6 implements a 6-input XOR)
+LUT_INPUTS = 6
+
+# Patterns compacted per session by runtime_bist_controller (256 cycles, MISR cleared in cycle 0)
+DEFAULT_PATTERNS = 255
+DEFAULT_STEPS = (1, 2, 4, 8, 16)
+
+
+def lut_levels(fan_in):
+    """LUT6 levels of a balanced XOR tree with `fan_in` inputs (0 for a wire)."""
+    if fan_in <= 1:
+        return 0
+    return math.ceil(math.log(fan_in, LUT_INPUTS) - 1e-9)
+
+
+def xor_luts(fan_in):
+    """LUTs of a LUT6 XOR tree with `fan_in` inputs."""
+    return 0 if fan_in <= 1 else math.ceil((fan_in - 1) / (LUT_INPUTS - 1))
+
+
+def misr_fan_in(steps):
+    """Per-bit fan-in of misr_analyzer_kstep: row of R^k plus one row of R^(k-1-j) per lane."""
+    fan_in = gf2_row_weights(gf2_pow(MISR_MATRIX, steps))
+    for j in range(steps):
+        lane = gf2_row_weights(gf2_pow(MISR_MATRIX, steps - 1 - j))
+        fan_in = [a + b for a, b in zip(fan_in, lane)]
+    return fan_in
+
+
+def lfsr_fan_in(steps):
+    """Per-bit fan-in of the lfsr_gen_kstep next state (row weights of T^k)."""
+    return gf2_row_weights(gf2_pow(LFSR_MATRIX, steps))
+
+
+def analyze(timing, steps_list=DEFAULT_STEPS, patterns=DEFAULT_PATTERNS):
+    """Trade-off table for each k, scaled from the single-step timing report."""
+    cp = timing.critical_path
+    if cp is None or not cp.logic_levels or cp.data_path_delay_ns is None:
+        raise ValueError(f"{timing.design}: no critical path with logic levels in the timing report")
+    per_level = cp.data_path_delay_ns / cp.logic_levels
+    # Clock skew, clock-to-out and setup: whatever the period holds beyond the data path
+    fixed = timing.period_ns - timing.wns_ns - cp.data_path_delay_ns
+    base_levels = max(lut_levels(f) for f in misr_fan_in(1))
+
+    rows = []
+    for k in steps_list:
+        misr = misr_fan_in(k)
+        lfsr = lfsr_fan_in(k)
+        misr_levels = max(lut_levels(f) for f in misr)
+        lfsr_levels = max(lut_levels(f) for f in lfsr)
+        # LFSR feedback path: clock-to-out + XOR tree (one LUT level per routing hop)
+        delay = max(cp.data_path_delay_ns + (misr_levels - base_levels) * per_level,
+                    (lfsr_levels + 1) * per_level)
+        fmax = 1000.0 / (delay + fixed)
+        cycles = math.ceil(patterns / k)
+        rows.append({
+            "steps": k,
+            "misr_fan_in": max(misr),
+            "misr_levels": misr_levels,
+            "lfsr_fan_in": max(lfsr),
+            "lfsr_levels": lfsr_levels,
+            "xor_luts": sum(xor_luts(f) for f in misr) + sum(xor_luts(f) for f in lfsr),
+            "delay_ns": delay,
+            "fmax_mhz": fmax,
+            "session_cycles": cycles,
+            "session_ns": cycles * 1000.0 / fmax,
+        })
+    ref = rows[0]["session_ns"]
+    for row in rows:
+        row["speedup"] = ref / row["session_ns"]
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="k-step LFSR/MISR timing vs. latency trade-off")
+    parser.add_argument("--dir", default=REPORTS_DIR, help="report directory")
+    parser.add_argument("--tag", default="BIST", help="report tag of the single-step design")
+    parser.add_argument("--patterns", type=int, default=DEFAULT_PATTERNS, help="patterns per session")
+    parser.add_argument("--steps", type=int, nargs="+", default=list(DEFAULT_STEPS))
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args(argv)
+
+    timing = load_reports(args.dir).get(args.tag, {}).get("timing")
+    if timing is None:
+        print(f"No timing report for tag {args.tag} in {args.dir}")
+        return 2
+    rows = analyze(timing, args.steps, args.patterns)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    cp = timing.critical_path
+    print(f"Reference: {args.tag} ({timing.design}), critical path {cp.source} -> {cp.destination}, "
+          f"{cp.data_path_delay_ns:.3f} ns / {cp.logic_levels} levels, Fmax {timing.fmax_mhz:.1f} MHz")
+    print(f"Session: {args.patterns} patterns")
+    print(f"{'k':>3} {'MISR FI':>8} {'LVL':>4} {'LFSR FI':>8} {'LVL':>4} {'XOR LUT':>8} "
+          f"{'DELAY':>8} {'FMAX':>8} {'CYCLES':>7} {'SESSION':>10} {'SPEEDUP':>8}")
+    for r in rows:
+        print(f"{r['steps']:>3} {r['misr_fan_in']:>8} {r['misr_levels']:>4} {r['lfsr_fan_in']:>8} "
+              f"{r['lfsr_levels']:>4} {r['xor_luts']:>8} {r['delay_ns']:>6.3f}ns {r['fmax_mhz']:>5.1f}MHz "
+              f"{r['session_cycles']:>7} {r['session_ns']:>8.1f}ns {r['speedup']:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
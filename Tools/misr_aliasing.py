@@ -0,0 +1,337 @@
+"""
+MISR Aliasing — error cancellation of the rotate-XOR and polynomial compactors.
+
+A non-zero error sequence (faulty XOR good responses) aliases when it leaves
+the same signature as the fault-free session. The MISR is linear, so an error
+sequence e_0 .. e_{n-1} leaves the error signature XOR_t M^(n-1-t) e_t, where
+M is the one-step matrix of the feedback polynomial. The former compactor
+{misr_reg[30:0], misr_reg[31]} is POLY = 1 (x^32 + 1): M^32 = I, so any two
+equal errors WIDTH cycles apart cancel. A primitive POLY has M^d != I for
+every d < 2^WIDTH - 1.
+
+Error patterns per category:
+
+    fault     modelled stuck-at faults (fault_model.py) on random seeds and
+              every operator mix: activated faults with a zero error signature
+    double    two single-bit errors at random cycles
+    multi     three or four single-bit errors at random cycles
+    burst     2 .. 8 consecutive cycles, one random bit each (a transient)
+    stride    one bit wrong every d cycles (2 .. 6 times, d = 1 .. 2*WIDTH):
+              an intermittent fault locked to a period of the stimulus
+    word      two random full-width error words
+
+`poly` prints the default misr_analyzer POLY and lfsr_gen TAPS of a WIDTH:
+MISR_POLY / LFSR_TAPS at 32 bits, else a lowest-weight primitive polynomial.
+`pkg` writes them for WIDTH 2 .. 64 into HDL/bist_poly_pkg.sv (and its
+Vivado/rtl/packages copy), from which the MISR and LFSR modules take their
+defaults. `check` verifies that the RTL uses the package, that the package is
+up to date and primitive, and the bit-sliced compactor against bist_model.
+
+Usage:
+    python Tools/misr_aliasing.py report
+    python Tools/misr_aliasing.py report --len-sel 1 --trials 50000 --poly 0x00000005 --json aliasing.json
+    python Tools/misr_aliasing.py poly --width 16
+    python Tools/misr_aliasing.py pkg
+    python Tools/misr_aliasing.py check
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+
+from bist_model import (INITIAL_SEED, LFSR_TAPS, MISR_POLY, OP_MODES, ROTATE_POLY, WIDTH, default_poly, gf2_apply,
+                        gf2_identity, gf2_matrix, gf2_mul, lfsr_is_maximal, misr_is_maximal, misr_step, poly_taps,
+                        session_length)
+from bitslice_model import Lanes, compact_errors, fault_error, session_cycles
+from fault_model import fault_list
+from results_db import REPO_ROOT
+
+RESET_LEN_SEL = 3  # CFG reset value: 256-cycle sessions
+CATEGORIES = ("fault", "double", "multi", "burst", "stride", "word")
+# Modules whose POLY / TAPS default comes from bist_poly_pkg
+RTL_FILES = [f"{d}/{m}.sv" for d in ("HDL", "Vivado/rtl")
+             for m in ("misr_analyzer", "misr_analyzer_kstep", "bist_space_compactor", "lfsr_gen", "lfsr_gen_kstep")]
+DEFAULT_RE = re.compile(r"parameter\s+logic\s+\[WIDTH-1:0\]\s+(POLY|TAPS)\s*=\s*WIDTH'\((default_poly|default_taps)"
+                        r"\(WIDTH\)\)")
+PKG_NAME = "bist_poly_pkg"
+PKG_FILES = [os.path.join(REPO_ROOT, "HDL", f"{PKG_NAME}.sv"),
+             os.path.join(REPO_ROOT, "Vivado", "rtl", "packages", f"{PKG_NAME}.sv")]
+PKG_WIDTHS = range(2, 65)
+
+
+def poly_name(poly, width=WIDTH):
+    """x^32 + x^22 + x^2 + x^1 + 1 notation of a POLY value."""
+    terms = [f"x^{i}" if i else "1" for i in range(width - 1, -1, -1) if (poly >> i) & 1]
+    return " + ".join([f"x^{width}"] + terms)
+
+
+# =============================================================================
+# Error patterns
+# =============================================================================
+def single_bits(rng, length, count):
+    """`count` distinct (cycle, single-bit error) events."""
+    events = set()
+    while len(events) < count:
+        events.add((rng.randrange(length), 1 << rng.randrange(WIDTH)))
+    return list(events)
+
+
+def random_pattern(rng, category, length):
+    """One non-zero error sequence of `category` as [(cycle, error word)]."""
+    if category == "double":
+        return single_bits(rng, length, 2)
+    if category == "multi":
+        return single_bits(rng, length, rng.choice((3, 4)))
+    if category == "burst":
+        span = rng.randint(2, 8)
+        start = rng.randrange(length - span + 1)
+        return [(start + i, 1 << rng.randrange(WIDTH)) for i in range(span)]
+    if category == "stride":
+        stride, hits = rng.randint(1, min(2 * WIDTH, length - 1)), rng.randint(2, 6)
+        while stride * (hits - 1) >= length:
+            hits -= 1
+        start = rng.randrange(length - stride * (hits - 1))
+        bit = 1 << rng.randrange(WIDTH)
+        return [(start + i * stride, bit) for i in range(hits)]
+    if category == "word":
+        t1, t2 = rng.sample(range(length), 2)
+        return [(t1, rng.getrandbits(WIDTH) or 1), (t2, rng.getrandbits(WIDTH) or 1)]
+    raise ValueError(f"unknown category {category}")
+
+
+def powers(poly, length):
+    """M^n of the MISR with feedback `poly`, n = 0 .. length - 1."""
+    step = gf2_matrix(lambda s: misr_step(s, 0, WIDTH, poly))
+    table = [gf2_identity()]
+    for _ in range(length - 1):
+        table.append(gf2_mul(step, table[-1]))
+    return table
+
+
+def pattern_signature(table, pattern, captures):
+    """Error signature of [(cycle, error)] after `captures` captures from a cleared MISR."""
+    sig = 0
+    for t, e in pattern:
+        sig ^= gf2_apply(table[captures - 1 - t], e)
+    return sig
+
+
+# =============================================================================
+# Aliasing rates
+# =============================================================================
+def fault_aliasing(polys, seeds, length, op_modes):
+    """{poly: aliased count} and activated count of fault_list() over seeds x operator mixes."""
+    lanes = Lanes(len(seeds))
+    aliased = dict.fromkeys(polys, 0)
+    activated = 0
+    for op_mode in op_modes:
+        cycles = session_cycles(lanes, seeds, length, op_mode)
+        for f in fault_list():
+            errors = [fault_error(cyc, f) for cyc in cycles]
+            active = 0
+            for err in errors:
+                for plane in err.values():
+                    active |= plane
+            if not active:
+                continue
+            activated += bin(active).count("1")
+            for poly in polys:
+                detected = 0
+                for plane in compact_errors(errors, poly):
+                    detected |= plane
+                aliased[poly] += bin(active & ~detected).count("1")
+    return aliased, activated
+
+
+def pattern_aliasing(polys, category, trials, length, rng):
+    """{poly: aliased count} over `trials` random error sequences of `category`."""
+    captures = length - 1
+    tables = {poly: powers(poly, captures) for poly in polys}
+    aliased = dict.fromkeys(polys, 0)
+    for _ in range(trials):
+        pattern = random_pattern(rng, category, captures)
+        for poly in polys:
+            if pattern_signature(tables[poly], pattern, captures) == 0:
+                aliased[poly] += 1
+    return aliased
+
+
+def report(polys, length, trials, seeds, rng):
+    """One row per category: {"category", "trials", "aliased": {poly: count}}."""
+    rows = []
+    for category in CATEGORIES:
+        if category == "fault":
+            aliased, total = fault_aliasing(polys, seeds, length, OP_MODES)
+        else:
+            aliased, total = pattern_aliasing(polys, category, trials, length, rng), trials
+        rows.append({"category": category, "trials": total, "aliased": aliased})
+    return rows
+
+
+def cmd_report(args):
+    rng = random.Random(args.rng_seed)
+    polys = [ROTATE_POLY, MISR_POLY] + [p for p in args.poly if p not in (ROTATE_POLY, MISR_POLY)]
+    length = session_length(args.len_sel)
+    seeds = [INITIAL_SEED] + [rng.getrandbits(WIDTH) | 1 for _ in range(args.seeds - 1)]
+    rows = report(polys, length, args.trials, seeds, rng)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"len_sel": args.len_sel, "length": length, "polys": polys,
+                       "rows": [dict(r, aliased={f"0x{p:08X}": n for p, n in r["aliased"].items()}) for r in rows]},
+                      f, indent=2)
+    print(f"MISR aliasing: {length}-cycle sessions ({length - 1} captures), {len(seeds)} seeds for the fault "
+          f"category, {args.trials} trials per random category")
+    for poly in polys:
+        kind = "primitive" if misr_is_maximal(poly) else "not primitive"
+        print(f"   POLY 0x{poly:08X}: {poly_name(poly)} ({kind})")
+    print(f"{'CATEGORY':<9} {'TRIALS':>8}" + "".join(f" {f'0x{p:08X}':>18}" for p in polys))
+    for r in rows:
+        cells = "".join(f" {n:>7} ({100 * n / r['trials']:>6.3f}%)" for n in r["aliased"].values())
+        print(f"{r['category']:<9} {r['trials']:>8}{cells}")
+    return 0
+
+
+# =============================================================================
+# Polynomial / check
+# =============================================================================
+def render_package():
+    lines = [
+        f"// File: HDL/{PKG_NAME}.sv",
+        "// Description: Default feedback polynomials of misr_analyzer, misr_analyzer_kstep,",
+        "//              bist_space_compactor (POLY) and lfsr_gen, lfsr_gen_kstep (TAPS)",
+        f"//              per WIDTH ({PKG_WIDTHS[0]} .. {PKG_WIDTHS[-1]}): a lowest-weight primitive x^WIDTH + POLY,",
+        "//              x^32 + x^22 + x^2 + x^1 + 1 at 32 bits. Both functions return 0",
+        "//              for any other WIDTH.",
+        "//              GENERATED by Tools/misr_aliasing.py -- do not edit by hand.",
+        "",
+        f"package {PKG_NAME};",
+        "",
+        "    // POLY: the terms of x^width + POLY below x^width",
+        "    function automatic logic [63:0] default_poly(input int width);",
+        "        case (width)",
+    ]
+    for width in PKG_WIDTHS:
+        poly = default_poly(width)
+        lines.append(f"            {width:<2}: default_poly = 64'h{poly:016X};  // {poly_name(poly, width)}")
+    lines += [
+        "            default: default_poly = '0;",
+        "        endcase",
+        "    endfunction",
+        "",
+        "    // TAPS of the same polynomial: tap i stands for x^(i+1)",
+        "    function automatic logic [63:0] default_taps(input int width);",
+        "        logic [64:0] full;",
+        "        full = (65'd1 << width) | {1'b0, default_poly(width)};",
+        "        default_taps = (default_poly(width) == '0) ? '0 : full[64:1];",
+        "    endfunction",
+        "",
+        "endpackage",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def cmd_poly(args):
+    poly = default_poly(args.width)
+    digits = (args.width + 3) // 4
+    print(f"WIDTH {args.width}: {poly_name(poly, args.width)}")
+    print(f"   misr_analyzer #(.WIDTH({args.width}), .POLY({args.width}'h{poly:0{digits}X}))")
+    print(f"   lfsr_gen      #(.WIDTH({args.width}), .TAPS({args.width}'h{poly_taps(poly, args.width):0{digits}X}))")
+    return 0
+
+
+def cmd_pkg(args):
+    text = render_package()
+    for path in args.output:
+        with open(path, "w") as f:
+            f.write(text)
+        print(f"Wrote {os.path.relpath(path, REPO_ROOT)}")
+    return 0
+
+
+def check(rng):
+    """Mismatches between the RTL, MISR_POLY, bist_poly_pkg and the compactor models (empty when they agree)."""
+    mismatches = []
+    for path in RTL_FILES:
+        with open(os.path.join(REPO_ROOT, path)) as f:
+            match = DEFAULT_RE.search(f.read())
+        if not match:
+            mismatches.append(f"{path}: POLY / TAPS default does not come from {PKG_NAME}")
+    expected = render_package()
+    for path in PKG_FILES:
+        if not os.path.exists(path) or open(path).read() != expected:
+            mismatches.append(f"{os.path.relpath(path, REPO_ROOT)} is stale (run: python Tools/misr_aliasing.py pkg)")
+    if default_poly(WIDTH) != MISR_POLY or poly_taps(MISR_POLY, WIDTH) != LFSR_TAPS:
+        mismatches.append(f"{WIDTH}-bit defaults are not MISR_POLY / LFSR_TAPS")
+    for width in PKG_WIDTHS:
+        if not misr_is_maximal(default_poly(width), width):
+            mismatches.append(f"WIDTH {width}: POLY 0x{default_poly(width):X} is not primitive")
+    for width in (4, 8, 16, 24):
+        if not lfsr_is_maximal(poly_taps(default_poly(width), width), width):
+            mismatches.append(f"WIDTH {width}: lfsr_gen TAPS 0x{poly_taps(default_poly(width), width):X} "
+                              f"is not maximal-length")
+    if not misr_is_maximal(MISR_POLY):
+        mismatches.append(f"MISR_POLY 0x{MISR_POLY:08X} is not primitive")
+
+    # The pair that defeats the rotation: the same bit wrong WIDTH cycles apart
+    captures = session_length(RESET_LEN_SEL) - 1
+    pair = [(10, 1 << 5), (10 + WIDTH, 1 << 5)]
+    for poly, cancels in ((ROTATE_POLY, True), (MISR_POLY, False)):
+        if (pattern_signature(powers(poly, captures), pair, captures) == 0) != cancels:
+            mismatches.append(f"POLY 0x{poly:08X}: errors {WIDTH} cycles apart "
+                              f"{'do not cancel' if cancels else 'cancel'}")
+
+    # Bit-sliced compactor vs. bist_model.misr_step, one random error stream per lane
+    lanes = Lanes(16)
+    streams = [[rng.getrandbits(WIDTH) if rng.random() < 0.3 else 0 for _ in range(40)] for _ in range(lanes.lanes)]
+    errors = []
+    for t in range(40):
+        planes = lanes.pack([s[t] for s in streams])
+        errors.append({i: p for i, p in enumerate(planes) if p})
+    for poly in (ROTATE_POLY, MISR_POLY, rng.getrandbits(WIDTH) | 1, rng.getrandbits(WIDTH) & ~1):
+        sliced = lanes.unpack(compact_errors(errors, poly))
+        for k, stream in enumerate(streams):
+            sig = 0
+            for e in stream:
+                sig = misr_step(sig, e, WIDTH, poly)
+            if sliced[k] != sig:
+                mismatches.append(f"POLY 0x{poly:08X} lane {k}: bit-sliced 0x{sliced[k]:08X} != 0x{sig:08X}")
+    return mismatches
+
+
+def cmd_check(args):
+    mismatches = check(random.Random(args.rng_seed))
+    for m in mismatches:
+        print(f"❌ {m}")
+    if mismatches:
+        return 1
+    print(f"✅ MISR POLY 0x{MISR_POLY:08X} is primitive; {PKG_NAME} is up to date with primitive defaults for "
+          f"WIDTH {PKG_WIDTHS[0]} .. {PKG_WIDTHS[-1]}, used by the RTL ({len(RTL_FILES)} files); "
+          f"the bit-sliced compactor matches")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MISR aliasing of the rotate-XOR and polynomial compactors")
+    parser.add_argument("--rng-seed", type=int, default=1, help="error pattern generator seed")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("report", help="aliasing rate per error pattern category")
+    p.add_argument("--len-sel", type=int, default=RESET_LEN_SEL, help="CFG[1:0] session length select")
+    p.add_argument("--trials", type=int, default=20000, help="random error sequences per category")
+    p.add_argument("--seeds", type=int, default=64, help="LFSR seeds of the fault category")
+    p.add_argument("--poly", type=lambda s: int(s, 0), nargs="*", default=[], help="more POLY values to compare")
+    p.add_argument("--json", metavar="FILE", help="write the rates to FILE")
+    p = sub.add_parser("poly", help="the default POLY / TAPS of a register width")
+    p.add_argument("--width", type=int, default=WIDTH)
+    p = sub.add_parser("pkg", help=f"write the {PKG_NAME} SV package")
+    p.add_argument("-o", "--output", nargs="+", default=PKG_FILES)
+    sub.add_parser("check", help="RTL defaults, package, primitivity and compactor model self-check")
+    args = parser.parse_args(argv)
+    return {"report": cmd_report, "poly": cmd_poly, "pkg": cmd_pkg, "check": cmd_check}[args.cmd](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Multi-Unit BIST Benchmark — area and test-completion rate from 1 to 8 units.
+
+Runs the cocotb completion-rate benchmark of multi_unit_bist_controller
+(Test/test_multi_unit_bist_controller.py) once per unit count and joins the
+results with the synthesis reports of each build:
+
+    Reports/utilization_report_MULTI_N<n>.txt   multi_unit_bist_controller, N_UNITS = n
+    Reports/utilization_report_BIST_CTRL.txt    one runtime_bist_controller (per-core baseline)
+
+generated with
+    vivado -mode batch -source Vivado/scripts/synth_reports.tcl \\
+        -tclargs multi_unit_bist_controller MULTI_N4 N_UNITS=4
+    vivado -mode batch -source Vivado/scripts/synth_reports.tcl -tclargs runtime_bist_controller BIST_CTRL
+
+Without Vivado reports the area comes from Yosys (yosys_synth.py): generic
+gate cells and flip-flops of multi_unit_bist_controller:N_UNITS=<n> and of
+runtime_bist_controller:GOLDEN_TABLE_RAM=0 (the baseline). They are read from
+the committed snapshot Reports/yosys_metrics.json, which holds N = 1, 2, 4, 8;
+other unit counts, or every build with --yosys, are synthesised on the spot.
+
+The shared controller is compared against N dedicated controllers (N x
+BIST_CTRL); area columns are left empty for builds without any area source.
+
+Usage:
+    python Tools/multi_unit_bench.py                          # N = 1 2 4 8, SIM from the makefile
+    python Tools/multi_unit_bench.py --units 1 2 3 4 5 6 7 8 --make-arg SIM=verilator -j 4
+    python Tools/multi_unit_bench.py --no-sim --json          # area only
+    python Tools/multi_unit_bench.py --no-sim --units 1 2 3 4 --yosys   # fresh Yosys area for every build
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from results_db import REPO_ROOT
+from vivado_reports import REPORTS_DIR, load_reports, metrics
+from yosys_synth import SNAPSHOT_FILE, config_name, find_yosys, synthesize
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+TARGET = "test_multi_unit"
+BENCH_TEST = "test_completion_rate_benchmark"
+DEFAULT_UNITS = (1, 2, 4, 8)
+BASELINE_TAG = "BIST_CTRL"
+MULTI_TOP = "multi_unit_bist_controller"
+BASELINE_TOP, BASELINE_PARAMS = "runtime_bist_controller", {"GOLDEN_TABLE_RAM": 0}
+# (area, flops) keys of each area source, in order of preference
+AREA_KEYS = (("luts", "ffs"), ("cells", "flops"))
+
+
+def area_tag(n):
+    return f"MULTI_N{n}"
+
+
+def yosys_areas(units, fresh=False, yosys=None, jobs=1, snapshot=SNAPSHOT_FILE):
+    """{tag: {"cells", "flops"}} of each unit count and of BASELINE_TAG from Yosys.
+
+    Configurations come from the snapshot unless `fresh`; the rest are synthesised
+    when a Yosys binary is available.
+    """
+    builds = {area_tag(n): (MULTI_TOP, {"N_UNITS": n}) for n in units}
+    builds[BASELINE_TAG] = (BASELINE_TOP, BASELINE_PARAMS)
+    configs = {}
+    if not fresh and os.path.exists(snapshot):
+        with open(snapshot) as f:
+            configs = json.load(f)["configs"]
+    todo = [(tag, config_name(top, params), top, params) for tag, (top, params) in builds.items()
+            if config_name(top, params) not in configs]
+    if todo and yosys:
+        print(f"Yosys synthesis of {len(todo)} build(s) not in the snapshot ...", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            records = pool.map(lambda t: synthesize(t[1], t[2], t[3], yosys), todo)
+        configs = dict(configs, **{name: r for (_, name, _, _), r in zip(todo, records)})
+    areas = {}
+    for tag, (top, params) in builds.items():
+        record = configs.get(config_name(top, params), {})
+        if "error" not in record and "cells" in record:
+            areas[tag] = {"cells": record["cells"], "flops": record["flops"]}
+    return areas
+
+
+def run_benchmark(n, make_args, out_dir):
+    """Simulate the completion-rate benchmark for N_UNITS = n. Returns its result dict (None on failure)."""
+    out = os.path.join(out_dir, f"multi_unit_bench_n{n}.json")
+    log = os.path.join(out_dir, f"multi_unit_bench_n{n}.log")
+    if os.path.exists(out):
+        os.remove(out)
+    cmd = ["make", "-f", "makefile", TARGET, f"N_UNITS={n}", f"COCOTB_RESULTS_FILE=results_multi_unit_n{n}.xml"]
+    env = dict(os.environ, PWD=TEST_DIR, MULTI_UNIT_BENCH_JSON=out, COCOTB_TEST_FILTER=BENCH_TEST)
+    with open(log, "w") as f:
+        rc = subprocess.run(cmd + make_args, cwd=TEST_DIR, env=env, stdout=f, stderr=subprocess.STDOUT).returncode
+    if rc != 0 or not os.path.exists(out):
+        print(f"❌ N_UNITS={n}: benchmark failed (see {os.path.relpath(log, REPO_ROOT)})")
+        return None
+    with open(out) as f:
+        return json.load(f)
+
+
+def build_rows(units, rates, areas):
+    """One row per unit count: completion rate, area and comparison with N dedicated controllers.
+
+    `areas` maps area_tag(n) / BASELINE_TAG to a metrics dict (Vivado luts/ffs or Yosys cells/flops).
+    """
+    base = areas.get(BASELINE_TAG, {})
+    ref = rates.get(1)
+    rows = []
+    for n in units:
+        rate = rates.get(n)
+        area = areas.get(area_tag(n), {})
+        row = {"n_units": n}
+        if rate:
+            row.update(completed=rate["completed"], aborted=rate["aborted"],
+                       sessions_per_kcycle=rate["sessions_per_kcycle"],
+                       per_unit_per_kcycle=rate["sessions_per_kcycle"] / n)
+            if ref:
+                # 1.0 = every unit is tested as often as a single unit with the controller to itself
+                row["rate_efficiency"] = rate["sessions_per_kcycle"] / (n * ref["sessions_per_kcycle"])
+        for key in (k for keys in AREA_KEYS for k in keys):
+            if key in area:
+                row[key] = area[key]
+                row[f"{key}_per_unit"] = area[key] / n
+            if key in base:
+                row[f"dedicated_{key}"] = n * base[key]
+                if key in area:
+                    row[f"{key}_saving"] = 1.0 - area[key] / (n * base[key])
+        rows.append(row)
+    return rows
+
+
+def _fmt(value, spec, width):
+    return f"{value:{spec}}".rjust(width) if value is not None else "-".rjust(width)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-unit BIST area / completion-rate scaling")
+    parser.add_argument("--units", type=int, nargs="+", default=list(DEFAULT_UNITS))
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    parser.add_argument("--dir", default=REPORTS_DIR, help="report directory")
+    parser.add_argument("--no-sim", action="store_true", help="area only, skip the simulations")
+    parser.add_argument("--yosys", action="store_true",
+                        help="synthesise every build with Yosys instead of reading Reports/yosys_metrics.json")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args(argv)
+
+    rates = {}
+    if not args.no_sim:
+        out_dir = os.path.join(TEST_DIR, "sim_build", "logs")
+        os.makedirs(out_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            results = pool.map(lambda n: (n, run_benchmark(n, args.make_arg, out_dir)), args.units)
+        rates = {n: r for n, r in results if r}
+
+    # Vivado reports when every build has one, else Yosys
+    reports = load_reports(args.dir)
+    tags = [area_tag(n) for n in args.units] + [BASELINE_TAG]
+    if all(tag in reports for tag in tags) and not args.yosys:
+        areas, source = {tag: metrics(reports[tag]) for tag in tags}, "Vivado"
+    else:
+        areas, source = yosys_areas(args.units, args.yosys, find_yosys(), args.jobs), "Yosys"
+    rows = build_rows(args.units, rates, areas)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0 if len(rates) == len(args.units) or args.no_sim else 1
+
+    area, flops = AREA_KEYS[0] if source == "Vivado" else AREA_KEYS[1]
+    label, flop_label = ("LUT", "FF") if source == "Vivado" else ("CELL", "FLOP")
+    print(f"Multi-unit BIST scaling (shared LFSR, per-unit MISR + idle detector), {source} area")
+    print(f"{'N':>2} {'SESS/KCYC':>10} {'PER UNIT':>9} {'EFFIC':>6} {'ABORTED':>8} "
+          f"{label:>6} {flop_label:>6} {label + '/UNIT':>10} {'DEDIC ' + label:>11} {'SAVING':>7}")
+    for r in rows:
+        print(f"{r['n_units']:>2} {_fmt(r.get('sessions_per_kcycle'), '.2f', 10)} "
+              f"{_fmt(r.get('per_unit_per_kcycle'), '.2f', 9)} {_fmt(r.get('rate_efficiency'), '.0%', 6)} "
+              f"{_fmt(r.get('aborted'), 'd', 8)} {_fmt(r.get(area), 'd', 6)} {_fmt(r.get(flops), 'd', 6)} "
+              f"{_fmt(r.get(f'{area}_per_unit'), '.1f', 10)} {_fmt(r.get(f'dedicated_{area}'), 'd', 11)} "
+              f"{_fmt(r.get(f'{area}_saving'), '.0%', 7)}")
+    missing = [tag for tag in tags if tag not in areas]
+    if missing:
+        print(f"\nNo area for: {', '.join(missing)} (Vivado/scripts/synth_reports.tcl, or install Yosys)")
+    return 0 if len(rates) == len(args.units) or args.no_sim else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
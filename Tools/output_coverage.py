@@ -0,0 +1,184 @@
+"""
+Output Coverage — faults observed through result_o alone vs. every ALU output.
+
+bist_space_compactor folds adder_result_o, comparison_result_o and
+is_equal_result_o into the MISR input next to result_o. This report runs
+the bit-sliced fault simulation (bitslice_model.py) twice per session
+configuration, once with the result-only MISR input and once with the
+compacted one, over a set of LFSR seeds:
+
+    RESULT   mean faults detected with result_o only
+    ALL      mean faults detected with every output compacted
+    GAIN     mean extra faults per session (ALL - RESULT)
+    SITES    extra faults of the default seed by fault site
+
+With --cycles it also lists, for the default seed, the mean number of
+session cycles in which an activated fault of each site reaches the MISR
+input: adder faults are observed in every cycle once the adder output is
+compacted, not only in ADD / SUB cycles.
+
+`check` compares the compacted and result-only bit-sliced models with
+bist_model / fault_model, and that the RTL POLY default of
+bist_space_compactor is the bist_poly_pkg one (MISR_POLY at 32 bits).
+
+Usage:
+    python Tools/output_coverage.py report
+    python Tools/output_coverage.py report --len-sel 0 1 --seeds 256 --cycles --json output_coverage.json
+    python Tools/output_coverage.py check
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+from collections import Counter
+
+from bist_model import (INITIAL_SEED, LEN_SELECTS, MISR, MISR_POLY, OP_MODES, WIDTH, alu_response, default_poly,
+                        session_length)
+from bitslice_model import Lanes, fault_error, session_coverage, session_cycles, session_signatures
+from fault_model import SITES, detected_faults, fault_list
+from results_db import REPO_ROOT
+from seed_search import OP_NAMES, patterns
+
+RTL_FILES = [f"{d}/bist_space_compactor.sv" for d in ("HDL", "Vivado/rtl")]
+POLY_RE = re.compile(r"parameter\s+logic\s+\[WIDTH-1:0\]\s+POLY\s*=\s*WIDTH'\(default_poly\(WIDTH\)\)")
+
+
+# =============================================================================
+# Report
+# =============================================================================
+def coverage(seeds, length, op_mode, faults):
+    """(result-only counts, compacted counts, extra faults of lane 0) of one configuration."""
+    base, base_masks = session_coverage(seeds, length, op_mode, faults=faults, detail=True, compact_all=False)
+    full, full_masks = session_coverage(seeds, length, op_mode, faults=faults, detail=True)
+    extra = [f for f in faults if full_masks[f] & 1 and not base_masks[f] & 1]
+    return base, full, extra
+
+
+def observing_cycles(seed, length, op_mode, faults):
+    """{site: (mean result-only, mean compacted) cycles with a MISR input error} of activated faults."""
+    cycles = session_cycles(Lanes(1), [seed], length, op_mode)
+    totals = {}
+    for f in faults:
+        base = sum(1 for cyc in cycles if fault_error(cyc, f, compact_all=False))
+        full = sum(1 for cyc in cycles if fault_error(cyc, f))
+        if full:
+            n, b, a = totals.get(f.site, (0, 0, 0))
+            totals[f.site] = (n + 1, b + base, a + full)
+    return {site: (b / n, a / n) for site, (n, b, a) in totals.items()}
+
+
+def report(len_sels, seeds, with_cycles):
+    """One row per (len_sel, op_mode) configuration."""
+    faults = fault_list()
+    rows = []
+    for len_sel in len_sels:
+        length = session_length(len_sel)
+        for op_mode in OP_MODES:
+            base, full, extra = coverage(seeds, length, op_mode, faults)
+            row = {"len_sel": len_sel, "length": length, "op_mode": op_mode,
+                   "result_only": sum(base) / len(seeds), "all_outputs": sum(full) / len(seeds),
+                   "min_gain": min(a - b for a, b in zip(full, base)),
+                   "extra_sites": dict(Counter(f.site for f in extra)),
+                   "extra_faults": [str(f) for f in extra]}
+            if with_cycles:
+                row["cycles"] = observing_cycles(seeds[0], length, op_mode, faults)
+            rows.append(row)
+    return rows
+
+
+def cmd_report(args):
+    rng = random.Random(args.rng_seed)
+    seeds = [INITIAL_SEED] + [rng.getrandbits(WIDTH) | 1 for _ in range(args.seeds - 1)]
+    rows = report(args.len_sel, seeds, args.cycles)
+    faults = len(fault_list())
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"faults": faults, "seeds": seeds, "rows": rows}, f, indent=2)
+    print(f"Output coverage: {faults} faults, {len(seeds)} seeds per configuration "
+          f"(RESULT: result_o only, ALL: bist_space_compactor)")
+    print(f"{'LENGTH':>6} {'OP':<5} {'RESULT':>8} {'ALL':>8} {'GAIN':>6} {'MIN':>4}  EXTRA FAULTS (default seed)")
+    for r in rows:
+        sites = ", ".join(f"{site} {n}" for site, n in sorted(r["extra_sites"].items(), key=lambda s: SITES.index(s[0])))
+        print(f"{r['length']:>6} {OP_NAMES[r['op_mode']]:<5} {r['result_only']:>8.1f} {r['all_outputs']:>8.1f} "
+              f"{r['all_outputs'] - r['result_only']:>+6.1f} {r['min_gain']:>+4d}  {sites or '-'}")
+    for r in rows:
+        if "cycles" not in r:
+            continue
+        print(f"\nObserving cycles per activated fault, {r['length']}-cycle {OP_NAMES[r['op_mode']]} "
+              f"(default seed, {r['length'] - 1} captures): site RESULT -> ALL")
+        for site in SITES:
+            if site in r["cycles"]:
+                base, full = r["cycles"][site]
+                print(f"   {site:<7} {base:>6.1f} -> {full:>6.1f}")
+    return 0
+
+
+# =============================================================================
+# Check
+# =============================================================================
+def check(seeds, length):
+    """Mismatches between the RTL, the bit-sliced and the scalar models (empty when they agree)."""
+    mismatches = []
+    for path in RTL_FILES:
+        with open(os.path.join(REPO_ROOT, path)) as f:
+            match = POLY_RE.search(f.read())
+        if not match:
+            mismatches.append(f"{path}: POLY default is not bist_poly_pkg::default_poly(WIDTH)")
+    if default_poly(WIDTH) != MISR_POLY:
+        mismatches.append(f"default_poly({WIDTH}) 0x{default_poly(WIDTH):08X} != MISR_POLY 0x{MISR_POLY:08X}")
+
+    faults = fault_list()
+    for op_mode in OP_MODES:
+        for compact_all in (False, True):
+            sigs = session_signatures(seeds, length, op_mode, compact_all=compact_all)
+            _, masks = session_coverage(seeds, length, op_mode, faults=faults, detail=True, compact_all=compact_all)
+            for k, seed in enumerate(seeds):
+                pats = patterns(seed, length)
+                misr = MISR()
+                for p in pats:
+                    misr.clock([alu_response(p, op_mode, compact_all)])
+                name = f"op {op_mode} seed 0x{seed:08X} {'all outputs' if compact_all else 'result only'}"
+                if sigs[k] != misr.signature:
+                    mismatches.append(f"{name}: signature 0x{sigs[k]:08X} != 0x{misr.signature:08X}")
+                lanes = {f for f, m in masks.items() if (m >> k) & 1}
+                detected = detected_faults(pats, op_mode, faults, compact_all)
+                if lanes != detected:
+                    mismatches.append(f"{name}: {len(lanes ^ detected)} fault(s) differ")
+    return mismatches
+
+
+def cmd_check(args):
+    rng = random.Random(args.rng_seed)
+    seeds = [INITIAL_SEED] + [rng.getrandbits(WIDTH) | 1 for _ in range(args.seeds - 1)]
+    length = session_length(args.len_sel)
+    mismatches = check(seeds, length)
+    for m in mismatches:
+        print(f"❌ {m}")
+    if mismatches:
+        return 1
+    print(f"✅ Space compactor uses the bist_poly_pkg POLY ({len(RTL_FILES)} files); bit-sliced and scalar models agree with "
+          f"and without it: {len(seeds)} seeds x {len(OP_MODES)} operator mixes, {length}-cycle sessions")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fault coverage of result_o alone vs. every compacted ALU output")
+    parser.add_argument("--rng-seed", type=int, default=1, help="LFSR seed generator seed")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("report", help="detected faults per configuration, with and without space compaction")
+    p.add_argument("--len-sel", type=int, nargs="+", default=list(LEN_SELECTS), help="CFG[1:0] session lengths")
+    p.add_argument("--seeds", type=int, default=64)
+    p.add_argument("--cycles", action="store_true", help="observing cycles per fault site (default seed)")
+    p.add_argument("--json", metavar="FILE", help="write the rows to FILE")
+    p = sub.add_parser("check", help="compare the compacted models and the RTL POLY")
+    p.add_argument("--len-sel", type=int, default=0)
+    p.add_argument("--seeds", type=int, default=4)
+    args = parser.parse_args(argv)
+    return cmd_report(args) if args.cmd == "report" else cmd_check(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
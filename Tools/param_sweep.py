@@ -0,0 +1,273 @@
+"""
+Parameter Sweep — functional, coverage, latency and synthesis data per configuration.
+
+Sweeps a grid over ibex_alu_bist_wrapper. Grid axes are either build
+parameters of the top module (elaborated into the simulator and the netlist)
+or runtime settings written over APB:
+
+    build     TIMER_WIDTH   idle counter / THRESHOLD width (runtime_bist_controller)
+              RV32B         bit-manipulation extension of the ALU
+    runtime   len_sel       CFG[1:0], session length 32 << len_sel
+              op_mode       CFG[3:2], operator mix
+              threshold     THRESHOLD, idle cycles before a session
+
+Every build point gets its own simulator build (Test/sim_build/sweep_<params>,
+reused while the sources are unchanged) from the per-point overrides
+(-G<param>=<value> for Verilator, -P<top>.<param>=<value> for Icarus).
+The first chunk of runtime points of each build compiles it; the remaining
+chunks then run concurrently, one simulator process per worker
+(Test/test_param_sweep.py, PARAM_SWEEP_IN/OUT), alongside one Yosys run per
+build point (yosys_synth.py) when Yosys is installed. Points whose threshold
+does not fit TIMER_WIDTH are listed as such and not simulated.
+
+One row per point joins:
+    passed      golden-table pass, model signature, zero-cycle handover and
+                detection of an injected stuck-at-0 (Test/test_param_sweep.py)
+    latency     cycles from the first sleeping cycle to the session verdict
+    coverage    modelled stuck-at coverage of the ALU (fault_model.py)
+    cells, flops, logic_depth   Yosys estimate of the build
+
+Usage:
+    python Tools/param_sweep.py --make-arg SIM=verilator -j 8
+    python Tools/param_sweep.py --grid TIMER_WIDTH=8,12,16 --grid threshold=50,200 --grid len_sel=1 --json sweep.json
+    python Tools/param_sweep.py --grid RV32B=0,2 --no-synth
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from bist_model import INITIAL_SEED, LEN_SELECTS, OP_MIX, session_length, session_patterns
+from fault_model import detected_faults, fault_list
+from results_db import REPO_ROOT, git_revision
+from yosys_synth import config_name, find_yosys, synthesize
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+TARGET = "test_param_sweep"
+TOP = "ibex_alu_bist_wrapper"
+BUILD_PARAMS = ("TIMER_WIDTH", "RV32B")
+RUNTIME_PARAMS = ("len_sel", "op_mode", "threshold")
+DEFAULT_GRID = {
+    "TIMER_WIDTH": [8, 16, 32],
+    "RV32B": [0],
+    "len_sel": list(LEN_SELECTS),
+    "op_mode": [OP_MIX],
+    "threshold": [10, 100, 1000],
+}
+DEFAULT_SIM = "icarus"  # Test/makefile
+
+
+# =============================================================================
+# Grid
+# =============================================================================
+def expand(grid):
+    """{build key: (build params, [runtime points])} for every combination of the grid."""
+    build_keys = [k for k in BUILD_PARAMS if k in grid]
+    runtime_keys = [k for k in RUNTIME_PARAMS if k in grid]
+    points = [dict(zip(runtime_keys, values)) for values in itertools.product(*(grid[k] for k in runtime_keys))]
+    builds = {}
+    for values in itertools.product(*(grid[k] for k in build_keys)):
+        params = dict(zip(build_keys, values))
+        builds[build_dir(params)] = (params, points)
+    return builds
+
+
+def build_dir(params):
+    """SIM_BUILD directory name of one build point (under Test/sim_build)."""
+    return "sweep_" + "_".join(f"{k.lower()}{v}" for k, v in sorted(params.items())) if params else "sweep_default"
+
+
+def build_overrides(sim, params, top=TOP):
+    """Compile arguments that set the build parameters of `top` in simulator `sim`."""
+    if sim == "verilator":
+        return [f"-G{k}={v}" for k, v in sorted(params.items())]
+    return [f"-P{top}.{k}={v}" for k, v in sorted(params.items())]
+
+
+def fits(params, point):
+    """THRESHOLD must be representable in TIMER_WIDTH bits."""
+    return point.get("threshold", 0) < (1 << params.get("TIMER_WIDTH", 32))
+
+
+def _axis(value):
+    name, _, values = value.partition("=")
+    if name not in BUILD_PARAMS + RUNTIME_PARAMS or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2 with NAME in {', '.join(BUILD_PARAMS + RUNTIME_PARAMS)}")
+    return name, [int(v, 0) for v in values.split(",")]
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+def run_chunk(index, key, params, chunk, make_args, sim, out_dir):
+    """Simulate one chunk of runtime points on one build. Returns its result records ([] on failure)."""
+    name = f"param_sweep_{index}"
+    src = os.path.join(out_dir, f"{name}.json")
+    out = os.path.join(out_dir, f"{name}.jsonl")
+    log = os.path.join(out_dir, f"{name}.log")
+    with open(src, "w") as f:
+        json.dump({"build": params, "points": chunk}, f)
+    if os.path.exists(out):
+        os.remove(out)
+    cmd = ["make", "-f", "makefile", TARGET, f"COCOTB_RESULTS_FILE=results_{name}.xml", f"SWEEP_BUILD={key}",
+           f"SWEEP_ARGS={' '.join(build_overrides(sim, params))}"]
+    env = dict(os.environ, PWD=TEST_DIR, PARAM_SWEEP_IN=src, PARAM_SWEEP_OUT=out)
+    with open(log, "w") as f:
+        rc = subprocess.run(cmd + make_args, cwd=TEST_DIR, env=env, stdout=f, stderr=subprocess.STDOUT).returncode
+    if not os.path.exists(out):
+        print(f"❌ {key} chunk {index}: simulation failed (see {os.path.relpath(log, REPO_ROOT)})")
+        return []
+    with open(out) as f:
+        results = [json.loads(line) for line in f if line.strip()]
+    if rc != 0 and len(results) < len(chunk):
+        print(f"❌ {key} chunk {index}: simulation stopped after {len(results)} point(s) "
+              f"(see {os.path.relpath(log, REPO_ROOT)})")
+    return results
+
+
+def coverage(len_sel, op_mode, faults, cache={}):
+    """Modelled stuck-at coverage of one session configuration (cached)."""
+    key = (len_sel, op_mode)
+    if key not in cache:
+        detected = detected_faults(session_patterns(INITIAL_SEED, session_length(len_sel)), op_mode, faults)
+        cache[key] = len(detected) / len(faults)
+    return cache[key]
+
+
+# =============================================================================
+# Report
+# =============================================================================
+def build_rows(builds, results, synth):
+    """One row per grid point, in grid order."""
+    faults = fault_list()
+    by_point = {(r["_key"], r["len_sel"], r["op_mode"], r["threshold"]): r for r in results}
+    rows = []
+    for key, (params, points) in builds.items():
+        area = synth.get(key) or {}
+        for point in points:
+            point = dict({"len_sel": 0, "op_mode": OP_MIX, "threshold": 100}, **point)
+            row = dict(params, **point, build=key)
+            if not fits(params, point):
+                row["status"] = "invalid"
+            else:
+                r = by_point.get((key, point["len_sel"], point["op_mode"], point["threshold"]))
+                row["status"] = "error" if r is None else "pass" if r["passed"] else "fail"
+                if r is not None:
+                    row.update(latency=r["latency"], failures=r["failures"])
+            row["coverage"] = coverage(point["len_sel"], point["op_mode"], faults)
+            for metric in ("cells", "flops", "logic_depth"):
+                row[metric] = area.get(metric)
+            rows.append(row)
+    return rows
+
+
+def _fmt(value, spec, width):
+    return f"{value:{spec}}".rjust(width) if value is not None else "-".rjust(width)
+
+
+def print_rows(rows, build_keys):
+    print(" ".join(f"{k:>11}" for k in build_keys) + f" {'LEN':>4} {'OP':>3} {'THRESH':>7} {'STATUS':>7} "
+          f"{'LATENCY':>8} {'COVERAGE':>9} {'CELLS':>6} {'FLOPS':>6} {'DEPTH':>6}")
+    for r in rows:
+        print(" ".join(f"{r[k]:>11}" for k in build_keys) +
+              f" {session_length(r['len_sel']):>4} {r['op_mode']:>3} {r['threshold']:>7} {r['status']:>7} "
+              f"{_fmt(r.get('latency'), 'd', 8)} {100 * r['coverage']:>8.1f}% {_fmt(r['cells'], 'd', 6)} "
+              f"{_fmt(r['flops'], 'd', 6)} {_fmt(r['logic_depth'], 'd', 6)}")
+    for r in rows:
+        for msg in r.get("failures") or []:
+            print(f"   ❌ {r['build']} len {session_length(r['len_sel'])} threshold {r['threshold']}: {msg}")
+
+
+def cheapest_builds(rows):
+    """Build points whose simulated points all pass, smallest first (cells)."""
+    builds = {}
+    for r in rows:
+        if r["status"] != "invalid":
+            builds.setdefault(r["build"], []).append(r)
+    passing = [(rs[0]["cells"], key) for key, rs in builds.items() if all(r["status"] == "pass" for r in rs)]
+    return [key for _, key in sorted(passing, key=lambda c: (c[0] is None, c[0] or 0))]
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parameter sweep over ibex_alu_bist_wrapper")
+    parser.add_argument("--grid", type=_axis, action="append", default=[],
+                        help="values of one axis, e.g. TIMER_WIDTH=8,16 or threshold=10,100 "
+                             "(repeatable; replaces that axis of the default grid)")
+    parser.add_argument("--grid-file", help="JSON grid {axis: [values]} (replaces the default grid)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=4, help="runtime points per simulator process")
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    parser.add_argument("--no-synth", action="store_true", help="skip the Yosys runs")
+    parser.add_argument("--yosys", default=find_yosys(), help="Yosys binary (default: $YOSYS, yosys, yowasp-yosys)")
+    parser.add_argument("--json", metavar="FILE", help="write the grid and every row to FILE")
+    args = parser.parse_args(argv)
+
+    grid = dict(DEFAULT_GRID)
+    if args.grid_file:
+        with open(args.grid_file) as f:
+            grid = json.load(f)
+    grid.update(args.grid)
+    sim = next((a.split("=", 1)[1] for a in args.make_arg if a.startswith("SIM=")), DEFAULT_SIM)
+    builds = expand(grid)
+
+    out_dir = os.path.join(TEST_DIR, "sim_build", "logs")
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = {}
+    for key, (params, points) in builds.items():
+        runnable = [p for p in points if fits(params, p)]
+        chunks[key] = [runnable[i:i + args.chunk] for i in range(0, len(runnable), args.chunk)]
+    jobs = [(key, c) for key, cs in chunks.items() for c in cs]
+    synth_jobs = [] if args.no_synth or not args.yosys else list(builds)
+    print(f"Parameter sweep: {len(builds)} build(s), {sum(len(c) for _, c in jobs)} simulated point(s) in "
+          f"{len(jobs)} chunk(s), {len(synth_jobs)} synthesis run(s) on {args.jobs} worker(s) ({sim})")
+    if not args.no_synth and not args.yosys:
+        print("   no Yosys binary found: synthesis columns left empty")
+
+    def simulate(index, job):
+        key, chunk = job
+        return [dict(r, _key=key) for r in run_chunk(index, key, builds[key][0], chunk, args.make_arg, sim, out_dir)]
+
+    def synthesis(key):
+        params = builds[key][0]
+        return key, synthesize(config_name(TOP, params), TOP, params, args.yosys)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        synth_futures = [pool.submit(synthesis, key) for key in synth_jobs]
+        # The first chunk of each build compiles it; the other chunks reuse the simulator
+        first = {key: cs[0] for key, cs in chunks.items() if cs}
+        index = itertools.count()
+        for chunk_results in pool.map(lambda kc: simulate(next(index), kc), first.items()):
+            results += chunk_results
+        rest = [(key, c) for key, cs in chunks.items() for c in cs[1:]]
+        for chunk_results in pool.map(lambda kc: simulate(next(index), kc), rest):
+            results += chunk_results
+        synth = {key: r for key, r in (f.result() for f in synth_futures)}
+    for key, r in synth.items():
+        if "error" in r:
+            print(f"❌ {key}: synthesis failed (see {r['error']})")
+
+    rows = build_rows(builds, results, synth)
+    build_keys = [k for k in BUILD_PARAMS if k in grid]
+    print_rows(rows, build_keys)
+    ranked = cheapest_builds(rows)
+    if ranked:
+        print(f"\nPassing builds, smallest first: {', '.join(ranked)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"git_rev": git_revision(), "sim": sim, "grid": grid, "rows": rows}, f, indent=2)
+        print(f"Wrote {args.json}")
+    simulated = [r for r in rows if r["status"] != "invalid"]
+    return 0 if all(r["status"] == "pass" for r in simulated) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+DUT Port Bundles — typed Python views of the cocotb toplevels' port lists.
+
+Parses the ANSI port list of every toplevel used by a make target
+(Test/makefile, through test_deps.parse_makefile) and generates one
+PortBundle subclass per module into Test/dut_ports.py:
+
+    ports = IbexAluBistWrapperPorts(dut)      # port handles looked up once
+    ports.reset_inputs(instr_first_cycle_i=1) # every input to 0 (rst_n asserted) except overrides
+    ports.reset_inputs("apb")                 # one input group only
+    ports.drive(operand_a_i=a, operand_b_i=b) # inputs only
+    res = ports.sample("result_o")            # outputs only, as int
+    ports.result_o.value                      # cached handle for hot loops
+
+Driving an output or sampling an input raises AttributeError, so a
+testbench that falls out of sync with the RTL fails at the first access
+instead of silently poking the wrong signal. Widths are evaluated with the
+parameter defaults.
+
+Usage:
+    python Tools/port_bundles.py gen                # regenerate Test/dut_ports.py
+    python Tools/port_bundles.py show ibex_ex_block
+    python Tools/port_bundles.py check              # exit 1 if Test/dut_ports.py is stale
+"""
+import argparse
+import math
+import os
+import re
+import sys
+from collections import namedtuple
+
+from test_deps import HDL_DIR, REPO_ROOT, TEST_DIR, parse_makefile
+
+OUTPUT_FILE = os.path.join(TEST_DIR, "dut_ports.py")
+
+Port = namedtuple("Port", "name direction width")
+Module = namedtuple("Module", "name path params ports")
+
+# Input groups for bulk reset/drive, by port name (with or without the _i suffix)
+GROUP_PATTERNS = {
+    "apb": r"^(paddr|psel|penable|pwrite|pwdata)(_i)?$",
+    "fault": r"^sim_fault_\w+$",
+    "imd": r"^imd_val_(q|we)_i\w*$",
+    "operands": r"^\w*(operand|operator)\w*_i$",
+}
+CLOCK_NAMES = ("clk", "clk_i")
+
+_RE_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_RE_PARAM = re.compile(r"parameter\s+(?:\w+\s+)?(?:\[[^\]]*\]\s*)?(\w+)\s*=\s*([^,]+)")
+_RE_PORT = re.compile(r"^(?:(input|output|inout)\s+)?(?:(?:logic|wire|reg|bit)\s+)?(?:signed\s+)?"
+                      r"((?:\[[^\]]+\]\s*)*)(\w+)$")
+_RE_SV_LITERAL = re.compile(r"(\d+)?'([sS]?)([bBoOdDhH])([0-9a-fA-F_xXzZ]+)")
+
+
+# =============================================================================
+# SV header parsing
+# =============================================================================
+def _balanced(text, start):
+    """Contents of the parenthesised group opening at text[start] and the index after it."""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == "(":
+            depth += 1
+        elif text[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i], i + 1
+    raise ValueError("unbalanced parentheses in module header")
+
+
+def _sv_int(expr, params):
+    """Evaluate a constant width/parameter expression (SV literals, parameters, $clog2)."""
+    def literal(m):
+        base = {"b": 2, "o": 8, "d": 10, "h": 16}[m.group(3).lower()]
+        return str(int(re.sub(r"[_xXzZ]", "0", m.group(4)), base))
+    expr = _RE_SV_LITERAL.sub(literal, expr).replace("$clog2", "_clog2")
+    return int(eval(expr, {"__builtins__": {}, "_clog2": lambda v: max(0, math.ceil(math.log2(v)))}, params))
+
+
+def _width(dims, params):
+    width = 1
+    for hi, lo in re.findall(r"\[([^:\]]+):([^\]]+)\]", dims):
+        width *= abs(_sv_int(hi, params) - _sv_int(lo, params)) + 1
+    return width
+
+
+def parse_module(path, name):
+    """Module `name` of an SV file: parameter defaults and ANSI ports in declaration order."""
+    with open(path) as f:
+        text = _RE_COMMENT.sub("", f.read())
+    m = re.search(rf"\bmodule\s+{name}\b", text)
+    if not m:
+        raise ValueError(f"module {name} not found in {path}")
+    pos = m.end()
+    params = {}
+    hash_pos = text.find("#", pos)
+    paren_pos = text.find("(", pos)
+    if 0 <= hash_pos < paren_pos:
+        body, pos = _balanced(text, paren_pos)
+        for p_name, value in _RE_PARAM.findall(body):
+            try:
+                params[p_name] = _sv_int(value.strip(), params)
+            except (NameError, SyntaxError, TypeError, ValueError):
+                pass
+        paren_pos = text.find("(", pos)
+    body, _ = _balanced(text, paren_pos)
+
+    ports = []
+    direction = None
+    dims = ""
+    for decl in (d.strip() for d in body.split(",")):
+        pm = _RE_PORT.match(" ".join(decl.split()))
+        if not pm:
+            raise ValueError(f"{name}: cannot parse port declaration '{decl}'")
+        if pm.group(1):
+            direction, dims = pm.group(1), pm.group(2)
+        elif pm.group(2):
+            dims = pm.group(2)
+        ports.append(Port(pm.group(3), direction, _width(dims, params)))
+    return Module(name, path, params, ports)
+
+
+def find_module_file(name, sources):
+    """Source file defining module `name`, from a target's source list (then HDL/)."""
+    candidates = [s for s in sources if os.path.basename(s) == f"{name}.sv"]
+    candidates += [s for s in sources if s.endswith(".sv")] + [os.path.join(HDL_DIR, f"{name}.sv")]
+    for path in candidates:
+        if os.path.exists(path) and re.search(rf"\bmodule\s+{name}\b", open(path).read()):
+            return path
+    raise FileNotFoundError(f"no source file defines module {name}")
+
+
+def toplevel_modules(makefile=None):
+    """Parsed Module of every distinct cocotb toplevel in the makefile, in file order."""
+    targets = parse_makefile(makefile) if makefile else parse_makefile()
+    modules = {}
+    for info in targets.values():
+        top = info.get("toplevel")
+        if top and top not in modules:
+            modules[top] = parse_module(find_module_file(top, info["sources"]), top)
+    return list(modules.values())
+
+
+# =============================================================================
+# Code generation
+# =============================================================================
+def class_name(module):
+    return "".join(part.capitalize() for part in module.split("_")) + "Ports"
+
+
+def port_groups(inputs):
+    groups = {}
+    for group, pattern in GROUP_PATTERNS.items():
+        members = [p for p in inputs if re.match(pattern, p)]
+        if members:
+            groups[group] = members
+    return groups
+
+
+def _dict_lines(name, entries):
+    if not entries:
+        return [f"    {name} = {{}}"]
+    return [f"    {name} = {{"] + [f"        {k!r}: {v!r}," for k, v in entries] + ["    }"]
+
+
+def render_module(modules):
+    lines = [
+        '"""',
+        "Port bundles of the cocotb toplevels (see Tools/port_bundles.py).",
+        "GENERATED by Tools/port_bundles.py -- do not edit by hand.",
+        '"""',
+        "from port_bundles import PortBundle",
+    ]
+    for mod in modules:
+        clock = next((p.name for p in mod.ports if p.name in CLOCK_NAMES and p.direction == "input"), None)
+        inputs = [p for p in mod.ports if p.direction == "input" and p.name != clock]
+        outputs = [p for p in mod.ports if p.direction != "input"]
+        rel = os.path.relpath(mod.path, REPO_ROOT)
+        lines += ["", "", f"class {class_name(mod.name)}(PortBundle):",
+                  f'    """{mod.name} ({rel})."""',
+                  f"    MODULE = {mod.name!r}",
+                  f"    CLOCK = {clock!r}"]
+        lines += _dict_lines("INPUTS", [(p.name, p.width) for p in inputs])
+        lines += _dict_lines("OUTPUTS", [(p.name, p.width) for p in outputs])
+        lines += _dict_lines("GROUPS", [(g, tuple(m)) for g, m in port_groups([p.name for p in inputs]).items()])
+        lines += ["    __slots__ = ("]
+        lines += [f"        {n!r}," for n in ([clock] if clock else []) + [p.name for p in inputs + outputs]]
+        lines += ["    )"]
+    lines += ["", "", "BUNDLES = {"]
+    lines += [f"    {m.name!r}: {class_name(m.name)}," for m in modules]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Runtime base class (imported by the generated module)
+# =============================================================================
+class PortBundle:
+    """Cached, direction-checked handles of one DUT's ports."""
+    MODULE = ""
+    CLOCK = None
+    INPUTS = {}
+    OUTPUTS = {}
+    GROUPS = {}
+    __slots__ = ("dut",)
+
+    def __init__(self, dut):
+        self.dut = dut
+        for name in self.__slots__:
+            setattr(self, name, getattr(dut, name))
+
+    def drive(self, **values):
+        """Assign input ports by name."""
+        for name, value in values.items():
+            if name not in self.INPUTS:
+                raise AttributeError(f"{self.MODULE}.{name} is not an input port")
+            getattr(self, name).value = value
+
+    def reset_inputs(self, *groups, **overrides):
+        """Drive every input (or every input of `groups`) to 0, except `overrides`.
+
+        With no group, active-low resets are driven to 0 too, i.e. asserted.
+        """
+        names = self.INPUTS if not groups else [n for g in groups for n in self.GROUPS[g]]
+        for name in names:
+            getattr(self, name).value = 0
+        self.drive(**overrides)
+
+    def sample(self, *names):
+        """Output port value(s) as unsigned int (one name: int, several: tuple)."""
+        for name in names:
+            if name not in self.OUTPUTS:
+                raise AttributeError(f"{self.MODULE}.{name} is not an output port")
+        values = tuple(int(getattr(self, name).value) for name in names)
+        return values[0] if len(values) == 1 else values
+
+    def sample_all(self):
+        """{output: int} of every output port (None for X/Z)."""
+        out = {}
+        for name in self.OUTPUTS:
+            try:
+                out[name] = int(getattr(self, name).value)
+            except ValueError:
+                out[name] = None
+        return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DUT port bundle generator")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("gen", help="write the port bundle module")
+    p.add_argument("-o", "--output", default=OUTPUT_FILE)
+    p = sub.add_parser("show", help="print the parsed port list of toplevel modules")
+    p.add_argument("modules", nargs="*")
+    sub.add_parser("check", help="verify the committed bundles match the RTL")
+    args = parser.parse_args(argv)
+
+    modules = toplevel_modules()
+
+    if args.cmd == "gen":
+        with open(args.output, "w") as f:
+            f.write(render_module(modules))
+        print(f"Wrote {os.path.relpath(args.output, REPO_ROOT)} ({len(modules)} bundles)")
+
+    elif args.cmd == "show":
+        for mod in modules:
+            if args.modules and mod.name not in args.modules:
+                continue
+            print(f"{mod.name} ({os.path.relpath(mod.path, REPO_ROOT)}) -> {class_name(mod.name)}")
+            for port in mod.ports:
+                print(f"  {port.direction:<6} {port.width:>4}  {port.name}")
+
+    elif args.cmd == "check":
+        expected = render_module(modules)
+        if not os.path.exists(OUTPUT_FILE) or open(OUTPUT_FILE).read() != expected:
+            print(f"❌ Stale port bundles: {os.path.relpath(OUTPUT_FILE, REPO_ROOT)} "
+                  f"(run: python Tools/port_bundles.py gen)")
+            return 1
+        print(f"✅ Port bundles up to date ({len(modules)} modules)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
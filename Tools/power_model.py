@@ -0,0 +1,201 @@
+"""
+Toggle Activity and Energy — switching activity of BIST versus functional mode.
+
+Dynamic power is dominated by bit toggles. ToggleCounter counts them on the
+buses that runtime BIST adds activity to:
+
+    field       bus (ibex_alu_bist_wrapper)
+    operand_a   ALU operand_a (after the BIST input mux)
+    operand_b   ALU operand_b (after the BIST input mux)
+    result      ALU result_o (MISR input)
+    lfsr        u_bist_ctrl.u_lfsr.lfsr_reg
+    misr        u_bist_ctrl.u_misr.misr_reg
+
+Each cycle's values are packed into one integer; the toggles of a cycle are
+popcount(previous XOR current), split per field with one mask each, so a
+quiet cycle costs a single compare. Toggles are accumulated per operating
+mode (normal, bist, idle) and converted into energy with per-toggle weights
+(relative units, 1.0 per toggle unless configured, e.g. from a
+characterised library: pJ per toggle of each bus).
+
+The same counter runs on the RTL (Test/activity_monitor.py, streaming, in any
+wrapper testbench) and on the Python model of a BIST session
+(session_activity), which this tool uses to compare session lengths and
+operand modes on energy as well as fault coverage (fault_model.py).
+
+Usage:
+    python Tools/power_model.py
+    python Tools/power_model.py --len-sel 1 3 --op-mode 0 3 --weight result=1.6 --weight misr=0.4
+    python Tools/power_model.py --weights weights.json --json
+"""
+import argparse
+import json
+import sys
+
+from bist_model import (INITIAL_SEED, LEN_SELECTS, OP_MODES, WIDTH, alu_outputs, bist_operands, misr_step,
+                        session_length, session_patterns, space_compact)
+from fault_model import detected_faults, fault_list
+
+FIELDS = (
+    ("operand_a", WIDTH),
+    ("operand_b", WIDTH),
+    ("result", WIDTH),
+    ("lfsr", WIDTH),
+    ("misr", WIDTH),
+)
+MODES = ("normal", "bist", "idle")
+DEFAULT_WEIGHTS = {name: 1.0 for name, _ in FIELDS}
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+
+
+def _offsets(fields):
+    offsets, pos = [], 0
+    for name, width in fields:
+        offsets.append((name, pos, (1 << width) - 1))
+        pos += width
+    return offsets
+
+
+class ToggleCounter:
+    """Streaming per-mode toggle counts of packed bus samples (constant memory)."""
+
+    def __init__(self, fields=FIELDS, weights=None, modes=MODES):
+        self.fields = tuple(fields)
+        self.offsets = _offsets(self.fields)
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        unknown = set(self.weights) - {name for name, _ in self.fields}
+        if unknown:
+            raise ValueError(f"weights for unknown fields: {', '.join(sorted(unknown))}")
+        self.cycles = {mode: 0 for mode in modes}
+        self.toggles = {mode: [0] * len(self.fields) for mode in modes}
+        self.prev = None
+
+    def pack(self, values):
+        """One integer from {field: value} (or a sequence in field order)."""
+        if isinstance(values, dict):
+            values = [values[name] for name, _ in self.fields]
+        word = 0
+        for (_, pos, mask), value in zip(self.offsets, values):
+            word |= (value & mask) << pos
+        return word
+
+    def sample(self, word, mode):
+        """Account the transition from the previous sample into `word` to `mode`."""
+        prev, self.prev = self.prev, word
+        if prev is None:
+            return
+        self.cycles[mode] += 1
+        diff = prev ^ word
+        if diff:
+            counts = self.toggles[mode]
+            for i, (_, pos, mask) in enumerate(self.offsets):
+                counts[i] += ((diff >> pos) & mask).bit_count()
+
+    def energy(self, mode):
+        return sum(self.weights[name] * n for (name, _), n in zip(self.fields, self.toggles[mode]))
+
+    def report(self):
+        """{mode: {cycles, toggles, rate, energy, energy_per_cycle}}; rate = toggles per cycle."""
+        out = {}
+        for mode, cycles in self.cycles.items():
+            toggles = dict(zip((name for name, _ in self.fields), self.toggles[mode]))
+            energy = self.energy(mode)
+            out[mode] = {
+                "cycles": cycles,
+                "toggles": toggles,
+                "rate": {name: n / cycles if cycles else 0.0 for name, n in toggles.items()},
+                "energy": energy,
+                "energy_per_cycle": energy / cycles if cycles else 0.0,
+            }
+        return out
+
+
+def session_samples(seed=INITIAL_SEED, length=256, op_mode=0):
+    """Bus values of BIST cycles 1 .. length-1 of one session (field order of FIELDS).
+
+    In cycle c the LFSR holds T^(c-1) seed, which drives operand_a, and the
+    MISR holds the responses of cycles 1 .. c-1 (cleared in cycle 0).
+    """
+    misr = 0
+    for pattern in session_patterns(seed, length):
+        operator, a, b = bist_operands(pattern, op_mode)
+        outputs = alu_outputs(operator, a, b)
+        yield a, b, outputs[0], pattern, misr
+        misr = misr_step(misr, space_compact(*outputs))
+
+
+def session_activity(seed=INITIAL_SEED, length=256, op_mode=0, weights=None):
+    """ToggleCounter of the transitions between BIST cycles 1 .. length-1 of one session."""
+    counter = ToggleCounter(weights=weights)
+    for values in session_samples(seed, length, op_mode):
+        counter.sample(counter.pack(values), "bist")
+    return counter
+
+
+def compare(seed=INITIAL_SEED, len_sels=LEN_SELECTS, op_modes=OP_MODES, weights=None, coverage=True):
+    """Per-configuration session energy and fault coverage rows."""
+    faults = fault_list() if coverage else None
+    rows = []
+    for len_sel in len_sels:
+        length = session_length(len_sel)
+        for op_mode in op_modes:
+            counter = session_activity(seed, length, op_mode, weights)
+            bist = counter.report()["bist"]
+            row = {
+                "len_sel": len_sel,
+                "length": length,
+                "op_mode": OP_NAMES[op_mode],
+                "toggles": bist["toggles"],
+                "rate": bist["rate"],
+                "energy": bist["energy"],
+                "energy_per_cycle": bist["energy_per_cycle"],
+            }
+            if coverage:
+                detected = len(detected_faults(session_patterns(seed, length), op_mode, faults))
+                row["coverage"] = detected / len(faults)
+                row["energy_per_fault"] = bist["energy"] / detected if detected else None
+            rows.append(row)
+    return rows
+
+
+def _weight(value):
+    name, _, weight = value.partition("=")
+    return name, float(weight)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BIST session toggle activity, energy and coverage")
+    parser.add_argument("--seed", type=lambda v: int(v, 0), default=INITIAL_SEED, help="SEED register value")
+    parser.add_argument("--len-sel", type=int, nargs="+", default=list(LEN_SELECTS))
+    parser.add_argument("--op-mode", type=int, nargs="+", default=list(OP_MODES))
+    parser.add_argument("--weights", help="JSON file {field: energy per toggle}")
+    parser.add_argument("--weight", type=_weight, action="append", default=[],
+                        help="energy per toggle of one field, e.g. result=1.6 (repeatable)")
+    parser.add_argument("--no-coverage", action="store_true", help="skip fault simulation")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args(argv)
+
+    weights = {}
+    if args.weights:
+        with open(args.weights) as f:
+            weights.update(json.load(f))
+    weights.update(args.weight)
+    rows = compare(args.seed, args.len_sel, args.op_mode, weights, not args.no_coverage)
+    if args.json:
+        print(json.dumps({"weights": dict(DEFAULT_WEIGHTS, **weights), "sessions": rows}, indent=2))
+        return 0
+
+    names = [name for name, _ in FIELDS]
+    print(f"BIST session activity, SEED 0x{args.seed:08X} (toggles per cycle, energy in weight units)")
+    print(f"{'LEN':>4} {'OP':<6} " + " ".join(f"{n:>9}" for n in names) +
+          f" {'E/CYCLE':>8} {'E/SESSION':>10} {'COVERAGE':>9} {'E/FAULT':>8}")
+    for r in rows:
+        cov = f"{100 * r['coverage']:>8.1f}%" if "coverage" in r else f"{'-':>9}"
+        per_fault = f"{r['energy_per_fault']:>8.1f}" if r.get("energy_per_fault") else f"{'-':>8}"
+        print(f"{r['length']:>4} {r['op_mode']:<6} " + " ".join(f"{r['rate'][n]:>9.2f}" for n in names) +
+              f" {r['energy_per_cycle']:>8.1f} {r['energy']:>10.0f} {cov} {per_fault}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Results History Database — per-test outcome and duration trends.
+
+Ingests cocotb JUnit result files (results.xml) into a local SQLite database so
+that every run keeps its per-test outcome, simulation time, wall time, random
+seed and git revision. The CLI reports duration trends, flakiness and the
+slowest tests, and the parallel runner (run_tests.py) reads per-target duration
+estimates from it to order the runs.
+
+Usage:
+    python Tools/results_db.py ingest Test/results.xml --target test_lfsr
+    python Tools/results_db.py error --target test_lfsr     # the run failed without a results file
+    python Tools/results_db.py trend test_lfsr_gen.test_seed_load
+    python Tools/results_db.py flaky
+    python Tools/results_db.py slowest -n 10
+    python Tools/results_db.py estimates
+"""
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_DB = os.path.join(REPO_ROOT, "Test", "test_history.db")
+
+# Number of most recent runs used for duration estimates and flakiness rates
+HISTORY_WINDOW = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    target      TEXT    NOT NULL,
+    started_at  REAL    NOT NULL,
+    git_rev     TEXT,
+    seed        INTEGER,
+    wall_time_s REAL,
+    passed      INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id      INTEGER NOT NULL REFERENCES runs(id),
+    name        TEXT    NOT NULL,
+    outcome     TEXT    NOT NULL,
+    sim_time_ns REAL,
+    wall_time_s REAL,
+    seed        INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_tests_name ON tests(name);
+CREATE INDEX IF NOT EXISTS idx_runs_target ON runs(target);
+"""
+
+
+def git_revision(cwd=REPO_ROOT):
+    """Short git revision of the working tree, suffixed with '+' when dirty."""
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return rev + ("+" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_results_xml(path):
+    """Parse a cocotb results.xml into a list of per-test dicts."""
+    tests = []
+    root = ET.parse(path).getroot()
+    for case in root.iter("testcase"):
+        props = {p.get("name"): p.get("value") for p in case.iter("property")}
+        if case.find("skipped") is not None:
+            outcome = "skip"
+        elif case.find("failure") is not None or case.find("error") is not None:
+            outcome = "fail"
+        else:
+            outcome = "pass"
+        seed = props.get("random_seed")
+        sim_time = props.get("sim_time_duration")
+        sim_stop = props.get("sim_time_stop")
+        tests.append({
+            "name": f"{case.get('classname')}.{case.get('name')}",
+            "outcome": outcome,
+            "sim_time_ns": float(sim_time) if sim_time is not None else None,
+            "sim_stop_ns": float(sim_stop) if sim_stop is not None else None,
+            "wall_time_s": float(case.get("time", 0.0)),
+            "seed": int(seed) if seed is not None else None,
+        })
+    return tests
+
+
+class ResultsDB:
+    """Thin wrapper around the SQLite history database."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------------------------------------------------------------
+    # Ingestion
+    # ---------------------------------------------------------------------
+    def ingest(self, xml_path, target, git_rev=None, wall_time_s=None, started_at=None):
+        """Store one target run. Returns the run id."""
+        tests = parse_results_xml(xml_path)
+        seeds = {t["seed"] for t in tests if t["seed"] is not None}
+        passed = all(t["outcome"] != "fail" for t in tests) and len(tests) > 0
+        if wall_time_s is None:
+            wall_time_s = sum(t["wall_time_s"] for t in tests)
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (target, started_at, git_rev, seed, wall_time_s, passed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (target, started_at or time.time(), git_rev,
+                 seeds.pop() if len(seeds) == 1 else None, wall_time_s, int(passed)))
+            run_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO tests (run_id, name, outcome, sim_time_ns, wall_time_s, seed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, t["name"], t["outcome"], t["sim_time_ns"], t["wall_time_s"], t["seed"])
+                 for t in tests])
+        return run_id
+
+    def record_error(self, target, git_rev=None, wall_time_s=None, started_at=None, seed=None):
+        """Store a failed target run that wrote no results file (e.g. a build error). Returns the run id.
+
+        The wall time goes on the error row only, so the run does not skew the duration estimates.
+        """
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (target, started_at, git_rev, seed, wall_time_s, passed) "
+                "VALUES (?, ?, ?, ?, NULL, 0)",
+                (target, started_at or time.time(), git_rev, seed))
+            run_id = cur.lastrowid
+            self.conn.execute(
+                "INSERT INTO tests (run_id, name, outcome, sim_time_ns, wall_time_s, seed) "
+                "VALUES (?, ?, 'error', NULL, ?, ?)", (run_id, f"{target}.<no results>", wall_time_s, seed))
+        return run_id
+
+    # ---------------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------------
+    def trend(self, test_name, limit=HISTORY_WINDOW):
+        """Most recent runs of one test, oldest first."""
+        rows = self.conn.execute(
+            "SELECT r.started_at, r.git_rev, t.outcome, t.sim_time_ns, t.wall_time_s, t.seed "
+            "FROM tests t JOIN runs r ON r.id = t.run_id WHERE t.name = ? "
+            "ORDER BY r.started_at DESC LIMIT ?", (test_name, limit)).fetchall()
+        return list(reversed(rows))
+
+    def flakiness(self, window=HISTORY_WINDOW):
+        """Per-test failure rate and pass/fail flip count over the recent window.
+
+        A test is reported when it has both passed and failed within the window.
+        """
+        report = []
+        names = [r[0] for r in self.conn.execute("SELECT DISTINCT name FROM tests")]
+        for name in names:
+            outcomes = [r[0] for r in self.conn.execute(
+                "SELECT t.outcome FROM tests t JOIN runs r ON r.id = t.run_id "
+                "WHERE t.name = ? AND t.outcome != 'skip' ORDER BY r.started_at DESC LIMIT ?",
+                (name, window))]
+            fails = outcomes.count("fail")
+            if 0 < fails < len(outcomes):
+                flips = sum(1 for a, b in zip(outcomes, outcomes[1:]) if a != b)
+                report.append((name, len(outcomes), fails / len(outcomes), flips))
+        return sorted(report, key=lambda r: (-r[3], -r[2]))
+
+    def slowest(self, n=10, window=HISTORY_WINDOW):
+        """Tests ranked by median wall time over their recent runs."""
+        report = []
+        names = [r[0] for r in self.conn.execute("SELECT DISTINCT name FROM tests")]
+        for name in names:
+            rows = self.conn.execute(
+                "SELECT t.wall_time_s, t.sim_time_ns FROM tests t JOIN runs r ON r.id = t.run_id "
+                "WHERE t.name = ? ORDER BY r.started_at DESC LIMIT ?", (name, window)).fetchall()
+            walls = [r[0] for r in rows if r[0] is not None]
+            sims = [r[1] for r in rows if r[1] is not None]
+            if walls:
+                report.append((name, statistics.median(walls),
+                               statistics.median(sims) if sims else None, len(walls)))
+        return sorted(report, key=lambda r: -r[1])[:n]
+
+    def target_estimates(self, window=HISTORY_WINDOW):
+        """Median wall time (seconds) of each make target over its recent runs."""
+        estimates = {}
+        targets = [r[0] for r in self.conn.execute("SELECT DISTINCT target FROM runs")]
+        for target in targets:
+            walls = [r[0] for r in self.conn.execute(
+                "SELECT wall_time_s FROM runs WHERE target = ? AND wall_time_s IS NOT NULL "
+                "ORDER BY started_at DESC LIMIT ?", (target, window))]
+            if walls:
+                estimates[target] = statistics.median(walls)
+        return estimates
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def _fmt_time(ts):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+
+
+def _sparkline(values):
+    bars = "▁▂▃▄▅▆▇█"
+    lo, hi = min(values), max(values)
+    span = (hi - lo) or 1.0
+    return "".join(bars[int((v - lo) / span * (len(bars) - 1))] for v in values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="cocotb results history database")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("ingest", help="store a results.xml")
+    p.add_argument("xml")
+    p.add_argument("--target", required=True, help="make target that produced the file")
+    p.add_argument("--rev", default=None, help="git revision (default: current HEAD)")
+    p.add_argument("--wall", type=float, default=None, help="target wall time in seconds")
+
+    p = sub.add_parser("error", help="record a failed run that wrote no results file")
+    p.add_argument("--target", required=True, help="make target that failed")
+    p.add_argument("--rev", default=None, help="git revision (default: current HEAD)")
+    p.add_argument("--wall", type=float, default=None, help="target wall time in seconds")
+
+    p = sub.add_parser("trend", help="duration trend of one test")
+    p.add_argument("test", help="test name, e.g. test_lfsr_gen.test_seed_load")
+    p.add_argument("-n", type=int, default=HISTORY_WINDOW)
+
+    sub.add_parser("flaky", help="tests that both passed and failed recently")
+
+    p = sub.add_parser("slowest", help="slowest tests by median wall time")
+    p.add_argument("-n", type=int, default=10)
+
+    sub.add_parser("estimates", help="per-target duration estimates used by the scheduler")
+
+    args = parser.parse_args(argv)
+    db = ResultsDB(args.db)
+    try:
+        if args.cmd == "ingest":
+            run_id = db.ingest(args.xml, args.target, args.rev or git_revision(), args.wall)
+            print(f"Ingested {args.xml} as run #{run_id} ({args.target})")
+
+        elif args.cmd == "error":
+            run_id = db.record_error(args.target, args.rev or git_revision(), args.wall)
+            print(f"Recorded run #{run_id} ({args.target}) as an error: no results file")
+
+        elif args.cmd == "trend":
+            rows = db.trend(args.test, args.n)
+            if not rows:
+                print(f"No history for {args.test}")
+                return 1
+            print(f"{'DATE':<17} {'REV':<10} {'OUTCOME':<8} {'SIM (ns)':>12} {'WALL (s)':>9} {'SEED':>11}")
+            for started, rev, outcome, sim_ns, wall, seed in rows:
+                print(f"{_fmt_time(started):<17} {rev or '-':<10} {outcome:<8} "
+                      f"{sim_ns or 0:>12.1f} {wall or 0:>9.3f} {seed if seed is not None else '-':>11}")
+            print(f"wall trend: {_sparkline([r[4] or 0.0 for r in rows])}")
+
+        elif args.cmd == "flaky":
+            rows = db.flakiness()
+            if not rows:
+                print("No flaky tests in the recent history ✅")
+            for name, runs, rate, flips in rows:
+                print(f"{name:<55} runs={runs:<3} fail_rate={rate:6.1%} flips={flips}")
+
+        elif args.cmd == "slowest":
+            print(f"{'TEST':<55} {'WALL (s)':>9} {'SIM (ns)':>12} {'RUNS':>5}")
+            for name, wall, sim_ns, runs in db.slowest(args.n):
+                print(f"{name:<55} {wall:>9.3f} {sim_ns or 0:>12.1f} {runs:>5}")
+
+        elif args.cmd == "estimates":
+            for target, est in sorted(db.target_estimates().items(), key=lambda kv: -kv[1]):
+                print(f"{target:<20} {est:8.2f} s")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""
+Parallel cocotb Runner — runs the Test/makefile targets concurrently.
+
+Each target gets its own results file (results_<target>.xml) and a recorded
+random seed, and is ingested into the results history database afterwards.
+The results file is deleted before each run, so a file left by an earlier run
+is never ingested; a failed run without one is recorded as an error.
+Targets are scheduled longest-first (LPT) using the duration estimates kept in
+the database, so the slowest simulations never start last.
+
+Usage:
+    python Tools/run_tests.py                 # all targets, one job per CPU
+    python Tools/run_tests.py -j 4 test_misr test_bist_ctrl
+    python Tools/run_tests.py --seed 1234 --make-arg SIM=verilator
+    python Tools/run_tests.py --waves-on-fail 2000   # BIST waves around each failure (wave_window.py)
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from results_db import DEFAULT_DB, REPO_ROOT, ResultsDB, git_revision
+from test_deps import parse_makefile
+from wave_window import waves_for_failures
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+MAKEFILE = os.path.join(TEST_DIR, "makefile")
+
+# Estimate used for targets that have no history yet (schedules them early)
+UNKNOWN_ESTIMATE_S = float("inf")
+
+
+def discover_targets(makefile=MAKEFILE):
+    """Return the cocotb targets (rules that invoke Makefile.sim), in file order."""
+    return list(parse_makefile(makefile))
+
+
+def schedule(targets, estimates):
+    """Order targets longest-estimated-first (LPT list scheduling)."""
+    return sorted(targets, key=lambda t: -estimates.get(t, UNKNOWN_ESTIMATE_S))
+
+
+def run_target(target, seed, make_args, log_dir):
+    """Run one make target. Returns (target, seed, returncode, wall_time_s, results_file, log_file)."""
+    results_file = f"results_{target}.xml"
+    log_file = os.path.join(log_dir, f"{target}.log")
+    cmd = ["make", "-f", "makefile", target,
+           f"COCOTB_RESULTS_FILE={results_file}", f"COCOTB_RANDOM_SEED={seed}"] + make_args
+    # The makefile derives its paths from $(PWD), which the shell would normally set
+    env = dict(os.environ, PWD=TEST_DIR)
+    # A results file left by an earlier run would be read as this run's
+    if os.path.exists(os.path.join(TEST_DIR, results_file)):
+        os.remove(os.path.join(TEST_DIR, results_file))
+    start = time.monotonic()
+    with open(log_file, "w") as log:
+        rc = subprocess.run(cmd, cwd=TEST_DIR, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+    return target, seed, rc, time.monotonic() - start, os.path.join(TEST_DIR, results_file), log_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run cocotb targets in parallel")
+    parser.add_argument("targets", nargs="*", help="targets to run (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for every target (default: a fresh seed per target)")
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    parser.add_argument("--db", default=DEFAULT_DB, help="results history database")
+    parser.add_argument("--no-db", action="store_true", help="do not record the run")
+    parser.add_argument("--waves-on-fail", type=int, metavar="NS", default=None,
+                        help="re-run the first failing test of each failed target with NS ns of BIST waves")
+    args = parser.parse_args(argv)
+
+    targets = args.targets or discover_targets()
+    db = None if args.no_db else ResultsDB(args.db)
+    estimates = db.target_estimates() if db else {}
+    order = schedule(targets, estimates)
+    git_rev = git_revision()
+    log_dir = os.path.join(TEST_DIR, "sim_build", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    print("=============================================")
+    print(f" RUNNING {len(order)} COCOTB TARGETS ({args.jobs} jobs)")
+    print("=============================================")
+    for t in order:
+        est = estimates.get(t)
+        print(f"   {t:<20} est. {f'{est:.1f} s' if est is not None else 'unknown'}")
+
+    failed = []
+    started_at = time.time()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = []
+        for t in order:
+            seed = args.seed if args.seed is not None else random.randrange(2**31)
+            futures.append(pool.submit(run_target, t, seed, args.make_arg, log_dir))
+        for fut in as_completed(futures):
+            target, seed, rc, wall, results_file, log_file = fut.result()
+            ok = rc == 0
+            if db and os.path.exists(results_file):
+                db.ingest(results_file, target, git_rev, wall, started_at)
+            elif db and not ok:
+                db.record_error(target, git_rev, wall, started_at, seed)
+            if ok:
+                print(f">>> ✅ {target} PASSED ({wall:.1f} s)")
+            else:
+                print(f">>> ❌ {target} FAILED ({wall:.1f} s) — see {os.path.relpath(log_file, REPO_ROOT)}")
+                failed.append((target, seed, results_file))
+    if db:
+        db.close()
+
+    print("=============================================")
+    print(f" FINAL SUMMARY: {len(order) - len(failed)}/{len(order)} PASSED, {len(failed)} FAILED"
+          f" in {time.time() - started_at:.1f} s")
+    print("=============================================")
+    if args.waves_on_fail is not None:
+        for target, seed, results_file in failed:
+            if os.path.exists(results_file):
+                print(f">>> {target}: re-running with BIST waves (seed {seed})")
+                waves_for_failures(target, seed, results_file, args.waves_on_fail, make_args=args.make_arg)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
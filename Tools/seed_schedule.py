@@ -0,0 +1,115 @@
+"""
+Seed Schedule — session seeds, golden signatures and cumulative fault coverage.
+
+With CTRL[2] set, runtime_bist_controller rotates through SEED_SLOTS session
+seeds: slot 0 uses the SEED register (0x20) and every completed session hands
+its final LFSR state to the next slot, so successive idle slots test adjacent
+pattern windows. This tool precomputes the seeds and their signatures (the
+same values golden_table.py writes into the table) and reports how the
+stuck-at coverage of fault_model.py grows over sessions with rotation,
+compared with replaying the same seed every session, together with the
+diagnostic resolution of a single session's fault dictionary (fault_dict.py).
+
+Usage:
+    python Tools/seed_schedule.py seeds --len-sel 0
+    python Tools/seed_schedule.py seeds --seed 0x12345678 --op-mode 3
+    python Tools/seed_schedule.py coverage --len-sel 0 --sessions 8
+"""
+import argparse
+import json
+import sys
+
+from bist_model import (INITIAL_SEED, OP_MODES, SEED_SLOTS, schedule_seeds, session_length,
+                        session_patterns, session_signature)
+from fault_dict import diagnostic_resolution, failing_signatures
+from fault_model import detected_faults, fault_list
+
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+
+
+def session_seeds(seed, length, sessions, rotate=True, slots=SEED_SLOTS):
+    """Seeds used by `sessions` consecutive completed sessions."""
+    if not rotate:
+        return [seed] * sessions
+    schedule = schedule_seeds(seed, length, slots)
+    return [schedule[i % slots] for i in range(sessions)]
+
+
+def cumulative_coverage(seed, length, op_mode, sessions, rotate=True, slots=SEED_SLOTS, faults=None):
+    """Fraction of faults detected by at least one of the first 1..sessions sessions."""
+    faults = fault_list() if faults is None else faults
+    detected = set()
+    cache = {}
+    curve = []
+    for s in session_seeds(seed, length, sessions, rotate, slots):
+        if s not in cache:
+            cache[s] = detected_faults(session_patterns(s, length), op_mode, faults)
+        detected |= cache[s]
+        curve.append(len(detected) / len(faults))
+    return curve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BIST seed schedule and coverage report")
+    parser.add_argument("--seed", type=lambda v: int(v, 0), default=INITIAL_SEED, help="SEED register value")
+    parser.add_argument("--len-sel", type=int, default=3, help="CFG[1:0] session length select")
+    parser.add_argument("--slots", type=int, default=SEED_SLOTS)
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("seeds", help="seed and golden signature per slot")
+    p.add_argument("--op-mode", type=int, nargs="+", default=list(OP_MODES))
+    p = sub.add_parser("coverage", help="cumulative stuck-at coverage over sessions")
+    p.add_argument("--op-mode", type=int, nargs="+", default=list(OP_MODES))
+    p.add_argument("--sessions", type=int, default=2 * SEED_SLOTS)
+    args = parser.parse_args(argv)
+
+    length = session_length(args.len_sel)
+
+    if args.cmd == "seeds":
+        rows = []
+        for slot, s in enumerate(schedule_seeds(args.seed, length, args.slots)):
+            sigs = {OP_NAMES[m]: session_signature(s, length, m) for m in args.op_mode}
+            rows.append({"slot": slot, "seed": s, "signatures": sigs})
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return 0
+        print(f"Seed schedule: SEED 0x{args.seed:08X}, {length}-cycle sessions, {args.slots} slots")
+        print(f"{'SLOT':>4} {'SEED':>10}  " + "  ".join(f"{OP_NAMES[m]:>10}" for m in args.op_mode))
+        for r in rows:
+            print(f"{r['slot']:>4} 0x{r['seed']:08X}  " +
+                  "  ".join(f"0x{r['signatures'][OP_NAMES[m]]:08X}" for m in args.op_mode))
+
+    elif args.cmd == "coverage":
+        faults = fault_list()
+        report = {}
+        resolution = {}
+        for m in args.op_mode:
+            report[OP_NAMES[m]] = {
+                "rotating": cumulative_coverage(args.seed, length, m, args.sessions, True, args.slots, faults),
+                "fixed": cumulative_coverage(args.seed, length, m, args.sessions, False, args.slots, faults),
+            }
+            resolution[OP_NAMES[m]] = diagnostic_resolution(
+                *failing_signatures(session_patterns(args.seed, length), m, faults))
+        if args.json:
+            print(json.dumps({"faults": len(faults), "length": length, "coverage": report,
+                              "resolution": {k: r._asdict() for k, r in resolution.items()}}, indent=2))
+            return 0
+        print(f"Cumulative stuck-at coverage ({len(faults)} faults), {length}-cycle sessions, "
+              f"{args.slots} seed slots")
+        print(f"{'OP':<6} {'SEEDS':<9} " + " ".join(f"{f'S{i + 1}':>6}" for i in range(args.sessions)))
+        for name, curves in report.items():
+            for kind in ("fixed", "rotating"):
+                print(f"{name:<6} {kind:<9} " + " ".join(f"{100 * c:>5.1f}%" for c in curves[kind]))
+            gain = 100 * (curves["rotating"][-1] - curves["fixed"][-1])
+            print(f"{'':<6} {'gain':<9} {gain:>+5.1f} pts after {args.sessions} sessions")
+        print(f"\nDiagnostic resolution of one session (fault dictionary, SEED 0x{args.seed:08X})")
+        print(f"{'OP':<6} {'DETECTED':>9} {'SIGS':>5} {'UNIQUE':>7} {'AVG CAND':>9} {'MAX':>4}")
+        for name, r in resolution.items():
+            unique = 100 * r.unique / r.detected if r.detected else 0.0
+            print(f"{name:<6} {r.detected:>4}/{r.faults:<4} {r.classes:>5} {unique:>6.1f}% "
+                  f"{r.mean_candidates:>9.2f} {r.max_candidates:>4}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
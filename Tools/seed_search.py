@@ -0,0 +1,191 @@
+"""
+Seed Search — LFSR seeds (and feedback taps) that maximise modelled fault coverage.
+
+Every candidate is one lane of the bit-sliced model (bitslice_model.py):
+a batch of lanes simulates that many lfsr_gen -> ALU -> misr_analyzer
+sessions of the configured length and operator mix at once, together with
+every stuck-at fault of fault_model.py. Batches run on all cores
+(one process per worker). The best candidates are re-checked with the scalar
+fault model and listed with their golden signature. Program the winner with
+the SEED register (0x20), and regenerate the golden table for it with
+`golden_table.py --seed`.
+
+With --taps N the search also draws N random maximal-length feedback
+polynomials (same number of taps as LFSR_TAPS, bit 31 always set) and pairs
+them with random seeds. Taps are an elaboration parameter (lfsr_gen TAPS),
+not a register.
+
+`check` compares the bit-sliced model with bist_model / fault_model on random
+seeds and taps: golden signatures, and the detected set of every fault.
+
+Usage:
+    python Tools/seed_search.py search --len-sel 0 --candidates 16384 -j 8
+    python Tools/seed_search.py search --len-sel 1 --op-mode 3 --taps 32 --top 5 --json seeds.json
+    python Tools/seed_search.py check
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bist_model import (INITIAL_SEED, LFSR, LFSR_TAPS, MISR, OP_MIX, OP_MODES, WIDTH, alu_response, lfsr_is_maximal,
+                        session_length)
+from bitslice_model import session_coverage, session_signatures
+from fault_model import detected_faults, fault_list
+
+OP_NAMES = {0: "COMPL", 1: "ADD", 2: "SUB", 3: "MIX"}
+RESET_LEN_SEL = 3  # CFG reset value: 256-cycle sessions
+
+
+def patterns(seed, length, taps=LFSR_TAPS):
+    """Patterns of one session with any feedback taps (bist_model.session_patterns)."""
+    lfsr = LFSR(seed, taps=taps)
+    return [lfsr.clock()[0] for _ in range(length - 1)]
+
+
+def random_taps(rng, count, weight=bin(LFSR_TAPS).count("1")):
+    """`count` distinct maximal-length tap sets of `weight` taps, bit WIDTH-1 always set."""
+    found = set()
+    while len(found) < count:
+        taps = 1 << (WIDTH - 1)
+        for bit in rng.sample(range(WIDTH - 1), weight - 1):
+            taps |= 1 << bit
+        if taps != LFSR_TAPS and lfsr_is_maximal(taps):
+            found.add(taps)
+    return sorted(found)
+
+
+def evaluate(batch, length, op_mode):
+    """Detected faults per (seed, taps) of one batch (runs in a worker process)."""
+    seeds, taps = zip(*batch)
+    return session_coverage(list(seeds), length, op_mode, list(taps))
+
+
+# =============================================================================
+# Search
+# =============================================================================
+def search(candidates, length, op_mode, lanes, jobs):
+    """Detected-fault count of every (seed, taps) candidate, in candidate order."""
+    batches = [candidates[i:i + lanes] for i in range(0, len(candidates), lanes)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(evaluate, batches, [length] * len(batches), [op_mode] * len(batches))
+        return [count for counts in results for count in counts]
+
+
+def cmd_search(args):
+    rng = random.Random(args.rng_seed)
+    length = session_length(args.len_sel)
+    tap_sets = [LFSR_TAPS] + (random_taps(rng, args.taps) if args.taps else [])
+    candidates = [(INITIAL_SEED, LFSR_TAPS)]
+    while len(candidates) < args.candidates:
+        seed = rng.getrandbits(WIDTH)
+        if seed:
+            candidates.append((seed, rng.choice(tap_sets)))
+    faults = len(fault_list())
+
+    t0 = time.perf_counter()
+    counts = search(candidates, length, args.op_mode, args.lanes, args.jobs)
+    elapsed = time.perf_counter() - t0
+    # Ties go to the default taps, which need no RTL change
+    ranked = sorted(range(len(candidates)), key=lambda i: (-counts[i], candidates[i][1] != LFSR_TAPS))[:args.top]
+
+    rows = []
+    for i in [0] + ranked:
+        seed, taps = candidates[i]
+        sig = session_signatures([seed], length, args.op_mode, taps)[0]
+        rows.append({"seed": seed, "taps": taps, "detected": counts[i], "coverage": counts[i] / faults,
+                     "signature": sig})
+    best = rows[1]
+    scalar = len(detected_faults(patterns(best["seed"], length, best["taps"]), args.op_mode))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"len_sel": args.len_sel, "op_mode": args.op_mode, "faults": faults,
+                       "candidates": len(candidates), "taps": tap_sets, "baseline": rows[0], "best": rows[1:]},
+                      f, indent=2)
+    print(f"Seed search: {len(candidates)} candidates ({len(tap_sets)} tap set(s)), {length}-cycle "
+          f"{OP_NAMES[args.op_mode]} sessions, {faults} faults")
+    print(f"   {elapsed:.1f} s on {args.jobs} worker(s), {args.lanes} lanes per batch "
+          f"({len(candidates) / elapsed:.0f} candidates/s)")
+    print(f"{'RANK':>4} {'SEED':>10} {'TAPS':>10} {'DETECTED':>9} {'COVERAGE':>9} {'SIGNATURE':>10}")
+    for rank, r in enumerate(rows):
+        label = "base" if rank == 0 else f"{rank}"
+        print(f"{label:>4} 0x{r['seed']:08X} 0x{r['taps']:08X} {r['detected']:>9} {100 * r['coverage']:>8.1f}% "
+              f"0x{r['signature']:08X}")
+    gain = best["detected"] - rows[0]["detected"]
+    print(f"\nBest: SEED 0x{best['seed']:08X}, {gain:+d} faults over the default seed")
+    if best["taps"] != LFSR_TAPS:
+        print(f"   needs lfsr_gen TAPS = 32'h{best['taps']:08X}")
+    if scalar != best["detected"]:
+        print(f"❌ Scalar fault model detects {scalar} faults for the best candidate")
+        return 1
+    return 0
+
+
+# =============================================================================
+# Check
+# =============================================================================
+def check(seeds, length, rng):
+    """Mismatches between the bit-sliced model and the scalar models (empty when they agree)."""
+    mismatches = []
+    faults = fault_list()
+    # Every other lane runs with a random maximal-length polynomial
+    taps = random_taps(rng, 1)[0]
+    lane_taps = [LFSR_TAPS if k % 2 == 0 else taps for k in range(len(seeds))]
+    for op_mode in OP_MODES:
+        sigs = session_signatures(seeds, length, op_mode, lane_taps)
+        counts, masks = session_coverage(seeds, length, op_mode, lane_taps, faults, detail=True)
+        for k, (seed, tap_value) in enumerate(zip(seeds, lane_taps)):
+            pats = patterns(seed, length, tap_value)
+            misr = MISR()
+            for p in pats:
+                misr.clock([alu_response(p, op_mode)])
+            name = f"op {op_mode} seed 0x{seed:08X} taps 0x{tap_value:08X}"
+            if sigs[k] != misr.signature:
+                mismatches.append(f"{name}: signature 0x{sigs[k]:08X} != 0x{misr.signature:08X}")
+            detected = detected_faults(pats, op_mode, faults)
+            lanes = {f for f, m in masks.items() if (m >> k) & 1}
+            if lanes != detected or counts[k] != len(detected):
+                mismatches.append(f"{name}: {len(lanes ^ detected)} fault(s) differ")
+    return mismatches
+
+
+def cmd_check(args):
+    rng = random.Random(args.rng_seed)
+    seeds = [INITIAL_SEED] + [rng.getrandbits(WIDTH) | 1 for _ in range(args.seeds - 1)]
+    length = session_length(args.len_sel)
+    mismatches = check(seeds, length, rng)
+    for m in mismatches:
+        print(f"❌ {m}")
+    if mismatches:
+        return 1
+    print(f"✅ Bit-sliced model matches the scalar models: {len(seeds)} seeds (2 tap sets) x "
+          f"{len(OP_MODES)} operator mixes, {length}-cycle sessions")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LFSR seed / taps search on the bit-sliced BIST model")
+    parser.add_argument("--rng-seed", type=int, default=1, help="candidate generator seed")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("search", help="rank random seeds (and taps) by detected faults")
+    p.add_argument("--len-sel", type=int, default=RESET_LEN_SEL, help="CFG[1:0] session length select")
+    p.add_argument("--op-mode", type=int, default=OP_MIX, help="CFG[3:2] operator mix")
+    p.add_argument("--candidates", type=int, default=4096)
+    p.add_argument("--taps", type=int, default=0, help="random maximal-length tap sets to add to LFSR_TAPS")
+    p.add_argument("--lanes", type=int, default=1024, help="candidates per bit-sliced batch")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--top", type=int, default=10)
+    p.add_argument("--json", metavar="FILE", help="write the ranking to FILE")
+    p = sub.add_parser("check", help="compare the bit-sliced model with the scalar models")
+    p.add_argument("--len-sel", type=int, default=0)
+    p.add_argument("--seeds", type=int, default=8)
+    args = parser.parse_args(argv)
+    return cmd_search(args) if args.cmd == "search" else cmd_check(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Incremental Test Selection — dependency graph from HDL manifests to targets.
+
+Builds a dependency graph from every cocotb make target to the files it
+depends on:
+  * HDL sources listed in the target's VERILOG_SOURCES (makefile variables expanded),
+  * files pulled in through `include and package imports (transitively),
+  * file lists (*.f) passed to the target,
+  * the cocotb test module and the local Python modules it imports (transitively),
+  * the makefile itself.
+
+Given a git diff, only the targets whose dependency closure contains a changed
+file are selected, and optionally run through run_tests.py.
+
+Usage:
+    python Tools/test_deps.py affected                    # vs. HEAD (working tree changes)
+    python Tools/test_deps.py affected --base origin/main --run -j 8
+    python Tools/test_deps.py affected --files HDL/misr_analyzer.sv
+    python Tools/test_deps.py graph test_wrapper
+"""
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+TOOLS_DIR = os.path.join(REPO_ROOT, "Tools")
+HDL_DIR = os.path.join(REPO_ROOT, "HDL")
+MAKEFILE = os.path.join(TEST_DIR, "makefile")
+
+# Directories searched for local Python imports of the test modules
+PY_SEARCH_DIRS = [TEST_DIR, TOOLS_DIR]
+
+_RE_INCLUDE = re.compile(r'`include\s+"([^"]+)"')
+_RE_PKG_REF = re.compile(r"\b(\w+)::")
+_RE_PKG_DEF = re.compile(r"^\s*package\s+(\w+)\s*;", re.MULTILINE)
+_RE_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_RE_MAKE_VAR = re.compile(r"\$\((\w+)\)")
+
+
+# =============================================================================
+# Makefile parsing
+# =============================================================================
+def _join_continuations(text):
+    return re.sub(r"\\\n", " ", text)
+
+
+def _expand(value, variables, depth=0):
+    if depth > 10:
+        return value
+    expanded = _RE_MAKE_VAR.sub(lambda m: variables.get(m.group(1), m.group(0)), value)
+    return expanded if expanded == value else _expand(expanded, variables, depth + 1)
+
+
+def parse_makefile(makefile=MAKEFILE):
+    """Return {target: {"sources": [...], "modules": [...], "toplevel": str}} in file order.
+
+    Only targets that invoke cocotb's Makefile.sim are returned.
+    """
+    with open(makefile) as f:
+        text = _join_continuations(f.read())
+
+    variables = {"PWD": os.path.dirname(os.path.abspath(makefile))}
+    for m in re.finditer(r"^(\w+)\s*\??=\s*(.*)$", text, flags=re.MULTILINE):
+        variables.setdefault(m.group(1), m.group(2).strip())
+
+    targets = {}
+    rule_re = re.compile(r"^(test_\w+):[^\n]*\n((?:\t[^\n]*\n?)+)", re.MULTILINE)
+    for m in rule_re.finditer(text):
+        recipe = m.group(2)
+        if "Makefile.sim" not in recipe:
+            continue
+        fields = {k: q or u for k, q, u in re.findall(r'(\w+)=(?:"([^"]*)"|(\S+))', recipe)}
+        sources = _expand(fields.get("VERILOG_SOURCES", ""), variables).split()
+        # File lists handed to the compiler (-f/-c <list>.f) count as sources too
+        sources += re.findall(r"-[fc]\s+(\S+)", _expand(fields.get("COMPILE_ARGS", ""), variables))
+        modules = _expand(fields.get("COCOTB_TEST_MODULES", ""), variables).replace(",", " ").split()
+        targets[m.group(1)] = {
+            "sources": [os.path.normpath(s) for s in sources],
+            "modules": modules,
+            "toplevel": _expand(fields.get("TOPLEVEL", ""), variables),
+        }
+    return targets
+
+
+# =============================================================================
+# HDL and Python dependency scanning
+# =============================================================================
+class DependencyGraph:
+    """Dependency closure of each make target, as absolute file paths."""
+
+    def __init__(self, makefile=MAKEFILE, include_dirs=(HDL_DIR,)):
+        self.makefile = os.path.abspath(makefile)
+        self.include_dirs = list(include_dirs)
+        self.targets = parse_makefile(makefile)
+        self._pkg_index = self._index_packages()
+        self._hdl_cache = {}
+        self._py_cache = {}
+
+    def _index_packages(self):
+        index = {}
+        for d in self.include_dirs:
+            for name in sorted(os.listdir(d)):
+                if name.endswith((".sv", ".svh", ".v")):
+                    path = os.path.join(d, name)
+                    with open(path, errors="replace") as f:
+                        for pkg in _RE_PKG_DEF.findall(f.read()):
+                            index.setdefault(pkg, path)
+        return index
+
+    def hdl_deps(self, path):
+        """Direct HDL dependencies of one file: includes, imported packages, .f entries."""
+        if path in self._hdl_cache:
+            return self._hdl_cache[path]
+        deps = set()
+        self._hdl_cache[path] = deps
+        if not os.path.exists(path):
+            return deps
+        with open(path, errors="replace") as f:
+            text = f.read()
+        if path.endswith(".f"):
+            base = os.path.dirname(path)
+            for line in text.splitlines():
+                line = line.strip()
+                if line and not line.startswith(("//", "#", "+", "-")):
+                    deps.add(os.path.normpath(os.path.join(base, line)))
+            return deps
+        text = _RE_COMMENT.sub("", text)
+        for inc in _RE_INCLUDE.findall(text):
+            for d in [os.path.dirname(path)] + self.include_dirs:
+                candidate = os.path.join(d, inc)
+                if os.path.exists(candidate):
+                    deps.add(os.path.normpath(candidate))
+                    break
+        for pkg in set(_RE_PKG_REF.findall(text)):
+            pkg_file = self._pkg_index.get(pkg)
+            if pkg_file and pkg_file != path:
+                deps.add(pkg_file)
+        return deps
+
+    def py_deps(self, path):
+        """Direct local-module dependencies of one Python file."""
+        if path in self._py_cache:
+            return self._py_cache[path]
+        deps = set()
+        self._py_cache[path] = deps
+        if not os.path.exists(path):
+            return deps
+        with open(path) as f:
+            tree = ast.parse(f.read(), filename=path)
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(a.name.split(".")[0] for a in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                names.add(node.module.split(".")[0])
+        for name in names:
+            found = self.find_module(name)
+            if found:
+                deps.add(found)
+        return deps
+
+    @staticmethod
+    def find_module(name):
+        for d in PY_SEARCH_DIRS:
+            candidate = os.path.join(d, name + ".py")
+            if os.path.exists(candidate):
+                return os.path.normpath(candidate)
+        return None
+
+    def closure(self, target):
+        """All files the target depends on (absolute paths)."""
+        info = self.targets[target]
+        seen = {self.makefile}
+        stack = list(info["sources"])
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.hdl_deps(path))
+        stack = [m for m in (self.find_module(mod) for mod in info["modules"]) if m]
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.py_deps(path))
+        return seen
+
+    def affected(self, changed_files):
+        """Targets (in makefile order) whose closure contains any changed file."""
+        changed = {os.path.normpath(os.path.join(REPO_ROOT, f)) for f in changed_files}
+        return [t for t in self.targets if self.closure(t) & changed]
+
+
+# =============================================================================
+# git
+# =============================================================================
+def changed_files(base="HEAD"):
+    """Files changed between `base` and the working tree (tracked and untracked)."""
+    out = subprocess.run(["git", "diff", "--name-only", base], cwd=REPO_ROOT,
+                         capture_output=True, text=True, check=True).stdout.split()
+    out += subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=REPO_ROOT,
+                          capture_output=True, text=True, check=True).stdout.split()
+    return sorted(set(out))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dependency-aware cocotb target selection")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("affected", help="targets affected by a change")
+    p.add_argument("--base", default="HEAD", help="git revision to diff against (default: HEAD)")
+    p.add_argument("--files", nargs="+", default=None,
+                   help="explicit changed files (repo-relative) instead of git diff")
+    p.add_argument("--run", action="store_true", help="run the affected targets")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--make-arg", action="append", default=[], help="passed to run_tests.py")
+
+    p = sub.add_parser("graph", help="print the dependency closure of targets")
+    p.add_argument("targets", nargs="*")
+
+    args = parser.parse_args(argv)
+    graph = DependencyGraph()
+
+    if args.cmd == "graph":
+        for t in args.targets or graph.targets:
+            print(f"{t}:")
+            for path in sorted(graph.closure(t)):
+                print(f"    {os.path.relpath(path, REPO_ROOT)}")
+        return 0
+
+    files = args.files if args.files is not None else changed_files(args.base)
+    selected = graph.affected(files)
+    print(f"Changed files ({len(files)}):")
+    for f in files:
+        print(f"    {f}")
+    print(f"Affected targets ({len(selected)}/{len(graph.targets)}): {' '.join(selected) or '-'}")
+    if args.run and selected:
+        import run_tests
+        run_argv = selected + ["-j", str(args.jobs)]
+        for arg in args.make_arg:
+            run_argv += ["--make-arg", arg]
+        return run_tests.main(run_argv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Failure-Triggered Waveform Capture — BIST waves for failing runs only.
+
+Runs a cocotb target without any waveform dumping and records the simulation
+time at which each test failed (sim_time_stop in its results file). Passing
+runs end there and pay no waveform I/O. For a failure, the target is re-run
+with the same random seed, built with the controller's windowed dump logic
+(Test/makefile WAVE_WINDOW=1), and dumps only the runtime_bist_controller or
+multi_unit_bist_controller hierarchy from WINDOW ns before the failure. Targets
+without a controller (test_lfsr, test_misr, test_alu, ...) dump their whole
+toplevel instead (Test/bist_wave_dump.sv); a target with neither is rejected
+before it runs:
+
+  * the re-run selects the failing test and every test before it
+    (COCOTB_TEST_FILTER), so the random sequence is unchanged and the
+    simulation stops at the failure;
+  * dumping starts at the first clock edge at or after failure - WINDOW
+    (+bist_wave_start), into Test/sim_build/waves/<test>.<format>;
+  * the re-run must fail at the same time, otherwise it is reported as
+    not reproduced.
+
+Usage:
+    python Tools/wave_window.py test_bist_ctrl --make-arg SIM=verilator
+    python Tools/wave_window.py test_wrapper --window 5000 --seed 1234 --all
+    python Tools/run_tests.py --waves-on-fail 2000     # same for every failing target
+"""
+import argparse
+import os
+import random
+import re
+import subprocess
+import sys
+
+from results_db import REPO_ROOT, parse_results_xml
+from test_deps import parse_makefile
+
+TEST_DIR = os.path.join(REPO_ROOT, "Test")
+WAVE_DIR = os.path.join(TEST_DIR, "sim_build", "waves")
+LOG_DIR = os.path.join(TEST_DIR, "sim_build", "logs")
+DEFAULT_WINDOW_NS = 2000
+FORMATS = ("vcd", "fst")
+# Sources whose BIST_WAVE_WINDOW block writes the waves, and what it dumps
+WAVE_SOURCES = {
+    "runtime_bist_controller.sv": "runtime_bist_controller hierarchy",
+    "multi_unit_bist_controller.sv": "multi_unit_bist_controller hierarchy",
+    "bist_wave_dump.sv": "toplevel",
+}
+
+
+def wave_scope(target):
+    """What a WAVE_WINDOW=1 build of `target` dumps, or None if it has no windowed dump."""
+    sources = [os.path.basename(s) for s in parse_makefile().get(target, {}).get("sources", [])]
+    for source, scope in WAVE_SOURCES.items():
+        if source in sources:
+            return scope
+    return None
+
+
+def _make(target, make_args, log_file, variables):
+    cmd = ["make", "-f", "makefile", target] + [f"{k}={v}" for k, v in variables.items()] + make_args
+    env = dict(os.environ, PWD=TEST_DIR)
+    # Read back afterwards: a file left by an earlier run must not pass for this one's
+    results = os.path.join(TEST_DIR, str(variables["COCOTB_RESULTS_FILE"]))
+    if os.path.exists(results):
+        os.remove(results)
+    with open(log_file, "w") as log:
+        return subprocess.run(cmd, cwd=TEST_DIR, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+
+
+def failures(results_file):
+    """(tests in run order, failing tests) of a results file."""
+    tests = parse_results_xml(results_file)
+    return tests, [t for t in tests if t["outcome"] == "fail"]
+
+
+def capture(target, seed, tests, failure, window_ns, fmt, make_args):
+    """Re-run `target` up to `failure` with the BIST waves of the last window_ns. Returns a report dict."""
+    os.makedirs(WAVE_DIR, exist_ok=True)
+    module, name = failure["name"].rsplit(".", 1)
+    upto = [t["name"].rsplit(".", 1)[1] for t in tests[:tests.index(failure) + 1]]
+    start = max(0, int(failure["sim_stop_ns"]) - window_ns)
+    wave_file = os.path.join(WAVE_DIR, f"{name}.{fmt}")
+    results_file = f"results_{target}_waves.xml"
+    if os.path.exists(wave_file):
+        os.remove(wave_file)
+    rc = _make(target, make_args, os.path.join(LOG_DIR, f"{target}_waves.log"), {
+        "WAVE_WINDOW": 1,
+        "WAVE_FORMAT": fmt,
+        "COCOTB_RANDOM_SEED": seed,
+        "COCOTB_RESULTS_FILE": results_file,
+        # Quoted for the recipe shell; no '$' (make would expand it)
+        "COCOTB_TEST_FILTER": rf"'^{re.escape(module)}\.({'|'.join(upto)})\b'",
+        "COCOTB_PLUSARGS": f"+bist_wave_file={wave_file} +bist_wave_start={start}",
+    })
+    rerun = parse_results_xml(os.path.join(TEST_DIR, results_file)) \
+        if os.path.exists(os.path.join(TEST_DIR, results_file)) else []
+    same = [t for t in rerun if t["name"] == failure["name"]]
+    reproduced = bool(same) and same[0]["outcome"] == "fail" and same[0]["sim_stop_ns"] == failure["sim_stop_ns"]
+    return {
+        "test": failure["name"],
+        "failed_at_ns": failure["sim_stop_ns"],
+        "window_ns": (start, failure["sim_stop_ns"]),
+        "wave_file": wave_file if os.path.exists(wave_file) else None,
+        "wave_bytes": os.path.getsize(wave_file) if os.path.exists(wave_file) else 0,
+        "reproduced": reproduced,
+        "returncode": rc,
+        "scope": wave_scope(target),
+    }
+
+
+def print_capture(report):
+    lo, hi = report["window_ns"]
+    print(f"   {report['test']} failed at {hi:.0f} ns")
+    if report["wave_file"]:
+        print(f"   📈 {os.path.relpath(report['wave_file'], REPO_ROOT)} ({report['wave_bytes'] / 1024:.1f} KiB, "
+              f"{lo:.0f}–{hi:.0f} ns, {report['scope']})")
+    else:
+        print("   ❌ no waveform written (see the _waves log)")
+    if not report["reproduced"]:
+        print("   ⚠️  the re-run did not fail at the same time; the waves may not show the failure")
+
+
+def waves_for_failures(target, seed, results_file, window_ns=DEFAULT_WINDOW_NS, fmt="vcd", make_args=(),
+                       all_failures=False):
+    """Capture waves for the first (or every) failing test of a finished run. Returns the reports."""
+    if wave_scope(target) is None:
+        print(f"   ⚠️  {target} has no windowed waveform dump (Test/makefile WAVE_WINDOW=1); not re-run")
+        return []
+    tests, failed = failures(results_file)
+    reports = []
+    for failure in failed if all_failures else failed[:1]:
+        reports.append(capture(target, seed, tests, failure, window_ns, fmt, list(make_args)))
+        print_capture(reports[-1])
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a cocotb target; capture BIST waves around failures")
+    parser.add_argument("target", help="make target, e.g. test_bist_ctrl")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW_NS, help="ns dumped before the failure")
+    parser.add_argument("--format", choices=FORMATS, default="vcd")
+    parser.add_argument("--seed", type=int, default=None, help="random seed (default: a fresh one)")
+    parser.add_argument("--all", action="store_true", help="one capture per failing test (default: first)")
+    parser.add_argument("--make-arg", action="append", default=[],
+                        help="extra make variable, e.g. SIM=verilator (repeatable)")
+    args = parser.parse_args(argv)
+
+    if wave_scope(args.target) is None:
+        print(f"❌ {args.target}: no windowed waveform dump in its WAVE_WINDOW=1 build "
+              f"(a BIST controller or Test/bist_wave_dump.sv)")
+        return 2
+    os.makedirs(LOG_DIR, exist_ok=True)
+    seed = args.seed if args.seed is not None else random.randrange(2**31)
+    results_file = f"results_{args.target}.xml"
+    log_file = os.path.join(LOG_DIR, f"{args.target}.log")
+    rc = _make(args.target, args.make_arg, log_file,
+               {"COCOTB_RESULTS_FILE": results_file, "COCOTB_RANDOM_SEED": seed})
+    results_path = os.path.join(TEST_DIR, results_file)
+    if not os.path.exists(results_path):
+        print(f"❌ {args.target}: no results (see {os.path.relpath(log_file, REPO_ROOT)})")
+        return 1
+    tests, failed = failures(results_path)
+    if not failed:
+        print(f"✅ {args.target}: {len(tests)} tests passed (seed {seed}), no waveforms written")
+        return rc
+    print(f"❌ {args.target}: {len(failed)}/{len(tests)} tests failed (seed {seed}), re-running with waves")
+    waves_for_failures(args.target, seed, results_path, args.window, args.format, args.make_arg, args.all)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
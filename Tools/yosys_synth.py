@@ -0,0 +1,426 @@
+"""
+Yosys Synthesis Flow — local cell/flop/logic-depth estimates per configuration.
+
+Synthesises the HDL/ sources with Yosys' generic flow (synth -flatten, ABC
+mapping onto the internal gate library) for a matrix of top modules and
+parameter values, without Vivado:
+
+    cells           mapped cells ($_AND_, $_MUX_, $_DFF*_, ...; $scopeinfo excluded)
+    flops           flip-flops and latches among them
+    logic_depth     longest combinational path in cells, flop to flop (ltp -noff)
+    handover_depth  longest path in cells from the system request input
+                    (core_sleep_i / sys_req_valid) to a flop, i.e. the
+                    zero-cycle handover path through the ALU mux and the MISR
+                    enable (ltp -noff over the request's combinational cone)
+
+Gate counts are technology independent and not comparable to Vivado's LUTs;
+they track the relative cost of a BIST change (e.g. the wrapper versus the
+plain ibex_alu) from commit to commit. Results are JSON keyed by configuration
+name ("top" or "top:PARAM=value,...") with the git revision and the Yosys
+version, and `check` compares a run against the committed snapshot
+Reports/yosys_metrics.json like `vivado_reports.py check`. `check` also
+fails when the handover path is longer than the flop-to-flop critical path:
+the request arrives after an input delay, so it must not set the clock.
+
+Yosys' built-in SystemVerilog frontend does not read every construct in
+HDL/, so each source is copied into the work directory with four
+rewrites (the originals are untouched):
+  * `module m import pkg::*;` becomes a file-scope import before the module
+  * functions of imported packages are copied into the module body
+    (package functions cannot be called from a module)
+  * `return expr;` becomes an assignment to the function name (every
+    return in HDL/ is the last statement of its function)
+  * the type of `localparam string` and of packed arrays of user types is
+    dropped (the value keeps its width)
+
+Parameters are set with chparam before elaboration: PARAM applies to the top
+module, module.PARAM to every instance of a submodule (e.g.
+runtime_bist_controller.GOLDEN_TABLE_RAM inside the wrapper). The binary is
+$YOSYS, `yosys` or `yowasp-yosys` (pip install yowasp-yosys), whichever is
+found first.
+
+Usage:
+    python Tools/yosys_synth.py run -j 8
+    python Tools/yosys_synth.py run --top ibex_alu_bist_wrapper --param runtime_bist_controller.GOLDEN_TABLE_RAM=0,1
+    python Tools/yosys_synth.py run --top multi_unit_bist_controller --param N_UNITS=1,2,4,8 --json n_units.json
+    python Tools/yosys_synth.py check                    # exit 1 on regressions against the snapshot
+    python Tools/yosys_synth.py snapshot                 # accept the current numbers
+    python Tools/yosys_synth.py compare old.json new.json
+"""
+import argparse
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from results_db import REPO_ROOT, git_revision
+
+HDL_DIR = os.path.join(REPO_ROOT, "HDL")
+WORK_DIR = os.path.join(REPO_ROOT, "Test", "sim_build", "yosys")
+SNAPSHOT_FILE = os.path.join(REPO_ROOT, "Reports", "yosys_metrics.json")
+
+# Regression tolerances: relative for cells/flops, absolute levels for logic depth
+AREA_TOLERANCE = 0.05
+DEPTH_TOLERANCE = 2
+
+# Source lists (package files first), as in Test/makefile
+CTRL_SOURCES = ["bist_golden_pkg.sv", "bist_poly_pkg.sv", "apb_slave_if.sv", "idle_detector.sv", "lfsr_gen.sv",
+                "misr_analyzer.sv"]
+SOURCES = {
+    "ibex_alu": ["ibex_pkg.sv", "ibex_alu.sv"],
+    "runtime_bist_controller": CTRL_SOURCES + ["runtime_bist_controller.sv"],
+    "multi_unit_bist_controller": CTRL_SOURCES + ["multi_unit_bist_controller.sv"],
+    "ibex_alu_bist_wrapper": ["ibex_pkg.sv", "ibex_alu.sv"] + CTRL_SOURCES +
+                             ["runtime_bist_controller.sv", "bist_fault_injector.sv", "bist_space_compactor.sv",
+                              "ibex_alu_bist_wrapper.sv"],
+    "ibex_ex_block": ["ibex_pkg.sv", "ibex_alu.sv", "ibex_multdiv_fast.sv", "ibex_ex_block.sv"],
+    "lfsr_gen_kstep": ["bist_poly_pkg.sv", "lfsr_gen_kstep.sv"],
+    "misr_analyzer_kstep": ["bist_poly_pkg.sv", "misr_analyzer_kstep.sv"],
+}
+# Default matrix: {top: {param: [values]}}, every combination is one configuration
+MATRIX = {
+    "ibex_alu": {},
+    "ibex_alu_bist_wrapper": {"runtime_bist_controller.GOLDEN_TABLE_RAM": [0, 1]},
+    "runtime_bist_controller": {"GOLDEN_TABLE_RAM": [0, 1]},
+    "multi_unit_bist_controller": {"N_UNITS": [1, 2, 4, 8]},
+    "ibex_ex_block": {},
+    "lfsr_gen_kstep": {"STEPS": [1, 2, 4, 8]},
+    "misr_analyzer_kstep": {"STEPS": [1, 2, 4, 8]},
+}
+# BIST overhead: configuration top -> baseline configuration
+BASELINES = {"ibex_alu_bist_wrapper": "ibex_alu"}
+# System request input of the tops with a zero-cycle handover
+REQUEST_PORTS = {"ibex_alu_bist_wrapper": "core_sleep_i", "runtime_bist_controller": "sys_req_valid",
+                 "multi_unit_bist_controller": "sys_req_valid"}
+
+FLOP_CELL = re.compile(r"^\$_(DFF|DFFE|SDFF|SDFFE|SDFFCE|ALDFF|ALDFFE|DFFSR|DFFSRE|DLATCH|SR)_")
+LTP_LENGTH = re.compile(r"Longest topological path in .* \(length=(\d+)\)")
+
+
+# =============================================================================
+# Configurations
+# =============================================================================
+def config_name(top, params):
+    if not params:
+        return top
+    return top + ":" + ",".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+def expand(matrix):
+    """[(name, top, params)] for every parameter combination of every top."""
+    configs = []
+    for top, axes in matrix.items():
+        keys = sorted(axes)
+        for values in itertools.product(*(axes[k] for k in keys)):
+            params = dict(zip(keys, values))
+            configs.append((config_name(top, params), top, params))
+    return configs
+
+
+def _param_axis(value):
+    name, _, values = value.partition("=")
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"expected PARAM=v1,v2 or module.PARAM=v1,v2, got {value!r}")
+    return name, [int(v, 0) for v in values.split(",")]
+
+
+# =============================================================================
+# Frontend shim
+# =============================================================================
+def _package_functions(path):
+    with open(path) as f:
+        text = f.read()
+    name = re.search(r"^\s*package\s+(\w+)\s*;", text, re.M)
+    if not name:
+        return None, ""
+    return name.group(1), "".join(m.group(0) + "\n" for m in
+                                  re.finditer(r"^[ \t]*function\b.*?\bendfunction\b", text, re.S | re.M))
+
+
+def _returns_to_assignments(text):
+    def fix(m):
+        name = m.group(1)
+        return re.sub(r"\breturn\s+([^;]+);", lambda r: f"{name} = {r.group(1)};", m.group(0))
+    return re.sub(r"\bfunction\s+(?:automatic\s+)?[^;(]*?(\w+)\s*\(.*?\bendfunction\b", fix, text, flags=re.S)
+
+
+def prepare_source(text, package_functions):
+    """Rewrite one HDL/ file for Yosys' read_verilog -sv (see module docstring)."""
+    text = re.sub(r"\bmodule\s+(\w+)\s+import\s+([\w:*, ]+);", r"import \2;\nmodule \1", text)
+    functions = "".join(package_functions.get(p, "") for p in re.findall(r"^\s*import\s+(\w+)::\*\s*;", text, re.M))
+    if functions:
+        module = re.search(r"^\s*module\s+\w+", text, re.M)
+        end = text.index(");", module.end()) + 2
+        text = text[:end] + "\n" + functions + text[end:]
+    text = _returns_to_assignments(text)
+    return re.sub(r"\blocalparam\s+(?:string|\w+_t\s*\[[^\]]*\])\s+", "localparam ", text)
+
+
+def stage_sources(files, out_dir):
+    """Copy the rewritten sources of one configuration into out_dir."""
+    package_functions = {}
+    for name in files:
+        pkg, functions = _package_functions(os.path.join(HDL_DIR, name))
+        if pkg:
+            package_functions[pkg] = functions
+    for name in files:
+        with open(os.path.join(HDL_DIR, name)) as f:
+            text = f.read()
+        with open(os.path.join(out_dir, name), "w") as f:
+            f.write(prepare_source(text, package_functions))
+
+
+# =============================================================================
+# Synthesis
+# =============================================================================
+def find_yosys():
+    for candidate in (os.environ.get("YOSYS"), "yosys", "yowasp-yosys"):
+        if candidate and shutil.which(candidate):
+            return candidate
+    return None
+
+
+def yosys_version(yosys):
+    out = subprocess.run([yosys, "-V"], capture_output=True, text=True).stdout.strip().splitlines()
+    return out[-1].split(" (")[0] if out else None
+
+
+def script(top, params, files):
+    lines = [f"read_verilog -sv {' '.join(files)}"]
+    for key, value in sorted(params.items()):
+        module, _, param = key.rpartition(".")
+        lines.append(f"chparam -set {param} {value} {module or top}")
+    lines += [f"synth -top {top} -flatten", "tee -q -o stat.json stat -json", "tee -q -o ltp.txt ltp -noff"]
+    if top in REQUEST_PORTS:
+        # Every cell of the cone is reached from the request, so its longest path starts there
+        lines.append(f"tee -q -o handover_ltp.txt ltp -noff w:{REQUEST_PORTS[top]} %coe*")
+    return "\n".join(lines) + "\n"
+
+
+def parse_results(stat_path, ltp_path, handover_path=None):
+    with open(stat_path) as f:
+        design = json.load(f)["design"]
+    by_type = {k: v for k, v in design["num_cells_by_type"].items() if k != "$scopeinfo"}
+    with open(ltp_path) as f:
+        depth = LTP_LENGTH.search(f.read())
+    record = {
+        "cells": sum(by_type.values()),
+        "flops": sum(n for cell, n in by_type.items() if FLOP_CELL.match(cell)),
+        "logic_depth": int(depth.group(1)) if depth else None,
+        "cells_by_type": dict(sorted(by_type.items())),
+    }
+    if handover_path:
+        with open(handover_path) as f:
+            handover = LTP_LENGTH.search(f.read())
+        record["handover_depth"] = int(handover.group(1)) if handover else None
+    return record
+
+
+def synthesize(name, top, params, yosys, work_dir=WORK_DIR):
+    """Run one configuration. Returns its record ({"error": log} on failure)."""
+    out_dir = os.path.join(work_dir, re.sub(r"[^\w.=-]+", "_", name))
+    os.makedirs(out_dir, exist_ok=True)
+    stage_sources(SOURCES[top], out_dir)
+    with open(os.path.join(out_dir, "synth.ys"), "w") as f:
+        f.write(script(top, params, SOURCES[top]))
+    for stale in ("stat.json", "ltp.txt", "handover_ltp.txt"):
+        if os.path.exists(os.path.join(out_dir, stale)):
+            os.remove(os.path.join(out_dir, stale))
+    log = os.path.join(out_dir, "yosys.log")
+    start = time.time()
+    # Relative paths only: yowasp-yosys sees the working directory, not the whole file system
+    with open(log, "w") as f:
+        rc = subprocess.run([yosys, "-q", "-s", "synth.ys"], cwd=out_dir, stdout=f, stderr=subprocess.STDOUT).returncode
+    record = {"top": top, "params": params, "runtime_s": round(time.time() - start, 1)}
+    try:
+        if rc != 0:
+            raise OSError(rc)
+        record.update(parse_results(os.path.join(out_dir, "stat.json"), os.path.join(out_dir, "ltp.txt"),
+                                    os.path.join(out_dir, "handover_ltp.txt") if top in REQUEST_PORTS else None))
+    except (OSError, ValueError, KeyError):
+        record["error"] = os.path.relpath(log, REPO_ROOT)
+    return record
+
+
+def overheads(results):
+    """Cells/flops of every configuration with a baseline (BASELINES) relative to it."""
+    out = {}
+    for name, r in results.items():
+        base = results.get(BASELINES.get(r["top"], ""))
+        if base is None or "error" in r or "error" in base:
+            continue
+        out[name] = {key: {"bist": r[key], "base": base[key], "delta": r[key] - base[key],
+                           "percent": 100.0 * (r[key] - base[key]) / base[key] if base[key] else None}
+                     for key in ("cells", "flops")}
+        out[name]["base"] = BASELINES[r["top"]]
+    return out
+
+
+# =============================================================================
+# Comparison
+# =============================================================================
+def find_regressions(current, baseline, area_tol=AREA_TOLERANCE, depth_tol=DEPTH_TOLERANCE):
+    """Compare per-configuration metrics against a snapshot. Returns a list of messages."""
+    problems = []
+    for name, cur in sorted(current.items()):
+        ref = baseline.get(name)
+        if ref is None or "error" in ref:
+            continue
+        if "error" in cur:
+            problems.append(f"{name}: synthesis failed (see {cur['error']})")
+            continue
+        for key in ("cells", "flops"):
+            limit = ref[key] * (1.0 + area_tol)
+            if cur[key] > limit and cur[key] > ref[key]:
+                problems.append(f"{name}: {key} {ref[key]} -> {cur[key]} (+{cur[key] - ref[key]}, limit {limit:.0f})")
+        for key in ("logic_depth", "handover_depth"):
+            if cur.get(key) is not None and ref.get(key) is not None and cur[key] > ref[key] + depth_tol:
+                problems.append(f"{name}: {key} {ref[key]} -> {cur[key]}")
+    return problems
+
+
+def handover_problems(results):
+    """Configurations whose request -> flop path is longer than their flop-to-flop critical path."""
+    return [f"{name}: handover path {r['handover_depth']} cells > critical path {r['logic_depth']} "
+            f"({REQUEST_PORTS[r['top']]} sets the clock)"
+            for name, r in sorted(results.items())
+            if r.get("handover_depth") is not None and r.get("logic_depth") is not None
+            and r["handover_depth"] > r["logic_depth"]]
+
+
+def _delta(old, new):
+    if old is None or new is None:
+        return f"{'-' if new is None else new:>7}"
+    return f"{new:>7}" + (f" ({new - old:+d})" if new != old else "")
+
+
+def print_results(results, reference=None):
+    print(f"{'CONFIGURATION':<66} {'CELLS':>14} {'FLOPS':>12} {'DEPTH':>10} {'HANDOVER':>10}")
+    for name, r in results.items():
+        if "error" in r:
+            print(f"{name:<66} synthesis failed (see {r['error']})")
+            continue
+        ref = (reference or {}).get(name) or {}
+        handover = _delta(ref.get("handover_depth"), r["handover_depth"]) if "handover_depth" in r else "-"
+        print(f"{name:<66} {_delta(ref.get('cells'), r['cells']):>14} {_delta(ref.get('flops'), r['flops']):>12} "
+              f"{_delta(ref.get('logic_depth'), r['logic_depth']):>10} {handover:>10}")
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yosys cell/flop/logic-depth estimates per configuration")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    def run_args(p):
+        p.add_argument("--top", nargs="+", choices=list(SOURCES), help="top modules (default: the whole matrix)")
+        p.add_argument("--param", type=_param_axis, action="append", default=[],
+                       help="parameter values of --top, e.g. N_UNITS=1,2,4,8 or "
+                            "runtime_bist_controller.GOLDEN_TABLE_RAM=0,1 (repeatable; replaces the matrix axes)")
+        p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+        p.add_argument("--yosys", default=find_yosys(), help="Yosys binary (default: $YOSYS, yosys, yowasp-yosys)")
+
+    p = sub.add_parser("run", help="synthesise the configuration matrix")
+    run_args(p)
+    p.add_argument("--json", metavar="FILE", help="write the results to FILE")
+
+    p = sub.add_parser("check", help="fail on regressions against the snapshot")
+    run_args(p)
+    p.add_argument("--baseline", default=SNAPSHOT_FILE)
+    p.add_argument("--area-tol", type=float, default=AREA_TOLERANCE)
+    p.add_argument("--depth-tol", type=int, default=DEPTH_TOLERANCE)
+
+    p = sub.add_parser("snapshot", help="write the current results as the new snapshot")
+    run_args(p)
+    p.add_argument("--baseline", default=SNAPSHOT_FILE)
+
+    p = sub.add_parser("compare", help="difference of two result files (e.g. from two commits)")
+    p.add_argument("old")
+    p.add_argument("new")
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "compare":
+        old, new = _load(args.old), _load(args.new)
+        print(f"{args.old} ({old.get('git_rev')}) -> {args.new} ({new.get('git_rev')})")
+        if old.get("yosys") != new.get("yosys"):
+            print(f"   note: different Yosys versions ({old.get('yosys')} / {new.get('yosys')})")
+        print_results(new["configs"], old["configs"])
+        gone = sorted(set(old["configs"]) - set(new["configs"]))
+        if gone:
+            print(f"   not in {args.new}: {', '.join(gone)}")
+        return 0
+
+    if not args.yosys:
+        print("No Yosys binary found: install Yosys or `pip install yowasp-yosys`, or set $YOSYS")
+        return 2
+    matrix = {top: MATRIX[top] for top in args.top or MATRIX}
+    if args.param:
+        matrix = {top: dict(axes, **dict(args.param)) for top, axes in matrix.items()}
+    configs = expand(matrix)
+    version = yosys_version(args.yosys)
+    print(f"Yosys synthesis: {len(configs)} configuration(s) on {args.jobs} worker(s) ({version})")
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        records = list(pool.map(lambda c: synthesize(c[0], c[1], c[2], args.yosys), configs))
+    results = {name: record for (name, _, _), record in zip(configs, records)}
+    report = {"git_rev": git_revision(), "yosys": version, "configs": results, "overhead": overheads(results)}
+    failed = [name for name, r in results.items() if "error" in r]
+
+    if args.cmd == "run":
+        print_results(results)
+        for name, o in report["overhead"].items():
+            print(f"   BIST overhead {name} vs {o['base']}: cells {o['cells']['delta']:+d} "
+                  f"({o['cells']['percent']:+.1f}%), flops {o['flops']['delta']:+d}")
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nWrote {args.json}")
+        return 1 if failed else 0
+
+    if args.cmd == "check":
+        if not os.path.exists(args.baseline):
+            print(f"No snapshot at {args.baseline}; run 'snapshot' first")
+            return 2
+        baseline = _load(args.baseline)
+        if baseline.get("yosys") != version:
+            print(f"   note: snapshot from {baseline.get('yosys')}, running {version}")
+        print_results(results, baseline["configs"])
+        for name in sorted(set(results) - set(baseline["configs"])):
+            print(f"   new configuration (not in snapshot): {name}")
+        problems = find_regressions(results, baseline["configs"], args.area_tol, args.depth_tol)
+        problems += handover_problems(results)
+        if problems:
+            print("❌ Synthesis estimate regressions:")
+            for msg in problems:
+                print(f"   {msg}")
+            return 1
+        print(f"✅ No regressions across {len(results)} configuration(s)")
+        return 0
+
+    # snapshot: runtimes and the working-tree state are not part of it
+    if failed:
+        print(f"❌ Not writing a snapshot: synthesis failed for {', '.join(failed)}")
+        return 1
+    for r in results.values():
+        r.pop("runtime_s")
+    report["git_rev"] = report["git_rev"].rstrip("+") if report["git_rev"] else None
+    with open(args.baseline, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {len(results)} configuration(s) to {os.path.relpath(args.baseline, REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
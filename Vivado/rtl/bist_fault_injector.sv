@@ -0,0 +1,57 @@
+// Module: bist_fault_injector.sv
+// Description: Simulation fault injector for the BIST-observed datapath.
+//              Forces one bit of data_i while BIST drives the datapath:
+//                mode 0: off
+//                mode 1: stuck-at-0 from BIST cycle inject_cycle on
+//                mode 2: stuck-at-1 from BIST cycle inject_cycle on
+//                mode 3: transient bit flip in BIST cycle inject_cycle only
+//              BIST cycles are counted while `enable` is high since the
+//              fault was armed (mode != 0). Tie mode to 0 for synthesis.
+
+module bist_fault_injector #(
+    parameter int WIDTH   = 32,
+    parameter int CYCLE_W = 16
+)(
+    input  logic                     clk,
+    input  logic                     rst_n,
+    input  logic                     enable,       // BIST drives the datapath
+    input  logic [1:0]               mode,
+    input  logic [$clog2(WIDTH)-1:0] bit_sel,
+    input  logic [CYCLE_W-1:0]       inject_cycle,
+    input  logic [WIDTH-1:0]         data_i,
+    output logic [WIDTH-1:0]         data_o,
+    output logic                     active        // fault applied in this cycle
+);
+
+    localparam logic [1:0] MODE_OFF = 2'd0;
+    localparam logic [1:0] MODE_SA0 = 2'd1;
+    localparam logic [1:0] MODE_SA1 = 2'd2;
+
+    logic [CYCLE_W-1:0] cycle_cnt;
+
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            cycle_cnt <= '0;
+        end else if (mode == MODE_OFF) begin
+            cycle_cnt <= '0;
+        end else if (enable && cycle_cnt != '1) begin
+            cycle_cnt <= cycle_cnt + 1'b1;
+        end
+    end
+
+    assign active = (mode != MODE_OFF) && enable &&
+                    ((mode == MODE_SA0 || mode == MODE_SA1) ? (cycle_cnt >= inject_cycle)
+                                                            : (cycle_cnt == inject_cycle));
+
+    always_comb begin
+        data_o = data_i;
+        if (active) begin
+            case (mode)
+                MODE_SA0: data_o[bit_sel] = 1'b0;
+                MODE_SA1: data_o[bit_sel] = 1'b1;
+                default:  data_o[bit_sel] = ~data_i[bit_sel];
+            endcase
+        end
+    end
+
+endmodule
@@ -2,7 +2,8 @@
 // Uses packed arrays and proper module-scoped import.
 
 module ibex_alu_bist_wrapper import ibex_pkg::*; #(
-    parameter integer RV32B = 0
+    parameter integer RV32B = 0,
+    parameter integer TIMER_WIDTH = 32   // BIST idle counter / THRESHOLD width
 ) (
     input  logic              clk_i,
     input  logic              rst_ni,
@@ -34,12 +35,19 @@ module ibex_alu_bist_wrapper import ibex_pkg::*; #(
     output logic [31:0]       prdata_o,
     output logic              pready_o,
     output logic              bist_error_irq_o,
-    input  logic              sim_fault_inject_i 
+    output logic              bist_irq_o,         // BIST done/fail/abort (IRQ_EN/IRQ_STATUS)
+    input  logic              sim_fault_inject_i,
+    // Parameterised fault injection (bist_fault_injector), tie to 0 for synthesis
+    input  logic [1:0]        sim_fault_mode_i,   // 0 off, 1 stuck-at-0, 2 stuck-at-1, 3 transient flip
+    input  logic [4:0]        sim_fault_bit_i,
+    input  logic [15:0]       sim_fault_cycle_i   // BIST cycle at which the fault is applied
 );
 
     // --- Internal Signals ---
     logic        bist_active;
     logic [31:0] bist_pattern;
+    logic [1:0]  bist_op_mode;
+    logic [31:0] bist_pattern_swap;
     
     // MUX Signals
     logic [6:0]  alu_operator_mux;
@@ -50,12 +58,29 @@ module ibex_alu_bist_wrapper import ibex_pkg::*; #(
     logic [31:0] alu_result_raw;
     
     //  INPUT MUX
+    assign bist_pattern_swap = {bist_pattern[15:0], bist_pattern[31:16]};
+
     always_comb begin
         if (bist_active) begin
-            // BIST Mode: Force ADD operation
+            // BIST Mode: operator mix selected by CFG[3:2]
             alu_operand_a_mux = bist_pattern;
-            alu_operand_b_mux = ~bist_pattern; 
-            alu_operator_mux  = ALU_ADD;       
+            alu_operand_b_mux = bist_pattern_swap;
+            case (bist_op_mode)
+                2'd0: begin  // Legacy: pattern + ~pattern
+                    alu_operand_b_mux = ~bist_pattern;
+                    alu_operator_mux  = ALU_ADD;
+                end
+                2'd1: alu_operator_mux = ALU_ADD;
+                2'd2: alu_operator_mux = ALU_SUB;
+                default: begin  // Mix: operator from pattern[1:0]
+                    case (bist_pattern[1:0])
+                        2'd0:    alu_operator_mux = ALU_ADD;
+                        2'd1:    alu_operator_mux = ALU_SUB;
+                        2'd2:    alu_operator_mux = ALU_XOR;
+                        default: alu_operator_mux = ALU_SLL;
+                    endcase
+                end
+            endcase
         end else begin
             // Normal Mode: Pass through
             alu_operand_a_mux = operand_a_i;
@@ -93,23 +118,57 @@ module ibex_alu_bist_wrapper import ibex_pkg::*; #(
         .multdiv_sel_i       (1'b0)
     );
 
-    // Fault injection: XOR bit[0] of result during BIST when sim_fault_inject_i is active
-    wire [31:0] alu_result_fault = alu_result_raw ^ {31'b0, (sim_fault_inject_i & bist_active)};
+    // Fault injection: stuck-at / transient fault on any result bit (sim_fault_mode_i),
+    // plus the legacy XOR of bit[0] during BIST when sim_fault_inject_i is active
+    logic [31:0] alu_result_inj;
+
+    bist_fault_injector #(
+        .WIDTH(32)
+    ) u_fault_inj (
+        .clk         (clk_i),
+        .rst_n       (rst_ni),
+        .enable      (bist_active),
+        .mode        (sim_fault_mode_i),
+        .bit_sel     (sim_fault_bit_i),
+        .inject_cycle(sim_fault_cycle_i),
+        .data_i      (alu_result_raw),
+        .data_o      (alu_result_inj),
+        .active      ()
+    );
+
+    wire [31:0] alu_result_fault = alu_result_inj ^ {31'b0, (sim_fault_inject_i & bist_active)};
     assign result_o = alu_result_raw;
 
+    // Space compaction: adder_result_o, comparison_result_o and is_equal_result_o
+    // join result_o in the MISR input (Tools/output_coverage.py)
+    logic [31:0] bist_response;
+
+    bist_space_compactor #(
+        .WIDTH(32)
+    ) u_space_compactor (
+        .result           (alu_result_fault),
+        .adder_result     (adder_result_o),
+        .comparison_result(comparison_result_o),
+        .is_equal_result  (is_equal_result_o),
+        .response         (bist_response)
+    );
+
     // RUNTIME BIST CONTROLLER  
     runtime_bist_controller #(
-        .DATA_WIDTH(32)
+        .DATA_WIDTH(32),
+        .TIMER_WIDTH(TIMER_WIDTH)
     ) u_bist_ctrl (
         .clk              (clk_i),
         .rst_n            (rst_ni),
         .sys_req_valid    (!core_sleep_i), 
         .bist_active_mode (bist_active),
-        .dut_result_in    (alu_result_fault),
+        .dut_result_in    (bist_response),
         .bist_pattern_out (bist_pattern),
+        .bist_op_mode     (bist_op_mode),
         .paddr(paddr_i), .psel(psel_i), .penable(penable_i), 
         .pwrite(pwrite_i), .pwdata(pwdata_i), .prdata(prdata_o), .pready(pready_o),
-        .error_irq        (bist_error_irq_o)
+        .error_irq        (bist_error_irq_o),
+        .bist_irq         (bist_irq_o)
     );
 
 endmodule
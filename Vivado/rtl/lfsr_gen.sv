@@ -1,5 +1,6 @@
-module lfsr_gen #(
+module lfsr_gen import bist_poly_pkg::*; #(
     parameter WIDTH = 32,
+    parameter logic [WIDTH-1:0] TAPS = WIDTH'(default_taps(WIDTH)),   // x^32 + x^22 + x^2 + x^1 + 1 at 32 bits
     parameter INITIAL_SEED = 32'hDEAD_BEEF
   )(
     input  logic             clk,
@@ -12,9 +13,11 @@ module lfsr_gen #(
 
   logic [WIDTH-1:0] lfsr_reg;
 
-  // Polynomial: x^32 + x^22 + x^2 + x^1 + 1 (Xilinx Standard)
+  // Polynomial: bist_poly_pkg's for WIDTH by default (x^32 + x^22 + x^2 + x^1 + 1,
+  // Xilinx Standard, at 32 bits);
+  // Tools/seed_search.py --taps searches other maximal-length TAPS
   logic feedback;
-  assign feedback = lfsr_reg[31] ^ lfsr_reg[21] ^ lfsr_reg[1] ^ lfsr_reg[0];
+  assign feedback = ^(lfsr_reg & TAPS);
 
   always_ff @(posedge clk or negedge rst_n)
   begin
@@ -37,4 +40,9 @@ module lfsr_gen #(
 
   assign pattern_out = lfsr_reg;
 
+  // Elaboration check: bist_poly_pkg has no default TAPS for this WIDTH
+  if (TAPS == '0) begin : g_no_default_taps
+    $error("lfsr_gen: no default TAPS for WIDTH %0d, set TAPS", WIDTH);
+  end
+
 endmodule
@@ -0,0 +1,66 @@
+// Module: lfsr_gen_kstep.sv
+// Description: k-step LFSR pattern generator. Produces STEPS consecutive
+//              lfsr_gen patterns per clock for parallel operand lanes.
+//              The k-step next-state logic is the GF(2) transition matrix
+//              T^k of the single-step LFSR, built at elaboration time.
+
+module lfsr_gen_kstep import bist_poly_pkg::*; #(
+    parameter WIDTH = 32,
+    parameter STEPS = 4,
+    parameter logic [WIDTH-1:0] TAPS = WIDTH'(default_taps(WIDTH)),   // as lfsr_gen
+    parameter logic [WIDTH-1:0] INITIAL_SEED = 32'hDEAD_BEEF
+)(
+    input  logic                        clk,
+    input  logic                        rst_n,
+    input  logic                        enable,
+    input  logic                        seed_load,
+    input  logic [WIDTH-1:0]            seed_data,
+    output logic [STEPS-1:0][WIDTH-1:0] pattern_out    // [0] = current state (== lfsr_gen)
+);
+
+    logic [WIDTH-1:0] lfsr_reg;
+    logic [WIDTH-1:0] lfsr_next;
+
+    // Single LFSR step (same update as lfsr_gen)
+    function automatic logic [WIDTH-1:0] lfsr_step(input logic [WIDTH-1:0] s);
+        return {s[WIDTH-2:0], ^(s & TAPS)};
+    endfunction
+
+    // Column j of T^n: image of unit vector e_j after n steps (constant per n, j)
+    function automatic logic [WIDTH-1:0] tmat_col(input int n, input int j);
+        logic [WIDTH-1:0] v;
+        v = '0;
+        v[j] = 1'b1;
+        for (int s = 0; s < n; s++) v = lfsr_step(v);
+        return v;
+    endfunction
+
+    // y = T^n x over GF(2): XOR of the columns selected by the set bits of x
+    function automatic logic [WIDTH-1:0] tmat_apply(input int n, input logic [WIDTH-1:0] x);
+        logic [WIDTH-1:0] y;
+        y = '0;
+        for (int j = 0; j < WIDTH; j++) y = y ^ (tmat_col(n, j) & {WIDTH{x[j]}});
+        return y;
+    endfunction
+
+    always_comb begin
+        for (int k = 0; k < STEPS; k++) pattern_out[k] = tmat_apply(k, lfsr_reg);
+        lfsr_next = tmat_apply(STEPS, lfsr_reg);
+    end
+
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            lfsr_reg <= INITIAL_SEED;
+        end else if (seed_load) begin
+            lfsr_reg <= seed_data;
+        end else if (enable) begin
+            lfsr_reg <= lfsr_next;
+        end
+    end
+
+    // Elaboration check: bist_poly_pkg has no default TAPS for this WIDTH
+    if (TAPS == '0) begin : g_no_default_taps
+        $error("lfsr_gen_kstep: no default TAPS for WIDTH %0d, set TAPS", WIDTH);
+    end
+
+endmodule
@@ -1,8 +1,15 @@
 // Module: misr_analyzer.sv
 // Description: Compresses the output of the DUT (Device Under Test) into a signature.
+//              Internal-XOR (Galois) MISR: shift left and, when the bit shifted
+//              out is set, XOR the feedback polynomial POLY (its terms below
+//              x^WIDTH). A primitive POLY gives a maximal-length register;
+//              the default is bist_poly_pkg's for WIDTH (x^32 + x^22 + x^2 +
+//              x^1 + 1 at 32 bits, Tools/misr_aliasing.py poly). POLY = 1
+//              (x^WIDTH + 1) is the former rotate-XOR compactor.
 
-module misr_analyzer #(
-    parameter WIDTH = 32
+module misr_analyzer import bist_poly_pkg::*; #(
+    parameter WIDTH = 32,
+    parameter logic [WIDTH-1:0] POLY = WIDTH'(default_poly(WIDTH))   // x^32 + x^22 + x^2 + x^1 + 1 at 32 bits
 )(
     input  logic             clk,
     input  logic             rst_n,
@@ -14,15 +21,14 @@ module misr_analyzer #(
 
     logic [WIDTH-1:0] misr_reg;
 
-    // Polynomial for signature analysis
     always_ff @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             misr_reg <= '0;
         end else if (clear) begin
             misr_reg <= '0;
         end else if (enable) begin
-            // Simple MISR logic: Shift and XOR with input
-            misr_reg <= {misr_reg[WIDTH-2:0], misr_reg[31]} ^ dut_response;
+            // Shift, polynomial feedback from the MSB, XOR with input
+            misr_reg <= {misr_reg[WIDTH-2:0], 1'b0} ^ (misr_reg[WIDTH-1] ? POLY : '0) ^ dut_response;
         end
     end
 
@@ -35,4 +41,9 @@ module misr_analyzer #(
     end
     // synthesis translate_on
 
+    // Elaboration check: bist_poly_pkg has no default POLY for this WIDTH
+    if (POLY == '0) begin : g_no_default_poly
+        $error("misr_analyzer: no default POLY for WIDTH %0d, set POLY", WIDTH);
+    end
+
 endmodule
\ No newline at end of file
@@ -0,0 +1,68 @@
+// Module: misr_analyzer_kstep.sv
+// Description: k-step MISR. Compacts STEPS responses per clock (one per
+//              operand lane or duplicated ALU). The signature after one clock
+//              equals STEPS serial misr_analyzer updates:
+//                  sig' = R^k sig ^ R^(k-1) d[0] ^ ... ^ R^0 d[k-1]
+//              where R is the single-step GF(2) transition matrix.
+
+module misr_analyzer_kstep import bist_poly_pkg::*; #(
+    parameter WIDTH = 32,
+    parameter STEPS = 4,
+    parameter logic [WIDTH-1:0] POLY = WIDTH'(default_poly(WIDTH))   // as misr_analyzer
+)(
+    input  logic                        clk,
+    input  logic                        rst_n,
+    input  logic                        enable,
+    input  logic                        clear,
+    input  logic [STEPS-1:0][WIDTH-1:0] dut_response,  // [0] = oldest response
+    output logic [WIDTH-1:0]            signature
+);
+
+    logic [WIDTH-1:0] misr_reg;
+    logic [WIDTH-1:0] misr_next;
+
+    // Single MISR step without input (same update as misr_analyzer)
+    function automatic logic [WIDTH-1:0] misr_step(input logic [WIDTH-1:0] s);
+        return {s[WIDTH-2:0], 1'b0} ^ (s[WIDTH-1] ? POLY : '0);
+    endfunction
+
+    // Column j of R^n: image of unit vector e_j after n steps
+    function automatic logic [WIDTH-1:0] rmat_col(input int n, input int j);
+        logic [WIDTH-1:0] v;
+        v = '0;
+        v[j] = 1'b1;
+        for (int s = 0; s < n; s++) v = misr_step(v);
+        return v;
+    endfunction
+
+    // y = R^n x over GF(2)
+    function automatic logic [WIDTH-1:0] rmat_apply(input int n, input logic [WIDTH-1:0] x);
+        logic [WIDTH-1:0] y;
+        y = '0;
+        for (int j = 0; j < WIDTH; j++) y = y ^ (rmat_col(n, j) & {WIDTH{x[j]}});
+        return y;
+    endfunction
+
+    always_comb begin
+        misr_next = rmat_apply(STEPS, misr_reg);
+        for (int k = 0; k < STEPS; k++) misr_next = misr_next ^ rmat_apply(STEPS - 1 - k, dut_response[k]);
+    end
+
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            misr_reg <= '0;
+        end else if (clear) begin
+            misr_reg <= '0;
+        end else if (enable) begin
+            misr_reg <= misr_next;
+        end
+    end
+
+    assign signature = misr_reg;
+
+    // Elaboration check: bist_poly_pkg has no default POLY for this WIDTH
+    if (POLY == '0) begin : g_no_default_poly
+        $error("misr_analyzer_kstep: no default POLY for WIDTH %0d, set POLY", WIDTH);
+    end
+
+endmodule
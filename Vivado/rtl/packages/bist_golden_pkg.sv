@@ -0,0 +1,124 @@
+// File: HDL/bist_golden_pkg.sv
+// Description: Golden MISR signatures of runtime_bist_controller, one per
+//              seed slot and BIST configuration
+//              (index = {seed_slot, CFG[3:0]} = {seed_slot, op_mode, len_sel}),
+//              for the ibex_alu_bist_wrapper datapath, and the CHKPT
+//              checkpoint signatures (index = {op_mode, k}).
+//              GENERATED by Tools/golden_table.py -- do not edit by hand.
+
+package bist_golden_pkg;
+
+    localparam logic [31:0] GOLDEN_SEED       = 32'hDEADBEEF;
+    localparam int          GOLDEN_SEED_SLOTS = 4;
+    localparam int          GOLDEN_SLOT_W     = 2;
+    localparam int          GOLDEN_IDX_W      = 6;
+    localparam int          GOLDEN_ENTRIES    = 64;
+    localparam int          CHKPT_WINDOW      = 32;
+    localparam int          CHKPT_IDX_W       = 5;
+
+    function automatic logic [31:0] golden_rom(input logic [GOLDEN_IDX_W-1:0] idx);
+        case (idx)
+            6'd0 : golden_rom = 32'hFF9FE802;  // slot 0 COMPL 32 cycles
+            6'd1 : golden_rom = 32'h015FD005;  // slot 0 COMPL 64 cycles
+            6'd2 : golden_rom = 32'h04D9DFAB;  // slot 0 COMPL 128 cycles
+            6'd3 : golden_rom = 32'hF1ED64B2;  // slot 0 COMPL 256 cycles
+            6'd4 : golden_rom = 32'h3F9637F0;  // slot 0 ADD   32 cycles
+            6'd5 : golden_rom = 32'h9FADDA56;  // slot 0 ADD   64 cycles
+            6'd6 : golden_rom = 32'h61476145;  // slot 0 ADD   128 cycles
+            6'd7 : golden_rom = 32'h630855C6;  // slot 0 ADD   256 cycles
+            6'd8 : golden_rom = 32'h215C8249;  // slot 0 SUB   32 cycles
+            6'd9 : golden_rom = 32'hB5B191A9;  // slot 0 SUB   64 cycles
+            6'd10: golden_rom = 32'h2FD5B572;  // slot 0 SUB   128 cycles
+            6'd11: golden_rom = 32'h1FCE11B8;  // slot 0 SUB   256 cycles
+            6'd12: golden_rom = 32'h935F9D5B;  // slot 0 MIX   32 cycles
+            6'd13: golden_rom = 32'h2A3940BE;  // slot 0 MIX   64 cycles
+            6'd14: golden_rom = 32'h74D1DD55;  // slot 0 MIX   128 cycles
+            6'd15: golden_rom = 32'hA28549C8;  // slot 0 MIX   256 cycles
+            6'd16: golden_rom = 32'hFF9FE802;  // slot 1 COMPL 32 cycles
+            6'd17: golden_rom = 32'h015FD005;  // slot 1 COMPL 64 cycles
+            6'd18: golden_rom = 32'h04D9DFAB;  // slot 1 COMPL 128 cycles
+            6'd19: golden_rom = 32'hF1ED64B2;  // slot 1 COMPL 256 cycles
+            6'd20: golden_rom = 32'h71C4A6BA;  // slot 1 ADD   32 cycles
+            6'd21: golden_rom = 32'hCCDD324F;  // slot 1 ADD   64 cycles
+            6'd22: golden_rom = 32'h4FFFC5F1;  // slot 1 ADD   128 cycles
+            6'd23: golden_rom = 32'h58D102AF;  // slot 1 ADD   256 cycles
+            6'd24: golden_rom = 32'hA4E63806;  // slot 1 SUB   32 cycles
+            6'd25: golden_rom = 32'h774C1FAA;  // slot 1 SUB   64 cycles
+            6'd26: golden_rom = 32'hD7AC3FCC;  // slot 1 SUB   128 cycles
+            6'd27: golden_rom = 32'h0E21583E;  // slot 1 SUB   256 cycles
+            6'd28: golden_rom = 32'hEB93DC0C;  // slot 1 MIX   32 cycles
+            6'd29: golden_rom = 32'h6F6ED5BC;  // slot 1 MIX   64 cycles
+            6'd30: golden_rom = 32'hB21E1F33;  // slot 1 MIX   128 cycles
+            6'd31: golden_rom = 32'hF9C72499;  // slot 1 MIX   256 cycles
+            6'd32: golden_rom = 32'hFF9FE802;  // slot 2 COMPL 32 cycles
+            6'd33: golden_rom = 32'h015FD005;  // slot 2 COMPL 64 cycles
+            6'd34: golden_rom = 32'h04D9DFAB;  // slot 2 COMPL 128 cycles
+            6'd35: golden_rom = 32'hF1ED64B2;  // slot 2 COMPL 256 cycles
+            6'd36: golden_rom = 32'hFD37BC1D;  // slot 2 ADD   32 cycles
+            6'd37: golden_rom = 32'hF7F1D113;  // slot 2 ADD   64 cycles
+            6'd38: golden_rom = 32'hC833D5E3;  // slot 2 ADD   128 cycles
+            6'd39: golden_rom = 32'hD9618B28;  // slot 2 ADD   256 cycles
+            6'd40: golden_rom = 32'h95B6DFE6;  // slot 2 SUB   32 cycles
+            6'd41: golden_rom = 32'h244DFD49;  // slot 2 SUB   64 cycles
+            6'd42: golden_rom = 32'h3DED8A0B;  // slot 2 SUB   128 cycles
+            6'd43: golden_rom = 32'h47E8F53F;  // slot 2 SUB   256 cycles
+            6'd44: golden_rom = 32'h992316CF;  // slot 2 MIX   32 cycles
+            6'd45: golden_rom = 32'hDD1D811F;  // slot 2 MIX   64 cycles
+            6'd46: golden_rom = 32'hE3B22A94;  // slot 2 MIX   128 cycles
+            6'd47: golden_rom = 32'h763B1F48;  // slot 2 MIX   256 cycles
+            6'd48: golden_rom = 32'hFF9FE802;  // slot 3 COMPL 32 cycles
+            6'd49: golden_rom = 32'h015FD005;  // slot 3 COMPL 64 cycles
+            6'd50: golden_rom = 32'h04D9DFAB;  // slot 3 COMPL 128 cycles
+            6'd51: golden_rom = 32'hF1ED64B2;  // slot 3 COMPL 256 cycles
+            6'd52: golden_rom = 32'h8947AADE;  // slot 3 ADD   32 cycles
+            6'd53: golden_rom = 32'h2F6EF184;  // slot 3 ADD   64 cycles
+            6'd54: golden_rom = 32'hB3BAD87A;  // slot 3 ADD   128 cycles
+            6'd55: golden_rom = 32'h0A6B8C37;  // slot 3 ADD   256 cycles
+            6'd56: golden_rom = 32'hE086FCA4;  // slot 3 SUB   32 cycles
+            6'd57: golden_rom = 32'h01F49BF1;  // slot 3 SUB   64 cycles
+            6'd58: golden_rom = 32'h75268F89;  // slot 3 SUB   128 cycles
+            6'd59: golden_rom = 32'hF37C4A11;  // slot 3 SUB   256 cycles
+            6'd60: golden_rom = 32'h87DD34BC;  // slot 3 MIX   32 cycles
+            6'd61: golden_rom = 32'h715A8636;  // slot 3 MIX   64 cycles
+            6'd62: golden_rom = 32'hECBAF2B7;  // slot 3 MIX   128 cycles
+            6'd63: golden_rom = 32'hA2DF906B;  // slot 3 MIX   256 cycles
+            default: golden_rom = 32'h0000_0000;
+        endcase
+    endfunction
+
+    // MISR value at cycle k * CHKPT_WINDOW of a slot-0 session, index = {op_mode, k}
+    function automatic logic [31:0] checkpoint_rom(input logic [CHKPT_IDX_W-1:0] idx);
+        case (idx)
+            5'd1 : checkpoint_rom = 32'hFF9FE802;  // COMPL cycle 32
+            5'd2 : checkpoint_rom = 32'h015FD005;  // COMPL cycle 64
+            5'd3 : checkpoint_rom = 32'h00A147B9;  // COMPL cycle 96
+            5'd4 : checkpoint_rom = 32'h04D9DFAB;  // COMPL cycle 128
+            5'd5 : checkpoint_rom = 32'h85754CF2;  // COMPL cycle 160
+            5'd6 : checkpoint_rom = 32'h18539DC0;  // COMPL cycle 192
+            5'd7 : checkpoint_rom = 32'h9E176B6B;  // COMPL cycle 224
+            5'd9 : checkpoint_rom = 32'h3F9637F0;  // ADD   cycle 32
+            5'd10: checkpoint_rom = 32'h9FADDA56;  // ADD   cycle 64
+            5'd11: checkpoint_rom = 32'h8D6EE1E9;  // ADD   cycle 96
+            5'd12: checkpoint_rom = 32'h61476145;  // ADD   cycle 128
+            5'd13: checkpoint_rom = 32'h88784BDA;  // ADD   cycle 160
+            5'd14: checkpoint_rom = 32'h9F488620;  // ADD   cycle 192
+            5'd15: checkpoint_rom = 32'h552D7B0C;  // ADD   cycle 224
+            5'd17: checkpoint_rom = 32'h215C8249;  // SUB   cycle 32
+            5'd18: checkpoint_rom = 32'hB5B191A9;  // SUB   cycle 64
+            5'd19: checkpoint_rom = 32'hFC20FC07;  // SUB   cycle 96
+            5'd20: checkpoint_rom = 32'h2FD5B572;  // SUB   cycle 128
+            5'd21: checkpoint_rom = 32'h2EF298A6;  // SUB   cycle 160
+            5'd22: checkpoint_rom = 32'hF8B81880;  // SUB   cycle 192
+            5'd23: checkpoint_rom = 32'h6322801E;  // SUB   cycle 224
+            5'd25: checkpoint_rom = 32'h935F9D5B;  // MIX   cycle 32
+            5'd26: checkpoint_rom = 32'h2A3940BE;  // MIX   cycle 64
+            5'd27: checkpoint_rom = 32'hCCBDC4D0;  // MIX   cycle 96
+            5'd28: checkpoint_rom = 32'h74D1DD55;  // MIX   cycle 128
+            5'd29: checkpoint_rom = 32'h4DBC2BC8;  // MIX   cycle 160
+            5'd30: checkpoint_rom = 32'h85882E1B;  // MIX   cycle 192
+            5'd31: checkpoint_rom = 32'hA94D6AFD;  // MIX   cycle 224
+            default: checkpoint_rom = 32'h0000_0000;
+        endcase
+    endfunction
+
+endpackage
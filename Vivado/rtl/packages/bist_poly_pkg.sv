@@ -0,0 +1,88 @@
+// File: HDL/bist_poly_pkg.sv
+// Description: Default feedback polynomials of misr_analyzer, misr_analyzer_kstep,
+//              bist_space_compactor (POLY) and lfsr_gen, lfsr_gen_kstep (TAPS)
+//              per WIDTH (2 .. 64): a lowest-weight primitive x^WIDTH + POLY,
+//              x^32 + x^22 + x^2 + x^1 + 1 at 32 bits. Both functions return 0
+//              for any other WIDTH.
+//              GENERATED by Tools/misr_aliasing.py -- do not edit by hand.
+
+package bist_poly_pkg;
+
+    // POLY: the terms of x^width + POLY below x^width
+    function automatic logic [63:0] default_poly(input int width);
+        case (width)
+            2 : default_poly = 64'h0000000000000003;  // x^2 + x^1 + 1
+            3 : default_poly = 64'h0000000000000003;  // x^3 + x^1 + 1
+            4 : default_poly = 64'h0000000000000003;  // x^4 + x^1 + 1
+            5 : default_poly = 64'h0000000000000005;  // x^5 + x^2 + 1
+            6 : default_poly = 64'h0000000000000003;  // x^6 + x^1 + 1
+            7 : default_poly = 64'h0000000000000003;  // x^7 + x^1 + 1
+            8 : default_poly = 64'h000000000000001D;  // x^8 + x^4 + x^3 + x^2 + 1
+            9 : default_poly = 64'h0000000000000011;  // x^9 + x^4 + 1
+            10: default_poly = 64'h0000000000000009;  // x^10 + x^3 + 1
+            11: default_poly = 64'h0000000000000005;  // x^11 + x^2 + 1
+            12: default_poly = 64'h0000000000000053;  // x^12 + x^6 + x^4 + x^1 + 1
+            13: default_poly = 64'h000000000000001B;  // x^13 + x^4 + x^3 + x^1 + 1
+            14: default_poly = 64'h000000000000002B;  // x^14 + x^5 + x^3 + x^1 + 1
+            15: default_poly = 64'h0000000000000003;  // x^15 + x^1 + 1
+            16: default_poly = 64'h000000000000002D;  // x^16 + x^5 + x^3 + x^2 + 1
+            17: default_poly = 64'h0000000000000009;  // x^17 + x^3 + 1
+            18: default_poly = 64'h0000000000000081;  // x^18 + x^7 + 1
+            19: default_poly = 64'h0000000000000027;  // x^19 + x^5 + x^2 + x^1 + 1
+            20: default_poly = 64'h0000000000000009;  // x^20 + x^3 + 1
+            21: default_poly = 64'h0000000000000005;  // x^21 + x^2 + 1
+            22: default_poly = 64'h0000000000000003;  // x^22 + x^1 + 1
+            23: default_poly = 64'h0000000000000021;  // x^23 + x^5 + 1
+            24: default_poly = 64'h000000000000001B;  // x^24 + x^4 + x^3 + x^1 + 1
+            25: default_poly = 64'h0000000000000009;  // x^25 + x^3 + 1
+            26: default_poly = 64'h0000000000000047;  // x^26 + x^6 + x^2 + x^1 + 1
+            27: default_poly = 64'h0000000000000027;  // x^27 + x^5 + x^2 + x^1 + 1
+            28: default_poly = 64'h0000000000000009;  // x^28 + x^3 + 1
+            29: default_poly = 64'h0000000000000005;  // x^29 + x^2 + 1
+            30: default_poly = 64'h0000000000000053;  // x^30 + x^6 + x^4 + x^1 + 1
+            31: default_poly = 64'h0000000000000009;  // x^31 + x^3 + 1
+            32: default_poly = 64'h0000000000400007;  // x^32 + x^22 + x^2 + x^1 + 1
+            33: default_poly = 64'h0000000000002001;  // x^33 + x^13 + 1
+            34: default_poly = 64'h0000000000000119;  // x^34 + x^8 + x^4 + x^3 + 1
+            35: default_poly = 64'h0000000000000005;  // x^35 + x^2 + 1
+            36: default_poly = 64'h0000000000000801;  // x^36 + x^11 + 1
+            37: default_poly = 64'h0000000000000053;  // x^37 + x^6 + x^4 + x^1 + 1
+            38: default_poly = 64'h0000000000000063;  // x^38 + x^6 + x^5 + x^1 + 1
+            39: default_poly = 64'h0000000000000011;  // x^39 + x^4 + 1
+            40: default_poly = 64'h0000000000000039;  // x^40 + x^5 + x^4 + x^3 + 1
+            41: default_poly = 64'h0000000000000009;  // x^41 + x^3 + 1
+            42: default_poly = 64'h0000000000000099;  // x^42 + x^7 + x^4 + x^3 + 1
+            43: default_poly = 64'h0000000000000059;  // x^43 + x^6 + x^4 + x^3 + 1
+            44: default_poly = 64'h0000000000000065;  // x^44 + x^6 + x^5 + x^2 + 1
+            45: default_poly = 64'h000000000000001B;  // x^45 + x^4 + x^3 + x^1 + 1
+            46: default_poly = 64'h00000000000001C1;  // x^46 + x^8 + x^7 + x^6 + 1
+            47: default_poly = 64'h0000000000000021;  // x^47 + x^5 + 1
+            48: default_poly = 64'h0000000000000291;  // x^48 + x^9 + x^7 + x^4 + 1
+            49: default_poly = 64'h0000000000000201;  // x^49 + x^9 + 1
+            50: default_poly = 64'h000000000000001D;  // x^50 + x^4 + x^3 + x^2 + 1
+            51: default_poly = 64'h000000000000004B;  // x^51 + x^6 + x^3 + x^1 + 1
+            52: default_poly = 64'h0000000000000009;  // x^52 + x^3 + 1
+            53: default_poly = 64'h0000000000000047;  // x^53 + x^6 + x^2 + x^1 + 1
+            54: default_poly = 64'h0000000000000149;  // x^54 + x^8 + x^6 + x^3 + 1
+            55: default_poly = 64'h0000000001000001;  // x^55 + x^24 + 1
+            56: default_poly = 64'h0000000000000095;  // x^56 + x^7 + x^4 + x^2 + 1
+            57: default_poly = 64'h0000000000000081;  // x^57 + x^7 + 1
+            58: default_poly = 64'h0000000000080001;  // x^58 + x^19 + 1
+            59: default_poly = 64'h0000000000000095;  // x^59 + x^7 + x^4 + x^2 + 1
+            60: default_poly = 64'h0000000000000003;  // x^60 + x^1 + 1
+            61: default_poly = 64'h0000000000000027;  // x^61 + x^5 + x^2 + x^1 + 1
+            62: default_poly = 64'h0000000000000069;  // x^62 + x^6 + x^5 + x^3 + 1
+            63: default_poly = 64'h0000000000000003;  // x^63 + x^1 + 1
+            64: default_poly = 64'h000000000000001B;  // x^64 + x^4 + x^3 + x^1 + 1
+            default: default_poly = '0;
+        endcase
+    endfunction
+
+    // TAPS of the same polynomial: tap i stands for x^(i+1)
+    function automatic logic [63:0] default_taps(input int width);
+        logic [64:0] full;
+        full = (65'd1 << width) | {1'b0, default_poly(width)};
+        default_taps = (default_poly(width) == '0) ? '0 : full[64:1];
+    endfunction
+
+endpackage
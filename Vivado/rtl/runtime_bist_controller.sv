@@ -1,5 +1,7 @@
-module runtime_bist_controller #(
-    parameter DATA_WIDTH = 32
+module runtime_bist_controller import bist_golden_pkg::*; #(
+    parameter DATA_WIDTH = 32,
+    parameter TIMER_WIDTH = 32,       // idle counter and THRESHOLD register width
+    parameter bit GOLDEN_TABLE_RAM = 1'b0  // 1: golden table writable over APB (GTBL_DATA)
 )(
     input  logic        clk,
     input  logic        rst_n,
@@ -11,6 +13,7 @@ module runtime_bist_controller #(
 
     // --- BIST Interface ---
     output logic [DATA_WIDTH-1:0] bist_pattern_out,
+    output logic [1:0]            bist_op_mode,     // CFG[3:2] operator mix for the datapath
 
     // --- APB Interface ---
     input  logic [31:0] paddr,
@@ -21,7 +24,8 @@ module runtime_bist_controller #(
     output logic [31:0] prdata,
     output logic        pready,
     
-    output logic        error_irq
+    output logic        error_irq,
+    output logic        bist_irq        // completion/fail/abort, masked by IRQ_EN
 );
 
     // --- ANSI Colors ---
@@ -37,8 +41,32 @@ module runtime_bist_controller #(
     // --- Registers ---
     logic [31:0] reg_ctrl;
     logic [31:0] reg_status;
-    logic [31:0] reg_threshold;
+    logic [TIMER_WIDTH-1:0] reg_threshold;
     logic [31:0] reg_golden_sig;
+    logic [3:0]  reg_cfg;        // [1:0] len_sel (32 << len_sel cycles), [3:2] op_mode
+    logic [GOLDEN_IDX_W-1:0] reg_gtbl_idx;
+    logic [31:0] golden_table [GOLDEN_ENTRIES];
+    logic [31:0] golden_expected;
+    logic [7:0]  session_last;
+    logic        lfsr_seed_load;
+    logic [31:0] reg_seed;       // session seed (slot 0 of the seed schedule)
+    logic [31:0] rot_seed;       // seed handed over by the last completed session
+    logic [31:0] session_seed;
+    logic [GOLDEN_SLOT_W-1:0] seed_slot;
+    logic [2:0]  reg_irq_en;     // [0] done, [1] fail, [2] abort
+    logic [2:0]  reg_irq_status; // same bits, write-1-to-clear
+    logic [2:0]  reg_chkpt;      // [0] enable, [2:1] window select (CHKPT_WINDOW << sel cycles)
+    logic [8:0]  reg_chkpt_status; // [7:0] cycle of the first mismatching checkpoint, [8] mismatch
+    logic        chkpt_due, chkpt_fail;
+    logic [31:0] chkpt_expected;
+    logic [31:0] reg_min_interval;  // minimum cycles from one session start to the next (0: off)
+    logic [31:0] reg_budget_window; // budget window length in cycles (0: no budget)
+    logic [31:0] reg_budget;        // BIST cycles allowed per window
+    logic [31:0] interval_cnt;      // cycles since the last session start (saturating)
+    logic [31:0] window_cnt;
+    logic [31:0] budget_used;       // BIST cycles of the current window
+    logic [8:0]  session_left;      // cycles the next (or resumed) session still needs
+    logic        interval_ok, budget_ok, rate_ok;
     
     logic        idle_detected;
     logic        lfsr_en, misr_en, misr_clear;
@@ -69,38 +97,151 @@ module runtime_bist_controller #(
     always_ff @(posedge clk or negedge rst_n) begin
         if(!rst_n) begin
             reg_ctrl <= '0;
-            reg_threshold <= 32'd100;
+            reg_threshold <= TIMER_WIDTH'(100);
             reg_golden_sig <= 32'hFFFF_FFFF; 
+            reg_cfg <= 4'b0011;  // 256 cycles, legacy operator
+            reg_gtbl_idx <= '0;
+            reg_seed <= GOLDEN_SEED;
+            reg_irq_en <= '0;
+            reg_chkpt <= '0;
+            reg_min_interval <= '0;
+            reg_budget_window <= '0;
+            reg_budget <= '0;
         end else if (reg_write_en) begin
             case(reg_addr)
                 8'h00: reg_ctrl <= reg_wdata;
-                8'h08: reg_threshold <= reg_wdata;
+                8'h08: reg_threshold <= reg_wdata[TIMER_WIDTH-1:0];
                 8'h0C: reg_golden_sig <= reg_wdata;
+                8'h14: reg_cfg <= reg_wdata[3:0];
+                8'h18: reg_gtbl_idx <= reg_wdata[GOLDEN_IDX_W-1:0];
+                8'h1C: reg_gtbl_idx <= reg_gtbl_idx + 1'b1;  // bulk-load: auto-increment
+                8'h20: reg_seed <= reg_wdata;
+                8'h28: reg_irq_en <= reg_wdata[2:0];
+                8'h30: reg_chkpt <= reg_wdata[2:0];
+                8'h38: reg_min_interval <= reg_wdata;
+                8'h3C: reg_budget_window <= reg_wdata;
+                8'h40: reg_budget <= reg_wdata;
             endcase
         end
     end
 
+    // GOLDEN SIGNATURE TABLE (indexed by CFG, contents from bist_golden_pkg)
+    generate
+        if (GOLDEN_TABLE_RAM) begin : g_golden_ram
+            always_ff @(posedge clk or negedge rst_n) begin
+                if (!rst_n) begin
+                    for (int i = 0; i < GOLDEN_ENTRIES; i++)
+                        golden_table[i] <= golden_rom(GOLDEN_IDX_W'(i));
+                end else if (reg_write_en && reg_addr == 8'h1C) begin
+                    golden_table[reg_gtbl_idx] <= reg_wdata;
+                end
+            end
+        end else begin : g_golden_rom
+            always_comb begin
+                for (int i = 0; i < GOLDEN_ENTRIES; i++)
+                    golden_table[i] = golden_rom(GOLDEN_IDX_W'(i));
+            end
+        end
+    endgenerate
+
+    // SEED SCHEDULER (CTRL[2]): each completed session hands its final LFSR
+    // state to the next slot, wrapping back to SEED after GOLDEN_SEED_SLOTS.
+    // Writing SEED or CFG, or clearing CTRL[2], restarts the schedule.
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            seed_slot <= '0;
+            rot_seed  <= GOLDEN_SEED;
+        end else if (!reg_ctrl[2] || (reg_write_en && (reg_addr == 8'h14 || reg_addr == 8'h20))) begin
+            seed_slot <= '0;
+        end else if (state == CHECK_RESULT) begin
+            seed_slot <= (seed_slot == GOLDEN_SLOT_W'(GOLDEN_SEED_SLOTS - 1)) ? '0 : seed_slot + 1'b1;
+            rot_seed  <= bist_pattern_out;
+        end
+    end
+
+    assign session_seed = (seed_slot == '0) ? reg_seed : rot_seed;
+
+    // CTRL[1] selects the table entry of the active seed slot and configuration
+    assign golden_expected = reg_ctrl[1] ? golden_table[{seed_slot, reg_cfg}] : reg_golden_sig;
+    assign bist_op_mode    = reg_cfg[3:2];
+    assign session_last    = 8'((32 << reg_cfg[1:0]) - 1);
+
     // READ MUX
     always_comb begin
         case(reg_addr)
             8'h00: reg_rdata_mux = reg_ctrl;
             8'h04: reg_rdata_mux = reg_status;
-            8'h08: reg_rdata_mux = reg_threshold;
+            8'h08: reg_rdata_mux = 32'(reg_threshold);
             8'h0C: reg_rdata_mux = reg_golden_sig;
             8'h10: reg_rdata_mux = misr_signature;
+            8'h14: reg_rdata_mux = {28'h0, reg_cfg};
+            8'h18: reg_rdata_mux = 32'(reg_gtbl_idx);
+            8'h1C: reg_rdata_mux = golden_table[reg_gtbl_idx];
+            8'h20: reg_rdata_mux = reg_seed;
+            8'h24: reg_rdata_mux = 32'(seed_slot);
+            8'h28: reg_rdata_mux = {29'h0, reg_irq_en};
+            8'h2C: reg_rdata_mux = {29'h0, reg_irq_status};
+            8'h30: reg_rdata_mux = {29'h0, reg_chkpt};
+            8'h34: reg_rdata_mux = {23'h0, reg_chkpt_status};
+            8'h38: reg_rdata_mux = reg_min_interval;
+            8'h3C: reg_rdata_mux = reg_budget_window;
+            8'h40: reg_rdata_mux = reg_budget;
+            8'h44: reg_rdata_mux = budget_used;
             default: reg_rdata_mux = 32'h0;
         endcase
     end
 
+    // CHECKPOINTS (CHKPT[0]): every (CHKPT_WINDOW << CHKPT[2:1]) cycles the MISR
+    // is compared against the checkpoint table, so a fault is flagged at the
+    // first mismatching window instead of at CHECK_RESULT. The table is built
+    // for SEED = GOLDEN_SEED, so checkpoints are skipped for other seeds and
+    // rotated seed slots.
+    assign chkpt_expected = checkpoint_rom({reg_cfg[3:2], test_cycle_cnt[7:$clog2(CHKPT_WINDOW)]});
+    assign chkpt_due  = reg_chkpt[0] && seed_slot == '0 && reg_seed == GOLDEN_SEED &&
+                        test_cycle_cnt != 0 &&
+                        (test_cycle_cnt & 8'((CHKPT_WINDOW << reg_chkpt[2:1]) - 1)) == 0;
+    assign chkpt_fail = (state == RUN_TEST) && chkpt_due && misr_signature != chkpt_expected;
+
+    // RATE LIMITING: a new session starts at least MIN_INTERVAL cycles after
+    // the previous start, and only if the rest of the current budget window
+    // covers all of its cycles (BUDGET per BUDGET_WINDOW). Resuming an
+    // aborted session is exempt from the interval but not from the budget.
+    // Masked request cycles are not BIST cycles.
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            interval_cnt <= '1;
+            window_cnt   <= '0;
+            budget_used  <= '0;
+        end else begin
+            if (state == RUN_TEST && test_cycle_cnt == 0 && !sys_req_valid) interval_cnt <= 32'd1;
+            else if (interval_cnt != '1) interval_cnt <= interval_cnt + 1;
+
+            if (reg_budget_window == 0 || (reg_write_en && reg_addr == 8'h3C) ||
+                window_cnt == reg_budget_window - 1) begin
+                window_cnt  <= '0;
+                budget_used <= '0;
+            end else begin
+                window_cnt <= window_cnt + 1;
+                if (state == RUN_TEST && !sys_req_valid) budget_used <= budget_used + 1;
+            end
+        end
+    end
+
+    assign session_left = {1'b0, session_last} + 9'd1 - {1'b0, test_cycle_cnt};
+    assign interval_ok  = test_cycle_cnt != 0 || {1'b0, interval_cnt} + 33'd1 >= {1'b0, reg_min_interval};
+    assign budget_ok    = reg_budget_window == 0 || {1'b0, budget_used} + 33'(session_left) <= {1'b0, reg_budget};
+    assign rate_ok      = interval_ok && budget_ok;
+
     // 3. SUB-MODULES
-    idle_detector #(.TIMER_WIDTH(32)) u_idle_det (
+    idle_detector #(.TIMER_WIDTH(TIMER_WIDTH)) u_idle_det (
         .clk(clk), .rst_n(rst_n), .system_valid(sys_req_valid),
         .threshold(reg_threshold), .idle_trigger(idle_detected)
     );
 
+    // Reseeded at the start of every session so signatures are reproducible
     lfsr_gen u_lfsr (
         .clk(clk), .rst_n(rst_n), .enable(lfsr_en),
-        .seed_load(1'b0), .seed_data(32'h0), .pattern_out(bist_pattern_out)
+        .seed_load(lfsr_seed_load), .seed_data(session_seed), .pattern_out(bist_pattern_out)
     );
 
     misr_analyzer u_misr (
@@ -118,7 +259,7 @@ module runtime_bist_controller #(
     // Counter
     always_ff @(posedge clk or negedge rst_n) begin
         if(!rst_n) test_cycle_cnt <= 0;
-        else if (state == RUN_TEST) test_cycle_cnt <= test_cycle_cnt + 1;
+        else if (state == RUN_TEST && !sys_req_valid) test_cycle_cnt <= test_cycle_cnt + 1;
         else if (state == IDLE) test_cycle_cnt <= 0;
     end
 
@@ -128,6 +269,7 @@ module runtime_bist_controller #(
         lfsr_en = 0;
         misr_en = 0;
         misr_clear = 0;
+        lfsr_seed_load = 0;
         bist_active_mode = 0; 
         
         case(state)
@@ -138,22 +280,28 @@ module runtime_bist_controller #(
             WAIT_FOR_SLOT: begin
                 if (sys_req_valid) begin
                     // Wait
-                end else if (idle_detected) begin
+                end else if (idle_detected && rate_ok) begin
                     next_state = RUN_TEST;
                 end
             end
 
             RUN_TEST: begin
-                bist_active_mode = 1;
-                lfsr_en = 1;
-                misr_en = 1;
-                if (test_cycle_cnt == 0) begin
+                // Zero-cycle handover: a system request takes the datapath in
+                // the cycle it arrives. That cycle's LFSR/MISR update is masked
+                // and the counter holds, so the resumed session replays it.
+                bist_active_mode = !sys_req_valid;
+                lfsr_en = !sys_req_valid;
+                misr_en = !sys_req_valid;
+                if (test_cycle_cnt == 0 && !sys_req_valid) begin
                     misr_clear = 1;
+                    lfsr_seed_load = 1;
                 end
 
-                if (sys_req_valid) begin
+                if (chkpt_fail) begin
+                    next_state = IDLE;  // fault already detected, end the session early
+                end else if (sys_req_valid) begin
                     next_state = ABORT;
-                end else if (test_cycle_cnt == 8'hFF) begin
+                end else if (test_cycle_cnt >= session_last) begin
                     next_state = CHECK_RESULT;
                 end
             end
@@ -173,28 +321,63 @@ module runtime_bist_controller #(
     always_ff @(posedge clk or negedge rst_n) begin
         if(!rst_n) begin
             reg_status <= 0;
+            reg_chkpt_status <= 0;
             error_irq <= 0;
         end else begin
             reg_status[0] <= (state == RUN_TEST); // Bit 0: Busy
+            // Bit 4: Throttled (idle slot held back by MIN_INTERVAL / BUDGET)
+            reg_status[4] <= (state == WAIT_FOR_SLOT) && !sys_req_valid && idle_detected && !rate_ok;
+            
+            if (chkpt_fail) begin
+                reg_status[1] <= 1; // Bit 1: Fail
+                reg_status[3] <= 1; // Bit 3: Fail detected at a checkpoint
+                reg_chkpt_status <= {1'b1, test_cycle_cnt};
+                error_irq <= 1;
+                // synthesis translate_off
+                $display("%s[FAIL] Checkpoint Mismatch at cycle %0d! Exp: %h, Got: %h%s", STR_RED,
+                         test_cycle_cnt, chkpt_expected, misr_signature, STR_RESET);
+                // synthesis translate_on
+            end
             
             if (state == CHECK_RESULT) begin
-                if (misr_signature == reg_golden_sig) begin
+                if (misr_signature == golden_expected) begin
                     reg_status[2] <= 1; // Bit 2: Pass
                 end else begin
                     reg_status[1] <= 1; // Bit 1: Fail
                     error_irq <= 1;
                     // synthesis translate_off
-                    $display("%s[FAIL] Signature Mismatch! Exp: %h, Got: %h%s", STR_RED, reg_golden_sig, misr_signature, STR_RESET);
+                    $display("%s[FAIL] Signature Mismatch! Exp: %h, Got: %h (CFG %h, slot %0d)%s", STR_RED,
+                             golden_expected, misr_signature, reg_cfg, seed_slot, STR_RESET);
+                    // Candidate faults: python Tools/fault_dict.py lookup <Got> --len-sel CFG[1:0] --op-mode CFG[3:2] --slot <slot>
                     // synthesis translate_on
                 end
             end
             if (state == RUN_TEST && test_cycle_cnt == 0) begin
-                reg_status[2:1] <= 0;
+                reg_status[3:1] <= 0;
+                reg_chkpt_status <= 0;
                 error_irq <= 0;
             end
         end
     end
 
+    // Interrupt Status (W1C): set on session end / abort, set wins over clear
+    always_ff @(posedge clk or negedge rst_n) begin
+        if(!rst_n) begin
+            reg_irq_status <= '0;
+        end else begin
+            if (reg_write_en && reg_addr == 8'h2C)
+                reg_irq_status <= reg_irq_status & ~reg_wdata[2:0];
+            if (state == CHECK_RESULT) begin
+                reg_irq_status[0] <= 1'b1;
+                if (misr_signature != golden_expected) reg_irq_status[1] <= 1'b1;
+            end
+            if (chkpt_fail) reg_irq_status[1] <= 1'b1;
+            if (state == ABORT) reg_irq_status[2] <= 1'b1;
+        end
+    end
+
+    assign bist_irq = |(reg_irq_status & reg_irq_en);
+
     // =========================================================================
     // 5. SYSTEMVERILOG ASSERTIONS (Vivado/Questa Only)
     // =========================================================================
@@ -202,12 +385,48 @@ module runtime_bist_controller #(
     // synthesis translate_off
     property p_safety_interruption;
         @(posedge clk) disable iff (!rst_n)
-        (sys_req_valid) |=> (!bist_active_mode);
+        (sys_req_valid) |-> (!bist_active_mode);
     endproperty
 
     a_safety_check: assert property (p_safety_interruption)
         else $error("%s[SVA ERROR] Safety Violation!%s", STR_RED, STR_RESET);
 
+    // The cycle of a system request is never compacted into the signature
+    property p_handover_masks_misr;
+        @(posedge clk) disable iff (!rst_n)
+        (sys_req_valid) |-> (!misr_en && !misr_clear && !lfsr_en);
+    endproperty
+
+    a_handover_mask: assert property (p_handover_masks_misr)
+        else $error("%s[SVA ERROR] MISR updated during a system request!%s", STR_RED, STR_RESET);
+
+    // synthesis translate_on
+`endif
+
+    // =========================================================================
+    // 6. WINDOWED WAVEFORM DUMP (Simulation Only, Tools/wave_window.py)
+    // =========================================================================
+    // Built with +define+BIST_WAVE_WINDOW. Dumps this controller's hierarchy
+    // into +bist_wave_file from +bist_wave_start (ns) on; without the plusarg
+    // nothing is dumped.
+`ifdef BIST_WAVE_WINDOW
+    // synthesis translate_off
+    string           wave_file;
+    longint unsigned wave_start = 0;
+    bit              wave_armed = 1'b0;
+
+    initial begin
+        wave_armed = $value$plusargs("bist_wave_file=%s", wave_file);
+        void'($value$plusargs("bist_wave_start=%d", wave_start));
+    end
+
+    always @(posedge clk) begin
+        if (wave_armed && $time >= wave_start) begin
+            $dumpfile(wave_file);
+            $dumpvars(0, runtime_bist_controller);
+            wave_armed = 1'b0;
+        end
+    end
     // synthesis translate_on
 `endif
 
@@ -20,7 +20,8 @@ module top_runtime_bist #(
     output logic        pready,
 
     // --- Interrupt Output ---
-    output logic        irq_error
+    output logic        irq_error,
+    output logic        irq_bist       // session done/fail/abort (IRQ_EN/IRQ_STATUS)
 );
 
     // Internal Signals
@@ -49,6 +50,22 @@ module top_runtime_bist #(
     end
     assign sys_result_out = dut_result;
 
+    // The adder is the whole datapath: its sum is both result and adder output,
+    // and the zero flag stands in for ibex_alu's is_equal / comparison outputs
+    logic [DATA_WIDTH-1:0] bist_response;
+    logic                  dut_is_zero;
+    assign dut_is_zero = (dut_result == '0);
+
+    bist_space_compactor #(
+        .WIDTH(DATA_WIDTH)
+    ) u_space_compactor (
+        .result           (dut_result),
+        .adder_result     (dut_result),
+        .comparison_result(dut_is_zero),
+        .is_equal_result  (dut_is_zero),
+        .response         (bist_response)
+    );
+
     // 3. BIST CONTROLLER INSTANCE
     runtime_bist_controller #(
         .DATA_WIDTH(DATA_WIDTH)
@@ -58,9 +75,10 @@ module top_runtime_bist #(
         // System Side
         .sys_req_valid(sys_req_valid),
         .bist_active_mode(bist_active),
-        .dut_result_in(dut_result),
+        .dut_result_in(bist_response),
         // BIST Side
         .bist_pattern_out(bist_pattern),
+        .bist_op_mode(),  // fixed adder datapath: operator mix not used
         // APB Side
         .paddr(paddr),
         .psel(psel),
@@ -70,7 +88,8 @@ module top_runtime_bist #(
         .prdata(prdata),
         .pready(pready),
         // Interrupt
-        .error_irq(irq_error)
+        .error_irq(irq_error),
+        .bist_irq(irq_bist)
     );
 
 endmodule
\ No newline at end of file
@@ -0,0 +1,91 @@
+## ============================================================================
+## RISC-V BIST IP — Out-of-Context Synthesis Reports
+##
+## Synthesizes one top module from Vivado/rtl and writes the timing and
+## utilization reports in the format parsed by Tools/vivado_reports.py:
+##   Reports/timing_report_<TAG>.txt
+##   Reports/utilization_report_<TAG>.txt
+##   Reports/handover_timing_<TAG>.txt   (tops with a system request port)
+##
+## Usage:
+##   vivado -mode batch -source synth_reports.tcl -tclargs <top_module> <TAG> [PARAM=VALUE ...]
+##
+## Examples:
+##   ... -tclargs ibex_alu              ALU        ;# plain ALU baseline
+##   ... -tclargs ibex_alu_bist_wrapper BIST
+##   ... -tclargs ibex_ex_block         RISC_BIST
+##   ... -tclargs runtime_bist_controller BIST_CTRL
+##   ... -tclargs multi_unit_bist_controller MULTI_N4 N_UNITS=4
+## ============================================================================
+
+if {$argc < 2} {
+    puts "Usage: vivado -mode batch -source synth_reports.tcl -tclargs <top_module> <TAG> \[PARAM=VALUE ...\]"
+    exit 1
+}
+set top_module [lindex $argv 0]
+set tag        [lindex $argv 1]
+set generics   [lrange $argv 2 end]
+
+# --- Configuration (matches the committed Reports/) ---
+set part          "xc7a200tfbg676-2"
+set clock_period  10.000
+# Arrival of the system request after the clock edge (core-side logic), as a fraction of the period.
+# Keep in sync with HANDOVER_INPUT_DELAY in Tools/vivado_reports.py
+set handover_input_delay [expr {0.3 * $clock_period}]
+
+set script_dir    [file dirname [info script]]
+set proj_root     [file normalize "$script_dir/.."]
+set rtl_dir       "$proj_root/rtl"
+set pkg_dir       "$proj_root/rtl/packages"
+set report_dir    [file normalize "$proj_root/../Reports"]
+
+puts "============================================"
+puts " Synthesizing: $top_module  (tag: $tag)"
+puts " Target FPGA:  $part"
+puts " Parameters:   [expr {[llength $generics] ? $generics : "defaults"}]"
+puts "============================================"
+
+# --- Read Sources (packages first) ---
+read_verilog -sv [glob -nocomplain "$pkg_dir/*.sv"]
+read_verilog -sv [glob -nocomplain "$rtl_dir/*.sv"]
+
+# --- Synthesize ---
+set generic_args {}
+foreach g $generics {
+    lappend generic_args -generic $g
+}
+synth_design -top $top_module -part $part -mode out_of_context {*}$generic_args
+
+# --- Clock Constraint (same sys_clk_pin as constraints/timing.xdc) ---
+set clk_ports [get_ports -quiet {clk_i clk}]
+if {[llength $clk_ports] > 0} {
+    create_clock -name sys_clk_pin -period $clock_period [lindex $clk_ports 0]
+}
+
+# --- Reports ---
+file mkdir $report_dir
+report_utilization -file "$report_dir/utilization_report_$tag.txt"
+report_timing_summary -delay_type min_max -report_unconstrained -check_timing_verbose \
+    -max_paths 10 -input_pins -routable_nets -file "$report_dir/timing_report_$tag.txt"
+
+# --- Zero-cycle handover: system request -> ALU mux -> result / MISR in the same cycle ---
+# Constrained after the summary so timing_report_<TAG>.txt stays comparable with the snapshot
+set req_ports [get_ports -quiet {core_sleep_i sys_req_valid}]
+set handover_written 0
+if {[llength $req_ports] > 0 && [llength $clk_ports] > 0} {
+    set_input_delay -clock sys_clk_pin $handover_input_delay $req_ports
+    report_timing -from $req_ports -delay_type max -max_paths 10 -nworst 1 -input_pins \
+        -file "$report_dir/handover_timing_$tag.txt"
+    set handover_written 1
+}
+
+puts "\n============================================"
+puts " Reports written to $report_dir"
+puts "   utilization_report_$tag.txt"
+puts "   timing_report_$tag.txt"
+if {$handover_written} {
+    puts "   handover_timing_$tag.txt"
+}
+puts " Next: python Tools/vivado_reports.py check"
+puts "       python Tools/vivado_reports.py handover"
+puts "============================================"